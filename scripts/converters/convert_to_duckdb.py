@@ -24,7 +24,7 @@ import sys
 import tempfile
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import duckdb
 import pandas as pd
@@ -40,6 +40,8 @@ project_root = Path(__file__).parent.parent.parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
+from landuse.converter_models import ConversionConfig
+from landuse.core.app_config import RUNTIME_PROFILES, RuntimeProfile
 from landuse.database.schema_version import SchemaVersion, SchemaVersionManager
 
 console = Console()
@@ -58,6 +60,7 @@ class LanduseCombinedScenarioConverter:
         use_bulk_copy: If True, uses COPY from Parquet (5-10x faster).
         conn: Active DuckDB connection.
         temp_dir: Directory for temporary Parquet files during bulk loading.
+        runtime: DuckDB runtime settings (memory limit, threads, spill directory).
     """
 
     # Security limits
@@ -99,7 +102,13 @@ class LanduseCombinedScenarioConverter:
         },
     }
 
-    def __init__(self, input_file: str, output_file: str, use_bulk_copy: bool = True):
+    def __init__(
+        self,
+        input_file: str,
+        output_file: str,
+        use_bulk_copy: bool = True,
+        runtime: Optional[RuntimeProfile] = None,
+    ):
         """Initialize the combined scenario converter with validated paths.
 
         Sets up the converter to aggregate multiple GCM projections into combined
@@ -113,6 +122,8 @@ class LanduseCombinedScenarioConverter:
                 must exist and file extension should be .db, .duckdb, or .duck.
             use_bulk_copy: Whether to use optimized COPY from Parquet (5-10x faster)
                 instead of traditional INSERT statements. Defaults to True.
+            runtime: DuckDB runtime settings for the output database (``main`` passes
+                the ``conversion`` profile). Defaults to DuckDB's own settings.
 
         Raises:
             ValueError: If paths contain directory traversal patterns, file is too large,
@@ -130,6 +141,7 @@ class LanduseCombinedScenarioConverter:
         self.output_file = self._validate_output_path(output_file)
         self.conn = None
         self.use_bulk_copy = use_bulk_copy
+        self.runtime = runtime
         self.temp_dir = tempfile.mkdtemp(prefix="landuse_convert_combined_")
         self._validate_file_size()
 
@@ -209,7 +221,7 @@ class LanduseCombinedScenarioConverter:
         )
 
         # Connect to DuckDB
-        self.conn = duckdb.connect(str(self.output_file))
+        self.conn = duckdb.connect(str(self.output_file), config=self.runtime.duckdb_config() if self.runtime else {})
 
         # Create dimension tables
         self._create_scenario_dim()
@@ -1151,6 +1163,12 @@ def main():
     parser.add_argument("--no-bulk-copy", action="store_true", help="Use traditional INSERT instead of bulk COPY")
     parser.add_argument("--input", default="data/raw/county_landuse_projections_RPA.json", help="Input JSON file path")
     parser.add_argument("--output", default="data/processed/landuse_analytics.duckdb", help="Output DuckDB file path")
+    parser.add_argument(
+        "--profile", default="conversion", choices=sorted(RUNTIME_PROFILES), help="DuckDB runtime profile"
+    )
+    parser.add_argument("--memory-limit", default="8GB", help="DuckDB memory limit (e.g. 8GB)")
+    parser.add_argument("--threads", type=int, default=8, help="DuckDB worker threads")
+    parser.add_argument("--temp-dir", type=Path, default=None, help="Directory DuckDB spills to when out of memory")
 
     args = parser.parse_args()
     use_bulk_copy = not args.no_bulk_copy
@@ -1165,7 +1183,17 @@ def main():
         )
     )
 
-    converter = LanduseCombinedScenarioConverter(args.input, args.output, use_bulk_copy=use_bulk_copy)
+    conversion_config = ConversionConfig(
+        input_file=Path(args.input),
+        output_file=Path(args.output),
+        memory_limit=args.memory_limit,
+        threads=args.threads,
+        temp_dir=args.temp_dir,
+    )
+    runtime = conversion_config.runtime_profile(RUNTIME_PROFILES[args.profile])
+    console.print(f"⚙️ DuckDB runtime: {runtime.duckdb_config()}")
+
+    converter = LanduseCombinedScenarioConverter(args.input, args.output, use_bulk_copy=use_bulk_copy, runtime=runtime)
 
     try:
         start_time = time.time()
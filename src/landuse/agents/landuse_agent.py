@@ -34,8 +34,17 @@ from rich.console import Console
 from rich.panel import Panel
 
 from landuse.agents.prompts import SYSTEM_PROMPT
-from landuse.agents.tools import TOOLS, close_api
+from landuse.agents.tools import TOOLS, close_api, configure_api
 from landuse.core.app_config import AppConfig
+from landuse.exceptions import RateLimitError
+from landuse.utils.circuit_breaker import get_circuit_breaker
+from landuse.utils.retry_decorators import (
+    AsyncRetryableOperation,
+    RetryBudget,
+    get_llm_retryable_exceptions,
+    llm_wait,
+)
+from landuse.utils.security import RateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +83,19 @@ class LandUseAgent:
         )
         self.llm_with_tools = self.llm.bind_tools(TOOLS)
 
+        # LLM calls per user, from SecurityConfig.rate_limit_calls / rate_limit_window
+        self.rate_limiter = RateLimiter.from_config(self.config.security)
+
+        # Shared by every agent in the process: fail fast while the Anthropic API is down
+        self.llm_breaker = get_circuit_breaker("llm:anthropic", failure_exceptions=get_llm_retryable_exceptions())
+
+        # Bound each tool query so one slow query cannot pin the agent
+        configure_api(
+            query_timeout=self.config.agent.max_execution_time,
+            in_memory=self.config.database.in_memory,
+            preload_scenarios=self.config.database.preload_scenarios,
+        )
+
         # Conversation history for multi-turn
         self._messages: list[dict] = []
         self._max_history = 20
@@ -112,6 +134,9 @@ class LandUseAgent:
         start_time = time.time()
         tool_calls_count = 0
 
+        # LLM retries for this request must finish within the execution time limit
+        budget = RetryBudget(deadline=self.config.agent.max_execution_time)
+
         # Convert to LangChain message format
         lc_messages = [SystemMessage(content=SYSTEM_PROMPT)]
 
@@ -129,8 +154,18 @@ class LandUseAgent:
             iteration += 1
 
             try:
+                # Wait for the user's rate limit rather than failing the conversation
+                await self.rate_limiter.acquire_async(
+                    user_id or "default", timeout=self.config.agent.max_execution_time
+                )
+
                 # Get response (may include tool calls)
-                response = await self.llm_with_tools.ainvoke(lc_messages)
+                response = await self._invoke_llm(lc_messages, budget)
+            except RateLimitError as e:
+                logger.warning(f"LLM rate limit for {user_id or 'default'}: {e}")
+                yield {"type": "text", "content": str(e)}
+                yield {"type": "finish"}
+                return
             except Exception as e:
                 logger.error(f"LLM invocation failed: {e}", exc_info=True)
                 yield {"type": "text", "content": f"Error communicating with Claude: {e}"}
@@ -166,11 +201,11 @@ class LandUseAgent:
                     "args": tool_call["args"],
                 }
 
-                # Execute the tool (sync - tools now use synchronous API)
+                # Execute the tool in a worker thread (tools use the synchronous API)
                 tool_func = {t.name: t for t in TOOLS}.get(tool_call["name"])
                 if tool_func:
                     try:
-                        result = tool_func.invoke(tool_call["args"])
+                        result = await asyncio.to_thread(tool_func.invoke, tool_call["args"])
                         tool_results[tool_call["id"]] = result
                         yield {
                             "type": "tool_result",
@@ -215,6 +250,17 @@ class LandUseAgent:
 
         yield {"type": "finish"}
 
+    async def _invoke_llm(self, messages: list, budget: RetryBudget):
+        """Call the LLM through its circuit breaker, retrying transient errors within ``budget``."""
+        operation = AsyncRetryableOperation(
+            "LLM call",
+            max_attempts=3,
+            exceptions=get_llm_retryable_exceptions(),
+            wait_for=llm_wait(),
+            budget=budget,
+        )
+        return await operation.execute(self.llm_breaker.call_async, self.llm_with_tools.ainvoke, messages)
+
     def query(self, question: str, **kwargs) -> str:
         """
         Query the agent with a question.
@@ -17,13 +17,24 @@ logger = logging.getLogger(__name__)
 # ============== API Instance (Lazy Initialization) ==============
 
 _api: LandUseAPI | None = None
+_api_options: dict = {}
+
+
+def configure_api(**options) -> None:
+    """Set LandUseAPI constructor options (e.g. ``query_timeout``) for the shared instance.
+
+    Any existing instance is closed so the next tool call picks up the options.
+    """
+    global _api_options
+    close_api()
+    _api_options = dict(options)
 
 
 def _get_api() -> LandUseAPI:
     """Get or create the API instance."""
     global _api
     if _api is None:
-        _api = LandUseAPI()
+        _api = LandUseAPI(**_api_options)
     return _api
 
 
@@ -28,6 +28,7 @@ For Claude tool definitions:
 """
 
 from landuse.api.client import LandUseAPI
+from landuse.api.expression import LandUseQuery
 from landuse.api.models import (
     # Enums for query parameters
     ChangeType,
@@ -35,15 +36,26 @@ from landuse.api.models import (
     Metric,
     Scenario,
     # Result models
+    AggregateResult,
     AgriculturalChangeResult,
     APIResult,
+    CountyPageResult,
     CountyResult,
+    CountyVectorResult,
+    CumulativeTransitionResult,
     DataSummaryResult,
     ErrorResult,
+    ExportResult,
     ForestChangeResult,
     LandUseAreaResult,
     RankedCounty,
     ScenarioComparisonResult,
+    ScenarioDiffResult,
+    ScenarioDivergence,
+    SimilarCountiesResult,
+    SimilarCounty,
+    SocioeconomicRecord,
+    SocioeconomicResult,
     StateComparisonResult,
     StateRanking,
     TimeSeriesPoint,
@@ -57,6 +69,7 @@ from landuse.api.models import (
 __all__ = [
     # Main API class
     "LandUseAPI",
+    "LandUseQuery",
     # Enums
     "Scenario",
     "LandUse",
@@ -73,12 +86,23 @@ __all__ = [
     "ForestChangeResult",
     "AgriculturalChangeResult",
     "ScenarioComparisonResult",
+    "ScenarioDiffResult",
+    "ScenarioDivergence",
     "StateComparisonResult",
     "StateRanking",
     "TimeSeriesResult",
     "TimeSeriesPoint",
     "CountyResult",
+    "CountyPageResult",
+    "CountyVectorResult",
+    "CumulativeTransitionResult",
+    "AggregateResult",
+    "ExportResult",
     "TopCountiesResult",
     "RankedCounty",
+    "SimilarCountiesResult",
+    "SimilarCounty",
+    "SocioeconomicResult",
+    "SocioeconomicRecord",
     "DataSummaryResult",
 ]
@@ -0,0 +1,253 @@
+"""Shared-scan evaluation for batched API requests.
+
+A single ``QueryBuilder.transition_cube`` scan returns acres grouped by state,
+scenario, period and from/to land use. Every state-level query in
+``LandUseAPI`` is a filter plus a re-aggregation of that cube, so a batch of
+related tool calls can be answered from one SQL statement.
+
+Each reducer below returns a DataFrame with exactly the columns (and sort
+order) of the corresponding ``QueryBuilder`` query, so ``LandUseAPI`` builds
+results through the same code path in both cases.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import pandas as pd
+
+from landuse.api.queries import QueryBuilder
+
+# LandUseAPI methods that can be answered from the transition cube
+CUBE_METHODS: frozenset[str] = frozenset(
+    [
+        "get_land_use_area",
+        "get_transitions",
+        "get_urban_expansion",
+        "get_forest_change",
+        "get_agricultural_change",
+        "compare_scenarios",
+        "compare_states",
+        "get_time_series",
+    ]
+)
+
+# LandUseAPI methods accepted by LandUseAPI.batch
+BATCH_METHODS: frozenset[str] = CUBE_METHODS | frozenset(
+    [
+        "get_county_data",
+        "get_top_counties",
+        "get_data_summary",
+    ]
+)
+
+
+@dataclass
+class BatchRequest:
+    """A single normalized request within a batch."""
+
+    method: str
+    args: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, request: Any) -> "BatchRequest":
+        """Normalize a request given as a dict or a (method, args) pair.
+
+        Raises:
+            ValueError: If the request is malformed or names an unknown method
+        """
+        if isinstance(request, BatchRequest):
+            parsed = request
+        elif isinstance(request, dict):
+            if "method" not in request:
+                raise ValueError("Batch request is missing 'method'")
+            parsed = cls(method=request["method"], args=dict(request.get("args") or {}))
+        elif isinstance(request, (tuple, list)) and len(request) == 2:
+            parsed = cls(method=request[0], args=dict(request[1] or {}))
+        else:
+            raise ValueError(f"Unsupported batch request: {request!r}")
+
+        if parsed.method not in BATCH_METHODS:
+            raise ValueError(
+                f"Method '{parsed.method}' is not batchable. Supported: {', '.join(sorted(BATCH_METHODS))}"
+            )
+        return parsed
+
+    def states(self) -> list[str] | None:
+        """States this request covers (None means all states)."""
+        return self.args.get("states") or None
+
+    def scenarios(self) -> list[str] | None:
+        """Scenario codes this request covers (None means all scenarios)."""
+        if self.method == "compare_scenarios":
+            codes = self.args.get("scenarios") or ["LM", "HM", "HL", "HH"]
+        else:
+            codes = [self.args["scenario"]] if self.args.get("scenario") else []
+        if not codes or any(QueryBuilder._scenario_pair(code) is None for code in codes):
+            return None
+        return list(codes)
+
+
+class TransitionCube:
+    """In-memory transition cube with reducers mirroring ``QueryBuilder`` queries."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+
+    def _mask(
+        self,
+        states: list[str] | None,
+        scenario: str | None = None,
+        year: int | None = None,
+        year_range: str | None = None,
+    ) -> pd.Series:
+        """Boolean mask for the shared state/scenario/time filters."""
+        df = self.df
+        mask = pd.Series(True, index=df.index)
+        state_names = QueryBuilder._state_names(states)
+        if state_names:
+            mask &= df["state_name"].isin(state_names)
+        pair = QueryBuilder._scenario_pair(scenario)
+        if pair is not None:
+            mask &= (df["rcp_scenario"] == pair[0]) & (df["ssp_scenario"] == pair[1])
+        if year:
+            mask &= (df["start_year"] <= year) & (df["end_year"] >= year)
+        if year_range:
+            mask &= df["year_range"] == year_range
+        return mask
+
+    def _aggregate(self, mask: pd.Series, keys: list[str], renames: dict[str, str], value: str) -> pd.DataFrame:
+        """Group the masked cube by ``keys`` and sum acres into ``value``."""
+        grouped = self.df[mask].groupby(keys, as_index=False)["acres"].sum()
+        return grouped.rename(columns={**renames, "acres": value})
+
+    def land_use_area(
+        self,
+        states: list[str],
+        land_use: str | None = None,
+        year: int | None = None,
+        scenario: str | None = None,
+    ) -> pd.DataFrame:
+        """Equivalent of ``QueryBuilder.land_use_area``."""
+        df = self.df
+        mask = self._mask(states, scenario, year=year) & (df["from_landuse"] == df["to_landuse"])
+        if land_use:
+            mask &= df["from_landuse"] == QueryBuilder._landuse_name(land_use)
+        result = self._aggregate(
+            mask, ["from_landuse", "state_name", "year_range"], {"from_landuse": "landuse_name"}, "total_acres"
+        )
+        return result.sort_values("total_acres", ascending=False)
+
+    def transitions(
+        self,
+        states: list[str],
+        from_use: str | None = None,
+        to_use: str | None = None,
+        year_range: str | None = None,
+        scenario: str | None = None,
+    ) -> pd.DataFrame:
+        """Equivalent of ``QueryBuilder.transitions``."""
+        df = self.df
+        mask = self._mask(states, scenario, year_range=year_range) & (df["transition_type"] == "change")
+        if from_use:
+            mask &= df["from_landuse"] == QueryBuilder._landuse_name(from_use)
+        if to_use:
+            mask &= df["to_landuse"] == QueryBuilder._landuse_name(to_use)
+        result = self._aggregate(mask, ["from_landuse", "to_landuse", "state_name"], {}, "transition_acres")
+        return result.sort_values("transition_acres", ascending=False)
+
+    def urban_expansion(
+        self,
+        states: list[str],
+        year_range: str | None = None,
+        scenario: str | None = None,
+        source_land_use: str | None = None,
+    ) -> pd.DataFrame:
+        """Equivalent of ``QueryBuilder.urban_expansion``."""
+        df = self.df
+        mask = self._mask(states, scenario, year_range=year_range)
+        mask &= (df["to_landuse"] == "Urban") & (df["transition_type"] == "change")
+        if source_land_use:
+            mask &= df["from_landuse"] == QueryBuilder._landuse_name(source_land_use)
+        result = self._aggregate(
+            mask, ["from_landuse", "state_name"], {"from_landuse": "source_landuse"}, "expansion_acres"
+        )
+        return result.sort_values("expansion_acres", ascending=False)
+
+    def forest_loss(
+        self,
+        states: list[str],
+        year_range: str | None = None,
+        scenario: str | None = None,
+    ) -> pd.DataFrame:
+        """Equivalent of ``QueryBuilder.forest_loss``."""
+        df = self.df
+        mask = self._mask(states, scenario, year_range=year_range)
+        mask &= (df["from_landuse"] == "Forest") & (df["transition_type"] == "change")
+        result = self._aggregate(mask, ["to_landuse", "state_name"], {"to_landuse": "to_use"}, "acres")
+        return result.sort_values("acres", ascending=False)
+
+    def forest_gain(
+        self,
+        states: list[str],
+        year_range: str | None = None,
+        scenario: str | None = None,
+    ) -> pd.DataFrame:
+        """Equivalent of ``QueryBuilder.forest_gain``."""
+        df = self.df
+        mask = self._mask(states, scenario, year_range=year_range)
+        mask &= (df["to_landuse"] == "Forest") & (df["transition_type"] == "change")
+        result = self._aggregate(mask, ["from_landuse", "state_name"], {"from_landuse": "from_use"}, "acres")
+        return result.sort_values("acres", ascending=False)
+
+    def agricultural_change(
+        self,
+        states: list[str],
+        ag_type: str | None = None,
+        year_range: str | None = None,
+        scenario: str | None = None,
+    ) -> pd.DataFrame:
+        """Equivalent of ``QueryBuilder.agricultural_change``."""
+        df = self.df
+        mask = self._mask(states, scenario, year_range=year_range)
+        mask &= df["from_landuse"].isin(QueryBuilder._ag_types(ag_type)) & (df["transition_type"] == "change")
+        result = self._aggregate(
+            mask,
+            ["from_landuse", "to_landuse", "state_name"],
+            {"from_landuse": "ag_type", "to_landuse": "to_use"},
+            "acres",
+        )
+        return result.sort_values("acres", ascending=False)
+
+    def state_comparison(
+        self,
+        states: list[str],
+        metric: str,
+        scenario: str | None = None,
+        year: int | None = None,
+    ) -> pd.DataFrame:
+        """Equivalent of ``QueryBuilder.state_comparison``."""
+        df = self.df
+        mask = self._mask(states, scenario, year=year)
+        if metric == "urban_expansion":
+            mask &= (df["to_landuse"] == "Urban") & (df["transition_type"] == "change")
+        elif metric == "forest_loss":
+            mask &= (df["from_landuse"] == "Forest") & (df["transition_type"] == "change")
+        else:  # land_area
+            mask &= df["transition_type"] == "same"
+        result = self._aggregate(mask, ["state_name"], {}, "total_acres")
+        return result.sort_values("total_acres", ascending=False)
+
+    def time_series(
+        self,
+        states: list[str],
+        metric: str,
+        scenario: str | None = None,
+    ) -> pd.DataFrame:
+        """Equivalent of ``QueryBuilder.time_series``."""
+        df = self.df
+        mask = self._mask(states, scenario) & (df["from_landuse"] == df["to_landuse"])
+        landuse_name = QueryBuilder._time_series_landuse(metric)
+        if landuse_name:
+            mask &= df["from_landuse"] == landuse_name
+        result = self._aggregate(mask, ["year_range", "start_year", "end_year"], {}, "total_acres")
+        return result.sort_values("start_year")
@@ -0,0 +1,248 @@
+"""Micro-benchmarks of query overhead and DuckDB runtime profiles in LandUseAPI.
+
+The default benchmark compares, per query shape, the cost of a call that
+compiles its SQL from scratch with one that reuses the SQL text cached for
+its shape, both for building the query alone and end to end.
+
+``--profiles`` instead measures each runtime profile (and DuckDB's defaults):
+sequential query latency, throughput with concurrent cursors, and the time to
+bulk-load and checkpoint a scratch table.
+
+Usage:
+    python -m landuse.api.benchmark --db data/processed/landuse_analytics.duckdb --iterations 200
+    python -m landuse.api.benchmark --db data/processed/landuse_analytics.duckdb --profiles --concurrency 8
+"""
+
+import argparse
+import functools
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import duckdb
+from rich.console import Console
+from rich.table import Table
+
+from landuse.api.expression import clear_plan_cache
+from landuse.api.queries import QueryBuilder
+from landuse.core.app_config import RUNTIME_PROFILES, RuntimeProfile
+
+# Representative tool calls: (QueryBuilder method, keyword arguments)
+BENCHMARK_CALLS: list[tuple[str, dict[str, Any]]] = [
+    ("land_use_area", {"states": ["CA", "TX"], "land_use": "forest"}),
+    ("urban_expansion", {"states": ["CA"], "scenario": "HH"}),
+    ("forest_loss", {"states": ["NC"], "scenario": "LM"}),
+    ("agricultural_change", {"states": ["TX"], "year_range": "2020-2030"}),
+    ("top_counties", {"metric": "urban_growth", "limit": 10, "states": ["CA"]}),
+    ("county_vector", {"metric": "forest_loss", "states": ["NC"], "scenario": "HM"}),
+]
+
+
+@dataclass(frozen=True)
+class OverheadResult:
+    """Mean per-call latency of one query shape, before and after caching."""
+
+    method: str
+    build_us: float
+    cached_build_us: float
+    baseline_us: float
+    compiled_us: float
+    iterations: int
+
+    def reduction(self, optimized_us: float) -> float:
+        """Fraction of per-call time saved relative to the baseline."""
+        return 1 - optimized_us / self.baseline_us if self.baseline_us else 0.0
+
+
+def _mean_us(fn, iterations: int) -> float:
+    """Mean wall time of ``fn`` in microseconds after one warm-up call."""
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def _build_cold(build) -> Any:
+    """Build a query with the plan cache emptied first."""
+    clear_plan_cache()
+    return build()
+
+
+def _build_and_fetch(build, conn: duckdb.DuckDBPyConnection) -> None:
+    """Build a query and fetch its rows."""
+    query = build()
+    conn.execute(query.sql, query.params).fetchall()
+
+
+def benchmark_query_overhead(db_path: str, iterations: int = 200) -> list[OverheadResult]:
+    """
+    Measure per-call overhead for each call in ``BENCHMARK_CALLS``.
+
+    Args:
+        db_path: DuckDB database with the land use star schema
+        iterations: Timed calls per query shape and mode
+
+    Returns:
+        One OverheadResult per query shape
+    """
+    conn = duckdb.connect(db_path, read_only=True)
+    results = []
+    try:
+        for method_name, kwargs in BENCHMARK_CALLS:
+            build_cached = functools.partial(getattr(QueryBuilder, method_name), **kwargs)
+            build = functools.partial(_build_cold, build_cached)
+
+            results.append(
+                OverheadResult(
+                    method=method_name,
+                    build_us=_mean_us(build, iterations * 10),
+                    cached_build_us=_mean_us(build_cached, iterations * 10),
+                    baseline_us=_mean_us(functools.partial(_build_and_fetch, build, conn), iterations),
+                    compiled_us=_mean_us(functools.partial(_build_and_fetch, build_cached, conn), iterations),
+                    iterations=iterations,
+                )
+            )
+    finally:
+        conn.close()
+    return results
+
+
+@dataclass(frozen=True)
+class ProfileResult:
+    """Query latency, concurrent throughput and bulk-load time under one runtime profile."""
+
+    profile: str
+    latency_ms: float
+    throughput_qps: float
+    load_seconds: float
+    concurrency: int
+
+
+def benchmark_runtime_profiles(
+    db_path: str,
+    profiles: Optional[dict[str, RuntimeProfile]] = None,
+    iterations: int = 20,
+    concurrency: int = 8,
+    load_rows: int = 5_000_000,
+) -> list[ProfileResult]:
+    """
+    Measure the effect of each runtime profile on the calls in ``BENCHMARK_CALLS``.
+
+    DuckDB applies one configuration per database file per process, so no
+    other connection to ``db_path`` may be open while this runs.
+
+    Args:
+        db_path: DuckDB database with the land use star schema
+        profiles: Profiles by name (defaults to DuckDB's defaults plus the built-in profiles)
+        iterations: Timed rounds of every query shape, sequentially and per concurrent worker
+        concurrency: Worker threads, each with its own cursor, for the throughput test
+        load_rows: Rows written to a scratch database for the bulk-load test
+
+    Returns:
+        One ProfileResult per profile
+    """
+    if profiles is None:
+        profiles = {"duckdb-default": RuntimeProfile(), **RUNTIME_PROFILES}
+    queries = [getattr(QueryBuilder, method_name)(**kwargs) for method_name, kwargs in BENCHMARK_CALLS]
+
+    def run_all(cursor: duckdb.DuckDBPyConnection) -> None:
+        for query in queries:
+            cursor.execute(query.sql, query.params).fetchall()
+
+    def worker(conn: duckdb.DuckDBPyConnection, _: int) -> None:
+        cursor = conn.cursor()
+        try:
+            for _ in range(iterations):
+                run_all(cursor)
+        finally:
+            cursor.close()
+
+    results = []
+    for name, profile in profiles.items():
+        config = profile.duckdb_config()
+        conn = duckdb.connect(db_path, read_only=True, config=config)
+        try:
+            latency_ms = _mean_us(functools.partial(run_all, conn), iterations) / len(queries) / 1000
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                list(pool.map(functools.partial(worker, conn), range(concurrency)))
+            throughput = concurrency * iterations * len(queries) / (time.perf_counter() - start)
+        finally:
+            conn.close()
+
+        with tempfile.TemporaryDirectory() as scratch:
+            with duckdb.connect(os.path.join(scratch, "load.duckdb"), config=config) as load:
+                start = time.perf_counter()
+                load.execute(
+                    "CREATE TABLE t AS SELECT range AS id, hash(range) % 3000 AS county, random() AS acres "
+                    f"FROM range({int(load_rows)})"
+                )
+                load.execute("CHECKPOINT")
+                load_seconds = time.perf_counter() - start
+
+        results.append(ProfileResult(name, latency_ms, throughput, load_seconds, concurrency))
+    return results
+
+
+def print_profile_results(results: list[ProfileResult], iterations: int) -> None:
+    """Print the runtime profile benchmark as a table."""
+    table = Table(title=f"DuckDB runtime profiles ({iterations} rounds of {len(BENCHMARK_CALLS)} queries)")
+    table.add_column("Profile")
+    table.add_column("Latency (ms/query)", justify="right")
+    table.add_column("Throughput (queries/s)", justify="right")
+    table.add_column("Bulk load (s)", justify="right")
+    for r in results:
+        table.add_row(
+            r.profile,
+            f"{r.latency_ms:,.2f}",
+            f"{r.throughput_qps:,.0f} ({r.concurrency} threads)",
+            f"{r.load_seconds:,.2f}",
+        )
+    Console().print(table)
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--db",
+        default=os.getenv("LANDUSE_DB_PATH", "data/processed/landuse_analytics.duckdb"),
+        help="DuckDB database path",
+    )
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per query shape")
+    parser.add_argument("--profiles", action="store_true", help="Benchmark the DuckDB runtime profiles instead")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent cursors for --profiles")
+    parser.add_argument("--load-rows", type=int, default=5_000_000, help="Rows bulk-loaded per profile for --profiles")
+    args = parser.parse_args()
+
+    if args.profiles:
+        results = benchmark_runtime_profiles(
+            args.db, iterations=args.iterations, concurrency=args.concurrency, load_rows=args.load_rows
+        )
+        print_profile_results(results, args.iterations)
+        return
+
+    results = benchmark_query_overhead(args.db, args.iterations)
+
+    table = Table(title=f"Per-call query overhead ({args.iterations} calls each)")
+    table.add_column("Query")
+    table.add_column("SQL build → cached (µs)", justify="right")
+    table.add_column("Rebuild (µs)", justify="right")
+    table.add_column("Cached SQL (µs)", justify="right")
+    for r in results:
+        table.add_row(
+            r.method,
+            f"{r.build_us:,.1f} → {r.cached_build_us:,.1f}",
+            f"{r.baseline_us:,.0f}",
+            f"{r.compiled_us:,.0f} ({r.reduction(r.compiled_us):.0%} saved)",
+        )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
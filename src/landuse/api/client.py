@@ -11,21 +11,58 @@ Example:
     ...     print(result.to_llm_string())
 """
 
+import bisect
+import functools
+import inspect
 import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable
 
 import duckdb
+import numpy as np
+import pyarrow as pa
 from rich.console import Console
 
+from landuse.connections.disk_cache import DiskQueryCache
+from landuse.connections.metadata import MetadataSnapshot, get_metadata_snapshot
+from landuse.connections.preload import PreloadReport, load_into_memory
+from landuse.connections.query_cache import freeze_frame
+from landuse.connections.registry import DatabaseHandle, get_registry
+from landuse.connections.single_flight import SingleFlight
+from landuse.connections.watchdog import QueryBudget, QueryDeadline
+from landuse.core.app_config import RuntimeProfile, get_runtime_profile
+from landuse.exceptions import CircuitOpenError, QueryTimeoutError
+from landuse.utils.circuit_breaker import CircuitBreaker, get_circuit_breaker
+
+from landuse.api.batch import CUBE_METHODS, BatchRequest, TransitionCube
 from landuse.api.formatters import format_acres, format_percent, format_state_abbrev
+from landuse.api.geography import GeographyResolver
 from landuse.api.models import (
+    AggregateResult,
     AgriculturalChangeResult,
+    APIResult,
+    CountyPageResult,
     CountyResult,
+    CountyVectorResult,
+    CumulativeTransitionResult,
     DataSummaryResult,
     ErrorResult,
+    ExportResult,
     ForestChangeResult,
     LandUseAreaResult,
     RankedCounty,
     ScenarioComparisonResult,
+    ScenarioDiffResult,
+    ScenarioDivergence,
+    SimilarCountiesResult,
+    SimilarCounty,
+    SocioeconomicRecord,
+    SocioeconomicResult,
     StateComparisonResult,
     StateRanking,
     TimeSeriesPoint,
@@ -35,7 +72,98 @@ from landuse.api.models import (
     TransitionsResult,
     UrbanExpansionResult,
 )
-from landuse.api.queries import QueryBuilder, SCENARIO_NAMES
+from landuse.api.pathways import build_transition_chain
+from landuse.api.profiling import QueryProfiler, cost_summary
+from landuse.api.expression import MEASURES, LandUseQuery
+from landuse.api.queries import QueryBuilder, SCENARIO_MAP, SCENARIO_NAMES, SOCIOECONOMIC_METRICS
+from landuse.api.similarity import CountySimilarityIndex
+
+
+EXPORT_FORMATS = ("parquet", "ipc")
+
+# Per-scenario county vectors kept by LandUseAPI for repeated diffs
+COUNTY_VECTOR_CACHE_SIZE = 64
+
+
+def _arrow_reader(result: duckdb.DuckDBPyConnection, batch_size: int) -> pa.RecordBatchReader:
+    """Arrow record batch reader over an executed DuckDB result."""
+    if hasattr(result, "to_arrow_reader"):
+        return result.to_arrow_reader(batch_size)
+    return result.fetch_record_batch(batch_size)
+
+
+def _next_batch(reader: pa.RecordBatchReader) -> pa.RecordBatch | None:
+    """Next batch from ``reader``, or None once it is exhausted."""
+    try:
+        return reader.read_next_batch()
+    except StopIteration:
+        return None
+
+
+def _write_batches(reader: pa.RecordBatchReader, path: str, file_format: str, compression: str | None) -> int:
+    """Write every batch of ``reader`` to a Parquet or Arrow IPC file.
+
+    Returns:
+        Number of rows written
+    """
+    rows = 0
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        with pq.ParquetWriter(path, reader.schema, compression=compression or "none") as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    else:
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, reader.schema, options=options) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    return rows
+
+
+# Errors meaning the database is failing or overloaded, as opposed to a bad request
+DATABASE_FAILURES = (
+    QueryTimeoutError,
+    duckdb.IOException,
+    duckdb.ConnectionException,
+    duckdb.InternalException,
+    duckdb.OutOfMemoryException,
+    duckdb.FatalException,
+)
+
+
+# In-flight queries by (database generation, SQL, parameters), shared by every API instance
+_flights = SingleFlight(share=lambda df: df.copy(deep=False))
+
+
+def _with_cost(method: Callable[..., APIResult]) -> Callable[..., APIResult]:
+    """Attach the profiled query cost of an API call to its result.
+
+    Only the outermost call attaches a summary, so nested calls (e.g.
+    compare_scenarios) report the total cost of all queries they ran.
+    Profiles are collected per thread, so concurrent calls on a shared API
+    each report their own queries. The call runs in a ``_call_scope``.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "LandUseAPI", *args, **kwargs) -> APIResult:
+        if self.profiler is None or getattr(self._local, "call_profiles", None) is not None:
+            with self._call_scope():
+                return method(self, *args, **kwargs)
+
+        profiles = self._local.call_profiles = []
+        try:
+            with self._call_scope():
+                result = method(self, *args, **kwargs)
+        finally:
+            self._local.call_profiles = None
+        if profiles:
+            result = result.model_copy(update={"cost": cost_summary(profiles)})
+        return result
+
+    return wrapper
 
 
 class LandUseAPI:
@@ -58,6 +186,15 @@ class LandUseAPI:
         self,
         db_path: str | None = None,
         verbose: bool = False,
+        query_timeout: float | None = None,
+        profiler: QueryProfiler | None = None,
+        in_memory: bool | None = None,
+        preload_scenarios: list[str] | None = None,
+        preload_columns: dict[str, list[str]] | None = None,
+        max_connections: int | None = None,
+        result_cache: DiskQueryCache | str | None = None,
+        runtime_profile: RuntimeProfile | str | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ):
         """Initialize the API.
 
@@ -65,20 +202,236 @@ class LandUseAPI:
             db_path: Path to DuckDB database. Defaults to LANDUSE_DB_PATH or
                      LANDUSE_DATABASE_PATH environment variable.
             verbose: Enable Rich console output for debugging.
+            query_timeout: Per-query deadline in seconds. Queries running longer
+                           are interrupted and return an ErrorResult with code
+                           TIMEOUT. None disables the deadline.
+            profiler: Enables DuckDB profiling; each result carries a ``cost``
+                      summary and the profiler aggregates a slow-query report.
+            in_memory: Copy the database into memory on first use so queries
+                       never wait on disk. Defaults to the
+                       LANDUSE_DATABASE__IN_MEMORY environment variable.
+            preload_scenarios: Scenario codes (e.g. ["HH", "LM"]) or "RCP/SSP"
+                               pairs to keep in memory; None keeps all scenarios.
+            preload_columns: Per-table column subsets to keep in memory.
+            max_connections: Maximum cursors open at once on the database,
+                             shared by every API instance using it. Defaults
+                             to LANDUSE_DATABASE__MAX_CONNECTIONS or 10.
+            result_cache: Persistent result cache (or the path of its SQLite
+                          file) shared by every process and kept across
+                          restarts, so a new worker answers repeated queries
+                          without running them. Only used for database files
+                          read from disk. Defaults to
+                          LANDUSE_DATABASE__RESULT_CACHE_PATH, if set.
+            runtime_profile: DuckDB runtime settings, or the name of a built-in
+                             profile ("api-low-latency", "api-high-concurrency").
+                             DuckDB applies one configuration per database file
+                             per process, so every connection to the file must
+                             use the same profile. Defaults to the
+                             LANDUSE_RUNTIME__PROFILE environment variable.
+            circuit_breaker: Breaker that fails queries fast with an
+                             UNAVAILABLE ErrorResult while the database keeps
+                             failing (I/O errors, timeouts). Defaults to one
+                             shared by every API instance on the same file.
         """
         self.db_path = db_path or os.getenv(
             "LANDUSE_DATABASE_PATH",
             os.getenv("LANDUSE_DB_PATH", "data/processed/landuse_analytics.duckdb"),
         )
         self._conn: duckdb.DuckDBPyConnection | None = None
+        self._db: DatabaseHandle | None = None
+        self._conn_thread: int | None = None
+        self._conn_epoch = 0
+        self._local = threading.local()
+        if max_connections is None:
+            max_connections = int(os.getenv("LANDUSE_DATABASE__MAX_CONNECTIONS", "10"))
+        self.max_connections = max_connections
+        if result_cache is None:
+            result_cache = os.getenv("LANDUSE_DATABASE__RESULT_CACHE_PATH") or None
+        if isinstance(result_cache, str):
+            max_mb = int(os.getenv("LANDUSE_DATABASE__RESULT_CACHE_MB", "1024"))
+            result_cache = DiskQueryCache(result_cache, max_bytes=max_mb * 1024**2)
+        self.result_cache = result_cache
+        if runtime_profile is None:
+            runtime_profile = os.getenv("LANDUSE_RUNTIME__PROFILE") or None
+        self.runtime_profile = get_runtime_profile(runtime_profile)
+        if circuit_breaker is None:
+            circuit_breaker = get_circuit_breaker(
+                f"duckdb:{os.path.abspath(self.db_path)}", failure_exceptions=DATABASE_FAILURES
+            )
+        self.circuit_breaker = circuit_breaker
+        self._geography: GeographyResolver | None = None
+        self._geography_token: str | None = None
         self._console = Console() if verbose else None
+        self.query_timeout = query_timeout
+        self.profiler = profiler
+        self._profiled_conns: weakref.WeakSet = weakref.WeakSet()
+        if in_memory is None:
+            in_memory = os.getenv("LANDUSE_DATABASE__IN_MEMORY", "").lower() in ("1", "true", "yes")
+        self.in_memory = in_memory
+        self.preload_scenarios = preload_scenarios
+        self.preload_columns = preload_columns
+        self.preload_report: PreloadReport | None = None
+        self._preloaded_metadata: MetadataSnapshot | None = None
+        self._county_vectors: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._county_vectors_lock = threading.Lock()
+        self._similarity: CountySimilarityIndex | None = None
+        self._similarity_token: str | None = None
 
     def _get_conn(self) -> duckdb.DuckDBPyConnection:
-        """Get or create database connection."""
+        """Get or create the calling thread's database connection.
+
+        The database is shared through the connection registry. The thread
+        that opened it uses ``_conn`` (replaced when the registry reopens a
+        rebuilt database file); other threads get their own cursor so
+        concurrent calls neither serialize nor interrupt each other. Inside
+        an API call (see ``_call_scope``) that cursor is leased from the pool
+        and returned when the call ends, so idle threads do not hold cursors.
+        """
         if self._conn is None:
-            self._conn = duckdb.connect(self.db_path, read_only=True)
+            registry = get_registry()
+            config = self.runtime_profile.duckdb_config() if self.runtime_profile else None
+            if self.in_memory:
+                conn, self.preload_report = load_into_memory(
+                    self.db_path,
+                    scenarios=self._preload_scenario_names(),
+                    columns=self.preload_columns,
+                    config=config,
+                )
+                self._log(self.preload_report.summary())
+                self._db = registry.adopt(conn, self.max_connections)
+            else:
+                self._db = registry.open(self.db_path, read_only=True, config=config, max_cursors=self.max_connections)
+            self._conn = self._db.cursor()
+            self._conn_thread = threading.get_ident()
+            self._conn_epoch = self._db.database.epoch
+        if self._db is None:
+            return self._conn
+        if threading.get_ident() != self._conn_thread:
+            leases = getattr(self._local, "leases", None)
+            if leases is None:
+                return self._db.cursor()
+            cursor = self._local.cursor
+            if cursor is None or self._local.epoch != self._db.database.epoch:
+                self._local.epoch = self._db.database.epoch
+                cursor = self._local.cursor = leases.enter_context(self._db.lease())
+            return cursor
+        database = self._db.database
+        database.check()
+        if self._conn_epoch != database.epoch:
+            self._conn = self._db.cursor()
+            self._conn_epoch = database.epoch
         return self._conn
 
+    @contextmanager
+    def _call_scope(self) -> Iterator[None]:
+        """Return the cursor this thread leases during an API call to the pool when the call ends.
+
+        Nested calls share the outermost call's cursor.
+        """
+        if getattr(self._local, "leases", None) is not None:
+            yield
+            return
+        with ExitStack() as leases:
+            self._local.leases, self._local.cursor = leases, None
+            try:
+                yield
+            finally:
+                self._local.leases = self._local.cursor = None
+
+    def _generation_token(self) -> str | None:
+        """Token identifying the database generation; part of every cache key."""
+        self._get_conn()
+        return self._db.generation().token if self._db is not None else None
+
+    def _preload_scenario_names(self) -> list[str] | None:
+        """Translate preload scenario codes to the "RCP/SSP" pairs used by the loader."""
+        if not self.preload_scenarios:
+            return None
+        names = []
+        for scenario in self.preload_scenarios:
+            pair = QueryBuilder._scenario_pair(scenario)
+            names.append(f"{pair[0]}/{pair[1]}" if pair else scenario)
+        return names
+
+    def _metadata(self) -> MetadataSnapshot:
+        """Metadata snapshot: shared per file, or built once for a preloaded copy."""
+        conn = self._get_conn()
+        if self.preload_report is None:
+            return get_metadata_snapshot(conn, self.db_path, self._db.generation().identity)
+        if self._preloaded_metadata is None:
+            self._preloaded_metadata = MetadataSnapshot.build(conn)
+        return self._preloaded_metadata
+
+    def _get_geography(self) -> GeographyResolver:
+        """Get or build the in-memory geography resolver (one dim_geography scan)."""
+        token = self._generation_token()
+        if self._geography is None or self._geography_token != token:
+            self._geography = GeographyResolver.from_connection(self._get_conn())
+            self._geography_token = token
+        return self._geography
+
+    def _execute(self, sql: str, params: list | None = None, description: str = "query"):
+        """Execute a query under the configured deadline and return a DataFrame.
+
+        Results are read from and stored in ``result_cache`` when one is set.
+        A query identical to one already running on the same database (from
+        any thread or API instance) waits for that execution, at most
+        ``query_timeout`` seconds, and shares its result, returned as a
+        read-only view. With a profiler every query runs, so each call's cost
+        covers the queries it asked for.
+
+        Raises:
+            QueryTimeoutError: If the query exceeds ``query_timeout``
+        """
+        self._get_conn()
+        token = self._db.generation().token if self._db is not None else None
+        if token is None or self.profiler is not None:
+            return self._run_query(sql, params, description)
+        timeout = self.query_timeout if self.query_timeout and self.query_timeout > 0 else None
+        try:
+            return _flights.do(
+                (token, sql, tuple(params or ())), self._run_shared_query, sql, params, description, timeout=timeout
+            )
+        except TimeoutError as e:
+            raise QueryTimeoutError(
+                f"Query exceeded the {timeout:g}s execution limit while waiting for an identical query",
+                query=sql,
+                timeout=timeout,
+            ) from e
+
+    def _run_shared_query(self, sql: str, params: list | None, description: str):
+        """``_run_query`` with its result frozen, so concurrent callers can share it."""
+        return freeze_frame(self._run_query(sql, params, description))
+
+    def _run_query(self, sql: str, params: list | None, description: str):
+        """Answer a query from ``result_cache`` or by executing it."""
+        conn = self._get_conn()
+        result_key = None
+        if self.result_cache is not None and self.preload_report is None and self._db is not None:
+            token = self._db.generation().token
+            result_key = (sql, tuple(params or ()))
+            df = self.result_cache.get(token, result_key)
+            if df is not None:
+                return df
+
+        if self.profiler is not None and conn not in self._profiled_conns:
+            self.profiler.enable(conn)
+            self._profiled_conns.add(conn)
+
+        start = time.perf_counter()
+        with self.circuit_breaker.guard(), QueryDeadline(conn, self.query_timeout, sql):
+            df = conn.execute(sql, params or []).df()
+
+        if self.profiler is not None:
+            wall_ms = (time.perf_counter() - start) * 1000
+            profile = self.profiler.record(conn, sql, description, wall_ms, len(df))
+            call_profiles = getattr(self._local, "call_profiles", None)
+            if profile is not None and call_profiles is not None:
+                call_profiles.append(profile)
+        if result_key is not None:
+            self.result_cache.set(token, result_key, df)
+        return df
+
     def _log(self, message: str, style: str = "green") -> None:
         """Log to console if verbose mode is enabled."""
         if self._console:
@@ -98,6 +451,19 @@ class LandUseAPI:
             suggestion=suggestion,
         )
 
+    def _database_error(self, error: Exception) -> ErrorResult:
+        """Convert a query exception into an ErrorResult."""
+        if isinstance(error, QueryTimeoutError):
+            return self._error(
+                error.message,
+                "TIMEOUT",
+                "Narrow the query with state, scenario or time period filters",
+            )
+        if isinstance(error, CircuitOpenError):
+            return self._error(error.message, "UNAVAILABLE", f"Retry in {error.retry_after:.0f} seconds")
+        return self._error(str(error), "DATABASE_ERROR")
+
+    @_with_cost
     def get_land_use_area(
         self,
         states: list[str],
@@ -120,36 +486,46 @@ class LandUseAPI:
             query = QueryBuilder.land_use_area(states, land_use, year, scenario)
             self._log(f"Executing: {query.description}")
 
-            conn = self._get_conn()
-            df = conn.execute(query.sql, query.params).df()
+            df = self._execute(query.sql, query.params, query.description)
+            return self._land_use_area_result(df, states, land_use, year, scenario)
 
-            if df.empty:
-                return self._error(
-                    "No data found for the specified filters",
-                    "NO_DATA",
-                    "Try broadening your query filters or check state codes",
-                )
-
-            total = float(df["total_acres"].sum())
-            by_land_use = df.groupby("landuse_name")["total_acres"].sum().to_dict()
-            by_state = df.groupby("state_name")["total_acres"].sum().to_dict()
+        except Exception as e:
+            return self._database_error(e)
 
-            return LandUseAreaResult(
-                total_acres=total,
-                total_formatted=format_acres(total),
-                by_land_use={k: format_acres(v) for k, v in by_land_use.items()},
-                by_state={k: format_acres(v) for k, v in by_state.items()},
-                filters={
-                    "states": states,
-                    "land_use": land_use,
-                    "year": year,
-                    "scenario": scenario,
-                },
+    def _land_use_area_result(
+        self,
+        df,
+        states: list[str],
+        land_use: str | None,
+        year: int | None,
+        scenario: str | None,
+    ) -> LandUseAreaResult | ErrorResult:
+        """Build a LandUseAreaResult from land use area rows."""
+        if df.empty:
+            return self._error(
+                "No data found for the specified filters",
+                "NO_DATA",
+                "Try broadening your query filters or check state codes",
             )
 
-        except Exception as e:
-            return self._error(str(e), "DATABASE_ERROR")
+        total = float(df["total_acres"].sum())
+        by_land_use = df.groupby("landuse_name")["total_acres"].sum().to_dict()
+        by_state = df.groupby("state_name")["total_acres"].sum().to_dict()
+
+        return LandUseAreaResult(
+            total_acres=total,
+            total_formatted=format_acres(total),
+            by_land_use={k: format_acres(v) for k, v in by_land_use.items()},
+            by_state={k: format_acres(v) for k, v in by_state.items()},
+            filters={
+                "states": states,
+                "land_use": land_use,
+                "year": year,
+                "scenario": scenario,
+            },
+        )
 
+    @_with_cost
     def get_transitions(
         self,
         states: list[str],
@@ -174,45 +550,56 @@ class LandUseAPI:
             query = QueryBuilder.transitions(states, from_use, to_use, year_range, scenario)
             self._log(f"Executing: {query.description}")
 
-            conn = self._get_conn()
-            df = conn.execute(query.sql, query.params).df()
+            df = self._execute(query.sql, query.params, query.description)
+            return self._transitions_result(df, states, from_use, to_use, year_range, scenario)
 
-            if df.empty:
-                return self._error(
-                    "No transitions found for the specified filters",
-                    "NO_DATA",
-                    "Try broadening your query filters",
-                )
+        except Exception as e:
+            return self._database_error(e)
 
-            total = float(df["transition_acres"].sum())
-            transitions = []
-            grouped = df.groupby(["from_landuse", "to_landuse"])["transition_acres"].sum()
-            for (from_lu, to_lu), acres in grouped.sort_values(ascending=False).head(20).items():
-                transitions.append(
-                    TransitionRecord(
-                        from_use=from_lu,
-                        to_use=to_lu,
-                        acres=float(acres),
-                        formatted=format_acres(acres),
-                    )
-                )
+    def _transitions_result(
+        self,
+        df,
+        states: list[str],
+        from_use: str | None,
+        to_use: str | None,
+        year_range: str | None,
+        scenario: str | None,
+    ) -> TransitionsResult | ErrorResult:
+        """Build a TransitionsResult from transition rows."""
+        if df.empty:
+            return self._error(
+                "No transitions found for the specified filters",
+                "NO_DATA",
+                "Try broadening your query filters",
+            )
 
-            return TransitionsResult(
-                total_acres=total,
-                total_formatted=format_acres(total),
-                transitions=transitions,
-                filters={
-                    "states": states,
-                    "from_use": from_use,
-                    "to_use": to_use,
-                    "year_range": year_range,
-                    "scenario": scenario,
-                },
+        total = float(df["transition_acres"].sum())
+        transitions = []
+        grouped = df.groupby(["from_landuse", "to_landuse"])["transition_acres"].sum()
+        for (from_lu, to_lu), acres in grouped.sort_values(ascending=False).head(20).items():
+            transitions.append(
+                TransitionRecord(
+                    from_use=from_lu,
+                    to_use=to_lu,
+                    acres=float(acres),
+                    formatted=format_acres(acres),
+                )
             )
 
-        except Exception as e:
-            return self._error(str(e), "DATABASE_ERROR")
+        return TransitionsResult(
+            total_acres=total,
+            total_formatted=format_acres(total),
+            transitions=transitions,
+            filters={
+                "states": states,
+                "from_use": from_use,
+                "to_use": to_use,
+                "year_range": year_range,
+                "scenario": scenario,
+            },
+        )
 
+    @_with_cost
     def get_urban_expansion(
         self,
         states: list[str],
@@ -235,36 +622,46 @@ class LandUseAPI:
             query = QueryBuilder.urban_expansion(states, year_range, scenario, source_land_use)
             self._log(f"Executing: {query.description}")
 
-            conn = self._get_conn()
-            df = conn.execute(query.sql, query.params).df()
+            df = self._execute(query.sql, query.params, query.description)
+            return self._urban_expansion_result(df, states, year_range, scenario, source_land_use)
 
-            if df.empty:
-                return self._error(
-                    "No urban expansion data found",
-                    "NO_DATA",
-                    "Try different filters or check state codes",
-                )
-
-            total = float(df["expansion_acres"].sum())
-            by_source = df.groupby("source_landuse")["expansion_acres"].sum().to_dict()
-            by_state = df.groupby("state_name")["expansion_acres"].sum().to_dict()
+        except Exception as e:
+            return self._database_error(e)
 
-            return UrbanExpansionResult(
-                total_acres=total,
-                total_formatted=format_acres(total),
-                by_source={k: format_acres(v) for k, v in by_source.items()},
-                by_state={k: format_acres(v) for k, v in by_state.items()},
-                filters={
-                    "states": states,
-                    "year_range": year_range,
-                    "scenario": scenario,
-                    "source_land_use": source_land_use,
-                },
+    def _urban_expansion_result(
+        self,
+        df,
+        states: list[str],
+        year_range: str | None,
+        scenario: str | None,
+        source_land_use: str | None,
+    ) -> UrbanExpansionResult | ErrorResult:
+        """Build an UrbanExpansionResult from urban expansion rows."""
+        if df.empty:
+            return self._error(
+                "No urban expansion data found",
+                "NO_DATA",
+                "Try different filters or check state codes",
             )
 
-        except Exception as e:
-            return self._error(str(e), "DATABASE_ERROR")
+        total = float(df["expansion_acres"].sum())
+        by_source = df.groupby("source_landuse")["expansion_acres"].sum().to_dict()
+        by_state = df.groupby("state_name")["expansion_acres"].sum().to_dict()
+
+        return UrbanExpansionResult(
+            total_acres=total,
+            total_formatted=format_acres(total),
+            by_source={k: format_acres(v) for k, v in by_source.items()},
+            by_state={k: format_acres(v) for k, v in by_state.items()},
+            filters={
+                "states": states,
+                "year_range": year_range,
+                "scenario": scenario,
+                "source_land_use": source_land_use,
+            },
+        )
 
+    @_with_cost
     def get_forest_change(
         self,
         states: list[str],
@@ -284,58 +681,69 @@ class LandUseAPI:
             ForestChangeResult with forest change data or ErrorResult on failure
         """
         try:
-            conn = self._get_conn()
-
             # Query forest loss
             loss_query = QueryBuilder.forest_loss(states, year_range, scenario)
-            loss_df = conn.execute(loss_query.sql, loss_query.params).df()
+            loss_df = self._execute(loss_query.sql, loss_query.params, loss_query.description)
 
             # Query forest gain
             gain_query = QueryBuilder.forest_gain(states, year_range, scenario)
-            gain_df = conn.execute(gain_query.sql, gain_query.params).df()
-
-            total_loss = float(loss_df["acres"].sum()) if not loss_df.empty else 0.0
-            total_gain = float(gain_df["acres"].sum()) if not gain_df.empty else 0.0
-            net_change = total_gain - total_loss
-
-            # Build result based on change_type
-            result_data: dict = {
-                "filters": {
-                    "states": states,
-                    "year_range": year_range,
-                    "scenario": scenario,
-                    "change_type": change_type,
-                },
-            }
-
-            if change_type in ("loss", "net"):
-                result_data["loss_acres"] = total_loss
-                result_data["loss_formatted"] = format_acres(total_loss)
-                if not loss_df.empty:
-                    loss_by_dest = loss_df.groupby("to_use")["acres"].sum().to_dict()
-                    result_data["loss_by_destination"] = {
-                        k: format_acres(v) for k, v in loss_by_dest.items()
-                    }
-
-            if change_type in ("gain", "net"):
-                result_data["gain_acres"] = total_gain
-                result_data["gain_formatted"] = format_acres(total_gain)
-                if not gain_df.empty:
-                    gain_by_src = gain_df.groupby("from_use")["acres"].sum().to_dict()
-                    result_data["gain_by_source"] = {
-                        k: format_acres(v) for k, v in gain_by_src.items()
-                    }
-
-            if change_type == "net":
-                result_data["net_acres"] = abs(net_change)
-                result_data["net_formatted"] = format_acres(abs(net_change))
-                result_data["net_direction"] = "gain" if net_change > 0 else "loss"
+            gain_df = self._execute(gain_query.sql, gain_query.params, gain_query.description)
 
-            return ForestChangeResult(**result_data)
+            return self._forest_change_result(loss_df, gain_df, states, year_range, scenario, change_type)
 
         except Exception as e:
-            return self._error(str(e), "DATABASE_ERROR")
+            return self._database_error(e)
 
+    def _forest_change_result(
+        self,
+        loss_df,
+        gain_df,
+        states: list[str],
+        year_range: str | None,
+        scenario: str | None,
+        change_type: str,
+    ) -> ForestChangeResult:
+        """Build a ForestChangeResult from forest loss and gain rows."""
+        total_loss = float(loss_df["acres"].sum()) if not loss_df.empty else 0.0
+        total_gain = float(gain_df["acres"].sum()) if not gain_df.empty else 0.0
+        net_change = total_gain - total_loss
+
+        # Build result based on change_type
+        result_data: dict = {
+            "filters": {
+                "states": states,
+                "year_range": year_range,
+                "scenario": scenario,
+                "change_type": change_type,
+            },
+        }
+
+        if change_type in ("loss", "net"):
+            result_data["loss_acres"] = total_loss
+            result_data["loss_formatted"] = format_acres(total_loss)
+            if not loss_df.empty:
+                loss_by_dest = loss_df.groupby("to_use")["acres"].sum().to_dict()
+                result_data["loss_by_destination"] = {
+                    k: format_acres(v) for k, v in loss_by_dest.items()
+                }
+
+        if change_type in ("gain", "net"):
+            result_data["gain_acres"] = total_gain
+            result_data["gain_formatted"] = format_acres(total_gain)
+            if not gain_df.empty:
+                gain_by_src = gain_df.groupby("from_use")["acres"].sum().to_dict()
+                result_data["gain_by_source"] = {
+                    k: format_acres(v) for k, v in gain_by_src.items()
+                }
+
+        if change_type == "net":
+            result_data["net_acres"] = abs(net_change)
+            result_data["net_formatted"] = format_acres(abs(net_change))
+            result_data["net_direction"] = "gain" if net_change > 0 else "loss"
+
+        return ForestChangeResult(**result_data)
+
+    @_with_cost
     def get_agricultural_change(
         self,
         states: list[str],
@@ -358,38 +766,48 @@ class LandUseAPI:
             query = QueryBuilder.agricultural_change(states, ag_type, year_range, scenario)
             self._log(f"Executing: {query.description}")
 
-            conn = self._get_conn()
-            df = conn.execute(query.sql, query.params).df()
+            df = self._execute(query.sql, query.params, query.description)
+            return self._agricultural_change_result(df, states, ag_type, year_range, scenario)
 
-            if df.empty:
-                return self._error(
-                    "No agricultural change data found",
-                    "NO_DATA",
-                    "Try broadening your query filters",
-                )
+        except Exception as e:
+            return self._database_error(e)
 
-            total_loss = float(df["acres"].sum())
-            by_ag_type = df.groupby("ag_type")["acres"].sum().to_dict()
-            by_destination = df.groupby("to_use")["acres"].sum().to_dict()
-            by_state = df.groupby("state_name")["acres"].sum().to_dict()
-
-            return AgriculturalChangeResult(
-                total_loss_acres=total_loss,
-                total_loss_formatted=format_acres(total_loss),
-                by_ag_type={k: format_acres(v) for k, v in by_ag_type.items()},
-                by_destination={k: format_acres(v) for k, v in by_destination.items()},
-                by_state={k: format_acres(v) for k, v in by_state.items()},
-                filters={
-                    "states": states,
-                    "ag_type": ag_type,
-                    "year_range": year_range,
-                    "scenario": scenario,
-                },
+    def _agricultural_change_result(
+        self,
+        df,
+        states: list[str],
+        ag_type: str | None,
+        year_range: str | None,
+        scenario: str | None,
+    ) -> AgriculturalChangeResult | ErrorResult:
+        """Build an AgriculturalChangeResult from agricultural change rows."""
+        if df.empty:
+            return self._error(
+                "No agricultural change data found",
+                "NO_DATA",
+                "Try broadening your query filters",
             )
 
-        except Exception as e:
-            return self._error(str(e), "DATABASE_ERROR")
+        total_loss = float(df["acres"].sum())
+        by_ag_type = df.groupby("ag_type")["acres"].sum().to_dict()
+        by_destination = df.groupby("to_use")["acres"].sum().to_dict()
+        by_state = df.groupby("state_name")["acres"].sum().to_dict()
+
+        return AgriculturalChangeResult(
+            total_loss_acres=total_loss,
+            total_loss_formatted=format_acres(total_loss),
+            by_ag_type={k: format_acres(v) for k, v in by_ag_type.items()},
+            by_destination={k: format_acres(v) for k, v in by_destination.items()},
+            by_state={k: format_acres(v) for k, v in by_state.items()},
+            filters={
+                "states": states,
+                "ag_type": ag_type,
+                "year_range": year_range,
+                "scenario": scenario,
+            },
+        )
 
+    @_with_cost
     def compare_scenarios(
         self,
         states: list[str],
@@ -407,62 +825,79 @@ class LandUseAPI:
             ScenarioComparisonResult with comparison data or ErrorResult on failure
         """
         try:
-            if not scenarios:
-                scenarios = ["LM", "HM", "HL", "HH"]
-
-            results: dict[str, dict] = {}
-
-            for scenario in scenarios:
-                scenario_upper = scenario.upper()
-                if metric == "urban_expansion":
-                    data = self.get_urban_expansion(states, scenario=scenario_upper)
-                    if data.success:
-                        results[scenario_upper] = {
-                            "name": SCENARIO_NAMES.get(scenario_upper, scenario_upper),
-                            "acres": data.total_acres,
-                            "formatted": data.total_formatted,
-                        }
-                elif metric == "forest_loss":
-                    data = self.get_forest_change(states, scenario=scenario_upper, change_type="loss")
-                    if data.success and data.loss_acres is not None:
-                        results[scenario_upper] = {
-                            "name": SCENARIO_NAMES.get(scenario_upper, scenario_upper),
-                            "acres": data.loss_acres,
-                            "formatted": data.loss_formatted,
-                        }
-                elif metric == "ag_loss":
-                    data = self.get_agricultural_change(states, scenario=scenario_upper)
-                    if data.success:
-                        results[scenario_upper] = {
-                            "name": SCENARIO_NAMES.get(scenario_upper, scenario_upper),
-                            "acres": data.total_loss_acres,
-                            "formatted": data.total_loss_formatted,
-                        }
-
-            if not results:
-                return self._error(
-                    "No comparison data found",
-                    "NO_DATA",
-                    "Check that the metric is valid and states have data",
-                )
-
-            # Sort by acres descending
-            sorted_results = dict(
-                sorted(results.items(), key=lambda x: x[1]["acres"], reverse=True)
+            return self._compare_scenarios_result(
+                states, metric, scenarios, lambda method, **kwargs: getattr(self, method)(**kwargs)
             )
-            keys = list(sorted_results.keys())
 
-            return ScenarioComparisonResult(
-                metric=metric,
-                comparison=sorted_results,
-                highest=keys[0] if keys else None,
-                lowest=keys[-1] if keys else None,
-                filters={"states": states, "scenarios": scenarios},
+        except Exception as e:
+            return self._database_error(e)
+
+    def _compare_scenarios_result(
+        self,
+        states: list[str],
+        metric: str,
+        scenarios: list[str] | None,
+        run: Callable[..., APIResult],
+    ) -> ScenarioComparisonResult | ErrorResult:
+        """Build a ScenarioComparisonResult, evaluating per-scenario queries with ``run``.
+
+        Args:
+            run: Callable taking an API method name and keyword arguments
+        """
+        if not scenarios:
+            scenarios = ["LM", "HM", "HL", "HH"]
+
+        results: dict[str, dict] = {}
+
+        for scenario in scenarios:
+            scenario_upper = scenario.upper()
+            if metric == "urban_expansion":
+                data = run("get_urban_expansion", states=states, scenario=scenario_upper)
+                if data.success:
+                    results[scenario_upper] = {
+                        "name": SCENARIO_NAMES.get(scenario_upper, scenario_upper),
+                        "acres": data.total_acres,
+                        "formatted": data.total_formatted,
+                    }
+            elif metric == "forest_loss":
+                data = run("get_forest_change", states=states, scenario=scenario_upper, change_type="loss")
+                if data.success and data.loss_acres is not None:
+                    results[scenario_upper] = {
+                        "name": SCENARIO_NAMES.get(scenario_upper, scenario_upper),
+                        "acres": data.loss_acres,
+                        "formatted": data.loss_formatted,
+                    }
+            elif metric == "ag_loss":
+                data = run("get_agricultural_change", states=states, scenario=scenario_upper)
+                if data.success:
+                    results[scenario_upper] = {
+                        "name": SCENARIO_NAMES.get(scenario_upper, scenario_upper),
+                        "acres": data.total_loss_acres,
+                        "formatted": data.total_loss_formatted,
+                    }
+
+        if not results:
+            return self._error(
+                "No comparison data found",
+                "NO_DATA",
+                "Check that the metric is valid and states have data",
             )
 
-        except Exception as e:
-            return self._error(str(e), "DATABASE_ERROR")
+        # Sort by acres descending
+        sorted_results = dict(
+            sorted(results.items(), key=lambda x: x[1]["acres"], reverse=True)
+        )
+        keys = list(sorted_results.keys())
+
+        return ScenarioComparisonResult(
+            metric=metric,
+            comparison=sorted_results,
+            highest=keys[0] if keys else None,
+            lowest=keys[-1] if keys else None,
+            filters={"states": states, "scenarios": scenarios},
+        )
 
+    @_with_cost
     def compare_states(
         self,
         states: list[str],
@@ -485,41 +920,51 @@ class LandUseAPI:
             query = QueryBuilder.state_comparison(states, metric, scenario, year)
             self._log(f"Executing: {query.description}")
 
-            conn = self._get_conn()
-            df = conn.execute(query.sql, query.params).df()
+            df = self._execute(query.sql, query.params, query.description)
+            return self._compare_states_result(df, states, metric, scenario, year)
 
-            if df.empty:
-                return self._error(
-                    "No comparison data found",
-                    "NO_DATA",
-                    "Check state codes and metric name",
-                )
+        except Exception as e:
+            return self._database_error(e)
 
-            rankings = []
-            for _, row in df.iterrows():
-                state_name = row["state_name"]
-                rankings.append(
-                    StateRanking(
-                        state=state_name,
-                        state_abbrev=format_state_abbrev(state_name),
-                        acres=float(row["total_acres"]),
-                        formatted=format_acres(row["total_acres"]),
-                    )
-                )
+    def _compare_states_result(
+        self,
+        df,
+        states: list[str],
+        metric: str,
+        scenario: str | None,
+        year: int | None,
+    ) -> StateComparisonResult | ErrorResult:
+        """Build a StateComparisonResult from per-state totals."""
+        if df.empty:
+            return self._error(
+                "No comparison data found",
+                "NO_DATA",
+                "Check state codes and metric name",
+            )
 
-            return StateComparisonResult(
-                metric=metric,
-                rankings=rankings,
-                filters={
-                    "states": states,
-                    "scenario": scenario,
-                    "year": year,
-                },
+        rankings = []
+        for _, row in df.iterrows():
+            state_name = row["state_name"]
+            rankings.append(
+                StateRanking(
+                    state=state_name,
+                    state_abbrev=format_state_abbrev(state_name),
+                    acres=float(row["total_acres"]),
+                    formatted=format_acres(row["total_acres"]),
+                )
             )
 
-        except Exception as e:
-            return self._error(str(e), "DATABASE_ERROR")
+        return StateComparisonResult(
+            metric=metric,
+            rankings=rankings,
+            filters={
+                "states": states,
+                "scenario": scenario,
+                "year": year,
+            },
+        )
 
+    @_with_cost
     def get_time_series(
         self,
         states: list[str],
@@ -540,57 +985,66 @@ class LandUseAPI:
             query = QueryBuilder.time_series(states, metric, scenario)
             self._log(f"Executing: {query.description}")
 
-            conn = self._get_conn()
-            df = conn.execute(query.sql, query.params).df()
+            df = self._execute(query.sql, query.params, query.description)
+            return self._time_series_result(df, states, metric, scenario)
 
-            if df.empty:
-                return self._error(
-                    "No time series data found",
-                    "NO_DATA",
-                    "Check state codes and metric name",
-                )
+        except Exception as e:
+            return self._database_error(e)
 
-            data_points = []
-            for _, row in df.iterrows():
-                data_points.append(
-                    TimeSeriesPoint(
-                        period=row["year_range"],
-                        start_year=int(row["start_year"]),
-                        end_year=int(row["end_year"]),
-                        acres=float(row["total_acres"]),
-                        formatted=format_acres(row["total_acres"]),
-                    )
-                )
+    def _time_series_result(
+        self,
+        df,
+        states: list[str],
+        metric: str,
+        scenario: str | None,
+    ) -> TimeSeriesResult | ErrorResult:
+        """Build a TimeSeriesResult with trend analysis from per-period totals."""
+        if df.empty:
+            return self._error(
+                "No time series data found",
+                "NO_DATA",
+                "Check state codes and metric name",
+            )
 
-            # Calculate trend
-            trend_direction = None
-            trend_change_acres = None
-            trend_change_percent = None
-
-            if len(data_points) >= 2:
-                first = data_points[0].acres
-                last = data_points[-1].acres
-                change = last - first
-                pct_change = (change / first * 100) if first > 0 else 0
-                trend_direction = "increasing" if change > 0 else "decreasing"
-                trend_change_acres = format_acres(abs(change))
-                trend_change_percent = format_percent(abs(pct_change))
-
-            return TimeSeriesResult(
-                metric=metric,
-                data_points=data_points,
-                trend_direction=trend_direction,
-                trend_change_acres=trend_change_acres,
-                trend_change_percent=trend_change_percent,
-                filters={
-                    "states": states,
-                    "scenario": scenario,
-                },
+        data_points = []
+        for _, row in df.iterrows():
+            data_points.append(
+                TimeSeriesPoint(
+                    period=row["year_range"],
+                    start_year=int(row["start_year"]),
+                    end_year=int(row["end_year"]),
+                    acres=float(row["total_acres"]),
+                    formatted=format_acres(row["total_acres"]),
+                )
             )
 
-        except Exception as e:
-            return self._error(str(e), "DATABASE_ERROR")
+        # Calculate trend
+        trend_direction = None
+        trend_change_acres = None
+        trend_change_percent = None
+
+        if len(data_points) >= 2:
+            first = data_points[0].acres
+            last = data_points[-1].acres
+            change = last - first
+            pct_change = (change / first * 100) if first > 0 else 0
+            trend_direction = "increasing" if change > 0 else "decreasing"
+            trend_change_acres = format_acres(abs(change))
+            trend_change_percent = format_percent(abs(pct_change))
+
+        return TimeSeriesResult(
+            metric=metric,
+            data_points=data_points,
+            trend_direction=trend_direction,
+            trend_change_acres=trend_change_acres,
+            trend_change_percent=trend_change_percent,
+            filters={
+                "states": states,
+                "scenario": scenario,
+            },
+        )
 
+    @_with_cost
     def get_county_data(
         self,
         state: str,
@@ -602,7 +1056,7 @@ class LandUseAPI:
 
         Args:
             state: State abbreviation
-            county: County name (partial match supported)
+            county: County name (partial and misspelled names supported)
             year: Year filter
             scenario: Scenario code
 
@@ -610,27 +1064,23 @@ class LandUseAPI:
             CountyResult with county data or ErrorResult on failure
         """
         try:
-            conn = self._get_conn()
-
-            # Look up the county
-            lookup_query = QueryBuilder.county_lookup(state, county)
-            county_df = conn.execute(lookup_query.sql, lookup_query.params).df()
+            # Resolve the county in memory (no SQL round trip)
+            match = self._get_geography().find_county(state, county)
 
-            if county_df.empty:
+            if match is None:
                 return self._error(
                     f"County '{county}' not found in {state}",
                     "NOT_FOUND",
                     "Check the county name spelling",
                 )
 
-            geo_id = int(county_df["geography_id"].iloc[0])
-            county_name = county_df["county_name"].iloc[0]
-            state_name = county_df["state_name"].iloc[0]
-            fips = county_df["fips_code"].iloc[0]
+            county_name = match.county_name
+            state_name = match.state_name
+            fips = match.fips_code
 
             # Query county area
-            area_query = QueryBuilder.county_area(geo_id, year, scenario)
-            df = conn.execute(area_query.sql, area_query.params).df()
+            area_query = QueryBuilder.county_area(match.geography_id, year, scenario)
+            df = self._execute(area_query.sql, area_query.params, area_query.description)
 
             if df.empty:
                 return self._error(
@@ -656,8 +1106,9 @@ class LandUseAPI:
             )
 
         except Exception as e:
-            return self._error(str(e), "DATABASE_ERROR")
+            return self._database_error(e)
 
+    @_with_cost
     def get_top_counties(
         self,
         metric: str,
@@ -680,8 +1131,7 @@ class LandUseAPI:
             query = QueryBuilder.top_counties(metric, limit, states, scenario)
             self._log(f"Executing: {query.description}")
 
-            conn = self._get_conn()
-            df = conn.execute(query.sql, query.params).df()
+            df = self._execute(query.sql, query.params, query.description)
 
             if df.empty:
                 return self._error(
@@ -690,18 +1140,19 @@ class LandUseAPI:
                     "Try a different metric or remove state filters",
                 )
 
-            counties = []
-            for i, (_, row) in enumerate(df.iterrows()):
-                counties.append(
-                    RankedCounty(
-                        rank=i + 1,
-                        county=row["county_name"],
-                        state=row["state_name"],
-                        fips=row["fips_code"],
-                        acres=float(row["total_acres"]),
-                        formatted=format_acres(row["total_acres"]),
-                    )
+            counties = [
+                RankedCounty(
+                    rank=i + 1,
+                    county=county_name,
+                    state=state_name,
+                    fips=fips_code,
+                    acres=float(total_acres),
+                    formatted=format_acres(total_acres),
+                )
+                for i, (county_name, state_name, fips_code, total_acres) in enumerate(
+                    df[["county_name", "state_name", "fips_code", "total_acres"]].itertuples(index=False, name=None)
                 )
+            ]
 
             return TopCountiesResult(
                 metric=metric,
@@ -714,8 +1165,718 @@ class LandUseAPI:
             )
 
         except Exception as e:
-            return self._error(str(e), "DATABASE_ERROR")
+            return self._database_error(e)
 
+    @_with_cost
+    def get_county_page(
+        self,
+        metric: str = "land_area",
+        states: list[str] | None = None,
+        scenarios: list[str] | None = None,
+        cursor: str | None = None,
+        page_counties: int = 100,
+    ) -> CountyPageResult | ErrorResult:
+        """Fetch one page of county x scenario x period rows.
+
+        Pages hold every row for up to ``page_counties`` counties in FIPS
+        order. Pass ``next_cursor`` from the previous page to continue.
+
+        Args:
+            metric: land_area, urban_expansion or forest_loss
+            states: Optional state filter
+            scenarios: Optional scenario codes (None for all scenarios)
+            cursor: ``next_cursor`` of the previous page (None for the first page)
+            page_counties: Number of counties per page
+
+        Returns:
+            CountyPageResult with rows as tuples or ErrorResult on failure
+        """
+        try:
+            query = QueryBuilder.county_export(metric, states, scenarios, cursor, page_counties)
+            self._log(f"Executing: {query.description} after {cursor or 'start'}")
+            df = self._execute(query.sql, query.params, query.description)
+
+            # Cursor comes from the in-memory county index, so counties without
+            # matching rows still advance the page
+            state_names = set(QueryBuilder._state_names(states))
+            fips_codes = sorted(
+                c.fips_code for c in self._get_geography().counties if not state_names or c.state_name in state_names
+            )
+            start = bisect.bisect_right(fips_codes, cursor) if cursor else 0
+            page = fips_codes[start : start + page_counties]
+            has_more = start + page_counties < len(fips_codes)
+
+            return CountyPageResult(
+                metric=metric,
+                columns=list(df.columns),
+                rows=list(df.itertuples(index=False, name=None)),
+                county_count=int(df["fips_code"].nunique()),
+                next_cursor=page[-1] if page and has_more else None,
+                filters={"states": states, "scenarios": scenarios, "cursor": cursor},
+            )
+
+        except ValueError as e:
+            return self._error(str(e), "INVALID_REQUEST", "Use land_area, urban_expansion or forest_loss")
+        except Exception as e:
+            return self._database_error(e)
+
+    @_with_cost
+    def get_county_vector(
+        self,
+        metric: str = "urban_expansion",
+        states: list[str] | None = None,
+        scenario: str | None = None,
+        year_range: str | None = None,
+        land_use: str | None = None,
+    ) -> CountyVectorResult | ErrorResult:
+        """Get one value per county as a dense array in FIPS order, for choropleth maps.
+
+        A single grouped query returns a value per geography_id, which is
+        scattered into the canonical FIPS-sorted county order with one numpy
+        index operation. The all-county vector is cached per metric, scenario
+        and period, and the state filter is applied as a mask. Every call
+        returns arrays of the same length and order, so results can be joined
+        to county shapes once and reused.
+
+        Args:
+            metric: urban_expansion, forest_loss, forest_gain, forest_net,
+                    ag_loss or land_area
+            states: Optional state filter (other counties are NaN)
+            scenario: Optional scenario code (LM, HM, HL, HH)
+            year_range: Optional time period (e.g. "2020-2030")
+            land_use: Land use for ``land_area`` (None for all land)
+
+        Returns:
+            CountyVectorResult with ``fips`` and ``values`` arrays or ErrorResult on failure
+        """
+        try:
+            geography = self._get_geography()
+            values = self._county_values(metric, scenario, year_range, land_use).copy()
+            values[~self._county_mask(geography, states)] = np.nan
+
+            return CountyVectorResult(
+                metric=metric,
+                fips=geography.fips_order,
+                values=values,
+                filters={"states": states, "scenario": scenario, "year_range": year_range, "land_use": land_use},
+            )
+
+        except ValueError as e:
+            return self._error(str(e), "INVALID_REQUEST", "Use one of: " + ", ".join(MEASURES))
+        except Exception as e:
+            return self._database_error(e)
+
+    @staticmethod
+    def _county_mask(geography: GeographyResolver, states: list[str] | None) -> np.ndarray:
+        """Boolean mask over the FIPS order selecting counties in ``states`` (all if None)."""
+        if not states:
+            return np.ones(len(geography.fips_order), dtype=bool)
+        mask = np.zeros(len(geography.fips_order), dtype=bool)
+        ids = np.concatenate([geography.state_geography_ids(state) for state in states])
+        mask[geography.fips_positions(ids)] = True
+        return mask
+
+    def _county_values(
+        self,
+        metric: str,
+        scenario: str | None = None,
+        year_range: str | None = None,
+        land_use: str | None = None,
+    ) -> np.ndarray:
+        """Cached metric value for every county in FIPS order (0 where no rows).
+
+        Vectors are computed for all counties, so later calls with any state
+        filter or scenario pairing reuse them. Callers must not modify the
+        returned array.
+
+        Raises:
+            ValueError: If the metric is unknown
+        """
+        key = (self._generation_token(), metric, scenario.upper() if scenario else None, year_range, land_use)
+        with self._county_vectors_lock:
+            values = self._county_vectors.get(key)
+            if values is not None:
+                self._county_vectors.move_to_end(key)
+                return values
+
+        query = QueryBuilder.county_vector(metric, None, scenario, year_range, land_use)
+        self._log(f"Executing: {query.description}")
+        df = self._execute(query.sql, query.params, query.description)
+
+        geography = self._get_geography()
+        values = np.zeros(len(geography.fips_order))
+        positions = geography.fips_positions(df["geography_id"].to_numpy())
+        found = positions >= 0
+        values[positions[found]] = df["value"].to_numpy(dtype=np.float64)[found]
+
+        with self._county_vectors_lock:
+            self._county_vectors[key] = values
+            if len(self._county_vectors) > COUNTY_VECTOR_CACHE_SIZE:
+                self._county_vectors.popitem(last=False)
+        return values
+
+    @_with_cost
+    def get_scenario_diff(
+        self,
+        metric: str = "urban_expansion",
+        scenario_a: str = "LM",
+        scenario_b: str = "HH",
+        level: str = "county",
+        top_k: int = 10,
+        states: list[str] | None = None,
+        year_range: str | None = None,
+        land_use: str | None = None,
+    ) -> ScenarioDiffResult | ErrorResult:
+        """Get where two scenarios diverge most for a metric, per county or state.
+
+        Each scenario's county vector is computed once (and cached), so the
+        difference for every county is a single array subtraction. The top-k
+        increases and decreases are found with ``np.argpartition``, which
+        selects k of n areas in linear time before sorting only those k.
+
+        Args:
+            metric: urban_expansion, forest_loss, forest_gain, forest_net,
+                    ag_loss or land_area
+            scenario_a: Baseline scenario code (LM, HM, HL, HH)
+            scenario_b: Compared scenario code; differences are ``b - a``
+            level: "county" or "state"
+            top_k: Number of largest increases and decreases to return
+            states: Optional state filter
+            year_range: Optional time period (e.g. "2020-2030")
+            land_use: Land use for ``land_area`` (None for all land)
+
+        Returns:
+            ScenarioDiffResult with per-area values and top divergences or ErrorResult on failure
+        """
+        for scenario in (scenario_a, scenario_b):
+            if not scenario or scenario.upper() not in SCENARIO_MAP:
+                return self._error(
+                    f"Unknown scenario '{scenario}'", "INVALID_REQUEST", "Use one of: " + ", ".join(SCENARIO_MAP)
+                )
+        if level not in ("county", "state"):
+            return self._error(f"Unknown level '{level}'", "INVALID_REQUEST", "Use county or state")
+        if top_k < 1:
+            return self._error("top_k must be at least 1", "INVALID_REQUEST")
+
+        try:
+            geography = self._get_geography()
+            values_a = self._county_values(metric, scenario_a, year_range, land_use)
+            values_b = self._county_values(metric, scenario_b, year_range, land_use)
+
+            selected = self._county_mask(geography, states)
+
+            if level == "state":
+                keys, inverse = np.unique(geography.fips_states[selected], return_inverse=True)
+                values_a = np.bincount(inverse, weights=values_a[selected], minlength=len(keys))
+                values_b = np.bincount(inverse, weights=values_b[selected], minlength=len(keys))
+                names = keys
+            else:
+                keys = geography.fips_order[selected]
+                values_a, values_b = values_a[selected], values_b[selected]
+                names = None
+
+            difference = values_b - values_a
+            increases = self._divergences(difference, top_k, keys, names, values_a, values_b, geography)
+            decreases = self._divergences(-difference, top_k, keys, names, values_a, values_b, geography)
+
+            return ScenarioDiffResult(
+                metric=metric,
+                scenario_a=scenario_a.upper(),
+                scenario_b=scenario_b.upper(),
+                level=level,
+                keys=keys,
+                values_a=values_a,
+                values_b=values_b,
+                increases=increases,
+                decreases=decreases,
+                filters={"states": states, "year_range": year_range, "land_use": land_use},
+            )
+
+        except ValueError as e:
+            return self._error(str(e), "INVALID_REQUEST", "Use one of: " + ", ".join(MEASURES))
+        except Exception as e:
+            return self._database_error(e)
+
+    @staticmethod
+    def _divergences(
+        score: np.ndarray,
+        top_k: int,
+        keys: np.ndarray,
+        names: np.ndarray | None,
+        values_a: np.ndarray,
+        values_b: np.ndarray,
+        geography: GeographyResolver,
+    ) -> list[ScenarioDivergence]:
+        """Areas with the ``top_k`` largest positive ``score``, largest first."""
+        if top_k < len(score):
+            candidates = np.argpartition(score, -top_k)[-top_k:]
+        else:
+            candidates = np.arange(len(score))
+        candidates = candidates[score[candidates] > 0]
+        ordered = candidates[np.argsort(-score[candidates], kind="stable")]
+
+        divergences = []
+        for rank, i in enumerate(ordered, 1):
+            if names is not None:
+                name = str(names[i])
+            else:
+                county = geography.county_by_fips(keys[i])
+                name = f"{county.county_name}, {format_state_abbrev(county.state_name)}" if county else keys[i]
+            divergences.append(
+                ScenarioDivergence(
+                    rank=rank,
+                    key=str(keys[i]),
+                    name=name,
+                    value_a=float(values_a[i]),
+                    value_b=float(values_b[i]),
+                    difference=float(values_b[i] - values_a[i]),
+                )
+            )
+        return divergences
+
+    @_with_cost
+    def get_socioeconomic_metric(
+        self,
+        metric: str = "population_density",
+        states: list[str] | None = None,
+        scenario: str = "HM",
+        year: int = 2070,
+        limit: int = 20,
+        ascending: bool = False,
+    ) -> SocioeconomicResult | ErrorResult:
+        """Rank counties by a per-capita or density metric under an SSP scenario.
+
+        Reads the precomputed ``fact_county_socioeconomic`` table built by
+        ``SocioeconomicLoader``, so no joins run at query time.
+
+        Args:
+            metric: population, income_per_capita, population_density,
+                    urban_acres_per_capita, forest_acres_per_capita or
+                    urban_acres_per_new_resident
+            states: Optional state filter
+            scenario: Scenario code (LM, HM, HL, HH)
+            year: Period end year (e.g. 2030, 2070)
+            limit: Number of counties to return
+            ascending: Rank lowest values first
+
+        Returns:
+            SocioeconomicResult with ranked counties or ErrorResult on failure
+        """
+        try:
+            query = QueryBuilder.county_socioeconomic(metric, states, scenario, year, limit, ascending)
+            self._log(f"Executing: {query.description}")
+            df = self._execute(query.sql, query.params, query.description)
+
+            counties = [
+                SocioeconomicRecord(
+                    rank=rank,
+                    county=row.county_name,
+                    state=row.state_name,
+                    fips=row.fips_code,
+                    value=float(row.value),
+                )
+                for rank, row in enumerate(df.itertuples(index=False), 1)
+            ]
+            return SocioeconomicResult(
+                metric=metric,
+                unit=SOCIOECONOMIC_METRICS[metric][1],
+                scenario=scenario.upper(),
+                year=year,
+                counties=counties,
+                filters={"states": states, "ascending": ascending},
+            )
+
+        except ValueError as e:
+            return self._error(str(e), "INVALID_REQUEST")
+        except duckdb.CatalogException:
+            return self._error(
+                "Socioeconomic projections are not loaded in this database",
+                "NO_DATA",
+                "Load them with landuse.converters.socioeconomic_loader.SocioeconomicLoader",
+            )
+        except Exception as e:
+            return self._database_error(e)
+
+    def _get_similarity_index(self) -> CountySimilarityIndex:
+        """Build the county similarity index on first use (and again after a database rebuild)."""
+        token = self._generation_token()
+        if self._similarity is None or self._similarity_token != token:
+            query = QueryBuilder.county_land_trajectories()
+            self._log(f"Executing: {query.description}")
+            df = self._execute(query.sql, query.params, query.description)
+            geography = self._get_geography()
+            self._similarity = CountySimilarityIndex.from_frame(
+                df, geography.fips_order, geography.fips_positions(df["geography_id"].to_numpy())
+            )
+            self._similarity_token = token
+        return self._similarity
+
+    @_with_cost
+    def find_similar_counties(
+        self,
+        state: str,
+        county: str,
+        k: int = 10,
+        states: list[str] | None = None,
+        region: str | None = None,
+    ) -> SimilarCountiesResult | ErrorResult:
+        """Find counties whose land use trajectories look most like a given county.
+
+        Trajectories are land use shares at the end of every period under
+        every scenario. The index is built with one query on first use;
+        each search is then a matrix-vector product over all counties.
+
+        Args:
+            state: State of the target county
+            county: Target county name or FIPS code
+            k: Number of similar counties to return
+            states: Optional state filter for candidates
+            region: Optional region filter for candidates
+
+        Returns:
+            SimilarCountiesResult ranked by cosine similarity or ErrorResult on failure
+        """
+        if k < 1:
+            return self._error("k must be at least 1", "INVALID_REQUEST")
+        try:
+            geography = self._get_geography()
+            match = geography.find_county(state, county)
+            if match is None:
+                return self._error(
+                    f"County '{county}' not found in {state}",
+                    "NOT_FOUND",
+                    "Check the county name spelling",
+                )
+            if region and not geography.region_states(region):
+                return self._error(
+                    f"Unknown region '{region}'", "INVALID_REQUEST", "Use one of: " + ", ".join(geography.regions)
+                )
+
+            index = self._get_similarity_index()
+            mask = self._county_mask(geography, states)
+            if region:
+                mask &= np.isin(geography.fips_states, geography.region_states(region))
+            target = int(geography.fips_positions(np.array([match.geography_id]))[0])
+            positions, scores = index.neighbors(target, k, mask)
+
+            counties = []
+            for rank, (position, score) in enumerate(zip(positions, scores), 1):
+                neighbor = geography.county_by_fips(index.fips[position])
+                counties.append(
+                    SimilarCounty(
+                        rank=rank,
+                        county=neighbor.county_name,
+                        state=neighbor.state_name,
+                        fips=neighbor.fips_code,
+                        similarity=round(float(score), 6),
+                    )
+                )
+
+            return SimilarCountiesResult(
+                county=match.county_name,
+                state=match.state_name,
+                fips=match.fips_code,
+                counties=counties,
+                filters={"states": states, "region": region},
+            )
+
+        except Exception as e:
+            return self._database_error(e)
+
+    @_with_cost
+    def get_cumulative_transitions(
+        self,
+        scenario: str = "HM",
+        start_year: int = 2020,
+        end_year: int = 2070,
+        level: str = "county",
+        states: list[str] | None = None,
+    ) -> CumulativeTransitionResult | ErrorResult:
+        """Get cumulative transition matrices chained over every period in a span.
+
+        One query returns the per-period from/to acres of all counties; they
+        are scattered into a (counties, periods, K, K) array, row-normalized
+        and chained for all counties at once with batched matrix products.
+        State and region results sum county flows, so larger areas weight
+        counties by their land.
+
+        Args:
+            scenario: Scenario code (LM, HM, HL, HH)
+            start_year: Start of the first chained period
+            end_year: End of the last chained period
+            level: "county" (FIPS order), "state" or "region"
+            states: Optional state filter
+
+        Returns:
+            CumulativeTransitionResult with one matrix per area or ErrorResult on failure
+        """
+        if level not in ("county", "state", "region"):
+            return self._error(f"Unknown level '{level}'", "INVALID_REQUEST", "Use county, state or region")
+        try:
+            query = QueryBuilder.county_transition_matrices(scenario, start_year, end_year, states)
+            self._log(f"Executing: {query.description}")
+            df = self._execute(query.sql, query.params, query.description)
+            if df.empty:
+                return self._error(
+                    f"No transitions between {start_year} and {end_year}",
+                    "NO_DATA",
+                    "Check the years against get_data_summary()",
+                )
+
+            geography = self._get_geography()
+            chain = build_transition_chain(
+                df, geography.fips_order, geography.fips_positions(df["geography_id"].to_numpy())
+            )
+            if level == "state":
+                chain = chain.aggregate(geography.fips_states)
+            elif level == "region":
+                chain = chain.aggregate(geography.fips_regions)
+            # Drop areas without land in the filtered rows
+            chain = chain.select(chain.start_acres.sum(axis=1) > 0)
+
+            return CumulativeTransitionResult(
+                scenario=scenario.upper(),
+                level=level,
+                start_year=chain.periods[0][0],
+                end_year=chain.periods[-1][1],
+                keys=chain.keys,
+                land_uses=list(chain.land_uses),
+                matrices=chain.cumulative,
+                start_acres=chain.start_acres,
+                end_acres=chain.end_acres,
+            )
+
+        except ValueError as e:
+            return self._error(str(e), "INVALID_REQUEST", "Use one of: LM, HM, HL, HH")
+        except Exception as e:
+            return self._database_error(e)
+
+    @_with_cost
+    def aggregate(self, query: LandUseQuery) -> AggregateResult | ErrorResult:
+        """Run a composed LandUseQuery as one SQL statement.
+
+        Args:
+            query: Query built with LandUseQuery(...).where(...).group_by(...)
+
+        Returns:
+            AggregateResult with column names and row tuples or ErrorResult on failure
+        """
+        try:
+            compiled = query.compile()
+            self._log(f"Executing: {compiled.description}")
+            df = self._execute(compiled.sql, compiled.params, compiled.description)
+            return AggregateResult(
+                description=compiled.description,
+                columns=list(df.columns),
+                rows=list(df.itertuples(index=False, name=None)),
+            )
+        except Exception as e:
+            return self._database_error(e)
+
+    def iter_county_batches(
+        self,
+        metric: str = "land_area",
+        states: list[str] | None = None,
+        scenarios: list[str] | None = None,
+        batch_size: int = 10_000,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream county x scenario x period rows as Arrow record batches.
+
+        Rows arrive in FIPS order on a dedicated cursor, so memory stays
+        bounded by ``batch_size`` and other API calls can run meanwhile.
+        Unlike the query methods this raises on failure, since errors can
+        occur mid-stream.
+
+        Args:
+            metric: land_area, urban_expansion or forest_loss
+            states: Optional state filter
+            scenarios: Optional scenario codes (None for all scenarios)
+            batch_size: Rows per record batch
+
+        Yields:
+            pyarrow.RecordBatch
+
+        Raises:
+            ValueError: If the metric is unknown
+            QueryTimeoutError: If the query exceeds ``query_timeout``
+        """
+        query = QueryBuilder.county_export(metric, states, scenarios)
+        yield from self._stream(query.sql, query.params, _next_batch, lambda result: _arrow_reader(result, batch_size))
+
+    def iter_county_rows(
+        self,
+        metric: str = "land_area",
+        states: list[str] | None = None,
+        scenarios: list[str] | None = None,
+        chunk_size: int = 10_000,
+    ) -> Iterator[list[tuple]]:
+        """Stream county x scenario x period rows as chunks of plain tuples.
+
+        Tuple fields follow ``COUNTY_EXPORT_COLUMNS``. See
+        ``iter_county_batches`` for streaming and error semantics.
+
+        Args:
+            metric: land_area, urban_expansion or forest_loss
+            states: Optional state filter
+            scenarios: Optional scenario codes (None for all scenarios)
+            chunk_size: Rows per chunk
+
+        Yields:
+            Lists of up to ``chunk_size`` row tuples
+        """
+        query = QueryBuilder.county_export(metric, states, scenarios)
+        yield from self._stream(query.sql, query.params, lambda result: result.fetchmany(chunk_size) or None)
+
+    def _stream(
+        self,
+        sql: str,
+        params: list,
+        fetch: Callable[[Any], Any],
+        open_result: Callable[[duckdb.DuckDBPyConnection], Any] | None = None,
+    ) -> Iterator[Any]:
+        """Execute ``sql`` on a pooled cursor and yield ``fetch(result)`` until it returns None.
+
+        The deadline and circuit breaker are armed around DuckDB's work only
+        (the execute and each fetch), never while the consumer holds a chunk,
+        so a slow consumer neither times out nor trips the breaker.
+        ``query_timeout`` bounds the total time spent in DuckDB. The cursor
+        returns to the pool when the consumer finishes or closes the stream.
+        """
+        self._get_conn()
+        with self._db.lease() as cursor:
+            budget = QueryBudget(cursor, self.query_timeout, sql)
+            with self.circuit_breaker.guard(), budget.step():
+                result = cursor.execute(sql, params)
+                if open_result is not None:
+                    result = open_result(result)
+            while True:
+                with self.circuit_breaker.guard(), budget.step():
+                    chunk = fetch(result)
+                if chunk is None:
+                    return
+                yield chunk
+
+    def export_table(
+        self,
+        states: list[str] | None = None,
+        scenarios: list[str] | None = None,
+        rcp: str | None = None,
+        from_use: str | None = None,
+        to_use: str | None = None,
+        year_range: str | None = None,
+        transition_type: str | None = None,
+    ) -> pa.Table:
+        """Export county-level transition rows as a pyarrow Table.
+
+        Columns follow ``TRANSITIONS_EXPORT_COLUMNS``. DuckDB hands the result
+        over in Arrow format directly, with no DataFrame or model per row.
+        Like the streaming methods this raises on failure.
+
+        Args:
+            states: Optional state filter
+            scenarios: Optional scenario codes (None for all scenarios)
+            rcp: Optional climate pathway filter (e.g. "RCP85")
+            from_use: Source land use filter
+            to_use: Destination land use filter
+            year_range: Time period filter (e.g. "2020-2030")
+            transition_type: "change" or "same" (None for both)
+
+        Returns:
+            pyarrow.Table
+
+        Raises:
+            QueryTimeoutError: If the export exceeds ``query_timeout``
+        """
+        query = QueryBuilder.transitions_export(states, scenarios, rcp, from_use, to_use, year_range, transition_type)
+        self._log(f"Executing: {query.description}")
+        self._get_conn()
+        with self._db.lease() as cursor:
+            with self.circuit_breaker.guard(), QueryDeadline(cursor, self.query_timeout, query.sql):
+                result = cursor.execute(query.sql, query.params)
+                return result.to_arrow_table() if hasattr(result, "to_arrow_table") else result.fetch_arrow_table()
+
+    def export_file(
+        self,
+        path: str | os.PathLike,
+        file_format: str = "parquet",
+        states: list[str] | None = None,
+        scenarios: list[str] | None = None,
+        rcp: str | None = None,
+        from_use: str | None = None,
+        to_use: str | None = None,
+        year_range: str | None = None,
+        transition_type: str | None = None,
+        compression: str | None = "zstd",
+        batch_size: int = 100_000,
+    ) -> ExportResult | ErrorResult:
+        """Write county-level transition rows to a Parquet or Arrow IPC file.
+
+        Record batches stream from DuckDB straight into the file writer, so
+        memory stays bounded by ``batch_size`` regardless of export size. The
+        file is written next to ``path`` and renamed into place on success.
+
+        Args:
+            path: Destination file
+            file_format: "parquet" or "ipc" (Arrow IPC file, aka Feather v2)
+            states: Optional state filter
+            scenarios: Optional scenario codes (None for all scenarios)
+            rcp: Optional climate pathway filter (e.g. "RCP85")
+            from_use: Source land use filter
+            to_use: Destination land use filter
+            year_range: Time period filter (e.g. "2020-2030")
+            transition_type: "change" or "same" (None for both)
+            compression: Codec for the file (None for uncompressed)
+            batch_size: Rows per record batch
+
+        Returns:
+            ExportResult with the row count and file size or ErrorResult on failure
+        """
+        file_format = file_format.lower()
+        if file_format not in EXPORT_FORMATS:
+            return self._error(
+                f"Unknown export format: {file_format}",
+                "INVALID_REQUEST",
+                f"Use one of: {', '.join(EXPORT_FORMATS)}",
+            )
+
+        path = os.fspath(path)
+        partial = f"{path}.partial"
+        query = QueryBuilder.transitions_export(states, scenarios, rcp, from_use, to_use, year_range, transition_type)
+        self._log(f"Executing: {query.description} to {path}")
+        self._get_conn()
+        with self._db.lease() as cursor:
+            try:
+                with self.circuit_breaker.guard(), QueryDeadline(cursor, self.query_timeout, query.sql):
+                    reader = _arrow_reader(cursor.execute(query.sql, query.params), batch_size)
+                    rows = _write_batches(reader, partial, file_format, compression)
+                os.replace(partial, path)
+
+                return ExportResult(
+                    path=path,
+                    file_format=file_format,
+                    rows=rows,
+                    bytes_written=os.path.getsize(path),
+                    columns=list(reader.schema.names),
+                    filters={
+                        "states": states,
+                        "scenarios": scenarios,
+                        "rcp": rcp,
+                        "from_use": from_use,
+                        "to_use": to_use,
+                        "year_range": year_range,
+                        "transition_type": transition_type,
+                    },
+                )
+
+            except OSError as e:
+                return self._error(str(e), "EXPORT_ERROR", "Check that the destination directory exists and is writable")
+            except Exception as e:
+                return self._database_error(e)
+            finally:
+                if os.path.exists(partial):
+                    os.remove(partial)
+
+    @_with_cost
     def get_data_summary(self) -> DataSummaryResult | ErrorResult:
         """Get summary statistics about available data.
 
@@ -723,47 +1884,154 @@ class LandUseAPI:
             DataSummaryResult with coverage information or ErrorResult on failure
         """
         try:
-            conn = self._get_conn()
-
-            # Get counts and ranges
-            summary_query = QueryBuilder.data_summary()
-            summary_df = conn.execute(summary_query.sql, summary_query.params).df()
-
-            fact_count = int(summary_df["fact_count"].iloc[0])
-            county_count = int(summary_df["county_count"].iloc[0])
-            state_count = int(summary_df["state_count"].iloc[0])
-            min_year = int(summary_df["min_year"].iloc[0])
-            max_year = int(summary_df["max_year"].iloc[0])
-
-            # Get scenarios
-            scenarios_df = conn.execute(
-                "SELECT DISTINCT rcp_scenario || '/' || ssp_scenario as scenario FROM dim_scenario ORDER BY scenario"
-            ).df()
-            scenarios = scenarios_df["scenario"].tolist()
-
-            # Get land use types
-            landuse_df = conn.execute(
-                "SELECT landuse_name FROM dim_landuse ORDER BY landuse_name"
-            ).df()
-            land_use_types = landuse_df["landuse_name"].tolist()
+            # Served from the per-file metadata snapshot after the first call
+            snapshot = self._metadata()
+            if not snapshot.has_star_schema:
+                return self._error(
+                    "Database does not contain the land use star schema",
+                    "DATABASE_ERROR",
+                    "Check the database path",
+                )
 
             return DataSummaryResult(
-                total_records=fact_count,
-                counties=county_count,
-                states=state_count,
-                time_range=(min_year, max_year),
-                scenarios=scenarios,
-                land_use_types=land_use_types,
+                total_records=snapshot.fact_count,
+                counties=snapshot.county_count,
+                states=snapshot.state_count,
+                time_range=(snapshot.min_year, snapshot.max_year),
+                scenarios=list(snapshot.scenarios),
+                land_use_types=list(snapshot.land_use_types),
             )
 
         except Exception as e:
-            return self._error(str(e), "DATABASE_ERROR")
+            return self._database_error(e)
+
+    def batch(self, requests: list[dict[str, Any] | tuple[str, dict[str, Any]]]) -> list[APIResult]:
+        """Evaluate several API requests with the fewest SQL statements.
+
+        Requests for state-level methods (area, transitions, urban expansion,
+        forest and agricultural change, scenario/state comparisons, time
+        series) are answered from one shared scan of the fact table grouped by
+        state, scenario, period and land use. County-level and summary
+        requests run individually. Results match the individual method calls.
+
+        Args:
+            requests: Requests as ``{"method": "get_urban_expansion", "args": {...}}``
+                      dicts or ``("get_urban_expansion", {...})`` pairs
+
+        Returns:
+            One result per request, in request order. Malformed requests yield
+            an ErrorResult with code INVALID_REQUEST.
+
+        Example:
+            >>> results = api.batch([
+            ...     {"method": "get_urban_expansion", "args": {"states": ["CA"]}},
+            ...     {"method": "get_forest_change", "args": {"states": ["CA"]}},
+            ... ])
+        """
+        with self._call_scope():
+            return self._batch(requests)
+
+    def _batch(self, requests: list[dict[str, Any] | tuple[str, dict[str, Any]]]) -> list[APIResult]:
+        parsed: list[BatchRequest | ErrorResult] = []
+        for request in requests:
+            try:
+                batch_request = BatchRequest.parse(request)
+                bound = inspect.signature(getattr(self, batch_request.method)).bind(**batch_request.args)
+                bound.apply_defaults()
+                batch_request.args = dict(bound.arguments)
+                parsed.append(batch_request)
+            except (TypeError, ValueError) as e:
+                parsed.append(
+                    self._error(str(e), "INVALID_REQUEST", "Use {'method': <API method>, 'args': {...}}")
+                )
+
+        cube_requests = [r for r in parsed if isinstance(r, BatchRequest) and r.method in CUBE_METHODS]
+        cube: TransitionCube | None = None
+        cube_error: ErrorResult | None = None
+        if len(cube_requests) > 1:
+            try:
+                cube = self._load_transition_cube(cube_requests)
+            except Exception as e:
+                cube_error = self._database_error(e)
+
+        results: list[APIResult] = []
+        for request in parsed:
+            if isinstance(request, ErrorResult):
+                results.append(request)
+            elif request.method in CUBE_METHODS and cube_error is not None:
+                results.append(cube_error)
+            elif request.method in CUBE_METHODS and cube is not None:
+                results.append(self._from_cube(cube, request.method, request.args))
+            else:
+                results.append(getattr(self, request.method)(**request.args))
+        return results
+
+    def _load_transition_cube(self, requests: list[BatchRequest]) -> TransitionCube:
+        """Run one shared scan covering the states and scenarios of ``requests``."""
+        states: list[str] | None = []
+        scenarios: list[str] | None = []
+        for request in requests:
+            request_states = request.states()
+            request_scenarios = request.scenarios()
+            states = None if states is None or request_states is None else states + request_states
+            scenarios = None if scenarios is None or request_scenarios is None else scenarios + request_scenarios
+
+        query = QueryBuilder.transition_cube(
+            sorted(set(states)) if states else None,
+            sorted(set(scenarios)) if scenarios else None,
+        )
+        self._log(f"Executing: {query.description} for {len(requests)} requests")
+        df = self._execute(query.sql, query.params, query.description)
+        return TransitionCube(df)
+
+    def _from_cube(self, cube: TransitionCube, method: str, args: dict[str, Any]) -> APIResult:
+        """Answer a cube-compatible request from a loaded transition cube."""
+        try:
+            if method == "get_land_use_area":
+                return self._land_use_area_result(cube.land_use_area(**args), **args)
+            if method == "get_transitions":
+                return self._transitions_result(cube.transitions(**args), **args)
+            if method == "get_urban_expansion":
+                return self._urban_expansion_result(cube.urban_expansion(**args), **args)
+            if method == "get_forest_change":
+                filters = {k: args[k] for k in ("states", "year_range", "scenario")}
+                return self._forest_change_result(cube.forest_loss(**filters), cube.forest_gain(**filters), **args)
+            if method == "get_agricultural_change":
+                return self._agricultural_change_result(cube.agricultural_change(**args), **args)
+            if method == "compare_states":
+                return self._compare_states_result(cube.state_comparison(**args), **args)
+            if method == "get_time_series":
+                return self._time_series_result(cube.time_series(**args), **args)
+            if method == "compare_scenarios":
+                return self._compare_scenarios_result(
+                    **args, run=lambda name, **kwargs: self._from_cube(cube, name, self._with_defaults(name, kwargs))
+                )
+            raise ValueError(f"Method '{method}' cannot be answered from the transition cube")
+
+        except Exception as e:
+            return self._database_error(e)
+
+    def _with_defaults(self, method: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Bind ``kwargs`` to an API method's signature, filling in defaults."""
+        bound = inspect.signature(getattr(self, method)).bind(**kwargs)
+        bound.apply_defaults()
+        return dict(bound.arguments)
 
     def close(self) -> None:
         """Close database connection."""
-        if self._conn:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        elif self._conn:
             self._conn.close()
-            self._conn = None
+        self._conn = None
+        self._conn_thread = None
+        self._geography = None
+        self._profiled_conns = weakref.WeakSet()
+        self._preloaded_metadata = None
+        with self._county_vectors_lock:
+            self._county_vectors.clear()
+        self._similarity = None
 
     def __enter__(self) -> "LandUseAPI":
         """Context manager entry."""
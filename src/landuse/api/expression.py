@@ -0,0 +1,349 @@
+"""Composable lazy queries over the land use star schema.
+
+``LandUseQuery`` describes an aggregate over ``fact_landuse_transitions`` as
+data: filters on scenario, time, geography and land use, a measure, group-by
+dimensions and an optional top-k. Nothing touches the database until the
+query is compiled to a single SQL statement:
+
+- filters are pushed down to the fact table's foreign keys as semi-joins on
+  the (small) dimension tables, so the fact scan is pruned before any join
+- only dimensions needed for output columns or measures are joined
+- the SQL text depends only on the query's shape (which filters, how many
+  values, measure, grouping, top-k), so compiled plans are cached by shape
+  and values travel as parameters
+
+Example:
+    >>> query = (
+    ...     LandUseQuery("urban_expansion")
+    ...     .where(states=["CA", "TX"], scenario="HH")
+    ...     .group_by("county")
+    ...     .top(10)
+    ... )
+    >>> result = api.aggregate(query)
+
+``QueryBuilder``'s transition templates (urban expansion, forest loss and
+gain, agricultural change, state comparison, top counties) are built this way.
+"""
+
+import functools
+from dataclasses import dataclass, replace
+from typing import Any
+
+from landuse.api.queries import LANDUSE_MAP, SCENARIO_MAP, QueryBuilder, QueryResult
+
+# Dimension joins keyed by table alias
+_JOINS: dict[str, str] = {
+    "g": "JOIN dim_geography g ON f.geography_id = g.geography_id",
+    "s": "JOIN dim_scenario s ON f.scenario_id = s.scenario_id",
+    "t": "JOIN dim_time t ON f.time_id = t.time_id",
+    "fl": "JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id",
+    "tl": "JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id",
+}
+
+# Group-by dimensions: (join alias or None, output columns as (expression, alias))
+GROUP_DIMENSIONS: dict[str, tuple[str | None, tuple[tuple[str, str], ...]]] = {
+    "geography_id": (None, (("f.geography_id", "geography_id"),)),
+    "county": ("g", (("g.county_name", "county_name"), ("g.state_name", "state_name"), ("g.fips_code", "fips_code"))),
+    "state": ("g", (("g.state_name", "state_name"),)),
+    "region": ("g", (("g.region", "region"),)),
+    "scenario": ("s", (("s.rcp_scenario", "rcp_scenario"), ("s.ssp_scenario", "ssp_scenario"))),
+    "rcp": ("s", (("s.rcp_scenario", "rcp_scenario"),)),
+    "ssp": ("s", (("s.ssp_scenario", "ssp_scenario"),)),
+    "period": ("t", (("t.year_range", "year_range"), ("t.start_year", "start_year"), ("t.end_year", "end_year"))),
+    "from_use": ("fl", (("fl.landuse_name", "from_landuse"),)),
+    "to_use": ("tl", (("tl.landuse_name", "to_landuse"),)),
+    "transition_type": (None, (("f.transition_type", "transition_type"),)),
+}
+
+# Filters pushed down to fact columns: (fact column, dimension subquery with {} for placeholders)
+_FILTERS: dict[str, tuple[str, str | None]] = {
+    "state": ("f.geography_id", "SELECT geography_id FROM dim_geography WHERE state_name IN ({})"),
+    "county": ("f.geography_id", "SELECT geography_id FROM dim_geography WHERE fips_code IN ({})"),
+    "region": ("f.geography_id", "SELECT geography_id FROM dim_geography WHERE region IN ({})"),
+    "rcp": ("f.scenario_id", "SELECT scenario_id FROM dim_scenario WHERE rcp_scenario IN ({})"),
+    "ssp": ("f.scenario_id", "SELECT scenario_id FROM dim_scenario WHERE ssp_scenario IN ({})"),
+    "year_range": ("f.time_id", "SELECT time_id FROM dim_time WHERE year_range IN ({})"),
+    "from_use": ("f.from_landuse_id", "SELECT landuse_id FROM dim_landuse WHERE landuse_name IN ({})"),
+    "to_use": ("f.to_landuse_id", "SELECT landuse_id FROM dim_landuse WHERE landuse_name IN ({})"),
+    "transition_type": ("f.transition_type", None),
+}
+
+
+@dataclass(frozen=True)
+class Measure:
+    """An aggregate over the fact table and the filters it implies."""
+
+    expression: str
+    filters: tuple[tuple[str, tuple[Any, ...]], ...] = ()
+    predicate: str | None = None
+    joins: tuple[str, ...] = ()
+
+
+MEASURES: dict[str, Measure] = {
+    "acres": Measure("SUM(f.acres)"),
+    "land_area": Measure("SUM(f.acres)", (("transition_type", ("same",)),)),
+    "urban_expansion": Measure("SUM(f.acres)", (("to_use", ("Urban",)), ("transition_type", ("change",)))),
+    "forest_loss": Measure("SUM(f.acres)", (("from_use", ("Forest",)), ("transition_type", ("change",)))),
+    "forest_gain": Measure("SUM(f.acres)", (("to_use", ("Forest",)), ("transition_type", ("change",)))),
+    "forest_net": Measure(
+        "SUM(CASE WHEN tl.landuse_name = 'Forest' THEN f.acres ELSE -f.acres END)",
+        (("transition_type", ("change",)),),
+        predicate="(fl.landuse_name = 'Forest' OR tl.landuse_name = 'Forest')",
+        joins=("fl", "tl"),
+    ),
+    "ag_loss": Measure("SUM(f.acres)", (("from_use", ("Crop", "Pasture")), ("transition_type", ("change",)))),
+}
+
+
+def _as_tuple(value: Any) -> tuple:
+    """Wrap a scalar filter value in a tuple."""
+    if value is None:
+        return ()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(value)
+    return (value,)
+
+
+def _normalize(dimension: str, values: tuple) -> tuple:
+    """Map user-facing filter values to database values."""
+    if dimension == "state":
+        return tuple(QueryBuilder._state_names(list(values)))
+    if dimension in ("from_use", "to_use"):
+        return tuple(LANDUSE_MAP.get(str(v).lower(), str(v).title()) for v in values)
+    if dimension == "county":
+        return tuple(str(v).strip().zfill(5) for v in values)
+    if dimension in ("rcp", "ssp"):
+        return tuple(str(v).upper() for v in values)
+    if dimension == "scenario":
+        unknown = [v for v in values if str(v).upper() not in SCENARIO_MAP]
+        if unknown:
+            raise ValueError(f"Unknown scenario codes: {', '.join(map(str, unknown))}. Use LM, HM, HL or HH")
+        return tuple(str(v).upper() for v in values)
+    if dimension == "year":
+        return tuple(int(v) for v in values)
+    return values
+
+
+@dataclass(frozen=True)
+class LandUseQuery:
+    """Immutable, lazily compiled aggregate query.
+
+    Builder methods return new queries, so partial queries can be shared and
+    extended without affecting each other.
+
+    Attributes:
+        measure: Key of ``MEASURES``
+        filters: (dimension, values) pairs, ANDed together
+        dimensions: Group-by dimensions (keys of ``GROUP_DIMENSIONS``)
+        limit: Keep only the top ``limit`` groups by measure
+        descending: Rank the top-k by largest (True) or smallest measure
+        ranked: Order rows by measure even without a top-k
+        alias: Output column name of the measure
+        labels: (column, new name) renames of group-by output columns
+    """
+
+    measure: str = "acres"
+    filters: tuple[tuple[str, tuple[Any, ...]], ...] = ()
+    dimensions: tuple[str, ...] = ()
+    limit: int | None = None
+    descending: bool = True
+    ranked: bool = False
+    alias: str = "acres"
+    labels: tuple[tuple[str, str], ...] = ()
+
+    def __post_init__(self):
+        if self.measure not in MEASURES:
+            raise ValueError(f"Unknown measure '{self.measure}'. Use one of: {', '.join(MEASURES)}")
+
+    def where(
+        self,
+        states: list[str] | str | None = None,
+        counties: list[str] | str | None = None,
+        regions: list[str] | str | None = None,
+        scenario: list[str] | str | None = None,
+        rcp: list[str] | str | None = None,
+        ssp: list[str] | str | None = None,
+        year_range: list[str] | str | None = None,
+        year: int | None = None,
+        from_use: list[str] | str | None = None,
+        to_use: list[str] | str | None = None,
+        transition_type: str | None = None,
+    ) -> "LandUseQuery":
+        """Add filters. Arguments left as None add no filter.
+
+        Args:
+            states: State abbreviations or names
+            counties: County FIPS codes
+            regions: Region names
+            scenario: Scenario codes (LM, HM, HL, HH)
+            rcp: Climate pathways (e.g. "RCP85")
+            ssp: Socioeconomic pathways (e.g. "SSP5")
+            year_range: Time periods (e.g. "2020-2030")
+            year: Year contained in the time period
+            from_use: Source land uses
+            to_use: Destination land uses
+            transition_type: "change" or "same"
+
+        Returns:
+            A new LandUseQuery
+        """
+        requested = {
+            "state": states,
+            "county": counties,
+            "region": regions,
+            "scenario": scenario,
+            "rcp": rcp,
+            "ssp": ssp,
+            "year_range": year_range,
+            "year": year,
+            "from_use": from_use,
+            "to_use": to_use,
+            "transition_type": transition_type,
+        }
+        added = tuple(
+            (dimension, _normalize(dimension, _as_tuple(value)))
+            for dimension, value in requested.items()
+            if _as_tuple(value)
+        )
+        return replace(self, filters=self.filters + added)
+
+    def group_by(self, *dimensions: str) -> "LandUseQuery":
+        """Group by dimensions, in output column order."""
+        unknown = [d for d in dimensions if d not in GROUP_DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown dimensions: {', '.join(unknown)}. Use: {', '.join(GROUP_DIMENSIONS)}")
+        return replace(self, dimensions=self.dimensions + tuple(d for d in dimensions if d not in self.dimensions))
+
+    def top(self, k: int, descending: bool = True) -> "LandUseQuery":
+        """Keep only the ``k`` groups with the largest (or smallest) measure."""
+        if k < 1:
+            raise ValueError("top-k requires k >= 1")
+        return replace(self, limit=k, descending=descending)
+
+    def ranked_by_measure(self, descending: bool = True) -> "LandUseQuery":
+        """Order all groups by measure, largest (or smallest) first."""
+        return replace(self, ranked=True, descending=descending)
+
+    def named(self, alias: str) -> "LandUseQuery":
+        """Rename the measure's output column."""
+        if not alias.isidentifier():
+            raise ValueError(f"Invalid column name: {alias}")
+        return replace(self, alias=alias)
+
+    def label(self, **names: str) -> "LandUseQuery":
+        """Rename group-by output columns, e.g. ``label(from_landuse="source_landuse")``."""
+        known = {name for _, columns in GROUP_DIMENSIONS.values() for _, name in columns}
+        unknown = [column for column in names if column not in known]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+        invalid = [name for name in names.values() if not name.isidentifier()]
+        if invalid:
+            raise ValueError(f"Invalid column names: {', '.join(invalid)}")
+        return replace(self, labels=tuple(dict(self.labels, **names).items()))
+
+    @property
+    def shape(self) -> tuple:
+        """Everything the SQL text depends on; filter values are excluded."""
+        filters = tuple((dimension, len(values)) for dimension, values in self._all_filters())
+        return (
+            self.measure,
+            filters,
+            self.dimensions,
+            self.limit is not None,
+            self.ranked,
+            self.descending,
+            self.alias,
+            self.labels,
+        )
+
+    def _all_filters(self) -> tuple[tuple[str, tuple[Any, ...]], ...]:
+        """Measure filters followed by user filters."""
+        return MEASURES[self.measure].filters + self.filters
+
+    def params(self) -> list:
+        """Parameter values in the order the compiled SQL expects."""
+        params: list = []
+        for dimension, values in self._all_filters():
+            if dimension == "scenario":
+                for code in values:
+                    params.extend(SCENARIO_MAP[code])
+            elif dimension == "year":
+                for year in values:
+                    params.extend([year, year])
+            else:
+                params.extend(values)
+        if self.limit is not None:
+            params.append(self.limit)
+        return params
+
+    def compile(self) -> QueryResult:
+        """Compile to SQL, reusing the cached plan for this query's shape."""
+        return QueryResult(sql=_compile_plan(self.shape), params=self.params(), description=self.description)
+
+    @property
+    def description(self) -> str:
+        """Query description used for logging and profiling."""
+        grouping = ", ".join(self.dimensions) or "total"
+        top = f", top {self.limit}" if self.limit is not None else ""
+        return f"Aggregate {self.measure} by {grouping}{top}"
+
+
+def _filter_sql(dimension: str, count: int) -> str:
+    """SQL predicate for one filter with ``count`` values."""
+    placeholders = ", ".join("?" for _ in range(count))
+    if dimension == "scenario":
+        pairs = " OR ".join("(rcp_scenario = ? AND ssp_scenario = ?)" for _ in range(count))
+        return f"f.scenario_id IN (SELECT scenario_id FROM dim_scenario WHERE {pairs})"
+    if dimension == "year":
+        years = " OR ".join("(start_year <= ? AND end_year >= ?)" for _ in range(count))
+        return f"f.time_id IN (SELECT time_id FROM dim_time WHERE {years})"
+    column, subquery = _FILTERS[dimension]
+    if subquery is None:
+        return f"{column} IN ({placeholders})"
+    return f"{column} IN ({subquery.format(placeholders)})"
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_plan(shape: tuple) -> str:
+    """Compile a query shape to SQL text."""
+    measure_name, filters, dimensions, has_limit, ranked, descending, alias, labels = shape
+    measure = MEASURES[measure_name]
+
+    names = dict(labels)
+    columns = [
+        (expression, names.get(name, name))
+        for dimension in dimensions
+        for expression, name in GROUP_DIMENSIONS[dimension][1]
+    ]
+    aliases = set(measure.joins) | {GROUP_DIMENSIONS[d][0] for d in dimensions if GROUP_DIMENSIONS[d][0]}
+    joins = [sql for alias_key, sql in _JOINS.items() if alias_key in aliases]
+
+    predicates = [_filter_sql(dimension, count) for dimension, count in filters]
+    if measure.predicate:
+        predicates.append(measure.predicate)
+
+    select = [f"{expression} as {name}" for expression, name in columns] + [f"{measure.expression} as {alias}"]
+    lines = ["SELECT", "    " + ",\n    ".join(select), "FROM fact_landuse_transitions f", *joins]
+    if predicates:
+        lines.append("WHERE " + "\nAND ".join(predicates))
+    if columns:
+        lines.append("GROUP BY " + ", ".join(expression for expression, _ in columns))
+    if has_limit or ranked:
+        order = "DESC" if descending else "ASC"
+        tiebreak = "".join(f", {name}" for _, name in columns)
+        lines.append(f"ORDER BY {alias} {order}{tiebreak}")
+        if has_limit:
+            lines.append("LIMIT ?")
+    elif columns:
+        lines.append("ORDER BY " + ", ".join(name for _, name in columns))
+    return "\n".join(lines)
+
+
+def plan_cache_info() -> functools._CacheInfo:
+    """Hit/miss statistics of the compiled plan cache."""
+    return _compile_plan.cache_info()
+
+
+def clear_plan_cache() -> None:
+    """Drop all cached compiled plans."""
+    _compile_plan.cache_clear()
@@ -0,0 +1,261 @@
+"""In-memory geography resolver for states, counties, FIPS codes and regions.
+
+``dim_geography`` holds ~3,100 rows that never change between conversions, so
+it is loaded once and indexed in memory:
+
+- casefolded exact maps for state names/abbreviations/FIPS and county names
+- a per-state trigram index for fuzzy county matching ("Los Angles")
+- sorted ``geography_id`` arrays per state and region membership
+- a canonical FIPS-sorted county order for dense per-county vectors
+
+County lookups then resolve without a SQL round trip.
+"""
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from landuse.utils.state_mappings import StateMapper
+
+# Suffixes dropped before matching so "Wake County" finds "Wake"
+_COUNTY_SUFFIXES = (" county", " parish", " borough", " census area", " municipality")
+_PUNCTUATION = re.compile(r"[.'\-]")
+
+# Minimum trigram (Jaccard) similarity for a fuzzy county match
+FUZZY_THRESHOLD = 0.45
+
+
+@dataclass(frozen=True)
+class County:
+    """A county row from ``dim_geography``."""
+
+    geography_id: int
+    fips_code: str
+    county_name: str
+    state_name: str
+    region: str | None = None
+
+
+def normalize_county(name: str) -> str:
+    """Casefold a county name, dropping punctuation and administrative suffixes."""
+    folded = " ".join(_PUNCTUATION.sub(" ", name.casefold()).split())
+    for suffix in _COUNTY_SUFFIXES:
+        if folded.endswith(suffix) and len(folded) > len(suffix):
+            return folded[: -len(suffix)]
+    return folded
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Padded character trigrams of ``text`` (as in PostgreSQL pg_trgm)."""
+    padded = f"  {text} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class GeographyResolver:
+    """Resolve states, counties and regions from an in-memory index.
+
+    Example:
+        >>> resolver = GeographyResolver.from_connection(conn)
+        >>> resolver.find_county("CA", "los angeles").fips_code
+        '06037'
+    """
+
+    def __init__(self, counties: list[County]):
+        """Build indexes over ``counties``.
+
+        Args:
+            counties: All rows of ``dim_geography``
+        """
+        self.counties = counties
+        self._by_fips: dict[str, County] = {c.fips_code: c for c in counties}
+        self._by_id: dict[int, County] = {c.geography_id: c for c in counties}
+
+        # state -> normalized county name -> counties (names can repeat within a state)
+        self._exact: dict[str, dict[str, list[County]]] = defaultdict(lambda: defaultdict(list))
+        # state -> list of (normalized name, county), sorted for deterministic scans
+        self._names: dict[str, list[tuple[str, County]]] = defaultdict(list)
+        # state -> trigram -> indexes into self._names[state]
+        self._trigrams: dict[str, dict[str, list[int]]] = defaultdict(lambda: defaultdict(list))
+        self._name_trigrams: dict[str, list[frozenset[str]]] = defaultdict(list)
+
+        state_ids: dict[str, list[int]] = defaultdict(list)
+        region_states: dict[str, set[str]] = defaultdict(set)
+
+        for county in sorted(counties, key=lambda c: (c.state_name, c.county_name, c.fips_code)):
+            state = county.state_name
+            normalized = normalize_county(county.county_name)
+            self._exact[state][normalized].append(county)
+            grams = trigrams(normalized)
+            index = len(self._names[state])
+            self._names[state].append((normalized, county))
+            self._name_trigrams[state].append(grams)
+            for gram in grams:
+                self._trigrams[state][gram].append(index)
+            state_ids[state].append(county.geography_id)
+            if county.region:
+                region_states[county.region].add(state)
+
+        self._state_ids: dict[str, np.ndarray] = {
+            state: np.array(sorted(ids), dtype=np.int64) for state, ids in state_ids.items()
+        }
+        self._region_states: dict[str, list[str]] = {region: sorted(states) for region, states in region_states.items()}
+        self._folded_regions: dict[str, str] = {region.casefold(): region for region in self._region_states}
+
+        # Canonical FIPS order for dense county vectors, with a sorted
+        # geography_id index mapping ids to positions in that order
+        by_fips = sorted(counties, key=lambda c: c.fips_code)
+        self.fips_order: np.ndarray = np.array([c.fips_code for c in by_fips], dtype=object)
+        self.fips_states: np.ndarray = np.array([c.state_name for c in by_fips], dtype=object)
+        self.fips_regions: np.ndarray = np.array([c.region or "" for c in by_fips], dtype=object)
+        ids = np.array([c.geography_id for c in by_fips], dtype=np.int64)
+        self._id_order = np.argsort(ids, kind="stable")
+        self._sorted_ids = ids[self._id_order]
+
+        # Casefolded state keys: name, abbreviation and FIPS prefix
+        self._states: dict[str, str] = {}
+        for state in self._state_ids:
+            self._states[state.casefold()] = state
+            abbrev = StateMapper.name_to_abbrev(state)
+            if abbrev:
+                self._states[abbrev.casefold()] = state
+            fips = StateMapper.name_to_fips(state)
+            if fips:
+                self._states[fips] = state
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "GeographyResolver":
+        """Build a resolver from a ``dim_geography`` DataFrame."""
+        regions = df["region"] if "region" in df.columns else [None] * len(df)
+        counties = [
+            County(
+                geography_id=int(geography_id),
+                fips_code=str(fips_code),
+                county_name=str(county_name),
+                state_name=str(state_name),
+                region=region if isinstance(region, str) else None,
+            )
+            for geography_id, fips_code, county_name, state_name, region in zip(
+                df["geography_id"], df["fips_code"], df["county_name"], df["state_name"], regions
+            )
+        ]
+        return cls(counties)
+
+    @classmethod
+    def from_connection(cls, conn: duckdb.DuckDBPyConnection) -> "GeographyResolver":
+        """Load ``dim_geography`` once and build a resolver."""
+        df = conn.execute("SELECT geography_id, fips_code, county_name, state_name, region FROM dim_geography").df()
+        return cls.from_dataframe(df)
+
+    # ----- States and regions -----
+
+    def resolve_state(self, state: str) -> str | None:
+        """Resolve a state abbreviation, name or FIPS code to its ``state_name``."""
+        return self._states.get(state.strip().casefold())
+
+    @property
+    def states(self) -> list[str]:
+        """All state names present in the geography table."""
+        return sorted(self._state_ids)
+
+    def state_geography_ids(self, state: str) -> np.ndarray:
+        """Sorted ``geography_id`` array for a state (empty if unknown)."""
+        state_name = self.resolve_state(state)
+        if state_name is None:
+            return np.empty(0, dtype=np.int64)
+        return self._state_ids[state_name]
+
+    @property
+    def regions(self) -> list[str]:
+        """All region names."""
+        return sorted(self._region_states)
+
+    def region_states(self, region: str) -> list[str]:
+        """State names belonging to a region (case-insensitive)."""
+        name = self._folded_regions.get(region.strip().casefold())
+        return list(self._region_states.get(name, [])) if name else []
+
+    def region_geography_ids(self, region: str) -> np.ndarray:
+        """Sorted ``geography_id`` array for every county in a region."""
+        arrays = [self._state_ids[state] for state in self.region_states(region)]
+        if not arrays:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(arrays))
+
+    # ----- Counties -----
+
+    def fips_positions(self, geography_ids: np.ndarray) -> np.ndarray:
+        """Positions of ``geography_ids`` in ``fips_order`` (-1 for unknown ids)."""
+        geography_ids = np.asarray(geography_ids, dtype=np.int64)
+        if not len(self._sorted_ids):
+            return np.full(len(geography_ids), -1, dtype=np.int64)
+        index = np.searchsorted(self._sorted_ids, geography_ids).clip(0, len(self._sorted_ids) - 1)
+        return np.where(self._sorted_ids[index] == geography_ids, self._id_order[index], -1)
+
+    def county_by_fips(self, fips_code: str) -> County | None:
+        """Look up a county by its 5-digit FIPS code."""
+        return self._by_fips.get(fips_code.strip().zfill(5))
+
+    def county_by_id(self, geography_id: int) -> County | None:
+        """Look up a county by ``geography_id``."""
+        return self._by_id.get(geography_id)
+
+    def find_county(self, state: str, county: str) -> County | None:
+        """Resolve a county name within a state.
+
+        Matching order: exact (casefolded, suffix-insensitive), prefix,
+        substring, then trigram similarity for misspellings. A 5-digit FIPS
+        code is also accepted as ``county``.
+
+        Args:
+            state: State abbreviation, name or FIPS code
+            county: County name (partial and misspelled names supported)
+
+        Returns:
+            The best matching County, or None
+        """
+        if county.strip().isdigit():
+            match = self.county_by_fips(county)
+            state_name = self.resolve_state(state)
+            return match if match and (state_name is None or match.state_name == state_name) else None
+
+        state_name = self.resolve_state(state)
+        if state_name is None:
+            return None
+        query = normalize_county(county)
+        if not query:
+            return None
+
+        exact = self._exact[state_name].get(query)
+        if exact:
+            return exact[0]
+
+        names = self._names[state_name]
+        prefix = [c for name, c in names if name.startswith(query)]
+        if prefix:
+            return min(prefix, key=lambda c: (len(c.county_name), c.fips_code))
+        substring = [c for name, c in names if query in name]
+        if substring:
+            return min(substring, key=lambda c: (len(c.county_name), c.fips_code))
+
+        return self._fuzzy(state_name, query)
+
+    def _fuzzy(self, state_name: str, query: str) -> County | None:
+        """Best trigram match above FUZZY_THRESHOLD within a state."""
+        query_grams = trigrams(query)
+        index = self._trigrams[state_name]
+        overlap: dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for position in index.get(gram, ()):
+                overlap[position] += 1
+
+        best: tuple[float, int] | None = None
+        name_grams = self._name_trigrams[state_name]
+        for position, shared in overlap.items():
+            score = shared / (len(query_grams) + len(name_grams[position]) - shared)
+            if score >= FUZZY_THRESHOLD and (best is None or score > best[0]):
+                best = (score, position)
+        return self._names[state_name][best[1]][1] if best else None
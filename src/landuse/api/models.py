@@ -9,6 +9,8 @@ This module defines all data models for the Land Use API, including:
 from enum import Enum
 from typing import Any
 
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -60,6 +62,7 @@ class APIResult(BaseModel):
     error_message: str | None = None
     error_code: str | None = None
     source: str = "USDA Forest Service 2020 RPA Assessment"
+    cost: dict[str, Any] | None = None  # Query cost summary when profiling is enabled
 
     def to_llm_string(self) -> str:
         """Format result for LLM consumption. Override in subclasses."""
@@ -334,6 +337,272 @@ class TopCountiesResult(APIResult):
         return "\n".join(lines)
 
 
+class SimilarCounty(BaseModel):
+    """County ranked by similarity of its land use trajectory."""
+    model_config = ConfigDict(frozen=True)
+
+    rank: int
+    county: str
+    state: str
+    fips: str
+    similarity: float
+
+
+class SimilarCountiesResult(APIResult):
+    """Counties whose land use trajectories most resemble a target county."""
+    county: str
+    state: str
+    fips: str
+    counties: list[SimilarCounty] = Field(default_factory=list)
+    filters: dict[str, Any] = Field(default_factory=dict)
+
+    def to_llm_string(self) -> str:
+        lines = [f"**Counties Most Similar to {self.county}, {self.state} ({self.fips})**"]
+        for c in self.counties:
+            lines.append(f"{c.rank}. {c.county}, {c.state} (FIPS {c.fips}): similarity {c.similarity:.3f}")
+        if not self.counties:
+            lines.append("No comparable counties match the filters.")
+        lines.append(f"\n*Source: {self.source}*")
+        return "\n".join(lines)
+
+
+class SocioeconomicRecord(BaseModel):
+    """County value of a per-capita or density metric."""
+    model_config = ConfigDict(frozen=True)
+
+    rank: int
+    county: str
+    state: str
+    fips: str
+    value: float
+
+
+class SocioeconomicResult(APIResult):
+    """Counties ranked by a socioeconomic metric joined to land use."""
+    metric: str
+    unit: str
+    scenario: str
+    year: int
+    counties: list[SocioeconomicRecord] = Field(default_factory=list)
+    filters: dict[str, Any] = Field(default_factory=dict)
+
+    def to_llm_string(self) -> str:
+        lines = [f"**{self.metric.replace('_', ' ').title()} ({self.scenario}, {self.year})**"]
+        for c in self.counties:
+            value = f"{c.value:,.0f}" if abs(c.value) >= 100 else f"{c.value:,.3g}"
+            lines.append(f"{c.rank}. {c.county}, {c.state}: {value} {self.unit}")
+        lines.append(f"\n*Source: {self.source}; SSP population and income projections*")
+        return "\n".join(lines)
+
+
+class CountyPageResult(APIResult):
+    """One page of county-level rows, keyed by FIPS code for cursor paging."""
+    metric: str
+    columns: list[str]
+    rows: list[tuple] = Field(default_factory=list)
+    county_count: int = 0
+    next_cursor: str | None = None
+    filters: dict[str, Any] = Field(default_factory=dict)
+
+    def to_llm_string(self) -> str:
+        lines = [
+            f"**County Data: {self.metric}**",
+            f"- {len(self.rows):,} rows for {self.county_count} counties",
+        ]
+        if self.next_cursor:
+            lines.append(f"- More counties available after FIPS {self.next_cursor}")
+        lines.append(f"\n*Source: {self.source}*")
+        return "\n".join(lines)
+
+
+class CountyVectorResult(APIResult):
+    """One metric value per county, aligned to the canonical FIPS-sorted order.
+
+    ``values[i]`` belongs to ``fips[i]``. Counties outside the state filter
+    are NaN; counties inside it without matching rows are 0.
+    """
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    metric: str
+    fips: np.ndarray
+    values: np.ndarray
+    filters: dict[str, Any] = Field(default_factory=dict)
+
+    def to_series(self) -> pd.Series:
+        """Values as a Series indexed by FIPS code (e.g. to join county shapes)."""
+        return pd.Series(self.values, index=pd.Index(self.fips, name="fips_code"), name=self.metric)
+
+    def to_llm_string(self) -> str:
+        covered = ~np.isnan(self.values)
+        lines = [
+            f"**County Vector: {self.metric}**",
+            f"- {int(covered.sum()):,} of {len(self.fips):,} counties, total {np.nansum(self.values):,.0f} acres",
+        ]
+        if covered.any():
+            top = int(np.nanargmax(self.values))
+            lines.append(f"- Highest: FIPS {self.fips[top]} ({self.values[top]:,.0f} acres)")
+        lines.append(f"\n*Source: {self.source}*")
+        return "\n".join(lines)
+
+
+class ScenarioDivergence(BaseModel):
+    """One county or state where two scenarios diverge."""
+    model_config = ConfigDict(frozen=True)
+
+    rank: int
+    key: str
+    name: str
+    value_a: float
+    value_b: float
+    difference: float
+
+
+class ScenarioDiffResult(APIResult):
+    """Per-area difference of a metric between two scenarios (``b - a``).
+
+    ``values_a[i]`` and ``values_b[i]`` belong to ``keys[i]`` (FIPS codes in
+    canonical order, or state names). ``increases`` and ``decreases`` hold the
+    largest positive and negative differences.
+    """
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    metric: str
+    scenario_a: str
+    scenario_b: str
+    level: str
+    keys: np.ndarray
+    values_a: np.ndarray
+    values_b: np.ndarray
+    increases: list[ScenarioDivergence] = Field(default_factory=list)
+    decreases: list[ScenarioDivergence] = Field(default_factory=list)
+    filters: dict[str, Any] = Field(default_factory=dict)
+
+    @property
+    def difference(self) -> np.ndarray:
+        """``values_b - values_a`` per area."""
+        return self.values_b - self.values_a
+
+    def to_series(self) -> pd.Series:
+        """Differences as a Series indexed by area key."""
+        return pd.Series(self.difference, index=pd.Index(self.keys, name=self.level), name=self.metric)
+
+    def to_llm_string(self) -> str:
+        a, b = self.scenario_a, self.scenario_b
+        lines = [
+            f"**Scenario Difference: {self.metric} ({b} vs {a})**",
+            f"- {len(self.keys):,} {self.level} areas; total {np.nansum(self.values_b):,.0f} "
+            f"vs {np.nansum(self.values_a):,.0f} acres",
+        ]
+        for title, divergences in ((f"Higher under {b}", self.increases), (f"Higher under {a}", self.decreases)):
+            if divergences:
+                lines.append(f"\n{title}:")
+                for d in divergences:
+                    lines.append(
+                        f"{d.rank}. {d.name}: {d.difference:+,.0f} acres ({d.value_b:,.0f} vs {d.value_a:,.0f})"
+                    )
+        lines.append(f"\n*Source: {self.source}*")
+        return "\n".join(lines)
+
+
+class CumulativeTransitionResult(APIResult):
+    """Cumulative land use transitions chained across time periods.
+
+    ``matrices[a, i, j]`` is the share of area ``keys[a]``'s land in
+    ``land_uses[i]`` at ``start_year`` that is in ``land_uses[j]`` by
+    ``end_year``; ``flows`` holds the same transitions in acres.
+    """
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    scenario: str
+    level: str
+    start_year: int
+    end_year: int
+    keys: np.ndarray
+    land_uses: list[str]
+    matrices: np.ndarray
+    start_acres: np.ndarray
+    end_acres: np.ndarray
+
+    @property
+    def flows(self) -> np.ndarray:
+        """``(areas, K, K)`` acres moving from each land use to each other land use."""
+        return self.start_acres[:, :, None] * self.matrices
+
+    @property
+    def end_shares(self) -> np.ndarray:
+        """``(areas, K)`` implied land use shares at ``end_year``."""
+        totals = self.end_acres.sum(axis=1, keepdims=True)
+        return np.divide(self.end_acres, totals, out=np.zeros_like(self.end_acres), where=totals > 0)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """One row per area and land use with start acres, implied end acres and end share."""
+        k = len(self.land_uses)
+        return pd.DataFrame(
+            {
+                self.level: np.repeat(self.keys, k),
+                "land_use": np.tile(self.land_uses, len(self.keys)),
+                "start_acres": self.start_acres.reshape(-1),
+                "end_acres": self.end_acres.reshape(-1),
+                "end_share": self.end_shares.reshape(-1),
+            }
+        )
+
+    def to_llm_string(self) -> str:
+        flows = self.flows.sum(axis=0)
+        start = flows.sum(axis=1)
+        off_diagonal = flows * (1 - np.eye(len(self.land_uses)))
+        lines = [
+            f"**Cumulative Land Use Transitions {self.start_year}-{self.end_year} ({self.scenario})**",
+            f"- {len(self.keys):,} {self.level} areas, {start.sum():,.0f} acres",
+        ]
+        for flat in np.argsort(off_diagonal, axis=None)[::-1][:5]:
+            i, j = np.unravel_index(flat, off_diagonal.shape)
+            if off_diagonal[i, j] <= 0:
+                break
+            lines.append(
+                f"- {self.land_uses[i]} → {self.land_uses[j]}: {off_diagonal[i, j]:,.0f} acres "
+                f"({off_diagonal[i, j] / start[i]:.1%} of {self.start_year} {self.land_uses[i]})"
+            )
+        lines.append(f"\n*Source: {self.source}*")
+        return "\n".join(lines)
+
+
+class AggregateResult(APIResult):
+    """Rows of a composed LandUseQuery aggregate."""
+    description: str
+    columns: list[str]
+    rows: list[tuple] = Field(default_factory=list)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Rows as a DataFrame."""
+        return pd.DataFrame(self.rows, columns=self.columns)
+
+    def to_llm_string(self) -> str:
+        lines = [f"**{self.description}** ({len(self.rows):,} rows)", " | ".join(self.columns)]
+        for row in self.rows[:25]:
+            lines.append(" | ".join(f"{v:,.0f}" if isinstance(v, float) else str(v) for v in row))
+        if len(self.rows) > 25:
+            lines.append(f"... {len(self.rows) - 25:,} more rows")
+        lines.append(f"\n*Source: {self.source}*")
+        return "\n".join(lines)
+
+
+class ExportResult(APIResult):
+    """Result of a bulk export to a Parquet or Arrow IPC file."""
+    path: str
+    file_format: str
+    rows: int
+    bytes_written: int
+    columns: list[str] = Field(default_factory=list)
+    filters: dict[str, Any] = Field(default_factory=dict)
+
+    def to_llm_string(self) -> str:
+        return (
+            f"**Export complete**: {self.rows:,} rows written to {self.path} "
+            f"({self.file_format}, {self.bytes_written:,} bytes)\n\n*Source: {self.source}*"
+        )
+
+
 class DataSummaryResult(APIResult):
     """Data summary result with coverage statistics."""
     total_records: int
@@ -0,0 +1,183 @@
+"""Cumulative land use transition pathways across time periods.
+
+The fact table is a chain of per-period transition matrices: for each county,
+scenario and period, acres moving from each land use to each other land use
+(the diagonal is unchanged land). Row-normalizing a period's matrix gives the
+probability that an acre of land use *i* at the start of the period is land
+use *j* at its end. Multiplying the period matrices in order gives the
+cumulative transition matrix, e.g. "of today's cropland, what share is urban
+by 2070".
+
+All counties are processed at once as a ``(counties, periods, K, K)`` tensor:
+period matrices are chained with batched ``einsum`` products, and state or
+region results aggregate county flows with a one-hot membership ``einsum``.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class TransitionChain:
+    """Cumulative transition matrices for a set of areas (counties, states or regions).
+
+    Attributes:
+        keys: Area identifiers (FIPS codes, state names or region names)
+        land_uses: Land use names indexing the matrix axes
+        periods: (start_year, end_year) of each chained period, in order
+        start_acres: ``(areas, K)`` area of each land use at the chain start
+        cumulative: ``(areas, K, K)`` probability that land in use *i* at the
+                    start is in use *j* at the end (rows sum to 1)
+    """
+
+    keys: np.ndarray
+    land_uses: tuple[str, ...]
+    periods: tuple[tuple[int, int], ...]
+    start_acres: np.ndarray
+    cumulative: np.ndarray
+
+    @property
+    def flows(self) -> np.ndarray:
+        """``(areas, K, K)`` acres moving from use *i* (start) to use *j* (end)."""
+        return self.start_acres[:, :, None] * self.cumulative
+
+    @property
+    def end_acres(self) -> np.ndarray:
+        """``(areas, K)`` implied area of each land use at the chain end."""
+        return np.einsum("ai,aij->aj", self.start_acres, self.cumulative)
+
+    @property
+    def end_shares(self) -> np.ndarray:
+        """``(areas, K)`` implied land use shares at the chain end."""
+        end = self.end_acres
+        totals = end.sum(axis=1, keepdims=True)
+        return np.divide(end, totals, out=np.zeros_like(end), where=totals > 0)
+
+    def index(self, land_use: str) -> int:
+        """Axis position of a land use (case-insensitive)."""
+        folded = [name.casefold() for name in self.land_uses]
+        try:
+            return folded.index(land_use.casefold())
+        except ValueError:
+            raise ValueError(f"Unknown land use '{land_use}'. Use one of: {', '.join(self.land_uses)}") from None
+
+    def pathway(self, from_use: str, to_use: str) -> np.ndarray:
+        """Acres per area that start as ``from_use`` and end as ``to_use``."""
+        return self.flows[:, self.index(from_use), self.index(to_use)]
+
+    def select(self, mask: np.ndarray) -> "TransitionChain":
+        """Subset of areas selected by a boolean mask or index array."""
+        return TransitionChain(
+            keys=self.keys[mask],
+            land_uses=self.land_uses,
+            periods=self.periods,
+            start_acres=self.start_acres[mask],
+            cumulative=self.cumulative[mask],
+        )
+
+    def aggregate(self, labels: np.ndarray) -> "TransitionChain":
+        """Combine areas sharing a label (e.g. counties into states).
+
+        County flows are summed per group and re-normalized by the group's
+        starting area, so group matrices weight counties by their land.
+
+        Args:
+            labels: Group label for each area, aligned to ``keys``
+
+        Returns:
+            TransitionChain keyed by the sorted unique labels
+        """
+        groups, inverse = np.unique(np.asarray(labels), return_inverse=True)
+        membership = np.zeros((len(groups), len(self.keys)))
+        membership[inverse, np.arange(len(self.keys))] = 1.0
+
+        flows = np.einsum("ga,aij->gij", membership, self.flows)
+        start = np.einsum("ga,ai->gi", membership, self.start_acres)
+        return TransitionChain(
+            keys=groups,
+            land_uses=self.land_uses,
+            periods=self.periods,
+            start_acres=start,
+            cumulative=_row_normalize(flows),
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Long-form table of cumulative flows with one row per area, from and to use."""
+        k = len(self.land_uses)
+        return pd.DataFrame(
+            {
+                "key": np.repeat(self.keys, k * k),
+                "from_landuse": np.tile(np.repeat(self.land_uses, k), len(self.keys)),
+                "to_landuse": np.tile(self.land_uses, k * len(self.keys)),
+                "probability": self.cumulative.reshape(-1),
+                "acres": self.flows.reshape(-1),
+            }
+        )
+
+
+def _row_normalize(matrices: np.ndarray) -> np.ndarray:
+    """Row-normalize ``(..., K, K)`` matrices; empty rows become identity rows."""
+    totals = matrices.sum(axis=-1, keepdims=True)
+    probabilities = np.divide(matrices, totals, out=np.zeros_like(matrices), where=totals > 0)
+    k = matrices.shape[-1]
+    empty = (totals[..., 0] == 0)[..., None] * np.eye(k)
+    return probabilities + empty
+
+
+def build_transition_chain(
+    df: pd.DataFrame,
+    keys: np.ndarray,
+    positions: np.ndarray,
+    land_uses: tuple[str, ...] | None = None,
+) -> TransitionChain:
+    """Chain per-period county transition matrices into cumulative matrices.
+
+    Args:
+        df: Rows of ``QueryBuilder.county_transition_matrices`` (start_year,
+            end_year, from_landuse, to_landuse, acres)
+        keys: Area identifiers for the output rows
+        positions: Output row of each ``df`` row (-1 drops the row)
+        land_uses: Land use axis order (None for the sorted names in ``df``)
+
+    Returns:
+        TransitionChain with one cumulative matrix per key
+    """
+    if land_uses is None:
+        land_uses = tuple(sorted(set(df["from_landuse"]) | set(df["to_landuse"])))
+    periods = tuple(
+        (int(start), int(end))
+        for start, end in df[["start_year", "end_year"]]
+        .drop_duplicates()
+        .sort_values("start_year")
+        .itertuples(index=False, name=None)
+    )
+    k, n_periods = len(land_uses), len(periods)
+
+    period_index = pd.Index([start for start, _ in periods]).get_indexer(df["start_year"])
+    from_index = pd.Categorical(df["from_landuse"], categories=land_uses).codes
+    to_index = pd.Categorical(df["to_landuse"], categories=land_uses).codes
+    keep = (positions >= 0) & (from_index >= 0) & (to_index >= 0)
+
+    # (areas, periods, K, K) acres; duplicate cells accumulate
+    acres = np.zeros((len(keys), n_periods, k, k))
+    np.add.at(
+        acres,
+        (positions[keep], period_index[keep], from_index[keep], to_index[keep]),
+        df["acres"].to_numpy(dtype=np.float64)[keep],
+    )
+
+    probabilities = _row_normalize(acres)
+    cumulative = np.broadcast_to(np.eye(k), (len(keys), k, k)).copy()
+    for t in range(n_periods):
+        cumulative = np.einsum("aij,ajk->aik", cumulative, probabilities[:, t])
+
+    start_acres = acres[:, 0].sum(axis=2) if n_periods else np.zeros((len(keys), k))
+    return TransitionChain(
+        keys=np.asarray(keys),
+        land_uses=tuple(land_uses),
+        periods=periods,
+        start_acres=start_acres,
+        cumulative=cumulative,
+    )
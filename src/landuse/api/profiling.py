@@ -0,0 +1,254 @@
+"""DuckDB query profiling for LandUseAPI.
+
+When a ``QueryProfiler`` is passed to ``LandUseAPI``, DuckDB's JSON profiler
+is enabled on the API connection and every query records wall time, rows
+scanned, result rows and per-operator timings. Each profile is forwarded to an
+optional sink, a compact cost summary is attached to the API result, and the
+profiler aggregates a per-query-pattern report across the session.
+
+Example:
+    >>> profiler = QueryProfiler(slow_threshold_ms=250)
+    >>> with LandUseAPI(profiler=profiler) as api:
+    ...     result = api.get_urban_expansion(states=["CA"])
+    ...     print(result.cost)
+    >>> print(profiler.report())
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import defaultdict, deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import duckdb
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class OperatorTiming:
+    """Aggregate time spent in one physical operator type."""
+
+    operator: str
+    timing_ms: float
+    rows: int
+
+
+@dataclass(frozen=True)
+class QueryProfile:
+    """Cost of a single profiled query."""
+
+    description: str
+    wall_ms: float
+    latency_ms: float
+    rows_scanned: int
+    result_rows: int
+    operators: tuple[OperatorTiming, ...] = ()
+    sql: str = field(default="", repr=False)
+
+    @property
+    def top_operator(self) -> OperatorTiming | None:
+        """Operator with the largest timing."""
+        return self.operators[0] if self.operators else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a dictionary."""
+        return asdict(self)
+
+
+ProfileSink = Callable[[QueryProfile], None]
+
+
+def logging_sink(profile: QueryProfile) -> None:
+    """Sink that logs each profile at INFO level."""
+    top = profile.top_operator
+    logger.info(
+        "query=%s wall_ms=%.1f rows_scanned=%d result_rows=%d top_operator=%s",
+        profile.description,
+        profile.wall_ms,
+        profile.rows_scanned,
+        profile.result_rows,
+        f"{top.operator}:{top.timing_ms:.1f}ms" if top else "-",
+    )
+
+
+def cost_summary(profiles: list[QueryProfile]) -> dict[str, Any]:
+    """Compact cost summary for the queries behind one API call."""
+    summary: dict[str, Any] = {
+        "queries": len(profiles),
+        "wall_ms": round(sum(p.wall_ms for p in profiles), 2),
+        "rows_scanned": sum(p.rows_scanned for p in profiles),
+        "result_rows": sum(p.result_rows for p in profiles),
+    }
+    operators = [p.top_operator for p in profiles if p.top_operator]
+    if operators:
+        top = max(operators, key=lambda o: o.timing_ms)
+        summary["top_operator"] = f"{top.operator} ({top.timing_ms:.1f}ms)"
+    return summary
+
+
+def _flatten_operators(node: dict, totals: dict[str, list]) -> None:
+    """Accumulate operator timings and cardinalities from a profile tree."""
+    for child in node.get("children", []):
+        name = child.get("operator_type") or child.get("operator_name") or child.get("name")
+        if name:
+            entry = totals[name]
+            entry[0] += float(child.get("operator_timing", 0.0) or 0.0)
+            entry[1] += int(child.get("operator_cardinality", 0) or 0)
+        _flatten_operators(child, totals)
+
+
+def parse_profile(raw: dict, description: str, sql: str, wall_ms: float, result_rows: int) -> QueryProfile:
+    """Build a QueryProfile from DuckDB's JSON profiling output."""
+    totals: dict[str, list] = defaultdict(lambda: [0.0, 0])
+    _flatten_operators(raw, totals)
+    operators = tuple(
+        sorted(
+            (OperatorTiming(name, round(seconds * 1000, 3), rows) for name, (seconds, rows) in totals.items()),
+            key=lambda o: o.timing_ms,
+            reverse=True,
+        )
+    )
+    latency = raw.get("latency", raw.get("timing", 0.0)) or 0.0
+    return QueryProfile(
+        description=description,
+        wall_ms=round(wall_ms, 3),
+        latency_ms=round(float(latency) * 1000, 3),
+        rows_scanned=int(raw.get("cumulative_rows_scanned", 0) or 0),
+        result_rows=result_rows,
+        operators=operators,
+        sql=sql,
+    )
+
+
+class QueryProfiler:
+    """Collects DuckDB query profiles and aggregates a slow-query report.
+
+    Attributes:
+        slow_threshold_ms: Wall time above which a query counts as slow
+        sink: Optional callable receiving every QueryProfile
+    """
+
+    def __init__(
+        self,
+        sink: ProfileSink | None = None,
+        slow_threshold_ms: float = 500.0,
+        max_slow_queries: int = 100,
+    ):
+        """Initialize the profiler.
+
+        Args:
+            sink: Callable receiving each QueryProfile (e.g. ``logging_sink``)
+            slow_threshold_ms: Wall time above which queries are kept as slow
+            max_slow_queries: Number of slowest-query samples to retain
+        """
+        self.sink = sink
+        self.slow_threshold_ms = slow_threshold_ms
+        self.slow_queries: deque[QueryProfile] = deque(maxlen=max_slow_queries)
+        self._totals: dict[str, dict[str, float]] = {}
+        self._output_file: str | None = None
+        self._lock = threading.Lock()
+
+    def enable(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Turn on JSON profiling for a connection."""
+        if hasattr(conn, "get_profiling_information"):
+            conn.execute("SET enable_profiling = 'no_output'")
+        else:
+            # Older DuckDB releases only write profiles to a file
+            if self._output_file is None:
+                fd, self._output_file = tempfile.mkstemp(prefix="landuse_profile_", suffix=".json")
+                os.close(fd)
+            conn.execute("SET enable_profiling = 'json'")
+            conn.execute(f"SET profiling_output = '{self._output_file}'")
+
+    def _last_profile(self, conn: duckdb.DuckDBPyConnection) -> dict:
+        """Read the JSON profile of the connection's last query."""
+        if hasattr(conn, "get_profiling_information"):
+            return json.loads(conn.get_profiling_information(format="json"))
+        with open(self._output_file) as f:
+            return json.load(f)
+
+    def record(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        sql: str,
+        description: str,
+        wall_ms: float,
+        result_rows: int,
+    ) -> QueryProfile | None:
+        """Capture the profile of the query just executed on ``conn``.
+
+        Returns:
+            The QueryProfile, or None if DuckDB produced no profile
+        """
+        try:
+            raw = self._last_profile(conn)
+        except (duckdb.Error, OSError, ValueError) as e:
+            logger.debug(f"Query profile unavailable: {e}")
+            return None
+
+        profile = parse_profile(raw, description, sql, wall_ms, result_rows)
+        with self._lock:
+            totals = self._totals.setdefault(
+                description,
+                {"calls": 0, "total_ms": 0.0, "max_ms": 0.0, "rows_scanned": 0, "result_rows": 0},
+            )
+            totals["calls"] += 1
+            totals["total_ms"] += profile.wall_ms
+            totals["max_ms"] = max(totals["max_ms"], profile.wall_ms)
+            totals["rows_scanned"] += profile.rows_scanned
+            totals["result_rows"] += profile.result_rows
+
+            if profile.wall_ms >= self.slow_threshold_ms:
+                self.slow_queries.append(profile)
+        if self.sink is not None:
+            try:
+                self.sink(profile)
+            except Exception as e:
+                logger.warning(f"Profile sink failed: {e}")
+        return profile
+
+    def report(self, top: int | None = None) -> pd.DataFrame:
+        """Aggregate query cost per query pattern, most expensive first.
+
+        Args:
+            top: Limit to the N patterns with the most total time
+
+        Returns:
+            DataFrame with description, calls, total_ms, mean_ms, max_ms,
+            rows_scanned, result_rows and slow_calls columns
+        """
+        with self._lock:
+            slow_queries = list(self.slow_queries)
+            all_totals = {description: dict(t) for description, t in self._totals.items()}
+        slow_counts: dict[str, int] = defaultdict(int)
+        for profile in slow_queries:
+            slow_counts[profile.description] += 1
+
+        rows = [
+            {
+                "description": description,
+                "calls": int(t["calls"]),
+                "total_ms": round(t["total_ms"], 2),
+                "mean_ms": round(t["total_ms"] / t["calls"], 2),
+                "max_ms": round(t["max_ms"], 2),
+                "rows_scanned": int(t["rows_scanned"]),
+                "result_rows": int(t["result_rows"]),
+                "slow_calls": slow_counts[description],
+            }
+            for description, t in all_totals.items()
+        ]
+        columns = ["description", "calls", "total_ms", "mean_ms", "max_ms", "rows_scanned", "result_rows", "slow_calls"]
+        df = pd.DataFrame(rows, columns=columns).sort_values("total_ms", ascending=False, ignore_index=True)
+        return df.head(top) if top else df
+
+    def reset(self) -> None:
+        """Clear collected statistics."""
+        with self._lock:
+            self._totals.clear()
+            self.slow_queries.clear()
@@ -2,6 +2,8 @@
 
 This module generates safe, parameterized SQL queries for the RPA land use
 star schema. All queries use parameter binding to prevent SQL injection.
+Builders that compile through ``LandUseQuery`` reuse the SQL text cached per
+query shape, so repeated tool calls only recompute parameter values.
 """
 
 from dataclasses import dataclass
@@ -34,6 +36,19 @@ LANDUSE_MAP: dict[str, str] = {
     "rangeland": "Rangeland",
 }
 
+# Per-capita and density metrics over fact_county_socioeconomic: (SQL expression, unit)
+SOCIOECONOMIC_METRICS: dict[str, tuple[str, str]] = {
+    "population": ("population_end * 1000", "people"),
+    "income_per_capita": ("income_end * 1000", "2009 USD per person"),
+    "population_density": ("population_end * 1000 * 640 / NULLIF(total_acres, 0)", "people per sq mi"),
+    "urban_acres_per_capita": ("urban_acres / NULLIF(population_end * 1000, 0)", "urban acres per person"),
+    "forest_acres_per_capita": ("forest_acres / NULLIF(population_end * 1000, 0)", "forest acres per person"),
+    "urban_acres_per_new_resident": (
+        "urban_expansion_acres / NULLIF((population_end - population_start) * 1000, 0)",
+        "new urban acres per new resident",
+    ),
+}
+
 
 @dataclass
 class QueryResult:
@@ -43,6 +58,37 @@ class QueryResult:
     description: str
 
 
+# Column order of QueryBuilder.county_export rows
+COUNTY_EXPORT_COLUMNS = (
+    "fips_code",
+    "county_name",
+    "state_name",
+    "rcp_scenario",
+    "ssp_scenario",
+    "year_range",
+    "start_year",
+    "end_year",
+    "land_use",
+    "acres",
+)
+
+# Column order of QueryBuilder.transitions_export
+TRANSITIONS_EXPORT_COLUMNS = (
+    "fips_code",
+    "county_name",
+    "state_name",
+    "rcp_scenario",
+    "ssp_scenario",
+    "year_range",
+    "start_year",
+    "end_year",
+    "from_landuse",
+    "to_landuse",
+    "transition_type",
+    "acres",
+)
+
+
 class QueryBuilder:
     """Build parameterized SQL queries for the star schema.
 
@@ -51,25 +97,40 @@ class QueryBuilder:
     """
 
     @staticmethod
-    def _scenario_clause(scenario: str | None) -> tuple[str, list]:
-        """Build scenario filter clause with parameters."""
+    def _scenario_pair(scenario: str | None) -> tuple[str, str] | None:
+        """Resolve a scenario code to its (RCP, SSP) pair, or None for no filter."""
         if not scenario:
+            return None
+        return SCENARIO_MAP.get(scenario.upper())
+
+    @classmethod
+    def _scenario_code(cls, scenario: str | None) -> str | None:
+        """A known scenario code, or None so that unknown codes add no filter."""
+        return scenario if cls._scenario_pair(scenario) else None
+
+    @classmethod
+    def _scenario_clause(cls, scenario: str | None) -> tuple[str, list]:
+        """Build scenario filter clause with parameters."""
+        pair = cls._scenario_pair(scenario)
+        if pair is None:
             return "", []
-        scenario = scenario.upper()
-        if scenario not in SCENARIO_MAP:
-            return "", []
-        rcp, ssp = SCENARIO_MAP[scenario]
+        rcp, ssp = pair
         return "AND s.rcp_scenario = ? AND s.ssp_scenario = ?", [rcp, ssp]
 
-    @staticmethod
-    def _states_clause(states: list[str]) -> tuple[str, list]:
-        """Build states filter clause using state names."""
-        if not states:
+    @classmethod
+    def _scenarios_clause(cls, scenarios: list[str] | None) -> tuple[str, list]:
+        """Build a filter clause matching any of several scenario codes."""
+        pairs = [pair for pair in (cls._scenario_pair(sc) for sc in scenarios or []) if pair]
+        if not pairs:
             return "", []
+        conditions = " OR ".join(["(s.rcp_scenario = ? AND s.ssp_scenario = ?)" for _ in pairs])
+        return f"AND ({conditions})", [value for pair in pairs for value in pair]
 
-        # Convert abbreviations to full state names for database query
+    @staticmethod
+    def _state_names(states: list[str] | None) -> list[str]:
+        """Convert state abbreviations (or names) to database state names."""
         state_names = []
-        for s in states:
+        for s in states or []:
             s_upper = s.upper().strip()
             name = StateMapper.abbrev_to_name(s_upper)
             if name:
@@ -77,7 +138,12 @@ class QueryBuilder:
             else:
                 # Assume it's already a full state name
                 state_names.append(s.title())
+        return state_names
 
+    @classmethod
+    def _states_clause(cls, states: list[str]) -> tuple[str, list]:
+        """Build states filter clause using state names."""
+        state_names = cls._state_names(states)
         if not state_names:
             return "", []
 
@@ -85,12 +151,31 @@ class QueryBuilder:
         return f"AND g.state_name IN ({placeholders})", state_names
 
     @staticmethod
-    def _landuse_clause(land_use: str | None, alias: str = "l") -> tuple[str, list]:
+    def _landuse_name(land_use: str) -> str:
+        """Map a user-supplied land use type to its database name."""
+        return LANDUSE_MAP.get(land_use.lower(), land_use.title())
+
+    @classmethod
+    def _landuse_clause(cls, land_use: str | None, alias: str = "l") -> tuple[str, list]:
         """Build land use filter clause with parameters."""
         if not land_use:
             return "", []
-        name = LANDUSE_MAP.get(land_use.lower(), land_use.title())
-        return f"AND {alias}.landuse_name = ?", [name]
+        return f"AND {alias}.landuse_name = ?", [cls._landuse_name(land_use)]
+
+    @staticmethod
+    def _ag_types(ag_type: str | None) -> list[str]:
+        """Agricultural land use names covered by an ag_type filter."""
+        if ag_type:
+            return [LANDUSE_MAP.get(ag_type.lower(), ag_type.title())]
+        return ["Crop", "Pasture"]
+
+    @staticmethod
+    def _time_series_landuse(metric: str) -> str | None:
+        """Land use tracked by a time series metric (e.g. "urban_area" -> "Urban")."""
+        metric_lower = metric.lower().replace("_area", "").replace("_", "")
+        if metric_lower in ("urban", "forest", "crop", "pasture", "rangeland"):
+            return LANDUSE_MAP.get(metric_lower, metric_lower.title())
+        return None
 
     @staticmethod
     def _year_clause(year: int | None) -> tuple[str, list]:
@@ -224,34 +309,23 @@ class QueryBuilder:
         Returns:
             QueryResult with SQL and parameters
         """
-        states_clause, states_params = cls._states_clause(states)
-        scenario_clause, scenario_params = cls._scenario_clause(scenario)
-        source_clause, source_params = cls._landuse_clause(source_land_use, "fl")
-        year_clause, year_params = cls._year_range_clause(year_range)
-
-        sql = f"""
-        SELECT
-            fl.landuse_name as source_landuse,
-            g.state_name,
-            SUM(f.acres) as expansion_acres
-        FROM fact_landuse_transitions f
-        JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id
-        JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
-        JOIN dim_geography g ON f.geography_id = g.geography_id
-        JOIN dim_time t ON f.time_id = t.time_id
-        JOIN dim_scenario s ON f.scenario_id = s.scenario_id
-        WHERE tl.landuse_name = 'Urban'
-        AND f.transition_type = 'change'
-        {states_clause}
-        {source_clause}
-        {year_clause}
-        {scenario_clause}
-        GROUP BY fl.landuse_name, g.state_name
-        ORDER BY expansion_acres DESC
-        """
-
-        params = states_params + source_params + year_params + scenario_params
-        return QueryResult(sql=sql.strip(), params=params, description="Urban expansion query")
+        from landuse.api.expression import LandUseQuery
+
+        query = (
+            LandUseQuery("urban_expansion")
+            .where(
+                states=states,
+                year_range=year_range,
+                scenario=cls._scenario_code(scenario),
+                from_use=source_land_use,
+            )
+            .group_by("from_use", "state")
+            .label(from_landuse="source_landuse")
+            .ranked_by_measure()
+            .named("expansion_acres")
+            .compile()
+        )
+        return QueryResult(sql=query.sql, params=query.params, description="Urban expansion query")
 
     @classmethod
     def forest_loss(
@@ -270,32 +344,17 @@ class QueryBuilder:
         Returns:
             QueryResult with SQL and parameters
         """
-        states_clause, states_params = cls._states_clause(states)
-        year_clause, year_params = cls._year_range_clause(year_range)
-        scenario_clause, scenario_params = cls._scenario_clause(scenario)
-
-        sql = f"""
-        SELECT
-            tl.landuse_name as to_use,
-            g.state_name,
-            SUM(f.acres) as acres
-        FROM fact_landuse_transitions f
-        JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id
-        JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
-        JOIN dim_geography g ON f.geography_id = g.geography_id
-        JOIN dim_time t ON f.time_id = t.time_id
-        JOIN dim_scenario s ON f.scenario_id = s.scenario_id
-        WHERE fl.landuse_name = 'Forest'
-        AND f.transition_type = 'change'
-        {states_clause}
-        {year_clause}
-        {scenario_clause}
-        GROUP BY tl.landuse_name, g.state_name
-        ORDER BY acres DESC
-        """
-
-        params = states_params + year_params + scenario_params
-        return QueryResult(sql=sql.strip(), params=params, description="Forest loss query")
+        from landuse.api.expression import LandUseQuery
+
+        query = (
+            LandUseQuery("forest_loss")
+            .where(states=states, year_range=year_range, scenario=cls._scenario_code(scenario))
+            .group_by("to_use", "state")
+            .label(to_landuse="to_use")
+            .ranked_by_measure()
+            .compile()
+        )
+        return QueryResult(sql=query.sql, params=query.params, description="Forest loss query")
 
     @classmethod
     def forest_gain(
@@ -314,32 +373,17 @@ class QueryBuilder:
         Returns:
             QueryResult with SQL and parameters
         """
-        states_clause, states_params = cls._states_clause(states)
-        year_clause, year_params = cls._year_range_clause(year_range)
-        scenario_clause, scenario_params = cls._scenario_clause(scenario)
-
-        sql = f"""
-        SELECT
-            fl.landuse_name as from_use,
-            g.state_name,
-            SUM(f.acres) as acres
-        FROM fact_landuse_transitions f
-        JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id
-        JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
-        JOIN dim_geography g ON f.geography_id = g.geography_id
-        JOIN dim_time t ON f.time_id = t.time_id
-        JOIN dim_scenario s ON f.scenario_id = s.scenario_id
-        WHERE tl.landuse_name = 'Forest'
-        AND f.transition_type = 'change'
-        {states_clause}
-        {year_clause}
-        {scenario_clause}
-        GROUP BY fl.landuse_name, g.state_name
-        ORDER BY acres DESC
-        """
-
-        params = states_params + year_params + scenario_params
-        return QueryResult(sql=sql.strip(), params=params, description="Forest gain query")
+        from landuse.api.expression import LandUseQuery
+
+        query = (
+            LandUseQuery("forest_gain")
+            .where(states=states, year_range=year_range, scenario=cls._scenario_code(scenario))
+            .group_by("from_use", "state")
+            .label(from_landuse="from_use")
+            .ranked_by_measure()
+            .compile()
+        )
+        return QueryResult(sql=query.sql, params=query.params, description="Forest gain query")
 
     @classmethod
     def agricultural_change(
@@ -360,41 +404,23 @@ class QueryBuilder:
         Returns:
             QueryResult with SQL and parameters
         """
-        states_clause, states_params = cls._states_clause(states)
-        scenario_clause, scenario_params = cls._scenario_clause(scenario)
-        year_clause, year_params = cls._year_range_clause(year_range)
-
-        # Determine which ag types to query
-        if ag_type:
-            ag_types = [LANDUSE_MAP.get(ag_type.lower(), ag_type.title())]
-        else:
-            ag_types = ["Crop", "Pasture"]
-
-        ag_placeholders = ", ".join(["?" for _ in ag_types])
-
-        sql = f"""
-        SELECT
-            fl.landuse_name as ag_type,
-            tl.landuse_name as to_use,
-            g.state_name,
-            SUM(f.acres) as acres
-        FROM fact_landuse_transitions f
-        JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id
-        JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
-        JOIN dim_geography g ON f.geography_id = g.geography_id
-        JOIN dim_time t ON f.time_id = t.time_id
-        JOIN dim_scenario s ON f.scenario_id = s.scenario_id
-        WHERE fl.landuse_name IN ({ag_placeholders})
-        AND f.transition_type = 'change'
-        {states_clause}
-        {year_clause}
-        {scenario_clause}
-        GROUP BY fl.landuse_name, tl.landuse_name, g.state_name
-        ORDER BY acres DESC
-        """
-
-        params = ag_types + states_params + year_params + scenario_params
-        return QueryResult(sql=sql.strip(), params=params, description="Agricultural change query")
+        from landuse.api.expression import LandUseQuery
+
+        query = (
+            LandUseQuery("acres")
+            .where(
+                states=states,
+                year_range=year_range,
+                scenario=cls._scenario_code(scenario),
+                from_use=cls._ag_types(ag_type),
+                transition_type="change",
+            )
+            .group_by("from_use", "to_use", "state")
+            .label(from_landuse="ag_type", to_landuse="to_use")
+            .ranked_by_measure()
+            .compile()
+        )
+        return QueryResult(sql=query.sql, params=query.params, description="Agricultural change query")
 
     @classmethod
     def state_comparison(
@@ -415,65 +441,18 @@ class QueryBuilder:
         Returns:
             QueryResult with SQL and parameters
         """
-        states_clause, states_params = cls._states_clause(states)
-        scenario_clause, scenario_params = cls._scenario_clause(scenario)
-        year_clause, year_params = cls._year_clause(year)
-
-        if metric == "urban_expansion":
-            sql = f"""
-            SELECT
-                g.state_name,
-                SUM(f.acres) as total_acres
-            FROM fact_landuse_transitions f
-            JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
-            JOIN dim_geography g ON f.geography_id = g.geography_id
-            JOIN dim_time t ON f.time_id = t.time_id
-            JOIN dim_scenario s ON f.scenario_id = s.scenario_id
-            WHERE tl.landuse_name = 'Urban'
-            AND f.transition_type = 'change'
-            {states_clause}
-            {year_clause}
-            {scenario_clause}
-            GROUP BY g.state_name
-            ORDER BY total_acres DESC
-            """
-        elif metric == "forest_loss":
-            sql = f"""
-            SELECT
-                g.state_name,
-                SUM(f.acres) as total_acres
-            FROM fact_landuse_transitions f
-            JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id
-            JOIN dim_geography g ON f.geography_id = g.geography_id
-            JOIN dim_time t ON f.time_id = t.time_id
-            JOIN dim_scenario s ON f.scenario_id = s.scenario_id
-            WHERE fl.landuse_name = 'Forest'
-            AND f.transition_type = 'change'
-            {states_clause}
-            {year_clause}
-            {scenario_clause}
-            GROUP BY g.state_name
-            ORDER BY total_acres DESC
-            """
-        else:  # land_area
-            sql = f"""
-            SELECT
-                g.state_name,
-                SUM(f.acres) as total_acres
-            FROM fact_landuse_transitions f
-            JOIN dim_geography g ON f.geography_id = g.geography_id
-            JOIN dim_time t ON f.time_id = t.time_id
-            JOIN dim_scenario s ON f.scenario_id = s.scenario_id
-            WHERE f.transition_type = 'same'
-            {states_clause}
-            {year_clause}
-            {scenario_clause}
-            GROUP BY g.state_name
-            ORDER BY total_acres DESC
-            """
-
-        params = states_params + year_params + scenario_params
-        return QueryResult(sql=sql.strip(), params=params, description=f"State comparison ({metric})")
+        from landuse.api.expression import LandUseQuery
+
+        measure = metric if metric in ("urban_expansion", "forest_loss") else "land_area"
+        query = (
+            LandUseQuery(measure)
+            .where(states=states, scenario=cls._scenario_code(scenario), year=year or None)
+            .group_by("state")
+            .ranked_by_measure()
+            .named("total_acres")
+            .compile()
+        )
+        return QueryResult(sql=query.sql, params=query.params, description=f"State comparison ({metric})")
 
     @classmethod
     def time_series(
@@ -496,12 +475,8 @@ class QueryBuilder:
         scenario_clause, scenario_params = cls._scenario_clause(scenario)
 
         # Determine land use filter based on metric
-        metric_lower = metric.lower().replace("_area", "").replace("_", "")
-        if metric_lower in ("urban", "forest", "crop", "pasture", "rangeland"):
-            landuse_name = LANDUSE_MAP.get(metric_lower, metric_lower.title())
-            landuse_filter = f"AND l.landuse_name = '{landuse_name}'"
-        else:
-            landuse_filter = ""
+        landuse_name = cls._time_series_landuse(metric)
+        landuse_filter = f"AND l.landuse_name = '{landuse_name}'" if landuse_name else ""
 
         sql = f"""
         SELECT
@@ -608,50 +583,17 @@ class QueryBuilder:
         Returns:
             QueryResult with SQL and parameters
         """
-        states_clause, states_params = cls._states_clause(states or [])
-        scenario_clause, scenario_params = cls._scenario_clause(scenario)
-
-        if metric == "urban_growth":
-            sql = f"""
-            SELECT
-                g.county_name,
-                g.state_name,
-                g.fips_code,
-                SUM(f.acres) as total_acres
-            FROM fact_landuse_transitions f
-            JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
-            JOIN dim_geography g ON f.geography_id = g.geography_id
-            JOIN dim_scenario s ON f.scenario_id = s.scenario_id
-            WHERE tl.landuse_name = 'Urban'
-            AND f.transition_type = 'change'
-            {states_clause}
-            {scenario_clause}
-            GROUP BY g.county_name, g.state_name, g.fips_code
-            ORDER BY total_acres DESC
-            LIMIT ?
-            """
-        else:  # forest_loss
-            sql = f"""
-            SELECT
-                g.county_name,
-                g.state_name,
-                g.fips_code,
-                SUM(f.acres) as total_acres
-            FROM fact_landuse_transitions f
-            JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id
-            JOIN dim_geography g ON f.geography_id = g.geography_id
-            JOIN dim_scenario s ON f.scenario_id = s.scenario_id
-            WHERE fl.landuse_name = 'Forest'
-            AND f.transition_type = 'change'
-            {states_clause}
-            {scenario_clause}
-            GROUP BY g.county_name, g.state_name, g.fips_code
-            ORDER BY total_acres DESC
-            LIMIT ?
-            """
-
-        params = states_params + scenario_params + [limit]
-        return QueryResult(sql=sql.strip(), params=params, description=f"Top counties ({metric})")
+        from landuse.api.expression import LandUseQuery
+
+        query = (
+            LandUseQuery("urban_expansion" if metric == "urban_growth" else "forest_loss")
+            .where(states=states, scenario=cls._scenario_code(scenario))
+            .group_by("county")
+            .top(limit)
+            .named("total_acres")
+            .compile()
+        )
+        return QueryResult(sql=query.sql, params=query.params, description=f"Top counties ({metric})")
 
     @classmethod
     def data_summary(cls) -> QueryResult:
@@ -669,3 +611,372 @@ class QueryBuilder:
             (SELECT MAX(end_year) FROM dim_time) as max_year
         """
         return QueryResult(sql=sql.strip(), params=[], description="Data summary")
+
+    @classmethod
+    def transition_cube(
+        cls,
+        states: list[str] | None = None,
+        scenarios: list[str] | None = None,
+    ) -> QueryResult:
+        """Build a shared-scan query aggregating transitions over every dimension.
+
+        One scan of the fact table grouped by state, scenario, period and
+        from/to land use answers all state-level area, transition and time
+        series questions for the covered states. Used by ``LandUseAPI.batch``.
+
+        Args:
+            states: State abbreviations to cover (None or empty for all states)
+            scenarios: Scenario codes to cover (None or empty for all scenarios)
+
+        Returns:
+            QueryResult with SQL and parameters
+        """
+        states_clause, states_params = cls._states_clause(states or [])
+        scenario_clause, scenario_params = cls._scenarios_clause(scenarios)
+
+        sql = f"""
+        SELECT
+            g.state_name,
+            s.rcp_scenario,
+            s.ssp_scenario,
+            t.year_range,
+            t.start_year,
+            t.end_year,
+            fl.landuse_name as from_landuse,
+            tl.landuse_name as to_landuse,
+            f.transition_type,
+            SUM(f.acres) as acres
+        FROM fact_landuse_transitions f
+        JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id
+        JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
+        JOIN dim_geography g ON f.geography_id = g.geography_id
+        JOIN dim_time t ON f.time_id = t.time_id
+        JOIN dim_scenario s ON f.scenario_id = s.scenario_id
+        WHERE 1 = 1
+        {states_clause}
+        {scenario_clause}
+        GROUP BY ALL
+        """
+
+        params = states_params + scenario_params
+        return QueryResult(sql=sql.strip(), params=params, description="Transition cube (shared scan)")
+
+    @classmethod
+    def county_transition_matrices(
+        cls,
+        scenario: str,
+        start_year: int | None = None,
+        end_year: int | None = None,
+        states: list[str] | None = None,
+    ) -> QueryResult:
+        """Build query for per-county, per-period from/to land use acres.
+
+        Includes unchanged land (from == to), so row sums give each land use's
+        area at the start of a period.
+
+        Args:
+            scenario: Scenario code (LM, HM, HL, HH)
+            start_year: First period start year (None for the earliest)
+            end_year: Last period end year (None for the latest)
+            states: Optional state filter
+
+        Returns:
+            QueryResult with SQL and parameters
+
+        Raises:
+            ValueError: If the scenario code is unknown (periods only chain within one scenario)
+        """
+        if cls._scenario_pair(scenario) is None:
+            raise ValueError(f"Unknown scenario '{scenario}'. Use one of: {', '.join(SCENARIO_MAP)}")
+        states_clause, states_params = cls._states_clause(states or [])
+        scenario_clause, scenario_params = cls._scenario_clause(scenario)
+        start_clause, start_params = ("AND t.start_year >= ?", [start_year]) if start_year else ("", [])
+        end_clause, end_params = ("AND t.end_year <= ?", [end_year]) if end_year else ("", [])
+
+        sql = f"""
+        SELECT
+            f.geography_id,
+            t.start_year,
+            t.end_year,
+            fl.landuse_name as from_landuse,
+            tl.landuse_name as to_landuse,
+            SUM(f.acres) as acres
+        FROM fact_landuse_transitions f
+        JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id
+        JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
+        JOIN dim_geography g ON f.geography_id = g.geography_id
+        JOIN dim_time t ON f.time_id = t.time_id
+        JOIN dim_scenario s ON f.scenario_id = s.scenario_id
+        WHERE 1 = 1
+        {scenario_clause}
+        {start_clause}
+        {end_clause}
+        {states_clause}
+        GROUP BY ALL
+        """
+
+        params = scenario_params + start_params + end_params + states_params
+        return QueryResult(sql=sql.strip(), params=params, description="County transition matrices")
+
+    @classmethod
+    def county_land_trajectories(cls) -> QueryResult:
+        """Build query for every county's land use area at the end of each period, per scenario.
+
+        Returns:
+            QueryResult with SQL and parameters
+        """
+        sql = """
+        SELECT
+            f.geography_id,
+            s.scenario_name,
+            t.end_year,
+            tl.landuse_name as land_use,
+            SUM(f.acres) as acres
+        FROM fact_landuse_transitions f
+        JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
+        JOIN dim_time t ON f.time_id = t.time_id
+        JOIN dim_scenario s ON f.scenario_id = s.scenario_id
+        GROUP BY ALL
+        """
+        return QueryResult(sql=sql.strip(), params=[], description="County land use trajectories")
+
+    @classmethod
+    def county_socioeconomic(
+        cls,
+        metric: str = "population_density",
+        states: list[str] | None = None,
+        scenario: str = "HM",
+        year: int = 2070,
+        limit: int = 20,
+        ascending: bool = False,
+    ) -> QueryResult:
+        """Build query ranking counties by a per-capita or density metric.
+
+        Reads only the precomputed ``fact_county_socioeconomic`` table, which
+        already joins land use, population and income per county, scenario
+        and period.
+
+        Args:
+            metric: One of ``SOCIOECONOMIC_METRICS``
+            states: Optional state filter
+            scenario: Scenario code (LM, HM, HL, HH)
+            year: Period end year the metric is measured at
+            limit: Number of counties to return
+            ascending: Rank lowest values first
+
+        Returns:
+            QueryResult with SQL and parameters
+
+        Raises:
+            ValueError: If the metric or scenario is unknown
+        """
+        if metric not in SOCIOECONOMIC_METRICS:
+            raise ValueError(f"Unknown metric '{metric}'. Use one of: {', '.join(SOCIOECONOMIC_METRICS)}")
+        pair = cls._scenario_pair(scenario)
+        if pair is None:
+            raise ValueError(f"Unknown scenario '{scenario}'. Use one of: {', '.join(SCENARIO_MAP)}")
+        expression, _unit = SOCIOECONOMIC_METRICS[metric]
+        state_names = cls._state_names(states)
+        states_clause = f"AND state_name IN ({', '.join('?' for _ in state_names)})" if state_names else ""
+
+        sql = f"""
+        SELECT
+            fips_code,
+            county_name,
+            state_name,
+            AVG({expression}) as value
+        FROM fact_county_socioeconomic
+        WHERE rcp_scenario = ? AND ssp_scenario = ?
+        AND end_year = ?
+        {states_clause}
+        GROUP BY ALL
+        HAVING value IS NOT NULL
+        ORDER BY value {"ASC" if ascending else "DESC"}, fips_code
+        LIMIT ?
+        """
+
+        params = [*pair, year, *state_names, limit]
+        return QueryResult(sql=sql.strip(), params=params, description=f"County {metric.replace('_', ' ')}")
+
+    @classmethod
+    def county_export(
+        cls,
+        metric: str = "land_area",
+        states: list[str] | None = None,
+        scenarios: list[str] | None = None,
+        after_fips: str | None = None,
+        county_limit: int | None = None,
+    ) -> QueryResult:
+        """Build query for county x scenario x period results, ordered by FIPS.
+
+        The ``land_use`` column is the land use itself for ``land_area``, the
+        source land use for ``urban_expansion`` and the destination land use
+        for ``forest_loss``. Rows are ordered by FIPS code so results can be
+        streamed or paged by county.
+
+        Args:
+            metric: land_area, urban_expansion or forest_loss
+            states: Optional state filter
+            scenarios: Optional scenario codes (None for all scenarios)
+            after_fips: Only counties with a FIPS code after this one (keyset paging)
+            county_limit: Maximum number of counties to include
+
+        Returns:
+            QueryResult with SQL and parameters
+        """
+        metric_filters = {
+            "land_area": ("fl.landuse_name", "f.transition_type = 'same'"),
+            "urban_expansion": ("fl.landuse_name", "tl.landuse_name = 'Urban' AND f.transition_type = 'change'"),
+            "forest_loss": ("tl.landuse_name", "fl.landuse_name = 'Forest' AND f.transition_type = 'change'"),
+        }
+        if metric not in metric_filters:
+            raise ValueError(f"Unknown county export metric '{metric}'. Use one of: {', '.join(metric_filters)}")
+        land_use_column, metric_clause = metric_filters[metric]
+
+        states_clause, states_params = cls._states_clause(states or [])
+        scenario_clause, scenario_params = cls._scenarios_clause(scenarios)
+        after_clause, after_params = ("AND g.fips_code > ?", [after_fips]) if after_fips else ("", [])
+        limit_clause, limit_params = ("LIMIT ?", [county_limit]) if county_limit else ("", [])
+
+        sql = f"""
+        WITH counties AS (
+            SELECT g.geography_id, g.fips_code, g.county_name, g.state_name
+            FROM dim_geography g
+            WHERE 1 = 1
+            {states_clause}
+            {after_clause}
+            ORDER BY g.fips_code
+            {limit_clause}
+        )
+        SELECT
+            c.fips_code,
+            c.county_name,
+            c.state_name,
+            s.rcp_scenario,
+            s.ssp_scenario,
+            t.year_range,
+            t.start_year,
+            t.end_year,
+            {land_use_column} as land_use,
+            SUM(f.acres) as acres
+        FROM fact_landuse_transitions f
+        JOIN counties c ON f.geography_id = c.geography_id
+        JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id
+        JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
+        JOIN dim_time t ON f.time_id = t.time_id
+        JOIN dim_scenario s ON f.scenario_id = s.scenario_id
+        WHERE {metric_clause}
+        {scenario_clause}
+        GROUP BY ALL
+        ORDER BY c.fips_code, s.rcp_scenario, s.ssp_scenario, t.start_year, land_use
+        """
+
+        params = states_params + after_params + limit_params + scenario_params
+        return QueryResult(sql=sql.strip(), params=params, description=f"County export ({metric})")
+
+    @classmethod
+    def county_vector(
+        cls,
+        metric: str = "urban_expansion",
+        states: list[str] | None = None,
+        scenario: str | None = None,
+        year_range: str | None = None,
+        land_use: str | None = None,
+    ) -> QueryResult:
+        """Build query for one metric value per county, keyed by geography_id.
+
+        Args:
+            metric: One of ``expression.MEASURES``
+            states: Optional state filter
+            scenario: Optional scenario code
+            year_range: Optional time period (e.g. "2020-2030")
+            land_use: Land use for ``land_area`` (None for all land)
+
+        Returns:
+            QueryResult with SQL and parameters
+        """
+        from landuse.api.expression import LandUseQuery
+
+        query = (
+            LandUseQuery(metric)
+            .where(
+                states=states,
+                scenario=scenario if cls._scenario_pair(scenario) else None,
+                year_range=year_range,
+                from_use=land_use if metric == "land_area" else None,
+            )
+            .group_by("geography_id")
+            .named("value")
+            .compile()
+        )
+        return QueryResult(sql=query.sql, params=query.params, description=f"County vector ({metric})")
+
+    @classmethod
+    def transitions_export(
+        cls,
+        states: list[str] | None = None,
+        scenarios: list[str] | None = None,
+        rcp: str | None = None,
+        from_use: str | None = None,
+        to_use: str | None = None,
+        year_range: str | None = None,
+        transition_type: str | None = None,
+    ) -> QueryResult:
+        """Build query for county-level transition rows for bulk export.
+
+        Output columns follow ``TRANSITIONS_EXPORT_COLUMNS``.
+
+        Args:
+            states: Optional state filter
+            scenarios: Optional scenario codes
+            rcp: Optional climate pathway filter (e.g. "RCP85")
+            from_use: Source land use filter
+            to_use: Destination land use filter
+            year_range: Time period filter
+            transition_type: "change" or "same" (None for both)
+
+        Returns:
+            QueryResult with SQL and parameters
+        """
+        states_clause, states_params = cls._states_clause(states or [])
+        scenario_clause, scenario_params = cls._scenarios_clause(scenarios)
+        rcp_clause, rcp_params = ("AND s.rcp_scenario = ?", [rcp.upper()]) if rcp else ("", [])
+        from_clause, from_params = cls._landuse_clause(from_use, "fl")
+        to_clause, to_params = cls._landuse_clause(to_use, "tl")
+        year_range_clause, year_range_params = cls._year_range_clause(year_range)
+        type_clause, type_params = ("AND f.transition_type = ?", [transition_type]) if transition_type else ("", [])
+
+        sql = f"""
+        SELECT
+            g.fips_code,
+            g.county_name,
+            g.state_name,
+            s.rcp_scenario,
+            s.ssp_scenario,
+            t.year_range,
+            t.start_year,
+            t.end_year,
+            fl.landuse_name as from_landuse,
+            tl.landuse_name as to_landuse,
+            f.transition_type,
+            f.acres
+        FROM fact_landuse_transitions f
+        JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id
+        JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
+        JOIN dim_geography g ON f.geography_id = g.geography_id
+        JOIN dim_time t ON f.time_id = t.time_id
+        JOIN dim_scenario s ON f.scenario_id = s.scenario_id
+        WHERE 1 = 1
+        {states_clause}
+        {scenario_clause}
+        {rcp_clause}
+        {from_clause}
+        {to_clause}
+        {year_range_clause}
+        {type_clause}
+        """
+
+        params = (
+            states_params + scenario_params + rcp_params + from_params + to_params + year_range_params + type_params
+        )
+        return QueryResult(sql=sql.strip(), params=params, description="Transitions export")
@@ -0,0 +1,94 @@
+"""County similarity search over land use trajectories.
+
+Each county is described by its land use shares at the end of every period
+under every scenario, flattened into one feature vector. Features are
+centered on the all-county mean, so similarity reflects how a county differs
+from the typical county rather than the shares every county has in common,
+and rows are L2-normalized. Cosine similarity to a county is then a single
+matrix-vector product, and ``np.argpartition`` picks the k nearest without
+sorting every county.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class CountySimilarityIndex:
+    """L2-normalized land use trajectory vectors for every county in FIPS order.
+
+    Attributes:
+        fips: County FIPS codes (canonical FIPS order)
+        matrix: ``(counties, features)`` unit-length trajectory vectors
+                (all zeros for counties without data)
+        features: (scenario, end_year, land_use) label of each column
+        valid: Counties with data (the only ones returned as neighbors)
+    """
+
+    fips: np.ndarray
+    matrix: np.ndarray
+    features: tuple[tuple[str, int, str], ...]
+    valid: np.ndarray
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, fips: np.ndarray, positions: np.ndarray) -> "CountySimilarityIndex":
+        """Build the index from ``QueryBuilder.county_land_trajectories`` rows.
+
+        Args:
+            df: Rows with scenario_name, end_year, land_use and acres
+            fips: FIPS codes of the index rows
+            positions: Index row of each ``df`` row (-1 drops the row)
+
+        Returns:
+            CountySimilarityIndex over ``fips``
+        """
+        keep = positions >= 0
+        df = df[keep]
+        positions = positions[keep]
+
+        # One column per (scenario, period, land use); shares sum to 1 per (scenario, period)
+        trajectory, trajectories = pd.MultiIndex.from_frame(df[["scenario_name", "end_year"]]).factorize(sort=True)
+        land_use, land_uses = pd.factorize(df["land_use"], sort=True)
+        columns = trajectory * len(land_uses) + land_use
+
+        acres = np.zeros((len(fips), len(trajectories) * len(land_uses)))
+        np.add.at(acres, (positions, columns), df["acres"].to_numpy(dtype=np.float64))
+        blocks = acres.reshape(len(fips), len(trajectories), len(land_uses))
+        totals = blocks.sum(axis=2, keepdims=True)
+        shares = np.divide(blocks, totals, out=np.zeros_like(blocks), where=totals > 0).reshape(len(fips), -1)
+
+        has_data = acres.sum(axis=1) > 0
+        if has_data.any():
+            shares[has_data] -= shares[has_data].mean(axis=0)
+        shares[~has_data] = 0.0
+        norms = np.linalg.norm(shares, axis=1, keepdims=True)
+        matrix = np.divide(shares, norms, out=np.zeros_like(shares), where=norms > 0)
+
+        features = tuple((str(scenario), int(year), str(use)) for scenario, year in trajectories for use in land_uses)
+        return cls(fips=np.asarray(fips), matrix=matrix, features=features, valid=norms[:, 0] > 0)
+
+    def neighbors(self, position: int, k: int = 10, mask: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """The ``k`` counties most similar to the county at ``position``.
+
+        Args:
+            position: Row of the target county
+            k: Number of neighbors
+            mask: Optional boolean mask of candidate counties
+
+        Returns:
+            (positions, cosine similarities), most similar first; the target
+            and counties without data are never returned
+        """
+        scores = self.matrix @ self.matrix[position]
+        candidates = self.valid.copy() if mask is None else self.valid & mask
+        candidates[position] = False
+        scores = np.where(candidates, scores, -np.inf)
+
+        k = min(k, int(candidates.sum()))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        top = np.argpartition(scores, -k)[-k:] if k < len(scores) else np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return top, scores[top]
@@ -0,0 +1,283 @@
+"""
+Persistent on-disk cache of query result DataFrames.
+
+A second-level cache below the in-memory ``QueryCache``: results are stored in
+a local SQLite file shared by every process on the host and kept across
+restarts, so a freshly started worker serves popular queries without running
+them again.
+
+Entries are keyed by a digest of the database generation token plus the query
+fingerprint (SQL and parameters). A rebuilt database has a new generation, so
+results computed against an earlier file are never served; they simply stop
+being read and are evicted like any other cold entry. Only results from
+databases with a file identity should be stored: in-memory databases have
+process-local generations.
+
+Frames are serialized as Arrow IPC streams, which round-trip the dtypes of
+DuckDB ``.df()`` results and, unlike pickle, cannot execute code when read.
+
+SQLite runs in WAL mode, so readers never block each other or the single
+writer; writers wait up to ``busy_timeout`` for the lock. The total payload
+size is bounded by evicting the least recently read entries after each write.
+Read times are only written back once per ``touch_interval`` so hits stay
+read-only. Any SQLite error is logged and treated as a miss, so a locked,
+full or corrupt cache file never fails a query; an entry whose payload cannot
+be decoded is also deleted.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Hashable, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    generation TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    nbytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at);
+"""
+
+# Keep the most recently read entries whose running payload size fits the budget
+_EVICT = """
+DELETE FROM results WHERE key IN (
+    SELECT key FROM (
+        SELECT key, SUM(nbytes) OVER (ORDER BY accessed_at DESC, key) AS running FROM results
+    ) WHERE running > ?
+)
+"""
+
+
+def fingerprint(generation: str, key: Hashable) -> str:
+    """
+    Digest identifying a cached result across processes.
+
+    Args:
+        generation: Database generation token
+        key: Query fingerprint built from str, int, float, None and tuples, whose repr is stable
+
+    Returns:
+        Hex digest
+    """
+    return hashlib.blake2b(repr((generation, key)).encode(), digest_size=16).hexdigest()
+
+
+def serialize_frame(df: pd.DataFrame, compression: Optional[str] = None) -> bytes:
+    """Serialize a DataFrame as an Arrow IPC stream."""
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def deserialize_frame(payload: bytes) -> pd.DataFrame:
+    """Read a DataFrame written by ``serialize_frame``."""
+    return pa.ipc.open_stream(pa.py_buffer(payload)).read_all().to_pandas()
+
+
+class DiskQueryCache:
+    """
+    Size-bounded SQLite store of query results shared between processes.
+
+    Example:
+        >>> cache = DiskQueryCache("~/.cache/landuse/results.sqlite", max_bytes=1024**3)
+        >>> cache.set(generation.token, ("SELECT 1", ()), df, ttl=86400)
+        >>> cache.get(generation.token, ("SELECT 1", ()))
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = 1024**3,
+        max_entry_bytes: int = 64 * 1024**2,
+        ttl: float = 86400.0,
+        touch_interval: float = 60.0,
+        busy_timeout: float = 5.0,
+        compression: Optional[str] = "lz4",
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache, creating the file if needed.
+
+        Args:
+            path: SQLite file, shared by every process using the same path
+            max_bytes: Maximum total size of stored payloads
+            max_entry_bytes: Results with larger payloads are not stored
+            ttl: Default seconds until an entry expires
+            touch_interval: Minimum seconds between read-time updates of an entry
+            busy_timeout: Seconds to wait for another process's write lock
+            compression: Arrow IPC compression ("lz4", "zstd" or None)
+            clock: Wall-clock time source, comparable across processes (injectable for tests)
+        """
+        self.path = Path(path).expanduser()
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.ttl = ttl
+        self.touch_interval = touch_interval
+        self.busy_timeout = busy_timeout
+        self.compression = compression
+        self._clock = clock
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """The calling thread's SQLite connection (reopened after a fork)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _failed(self, action: str, error: Exception) -> None:
+        self.errors += 1
+        logger.warning(f"Result cache {action} failed for {self.path}: {error}")
+
+    def get(self, generation: str, key: Hashable, max_age: Optional[float] = None) -> Optional[pd.DataFrame]:
+        """
+        Look up a stored result.
+
+        Args:
+            generation: Database generation token
+            key: Query fingerprint
+            max_age: Treat entries older than this many seconds as a miss
+
+        Returns:
+            A new DataFrame, or None on a miss
+        """
+        digest = fingerprint(generation, key)
+        now = self._clock()
+        try:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT payload, created_at, expires_at, accessed_at FROM results WHERE key = ?", (digest,)
+            ).fetchone()
+            if row is None or row[2] <= now or (max_age is not None and now - row[1] >= max_age):
+                self.misses += 1
+                return None
+            if now - row[3] >= self.touch_interval:
+                conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, digest))
+            frame = deserialize_frame(row[0])
+        except pa.ArrowException as e:
+            self._failed("decode", e)
+            self._delete(digest)
+            self.misses += 1
+            return None
+        except sqlite3.Error as e:
+            self._failed("read", e)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return frame
+
+    def _delete(self, digest: str) -> None:
+        """Drop one entry."""
+        try:
+            self._connection().execute("DELETE FROM results WHERE key = ?", (digest,))
+        except sqlite3.Error as e:
+            self._failed("delete", e)
+
+    def set(self, generation: str, key: Hashable, frame: pd.DataFrame, ttl: Optional[float] = None) -> bool:
+        """
+        Store a result, evicting least recently read entries to stay within ``max_bytes``.
+
+        Args:
+            generation: Database generation token
+            key: Query fingerprint
+            frame: Result to store
+            ttl: Seconds until the entry expires (defaults to ``self.ttl``)
+
+        Returns:
+            True if stored
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return False
+        try:
+            payload = serialize_frame(frame, self.compression)
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            logger.debug(f"Result not cached on disk: {e}")
+            return False
+        if len(payload) > min(self.max_entry_bytes, self.max_bytes):
+            return False
+
+        now = self._clock()
+        try:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM results WHERE expires_at <= ?", (now,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (fingerprint(generation, key), generation, payload, len(payload), now, now + ttl, now),
+                )
+                conn.execute(_EVICT, (self.max_bytes,))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            self._failed("write", e)
+            return False
+        self.writes += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop all entries, for every process sharing the file."""
+        try:
+            self._connection().execute("DELETE FROM results")
+        except sqlite3.Error as e:
+            self._failed("clear", e)
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of stored payloads."""
+        return self._connection().execute("SELECT COALESCE(SUM(nbytes), 0) FROM results").fetchone()[0]
+
+    def stats(self) -> dict[str, int]:
+        """Cache statistics (entries and bytes are shared; counters are this process's)."""
+        counters = {"hits": self.hits, "misses": self.misses, "writes": self.writes, "errors": self.errors}
+        try:
+            entries, nbytes = (
+                self._connection().execute("SELECT COUNT(*), COALESCE(SUM(nbytes), 0) FROM results").fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache stats failed for {self.path}: {e}")
+            entries = nbytes = 0
+        return {"entries": entries, "bytes": nbytes, **counters}
+
+    def close(self) -> None:
+        """Close the calling thread's SQLite connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            if self._local.pid == os.getpid():
+                conn.close()
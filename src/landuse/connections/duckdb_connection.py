@@ -5,21 +5,31 @@ DuckDB Connection Manager
 Provides efficient database access with connection pooling, caching, and retry logic.
 """
 
+import asyncio
 import os
+import threading
 import time
-from functools import lru_cache
+from contextlib import contextmanager
 from pathlib import Path
 from threading import Lock
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import duckdb
 import pandas as pd
 from pydantic import BaseModel, Field
 
-from ..exceptions import DatabaseConnectionError, DatabaseError, wrap_exception
+from ..core.app_config import RuntimeProfile
+from ..exceptions import DatabaseConnectionError, DatabaseError, QueryTimeoutError, wrap_exception
 from ..models import QueryResult, SQLQuery
 from ..security.database_security import DatabaseSecurity
 from ..utils.retry_decorators import database_retry
+from .disk_cache import DiskQueryCache
+from .metadata import DatabaseGeneration, MetadataSnapshot, get_metadata_snapshot
+from .preload import PreloadReport, load_into_memory
+from .query_cache import QueryCache, freeze_frame
+from .registry import DatabaseHandle, get_registry
+from .single_flight import SingleFlight
+from .watchdog import QueryDeadline
 
 
 class ConnectionConfig(BaseModel):
@@ -30,8 +40,72 @@ class ConnectionConfig(BaseModel):
         description="Path to DuckDB file or ':memory:'",
     )
     read_only: bool = Field(default=True, description="Open in read-only mode")
-    memory_limit: Optional[str] = Field(default=None, description="Memory limit for DuckDB")
-    threads: Optional[int] = Field(default=None, description="Number of threads for DuckDB")
+    profile: Optional[RuntimeProfile] = Field(default=None, description="DuckDB runtime settings to apply")
+    memory_limit: Optional[str] = Field(default=None, description="Memory limit for DuckDB (overrides profile)")
+    threads: Optional[int] = Field(default=None, description="Number of threads for DuckDB (overrides profile)")
+    query_timeout: Optional[float] = Field(
+        default=None, gt=0, description="Per-statement deadline in seconds (None disables)"
+    )
+    in_memory: bool = Field(default=False, description="Copy the database file into memory on connect")
+    preload_tables: Optional[list[str]] = Field(default=None, description="Tables to copy (None copies all)")
+    preload_scenarios: Optional[list[str]] = Field(
+        default=None, description='Scenarios to keep, as scenario_name or "RCP/SSP" pairs (None keeps all)'
+    )
+    preload_columns: Optional[dict[str, list[str]]] = Field(
+        default=None, description="Per-table column subsets to copy"
+    )
+    cache_max_entries: int = Field(default=256, ge=0, description="Maximum cached query results")
+    cache_max_bytes: int = Field(default=256 * 1024**2, ge=0, description="Maximum size of cached query results")
+    max_connections: int = Field(default=10, ge=1, description="Maximum cursors open at once on the database")
+    result_cache_path: Optional[str] = Field(
+        default=None, description="SQLite file persisting query results across processes (None disables)"
+    )
+    result_cache_bytes: int = Field(default=1024**3, ge=0, description="Maximum size of persisted query results")
+
+    @classmethod
+    def from_app_config(cls, app_config: Any) -> "ConnectionConfig":
+        """
+        Build a connection config from an AppConfig.
+
+        ``DatabaseConfig.connection_timeout`` bounds every statement run
+        through the connection; ``in_memory`` and ``preload_scenarios``
+        enable in-memory preloading; ``cache_max_entries`` and
+        ``cache_max_mb`` bound the query result cache; ``max_connections``
+        bounds the cursors open on the shared database; ``result_cache_path``
+        and ``result_cache_mb`` enable the persistent result cache. The
+        selected ``runtime`` profile (conversion profile for writable
+        databases) sets DuckDB's runtime options.
+
+        Args:
+            app_config: AppConfig instance
+
+        Returns:
+            ConnectionConfig for the configured database
+        """
+        db = app_config.database
+        runtime = app_config.runtime
+        return cls(
+            database=db.path,
+            profile=runtime.get() if db.read_only else runtime.conversion,
+            read_only=db.read_only,
+            query_timeout=db.connection_timeout,
+            in_memory=db.in_memory,
+            preload_scenarios=db.preload_scenarios,
+            cache_max_entries=db.cache_max_entries,
+            cache_max_bytes=db.cache_max_mb * 1024**2,
+            max_connections=db.max_connections,
+            result_cache_path=db.result_cache_path,
+            result_cache_bytes=db.result_cache_mb * 1024**2,
+        )
+
+    def duckdb_config(self) -> dict[str, Any]:
+        """DuckDB ``config`` dict: the profile's settings with ``memory_limit`` and ``threads`` applied on top."""
+        config = self.profile.duckdb_config() if self.profile else {}
+        if self.memory_limit:
+            config["memory_limit"] = self.memory_limit
+        if self.threads:
+            config["threads"] = self.threads
+        return config
 
 
 class DuckDBConnection:
@@ -40,9 +114,17 @@ class DuckDBConnection:
 
     This connection supports:
     - Local DuckDB files
-    - In-memory databases
-    - Thread-safe operations
+    - In-memory databases, including in-memory copies of database files
+    - Thread-safe operations: each thread gets its own cursor on a database
+      shared process-wide through the connection registry
     - Automatic retry on transient failures
+    - A bounded LRU/TTL cache of query results per connection, keyed by the
+      database generation so a rebuilt database file is never answered from
+      results cached before the rebuild
+    - An optional on-disk second-level result cache shared by every process
+      and kept across restarts
+    - Single-flight execution: identical concurrent queries (from threads or
+      ``query_async`` coroutines) share one execution on read-only databases
 
     Example:
         >>> config = ConnectionConfig(database="data/analytics.duckdb")
@@ -51,16 +133,13 @@ class DuckDBConnection:
         >>> conn.close()
     """
 
-    _instance: Optional[duckdb.DuckDBPyConnection] = None
-    _lock: Lock = Lock()
-    _query_cache: dict = {}
-    _cache_ttl: dict = {}
-
     def __init__(
         self,
         config: Optional[ConnectionConfig] = None,
         database: Optional[str] = None,
         read_only: bool = True,
+        cache: Optional[QueryCache] = None,
+        disk_cache: Optional[DiskQueryCache] = None,
     ):
         """
         Initialize DuckDB connection.
@@ -69,6 +148,10 @@ class DuckDBConnection:
             config: ConnectionConfig object with database settings
             database: Path to database file (overrides config)
             read_only: Open in read-only mode (overrides config)
+            cache: Query result cache to use, e.g. one shared by connections to
+                   the same database (defaults to a new cache sized by config)
+            disk_cache: Persistent result cache consulted on in-memory misses
+                        (defaults to one at ``config.result_cache_path``, if set)
         """
         if config:
             self._config = config
@@ -76,34 +159,62 @@ class DuckDBConnection:
             db_path = database or os.getenv("LANDUSE_DB_PATH", "data/processed/landuse_analytics.duckdb")
             self._config = ConnectionConfig(database=db_path, read_only=read_only)
 
-        self._instance = None
+        self._instance: Optional[duckdb.DuckDBPyConnection] = None
+        self._handle: Optional[DatabaseHandle] = None
+        self._owner: Optional[int] = None
+        self._lock = Lock()
+        self.preload_report: Optional[PreloadReport] = None
+        self._preloaded_metadata: Optional[MetadataSnapshot] = None
+        self._query_cache = cache or QueryCache(
+            max_entries=self._config.cache_max_entries, max_bytes=self._config.cache_max_bytes
+        )
+        if disk_cache is None and self._config.result_cache_path:
+            disk_cache = DiskQueryCache(self._config.result_cache_path, max_bytes=self._config.result_cache_bytes)
+        self._disk_cache = disk_cache
+        self._flights = SingleFlight(share=lambda df: df.copy(deep=False))
+
+    @property
+    def preloaded(self) -> bool:
+        """True if the database file is copied into memory on connect."""
+        db = self._config.database
+        return self._config.in_memory and db != ":memory:" and not db.startswith("md:")
 
     @database_retry(max_attempts=3, min_wait=1.0, max_wait=10.0)
-    def _connect(self) -> duckdb.DuckDBPyConnection:
+    def _connect(self) -> DatabaseHandle:
         """
         Connect to DuckDB database with retry logic.
 
+        Database files are shared through the process-wide registry; in-memory
+        databases and preloaded copies are private to this connection.
+
         Returns:
-            DuckDB connection object
+            Handle on the database
 
         Raises:
             DatabaseConnectionError: If connection fails after retries
         """
         db = self._config.database
 
-        # Validate database file exists (if not in-memory or MotherDuck)
-        if db != ":memory:" and not db.startswith("md:") and not Path(db).exists():
+        # Validate database file exists (if not in-memory or MotherDuck); writable connections create it
+        if self._config.read_only and db != ":memory:" and not db.startswith("md:") and not Path(db).exists():
             raise FileNotFoundError(f"Database file not found: {db}")
 
-        # Build connection kwargs
-        kwargs = {"read_only": self._config.read_only}
-        if self._config.memory_limit:
-            kwargs["config"] = {"memory_limit": self._config.memory_limit}
-        if self._config.threads:
-            kwargs.setdefault("config", {})["threads"] = self._config.threads
-
+        config = self._config.duckdb_config() or None
+        registry = get_registry()
+        max_cursors = self._config.max_connections
         try:
-            return duckdb.connect(database=db, **kwargs)
+            if self.preloaded:
+                conn, self.preload_report = load_into_memory(
+                    db,
+                    tables=self._config.preload_tables,
+                    scenarios=self._config.preload_scenarios,
+                    columns=self._config.preload_columns,
+                    config=config,
+                )
+                return registry.adopt(conn, max_cursors)
+            return registry.open(db, self._config.read_only, config, max_cursors)
+        except ValueError:
+            raise
         except Exception as e:
             raise DatabaseConnectionError(f"Failed to connect to DuckDB at {db}: {e}") from e
 
@@ -117,27 +228,75 @@ class DuckDBConnection:
         if self._instance is None:
             with self._lock:
                 if self._instance is None:
-                    self._instance = self._connect()
+                    self._handle = self._connect()
+                    self._instance = self._handle.cursor()
+                    self._owner = threading.get_ident()
         return self
 
     def cursor(self) -> duckdb.DuckDBPyConnection:
         """
-        Return a cursor (DuckDB connections are their own cursors).
+        Return the calling thread's cursor.
+
+        The thread that connected uses ``_instance``; other threads get their
+        own cursor on the same database so their queries do not interfere.
 
         Returns:
             DuckDB connection object
         """
         if self._instance is None:
             self.connect()
-        return self._instance
+        if self._handle is None:
+            return self._instance
+        cursor = self._handle.cursor()
+        if threading.get_ident() == self._owner:
+            # A replaced database file is reopened, so the connecting thread's cursor can change
+            self._instance = cursor
+        return cursor
+
+    @contextmanager
+    def _query_cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Cursor for one read: the calling thread's cursor, or on other threads of
+        a read-only database a pooled cursor leased for the duration of the read.
+
+        Leasing keeps idle threads from holding cursors; writable databases keep
+        per-thread cursors, whose sessions (transactions, temp tables) span queries.
+        """
+        if self._instance is None:
+            self.connect()
+        if self._handle is None or not self._config.read_only or threading.get_ident() == self._owner:
+            yield self.cursor()
+            return
+        with self._handle.lease() as cursor:
+            yield cursor
+
+    def generation(self) -> Optional[DatabaseGeneration]:
+        """
+        Get the generation (file identity and schema version) of the database being read.
+
+        The file is statted at most once a second; a replaced file is reopened.
+
+        Returns:
+            DatabaseGeneration, or None if the connection is not backed by the registry
+        """
+        if self._instance is None:
+            self.connect()
+        return self._handle.generation() if self._handle is not None else None
 
     def query(self, query: str, ttl: Optional[int] = 3600, use_cache: bool = True, **kwargs) -> pd.DataFrame:
         """
         Execute a query and return results as a DataFrame.
 
+        Cached results are returned as read-only views shared with the cache:
+        adding columns works, but call ``.copy()`` before editing values in place.
+        On a read-only database, identical queries issued while one is running
+        wait for and share its result (also as read-only views) instead of
+        running again.
+
         Args:
             query: SQL query to execute
-            ttl: Time-to-live for cached results in seconds (default: 3600)
+            ttl: Time-to-live for cached results in seconds (default: 3600);
+                 cached results older than this are not reused
             use_cache: Whether to use query caching (default: True)
             **kwargs: Additional parameters to pass to the query
 
@@ -146,33 +305,96 @@ class DuckDBConnection:
 
         Raises:
             ValueError: If query fails security validation
+            QueryTimeoutError: If the query exceeds the configured query_timeout
         """
         # Validate query security before execution
         DatabaseSecurity.validate_query_safety(query)
 
-        # Check cache
-        cache_key = (query, tuple(sorted(kwargs.items())))
-        current_time = time.time()
+        cache_key, generation, cached = self._cached(query, ttl, use_cache, kwargs)
+        if cached is not None:
+            return cached
+        if not self._config.read_only:
+            return self._run_query(query, ttl, use_cache, kwargs, cache_key, generation)
+        return self._flights.do(cache_key, self._run_shared_query, query, ttl, use_cache, kwargs, cache_key, generation)
 
-        if use_cache and cache_key in self._query_cache:
-            cached_time = self._cache_ttl.get(cache_key, 0)
-            if current_time - cached_time < (ttl or 3600):
-                return self._query_cache[cache_key].copy()
+    async def query_async(
+        self, query: str, ttl: Optional[int] = 3600, use_cache: bool = True, **kwargs
+    ) -> pd.DataFrame:
+        """
+        Async ``query``: runs the query in a worker thread, and coroutines waiting
+        on an identical in-flight query await it without holding a thread.
+
+        Args:
+            query: SQL query to execute
+            ttl: Time-to-live for cached results in seconds (default: 3600)
+            use_cache: Whether to use query caching (default: True)
+            **kwargs: Additional parameters to pass to the query
+
+        Returns:
+            pd.DataFrame: Query results
+        """
+        DatabaseSecurity.validate_query_safety(query)
+
+        cache_key, generation, cached = self._cached(query, ttl, use_cache, kwargs)
+        if cached is not None:
+            return cached
+        if not self._config.read_only:
+            return await asyncio.to_thread(self._run_query, query, ttl, use_cache, kwargs, cache_key, generation)
+        return await self._flights.do_async(
+            cache_key, self._run_shared_query, query, ttl, use_cache, kwargs, cache_key, generation
+        )
+
+    def _cached(
+        self, query: str, ttl: Optional[int], use_cache: bool, kwargs: dict
+    ) -> tuple[tuple, Optional[DatabaseGeneration], Optional[pd.DataFrame]]:
+        """Cache key, database generation and in-memory cached result (None on a miss) of a query."""
+        # Keys include the database generation, so rebuilt files miss
+        generation = self.generation() if use_cache else None
+        cache_key = (generation.token if generation else None, query, tuple(sorted(kwargs.items())))
+        cached = self._query_cache.get(cache_key, max_age=ttl or 3600) if use_cache else None
+        return cache_key, generation, cached
+
+    def _run_shared_query(self, *args) -> pd.DataFrame:
+        """``_run_query`` with its result frozen, so waiters can share it."""
+        return freeze_frame(self._run_query(*args))
+
+    def _run_query(
+        self,
+        query: str,
+        ttl: Optional[int],
+        use_cache: bool,
+        kwargs: dict,
+        cache_key: tuple,
+        generation: Optional[DatabaseGeneration],
+    ) -> pd.DataFrame:
+        """Answer a query missing from the in-memory cache: from the disk cache, or by executing it."""
+        # Only read-only database files have generations that mean the same thing in every process
+        disk_cache = None
+        if use_cache and ttl and self._config.read_only and generation and generation.identity is not None:
+            disk_cache = self._disk_cache
+        if disk_cache is not None:
+            df = disk_cache.get(generation.token, cache_key[1:], max_age=ttl)
+            if df is not None:
+                if self._query_cache.set(cache_key, df, ttl):
+                    return df.copy(deep=False)
+                return df
 
         # Execute query
-        cursor = self.cursor()
-        if kwargs:
-            params = list(kwargs.values())
-            result = cursor.execute(query, params)
-        else:
-            result = cursor.execute(query)
+        with self._query_cursor() as cursor, QueryDeadline(cursor, self._config.query_timeout, query):
+            if kwargs:
+                params = list(kwargs.values())
+                result = cursor.execute(query, params)
+            else:
+                result = cursor.execute(query)
 
-        df = result.df()
+            df = result.df()
+
+        if disk_cache is not None:
+            disk_cache.set(generation.token, cache_key[1:], df, ttl)
 
         # Cache result
-        if use_cache and ttl:
-            self._query_cache[cache_key] = df.copy()
-            self._cache_ttl[cache_key] = current_time
+        if use_cache and ttl and self._query_cache.set(cache_key, df, ttl):
+            return df.copy(deep=False)
 
         return df
 
@@ -205,6 +427,8 @@ class DuckDBConnection:
             return QueryResult(success=True, data=df, execution_time=execution_time, query=sql_obj.sql)
         except ValueError as e:
             return QueryResult(success=False, error=f"SQL validation error: {str(e)}", query=query)
+        except QueryTimeoutError as e:
+            return QueryResult(success=False, error=f"Query timeout: {e.message}", query=query)
         except (duckdb.Error, duckdb.CatalogException, duckdb.SyntaxException) as e:
             return QueryResult(success=False, error=f"Database error: {str(e)}", query=query)
         except Exception as e:
@@ -218,13 +442,17 @@ class DuckDBConnection:
         Args:
             query: SQL query to execute
             **kwargs: Additional parameters to pass to the query
+
+        Raises:
+            QueryTimeoutError: If the query exceeds the configured query_timeout
         """
         cursor = self.cursor()
-        if kwargs:
-            params = list(kwargs.values())
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
+        with QueryDeadline(cursor, self._config.query_timeout, query):
+            if kwargs:
+                params = list(kwargs.values())
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
 
     def get_table_info(self, table_name: str, ttl: int = 3600) -> pd.DataFrame:
         """
@@ -241,16 +469,42 @@ class DuckDBConnection:
         query = f"DESCRIBE {table_name}"
         return self.query(query, ttl=ttl)
 
+    def metadata(self) -> Optional[MetadataSnapshot]:
+        """
+        Get the metadata snapshot for a read-only database.
+
+        Returns:
+            MetadataSnapshot shared per database file (built once per
+            connection when preloaded), or None for writable connections
+        """
+        if self.preloaded:
+            # A preloaded copy may hold a subset of the file, so its snapshot is not shared
+            if self._preloaded_metadata is None:
+                with self._query_cursor() as cursor:
+                    self._preloaded_metadata = MetadataSnapshot.build(cursor)
+            return self._preloaded_metadata
+        if not self._config.read_only:
+            return None
+        generation = self.generation()
+        with self._query_cursor() as cursor:
+            return get_metadata_snapshot(cursor, self._config.database, generation.identity if generation else None)
+
     def list_tables(self, ttl: int = 3600) -> pd.DataFrame:
         """
         List all tables in the database.
 
+        Read-only databases are answered from the metadata snapshot.
+
         Args:
             ttl: Cache time-to-live in seconds
 
         Returns:
             pd.DataFrame: List of tables
         """
+        snapshot = self.metadata()
+        if snapshot is not None:
+            return pd.DataFrame({"table_name": list(snapshot.tables)})
+
         query = """
         SELECT table_name
         FROM information_schema.tables
@@ -263,6 +517,8 @@ class DuckDBConnection:
         """
         Get the row count for a table.
 
+        Read-only databases are answered from the metadata snapshot.
+
         Args:
             table_name: Name of the table
             ttl: Cache time-to-live in seconds (default: 300)
@@ -271,6 +527,10 @@ class DuckDBConnection:
             int: Number of rows in the table
         """
         DatabaseSecurity.validate_table_name(table_name)
+        snapshot = self.metadata()
+        if snapshot is not None and table_name in snapshot.row_counts:
+            return snapshot.row_counts[table_name]
+
         query = f"SELECT COUNT(*) as count FROM {table_name}"
         result = self.query(query, ttl=ttl)
         return result["count"].iloc[0]
@@ -288,18 +548,49 @@ class DuckDBConnection:
         except Exception:
             return False
 
+    def pool_stats(self) -> dict[str, int]:
+        """
+        Get cursor statistics for the underlying database.
+
+        Returns:
+            Open handles, open and idle cursors, the cursor limit, and
+            counts of cursors created, reaped and failing health checks
+        """
+        self.connect()
+        return self._handle.database.stats()
+
     def clear_cache(self) -> None:
         """Clear all cached query results."""
         self._query_cache.clear()
-        self._cache_ttl.clear()
+
+    def cache_stats(self) -> dict[str, int]:
+        """
+        Get query cache statistics.
+
+        Returns:
+            Entry count, approximate bytes, hits, misses, evictions and expirations,
+            ``coalesced`` queries that shared an in-flight execution, plus
+            ``disk_``-prefixed statistics of the persistent result cache if enabled
+        """
+        stats = self._query_cache.stats()
+        stats["coalesced"] = self._flights.coalesced
+        if self._disk_cache is not None:
+            stats.update({f"disk_{name}": value for name, value in self._disk_cache.stats().items()})
+        return stats
 
     def close(self) -> None:
         """Close the database connection."""
         if self._instance is not None:
             with self._lock:
                 if self._instance is not None:
-                    self._instance.close()
+                    if self._handle is not None:
+                        self._handle.close()
+                        self._handle = None
+                    else:
+                        self._instance.close()
                     self._instance = None
+                    self._owner = None
+                    self._preloaded_metadata = None
 
     def __enter__(self) -> "DuckDBConnection":
         """Context manager entry."""
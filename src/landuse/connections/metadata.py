@@ -0,0 +1,262 @@
+"""
+Metadata snapshots for read-only DuckDB databases.
+
+Table row counts, the table list and the data summary (year range, scenarios,
+land use types, per-state coverage) only change when the database file is
+rewritten. A snapshot is computed once per database file and served from
+memory until the file's identity (device, inode, size, mtime, plus its WAL)
+changes.
+"""
+
+import hashlib
+import os
+import time
+from dataclasses import astuple, dataclass, field
+from functools import cached_property
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+import duckdb
+
+from ..database.schema_version import SchemaVersionManager
+
+# Tables whose presence marks a land use star schema database
+STAR_SCHEMA_TABLES = frozenset(["fact_landuse_transitions", "dim_geography", "dim_scenario", "dim_time", "dim_landuse"])
+
+
+@dataclass(frozen=True)
+class FileIdentity:
+    """Identity of a database file; changes whenever the file is rewritten."""
+
+    path: str
+    device: int
+    inode: int
+    size: int
+    mtime_ns: int
+    wal_size: int = 0
+    wal_mtime_ns: int = 0
+
+    @classmethod
+    def of(cls, database: str | os.PathLike) -> Optional["FileIdentity"]:
+        """
+        Stat a database file.
+
+        Args:
+            database: Database path
+
+        Returns:
+            FileIdentity, or None for in-memory/MotherDuck databases and missing files
+        """
+        database = str(database)
+        if database == ":memory:" or database.startswith("md:"):
+            return None
+        try:
+            path = Path(database).resolve()
+            stat = path.stat()
+        except OSError:
+            return None
+
+        wal_size = wal_mtime_ns = 0
+        try:
+            wal = os.stat(f"{path}.wal")
+            wal_size, wal_mtime_ns = wal.st_size, wal.st_mtime_ns
+        except OSError:
+            pass
+
+        return cls(
+            path=str(path),
+            device=stat.st_dev,
+            inode=stat.st_ino,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            wal_size=wal_size,
+            wal_mtime_ns=wal_mtime_ns,
+        )
+
+    def same_file(self, other: Optional["FileIdentity"]) -> bool:
+        """True if ``other`` is the same file (device and inode), even if its contents changed."""
+        return other is not None and (self.device, self.inode) == (other.device, other.inode)
+
+
+@dataclass(frozen=True)
+class DatabaseGeneration:
+    """
+    What a connection is reading: the database file's identity plus its schema version.
+
+    ``token`` changes whenever the file is modified or replaced or its schema
+    version changes; caches include it in their keys so results computed
+    against an earlier generation are never served.
+    """
+
+    identity: Optional[FileIdentity]
+    schema_version: Optional[str] = None
+    instance: Optional[int] = None
+
+    @cached_property
+    def token(self) -> str:
+        """Short stable digest of the generation (identical across processes)."""
+        parts = astuple(self.identity) if self.identity else ("memory", self.instance)
+        return hashlib.blake2b(repr((parts, self.schema_version)).encode(), digest_size=8).hexdigest()
+
+    @classmethod
+    def read(
+        cls,
+        conn: duckdb.DuckDBPyConnection,
+        identity: Optional[FileIdentity] = None,
+        instance: Optional[int] = None,
+    ) -> "DatabaseGeneration":
+        """
+        Read the schema version of the database behind ``conn``.
+
+        Args:
+            conn: Open connection
+            identity: Identity of the file ``conn`` reads (None for in-memory databases)
+            instance: Distinguishes in-memory databases, which have no identity
+
+        Returns:
+            DatabaseGeneration
+        """
+        return cls(identity, SchemaVersionManager.read_version(conn), instance)
+
+
+@dataclass(frozen=True)
+class MetadataSnapshot:
+    """Point-in-time metadata for one database file."""
+
+    identity: Optional[FileIdentity]
+    tables: tuple[str, ...]
+    row_counts: dict[str, int]
+    fact_count: Optional[int] = None
+    county_count: Optional[int] = None
+    state_count: Optional[int] = None
+    min_year: Optional[int] = None
+    max_year: Optional[int] = None
+    scenarios: tuple[str, ...] = ()
+    land_use_types: tuple[str, ...] = ()
+    state_coverage: dict[str, int] = field(default_factory=dict)
+    build_seconds: float = 0.0
+
+    @property
+    def has_star_schema(self) -> bool:
+        """True if the database contains the land use star schema tables."""
+        return STAR_SCHEMA_TABLES.issubset(self.tables)
+
+    @classmethod
+    def build(cls, conn: duckdb.DuckDBPyConnection, identity: Optional[FileIdentity] = None) -> "MetadataSnapshot":
+        """
+        Compute a snapshot with one pass over the catalog and dimension tables.
+
+        Args:
+            conn: Open connection to the database
+            identity: Identity of the database file, if any
+
+        Returns:
+            MetadataSnapshot
+        """
+        start = time.perf_counter()
+        catalog = conn.execute(
+            """
+            SELECT table_name, table_type
+            FROM information_schema.tables
+            WHERE table_schema = 'main'
+            ORDER BY table_name
+            """
+        ).fetchall()
+        tables = tuple(name for name, _ in catalog)
+        base_tables = [name for name, table_type in catalog if table_type == "BASE TABLE"]
+
+        row_counts: dict[str, int] = {}
+        if base_tables:
+            counts_sql = " UNION ALL ".join(
+                "SELECT '{}' AS table_name, COUNT(*) AS n FROM \"{}\"".format(
+                    name.replace("'", "''"), name.replace('"', '""')
+                )
+                for name in base_tables
+            )
+            row_counts = {name: int(n) for name, n in conn.execute(counts_sql).fetchall()}
+
+        summary: dict = {}
+        if STAR_SCHEMA_TABLES.issubset(tables):
+            county_count, state_count = conn.execute(
+                "SELECT COUNT(DISTINCT geography_id), COUNT(DISTINCT state_name) FROM dim_geography"
+            ).fetchone()
+            min_year, max_year = conn.execute("SELECT MIN(start_year), MAX(end_year) FROM dim_time").fetchone()
+            scenarios = conn.execute(
+                "SELECT DISTINCT rcp_scenario || '/' || ssp_scenario as scenario FROM dim_scenario ORDER BY scenario"
+            ).fetchall()
+            land_uses = conn.execute("SELECT landuse_name FROM dim_landuse ORDER BY landuse_name").fetchall()
+            coverage = conn.execute(
+                "SELECT state_name, COUNT(*) FROM dim_geography GROUP BY state_name ORDER BY state_name"
+            ).fetchall()
+            summary = {
+                "fact_count": row_counts.get("fact_landuse_transitions", 0),
+                "county_count": int(county_count),
+                "state_count": int(state_count),
+                "min_year": int(min_year) if min_year is not None else None,
+                "max_year": int(max_year) if max_year is not None else None,
+                "scenarios": tuple(row[0] for row in scenarios),
+                "land_use_types": tuple(row[0] for row in land_uses),
+                "state_coverage": {state: int(n) for state, n in coverage},
+            }
+
+        return cls(
+            identity=identity,
+            tables=tables,
+            row_counts=row_counts,
+            build_seconds=time.perf_counter() - start,
+            **summary,
+        )
+
+
+_snapshots: dict[str, MetadataSnapshot] = {}
+_snapshots_lock = Lock()
+
+
+def get_metadata_snapshot(
+    conn: duckdb.DuckDBPyConnection, database: str | os.PathLike, identity: Optional[FileIdentity] = None
+) -> MetadataSnapshot:
+    """
+    Return the metadata snapshot for ``database``, computing it on first use.
+
+    Snapshots are shared process-wide per file and rebuilt only when the file
+    identity changes. In-memory databases have no identity, so their snapshot
+    is recomputed on every call.
+
+    Args:
+        conn: Open (read-only) connection to ``database``
+        database: Database path the connection was opened with
+        identity: Identity of the file ``conn`` actually reads, when known (an
+                  open connection keeps reading a file that has since been
+                  replaced on disk); defaults to statting ``database``
+
+    Returns:
+        MetadataSnapshot
+    """
+    identity = identity or FileIdentity.of(database)
+    if identity is None:
+        return MetadataSnapshot.build(conn)
+
+    with _snapshots_lock:
+        cached = _snapshots.get(identity.path)
+    if cached is not None and cached.identity == identity:
+        return cached
+
+    snapshot = MetadataSnapshot.build(conn, identity)
+    with _snapshots_lock:
+        _snapshots[identity.path] = snapshot
+    return snapshot
+
+
+def invalidate_metadata_snapshots(database: str | os.PathLike | None = None) -> None:
+    """
+    Drop cached snapshots.
+
+    Args:
+        database: Database path to invalidate (None drops all)
+    """
+    with _snapshots_lock:
+        if database is None:
+            _snapshots.clear()
+        else:
+            _snapshots.pop(str(Path(database).resolve()), None)
@@ -0,0 +1,190 @@
+"""
+In-memory preloading of DuckDB databases.
+
+A file-backed connection reads pages from disk on demand, so the first
+queries after a deploy pay for cold I/O. ``load_into_memory`` attaches the
+database file read-only, copies the selected tables (optionally restricted to
+some scenarios or columns) into an in-memory database and detaches the file,
+so every later query runs against RAM.
+
+Example:
+    >>> conn, report = load_into_memory("data/processed/landuse_analytics.duckdb", scenarios=["RCP85/SSP5"])
+    >>> print(report.summary())
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+_SOURCE = "preload_source"
+
+
+@dataclass(frozen=True)
+class PreloadReport:
+    """Outcome of copying a database file into memory."""
+
+    source: str
+    row_counts: dict[str, int]
+    load_seconds: float
+    memory_bytes: int
+    scenarios: tuple[str, ...] = ()
+    views: tuple[str, ...] = ()
+    skipped_views: tuple[str, ...] = ()
+    columns: dict[str, tuple[str, ...]] = field(default_factory=dict)
+
+    @property
+    def tables(self) -> tuple[str, ...]:
+        """Tables copied into memory."""
+        return tuple(self.row_counts)
+
+    @property
+    def total_rows(self) -> int:
+        """Rows copied across all tables."""
+        return sum(self.row_counts.values())
+
+    def summary(self) -> str:
+        """One-line summary for logs."""
+        return (
+            f"Loaded {len(self.row_counts)} tables ({self.total_rows:,} rows) from {self.source} "
+            f"in {self.load_seconds:.2f}s using {self.memory_bytes / 2**20:.1f} MiB"
+        )
+
+
+def _quote(identifier: str) -> str:
+    """Quote a SQL identifier."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _scenario_ids(conn: duckdb.DuckDBPyConnection, scenarios: list[str]) -> list[int]:
+    """Resolve scenario names or "RCP/SSP" pairs to scenario ids in the attached source."""
+    wanted = [s.strip().lower() for s in scenarios]
+    placeholders = ", ".join("?" for _ in wanted)
+    rows = conn.execute(
+        f"""
+        SELECT scenario_id
+        FROM {_SOURCE}.main.dim_scenario
+        WHERE lower(scenario_name) IN ({placeholders})
+           OR lower(rcp_scenario || '/' || ssp_scenario) IN ({placeholders})
+        ORDER BY scenario_id
+        """,
+        wanted + wanted,
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def load_into_memory(
+    database: str,
+    tables: Optional[list[str]] = None,
+    scenarios: Optional[list[str]] = None,
+    columns: Optional[dict[str, list[str]]] = None,
+    config: Optional[dict] = None,
+) -> tuple[duckdb.DuckDBPyConnection, PreloadReport]:
+    """
+    Copy a DuckDB database file into a new in-memory database.
+
+    Args:
+        database: Path to the DuckDB file (attached read-only)
+        tables: Tables to copy (None copies every base table)
+        scenarios: Keep only these scenarios, given as ``scenario_name`` or
+                   "RCP/SSP" pairs (e.g. "RCP85/SSP5"). Applies to every
+                   table with a ``scenario_id`` column.
+        columns: Per-table column subsets (tables not listed keep all columns)
+        config: DuckDB configuration for the in-memory database
+
+    Returns:
+        Tuple of the in-memory connection and a PreloadReport
+
+    Raises:
+        FileNotFoundError: If the database file does not exist
+        ValueError: If a requested table, column or scenario does not exist
+    """
+    if not Path(database).exists():
+        raise FileNotFoundError(f"Database file not found: {database}")
+
+    start = time.perf_counter()
+    conn = duckdb.connect(":memory:", config=config or {})
+    try:
+        path = str(Path(database).resolve()).replace("'", "''")
+        conn.execute(f"ATTACH '{path}' AS {_SOURCE} (READ_ONLY)")
+
+        source_columns: dict[str, list[str]] = {}
+        for table, column in conn.execute(
+            """
+            SELECT table_name, column_name
+            FROM information_schema.columns
+            WHERE table_catalog = ? AND table_schema = 'main'
+              AND table_name IN (
+                  SELECT table_name FROM information_schema.tables
+                  WHERE table_catalog = ? AND table_type = 'BASE TABLE'
+              )
+            ORDER BY table_name, ordinal_position
+            """,
+            [_SOURCE, _SOURCE],
+        ).fetchall():
+            source_columns.setdefault(table, []).append(column)
+
+        selected = list(tables) if tables else list(source_columns)
+        unknown = sorted(set(selected) - set(source_columns))
+        if unknown:
+            raise ValueError(f"Tables not found in {database}: {', '.join(unknown)}")
+
+        scenario_filter = ""
+        if scenarios:
+            ids = _scenario_ids(conn, scenarios)
+            if not ids:
+                raise ValueError(f"No scenarios in {database} match: {', '.join(scenarios)}")
+            scenario_filter = f"WHERE scenario_id IN ({', '.join(str(int(i)) for i in ids)})"
+
+        copied_columns: dict[str, tuple[str, ...]] = {}
+        row_counts: dict[str, int] = {}
+        for table in selected:
+            wanted = (columns or {}).get(table)
+            if wanted:
+                missing = sorted(set(wanted) - set(source_columns[table]))
+                if missing:
+                    raise ValueError(f"Columns not found in {table}: {', '.join(missing)}")
+                copied_columns[table] = tuple(wanted)
+            select_list = ", ".join(_quote(c) for c in wanted) if wanted else "*"
+            where = scenario_filter if "scenario_id" in source_columns[table] else ""
+            conn.execute(
+                f"CREATE TABLE main.{_quote(table)} AS SELECT {select_list} FROM {_SOURCE}.main.{_quote(table)} {where}"
+            )
+            row_counts[table] = conn.execute(f"SELECT COUNT(*) FROM main.{_quote(table)}").fetchone()[0]
+
+        # Recreate views; those depending on skipped tables or columns are dropped
+        views, skipped = [], []
+        for name, sql in conn.execute(
+            "SELECT view_name, sql FROM duckdb_views() WHERE database_name = ? AND NOT internal",
+            [_SOURCE],
+        ).fetchall():
+            try:
+                conn.execute(sql)
+                views.append(name)
+            except duckdb.Error as e:
+                logger.debug(f"Skipping view {name}: {e}")
+                skipped.append(name)
+
+        conn.execute(f"DETACH {_SOURCE}")
+        memory_bytes = conn.execute("SELECT COALESCE(SUM(memory_usage_bytes), 0) FROM duckdb_memory()").fetchone()[0]
+    except Exception:
+        conn.close()
+        raise
+
+    report = PreloadReport(
+        source=str(database),
+        row_counts=row_counts,
+        load_seconds=time.perf_counter() - start,
+        memory_bytes=int(memory_bytes),
+        scenarios=tuple(scenarios or ()),
+        views=tuple(views),
+        skipped_views=tuple(skipped),
+        columns=copied_columns,
+    )
+    logger.info(report.summary())
+    return conn, report
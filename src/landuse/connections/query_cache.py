@@ -0,0 +1,202 @@
+"""
+Bounded, thread-safe cache for query result DataFrames.
+
+Entries are evicted least-recently-used first once either the entry count or
+the approximate byte size of the cached frames exceeds its limit. Each entry
+has its own TTL: expired entries are dropped when looked up and by a sweep
+that runs at most once per ``sweep_interval`` seconds, so entries nobody asks
+for again do not linger.
+
+Cached frames are frozen (their column arrays are made read-only) and hits
+return a shallow copy sharing that memory, so a hit costs O(columns) rather
+than a deep copy. Adding or replacing columns on a returned frame works as
+usual; in-place edits of cached values raise ``ValueError: assignment
+destination is read-only``. Call ``.copy()`` on the result first to edit it.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def freeze_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Make a DataFrame's column arrays read-only in place.
+
+    Args:
+        df: Frame to freeze
+
+    Returns:
+        The same frame
+    """
+    for array in df._mgr.arrays:
+        # Masked and numpy-backed extension arrays keep their data in these attributes
+        parts = (array, getattr(array, "_data", None), getattr(array, "_mask", None), getattr(array, "_ndarray", None))
+        for values in parts:
+            if isinstance(values, np.ndarray):
+                values.flags.writeable = False
+    return df
+
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    """Approximate memory held by a DataFrame, including Python string objects."""
+    try:
+        return int(df.memory_usage(index=True, deep=True).sum())
+    except ValueError:
+        # pandas cannot size the objects of a read-only object column
+        return int(df.memory_usage(index=True, deep=False).sum())
+
+
+@dataclass
+class _Entry:
+    frame: pd.DataFrame
+    nbytes: int
+    created_at: float
+    expires_at: float
+
+
+class QueryCache:
+    """
+    LRU + TTL cache of read-only query result frames.
+
+    Example:
+        >>> cache = QueryCache(max_entries=128, max_bytes=64 * 1024**2)
+        >>> cache.set(("SELECT 1", ()), df, ttl=60)
+        >>> cache.get(("SELECT 1", ()))
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 256 * 1024**2,
+        sweep_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum approximate size of all cached frames
+            sweep_interval: Minimum seconds between sweeps for expired entries
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self._next_sweep = clock() + sweep_interval
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, max_age: Optional[float] = None) -> Optional[pd.DataFrame]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key
+            max_age: Treat entries older than this many seconds as a miss
+
+        Returns:
+            A read-only view of the cached frame, or None on a miss
+        """
+        now = self._clock()
+        with self._lock:
+            self._maybe_sweep(now)
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None or (max_age is not None and now - entry.created_at >= max_age):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            frame = entry.frame
+        return frame.copy(deep=False)
+
+    def set(self, key: Hashable, frame: pd.DataFrame, ttl: float) -> bool:
+        """
+        Cache a result, evicting least recently used entries to stay within bounds.
+
+        The frame is frozen in place, so callers should not keep editing it.
+
+        Args:
+            key: Cache key
+            frame: Result to cache
+            ttl: Seconds until the entry expires
+
+        Returns:
+            True if cached, False if the frame alone exceeds ``max_bytes``
+        """
+        if ttl <= 0:
+            return False
+        nbytes = frame_nbytes(frame)
+        if nbytes > self.max_bytes or self.max_entries <= 0:
+            return False
+        freeze_frame(frame)
+
+        now = self._clock()
+        with self._lock:
+            self._maybe_sweep(now)
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(frame, nbytes, now, now + ttl)
+            self._bytes += nbytes
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return True
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop an entry (lock held)."""
+        self._bytes -= self._entries.pop(key).nbytes
+
+    def _maybe_sweep(self, now: float) -> None:
+        """Drop every expired entry if the sweep interval has passed (lock held)."""
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self.sweep_interval
+        for key in [key for key, entry in self._entries.items() if entry.expires_at <= now]:
+            self._remove(key)
+            self.expirations += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate size of all cached frames."""
+        return self._bytes
+
+    def stats(self) -> dict[str, int]:
+        """Cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
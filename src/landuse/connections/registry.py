@@ -0,0 +1,669 @@
+"""
+Process-wide registry of open DuckDB databases.
+
+``duckdb.connect`` opens a database instance; ``connection.cursor()`` opens a
+cheap additional connection to the same instance. DuckDB connections are not
+safe to share between threads (one thread's query interrupts or serializes
+behind another's), so the registry keeps one root connection per
+``(path, read_only, config)`` and hands each user a ``DatabaseHandle`` that
+gives every thread its own cursor.
+
+Every database bounds the cursors open on it (``max_cursors``, from
+``DatabaseConfig.max_connections``). Per-thread cursors live until their
+thread exits or the handle is closed, so a live but idle thread keeps its
+slot; ``DatabaseHandle.lease()`` borrows a pooled cursor for short-lived work
+such as one API call, one query or streaming a result. Idle pooled
+cursors are health-checked before reuse and closed after ``idle_timeout``
+seconds, cursors of finished threads are reclaimed, and the root connection
+is closed when the last handle on a database is closed.
+
+Each database also tracks its generation (file identity plus schema version,
+see ``DatabaseGeneration``) by statting the file at most once per
+``check_interval`` seconds. A file modified in place gets a new generation.
+A file replaced by a new one (a rebuild renamed over the old path) is
+reopened: an open DuckDB instance keeps reading the file it opened, and
+DuckDB reuses that instance for new connections until every connection to it
+is closed. Each thread closes its stale cursor on its next access; cursors
+still open after ``drain_timeout`` seconds are closed for it, aborting any
+query running on them.
+
+In-memory databases (``:memory:`` and preloaded copies) are private to the
+connection that created them; ``DatabaseRegistry.adopt`` wraps them in a
+handle without sharing them.
+
+Example:
+    >>> handle = get_registry().open("data/processed/landuse_analytics.duckdb")
+    >>> handle.cursor().execute("SELECT COUNT(*) FROM dim_scenario").fetchone()
+    >>> with handle.lease() as cursor:
+    ...     rows = cursor.execute("SELECT * FROM dim_geography").fetchmany(100)
+    >>> handle.generation().token
+    >>> handle.close()
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+import duckdb
+
+from ..exceptions import DatabaseConnectionError
+from .metadata import DatabaseGeneration, FileIdentity
+
+DatabaseKey = tuple[str, bool, tuple[tuple[str, Any], ...]]
+
+
+def database_key(
+    database: str | os.PathLike, read_only: bool = True, config: Optional[dict[str, Any]] = None
+) -> DatabaseKey:
+    """
+    Registry key for a database: resolved path, access mode and DuckDB config.
+
+    Args:
+        database: Path to the database file or MotherDuck URL
+        read_only: Open in read-only mode
+        config: DuckDB configuration options
+
+    Returns:
+        Hashable key
+    """
+    database = os.fspath(database)
+    if not database.startswith("md:"):
+        database = str(Path(database).resolve())
+    return database, read_only, tuple(sorted((config or {}).items()))
+
+
+@dataclass
+class _ThreadCursor:
+    cursor: duckdb.DuckDBPyConnection
+    checked_at: float
+    epoch: int
+
+
+class SharedDatabase:
+    """One DuckDB database instance and the bounded set of cursors open on it."""
+
+    def __init__(
+        self,
+        root: duckdb.DuckDBPyConnection,
+        key: Optional[DatabaseKey] = None,
+        max_cursors: int = 10,
+        acquire_timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+        idle_timeout: float = 300.0,
+        check_interval: float = 1.0,
+        drain_timeout: float = 5.0,
+        identity: Optional[FileIdentity] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the database.
+
+        Args:
+            root: Connection that opened the database; cursors are created from it
+            key: Registry key (None for private databases)
+            max_cursors: Maximum cursors open at once across all handles
+            acquire_timeout: Seconds to wait for a cursor when all are in use
+            health_check_interval: Cursors unused for this long are checked before reuse
+            idle_timeout: Pooled cursors idle for this long are closed
+            check_interval: Minimum seconds between checks of the file's identity
+            drain_timeout: Seconds a reopen waits for threads to close stale cursors
+            identity: Identity of the file when ``root`` was opened
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.root = root
+        self.key = key
+        self.max_cursors = max_cursors
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self.idle_timeout = idle_timeout
+        self.check_interval = check_interval
+        self.drain_timeout = drain_timeout
+        self.identity = identity
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._idle: deque[tuple[duckdb.DuckDBPyConnection, float]] = deque()
+        self._out: set[duckdb.DuckDBPyConnection] = set()
+        self._handles: set[DatabaseHandle] = set()
+        self._generation: Optional[DatabaseGeneration] = None
+        self._checked_at = clock()
+        self._reloading = False
+        self.epoch = 0
+        self.refs = 0
+        self.closed = False
+        self.created = 0
+        self.reaped = 0
+        self.failed_checks = 0
+        self.reloads = 0
+
+    @property
+    def _open(self) -> int:
+        """Cursors currently open, idle or checked out (lock held)."""
+        return len(self._out) + len(self._idle)
+
+    def checkout(self, timeout: Optional[float] = None) -> duckdb.DuckDBPyConnection:
+        """
+        Take an idle cursor or open a new one, waiting while ``max_cursors`` are in use.
+
+        Args:
+            timeout: Seconds to wait (defaults to ``acquire_timeout``)
+
+        Returns:
+            Cursor owned by the caller until ``checkin``
+
+        Raises:
+            DatabaseConnectionError: If the database is closed or no cursor frees up in time
+        """
+        # Waits are real time; the injectable clock only drives idle and health-check ages
+        deadline = time.monotonic() + (self.acquire_timeout if timeout is None else timeout)
+        with self._cond:
+            while True:
+                if self.closed:
+                    raise DatabaseConnectionError("Database has been closed")
+                if not self._reloading:
+                    cursor = self._take(self._clock())
+                    if cursor is not None:
+                        return cursor
+                    # Cursors of finished threads are the usual reason the pool runs dry
+                    if self._reap_threads():
+                        continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DatabaseConnectionError(
+                        f"All {self.max_cursors} connections to {self.name} are in use; "
+                        "raise database.max_connections or close unused connections"
+                    )
+                self._cond.wait(remaining)
+
+    def _take(self, now: float) -> Optional[duckdb.DuckDBPyConnection]:
+        """Pop a healthy idle cursor or open one if below the limit (lock held)."""
+        while self._idle:
+            cursor, idle_since = self._idle.pop()
+            if now - idle_since < self.health_check_interval or self._healthy(cursor):
+                self._out.add(cursor)
+                return cursor
+            self._close(cursor)
+        if self._open < self.max_cursors:
+            cursor = self.root.cursor()
+            self._out.add(cursor)
+            self.created += 1
+            return cursor
+        return None
+
+    def checkin(self, cursor: duckdb.DuckDBPyConnection, reuse: bool = True, epoch: Optional[int] = None) -> None:
+        """
+        Return a cursor taken with ``checkout``.
+
+        Args:
+            cursor: Cursor to return
+            reuse: Keep it for later checkouts (False closes it)
+            epoch: ``epoch`` when the cursor was checked out; cursors from before a reopen are closed
+        """
+        with self._cond:
+            if cursor not in self._out:
+                # Already closed by a reopen or reaping
+                return
+            self._out.remove(cursor)
+            if reuse and not self.closed and epoch in (None, self.epoch):
+                self._idle.append((cursor, self._clock()))
+                self._reap_idle()
+            else:
+                self._close(cursor)
+            self._cond.notify_all()
+
+    def _healthy(self, cursor: duckdb.DuckDBPyConnection) -> bool:
+        """Run a trivial query on a cursor."""
+        try:
+            cursor.execute("SELECT 1").fetchone()
+            return True
+        except duckdb.Error:
+            self.failed_checks += 1
+            return False
+
+    @staticmethod
+    def _close(cursor: duckdb.DuckDBPyConnection) -> None:
+        try:
+            cursor.close()
+        except duckdb.Error:
+            pass
+
+    def _discard(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        """Close a checked-out cursor and free its slot (lock held)."""
+        if cursor in self._out:
+            self._out.remove(cursor)
+            self._close(cursor)
+
+    def _reap_idle(self) -> int:
+        """Close pooled cursors idle longer than ``idle_timeout`` (lock held)."""
+        cutoff = self._clock() - self.idle_timeout
+        reaped = 0
+        # The deque is ordered by return time, oldest first
+        while self._idle and self._idle[0][1] <= cutoff:
+            self._close(self._idle.popleft()[0])
+            reaped += 1
+        self.reaped += reaped
+        return reaped
+
+    def _reap_threads(self, threads: Optional[Callable[[threading.Thread], bool]] = None) -> int:
+        """Close the cursors of threads that have exited, or that match ``threads`` (lock held)."""
+        reaped = 0
+        for handle in list(self._handles):
+            for cursor in handle._take_threads(threads or (lambda thread: not thread.is_alive())):
+                self._discard(cursor)
+                reaped += 1
+        self.reaped += reaped
+        return reaped
+
+    def reap(self) -> int:
+        """
+        Close idle pooled cursors and cursors of finished threads.
+
+        Returns:
+            Number of cursors closed
+        """
+        with self._cond:
+            reaped = self._reap_idle() + self._reap_threads()
+            if reaped:
+                self._cond.notify_all()
+            return reaped
+
+    @property
+    def generation(self) -> DatabaseGeneration:
+        """Generation of the data the open database reads (schema version read on first use)."""
+        generation = self._generation
+        if generation is None:
+            with self._cond:
+                if self._generation is None:
+                    cursor = self.root.cursor()
+                    try:
+                        self._generation = DatabaseGeneration.read(cursor, self.identity, instance=self._instance)
+                    finally:
+                        self._close(cursor)
+                generation = self._generation
+        return generation
+
+    @property
+    def _instance(self) -> Optional[int]:
+        # Private databases have no file identity; tell them apart by object
+        return None if self.key else id(self)
+
+    def check(self) -> bool:
+        """
+        Compare the file's identity with the open database, at most once per ``check_interval``.
+
+        A file modified in place gets a new generation; a replaced file is reopened.
+
+        Returns:
+            True if the database was reopened
+        """
+        if self.key is None:
+            return False
+        now = self._clock()
+        if now - self._checked_at < self.check_interval:
+            return False
+        with self._cond:
+            if now - self._checked_at < self.check_interval or self._reloading or self.closed:
+                return False
+            self._checked_at = now
+            identity = FileIdentity.of(self.name)
+            if identity is None or identity == self.identity:
+                return False
+            if identity.same_file(self.identity):
+                # Modified in place; the open instance already sees the changes
+                self.identity = identity
+                self._generation = None
+                return False
+            self._reopen()
+            return True
+
+    def _reopen(self) -> None:
+        """Close every cursor and the root, then open the file again (lock held)."""
+        self._reloading = True
+        self.epoch += 1
+        try:
+            while self._idle:
+                self._close(self._idle.pop()[0])
+            # The calling thread is not running a query, so its cursors can go now
+            current = threading.current_thread()
+            self._reap_threads(lambda thread: thread is current)
+
+            deadline = time.monotonic() + self.drain_timeout
+            while self._out:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # Threads that have not come back are most likely idle
+                    self._reap_threads(lambda thread: True)
+                    for cursor in list(self._out):
+                        self._discard(cursor)
+                    break
+                self._cond.wait(remaining)
+
+            self._close(self.root)
+            path, read_only, config = self.key
+            self.identity = FileIdentity.of(path)
+            self.root = duckdb.connect(path, read_only=read_only, config=dict(config))
+            self._generation = None
+            self.reloads += 1
+        finally:
+            self._reloading = False
+            self._cond.notify_all()
+
+    def health_check(self) -> bool:
+        """
+        Check that the database still answers queries.
+
+        Returns:
+            True if a trivial query succeeds on a fresh cursor
+        """
+        try:
+            cursor = self.checkout(timeout=0)
+        except DatabaseConnectionError:
+            return False
+        healthy = self._healthy(cursor)
+        self.checkin(cursor, reuse=healthy)
+        return healthy
+
+    def close(self) -> None:
+        """Close every pooled cursor and the root connection."""
+        with self._cond:
+            if self.closed:
+                return
+            self.closed = True
+            while self._idle:
+                self._close(self._idle.pop()[0])
+            self._cond.notify_all()
+        self._close(self.root)
+
+    @property
+    def name(self) -> str:
+        """Database path, or a placeholder for private databases."""
+        return self.key[0] if self.key else "in-memory database"
+
+    def stats(self) -> dict[str, int]:
+        """Cursor statistics."""
+        with self._cond:
+            return {
+                "handles": self.refs,
+                "open": self._open,
+                "idle": len(self._idle),
+                "max": self.max_cursors,
+                "created": self.created,
+                "reaped": self.reaped,
+                "failed_checks": self.failed_checks,
+                "reloads": self.reloads,
+            }
+
+
+class DatabaseHandle:
+    """
+    One user's reference to a shared database.
+
+    ``cursor()`` returns the calling thread's cursor, opening it on first use;
+    ``lease()`` borrows a pooled cursor for the duration of a ``with`` block.
+    """
+
+    def __init__(self, database: SharedDatabase, release: Callable[[SharedDatabase], None]):
+        """
+        Initialize the handle (use ``DatabaseRegistry.open`` or ``adopt``).
+
+        Args:
+            database: Database the handle refers to
+            release: Called once when the handle is closed
+        """
+        self.database = database
+        self._release = release
+        self._threads: dict[threading.Thread, _ThreadCursor] = {}
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """
+        Get the calling thread's cursor.
+
+        Returns:
+            Cursor used by this thread only
+
+        Raises:
+            DatabaseConnectionError: If the handle is closed or the database is out of cursors
+        """
+        database = self.database
+        database.check()
+        thread = threading.current_thread()
+        entry = self._threads.get(thread)
+        if entry is not None:
+            if entry.epoch == database.epoch:
+                now = database._clock()
+                if now - entry.checked_at < database.health_check_interval or database._healthy(entry.cursor):
+                    entry.checked_at = now
+                    return entry.cursor
+            self._drop_thread(thread)
+
+        if self.closed:
+            raise DatabaseConnectionError("Database handle has been closed")
+        epoch = database.epoch
+        cursor = database.checkout()
+        with self._lock:
+            closed = self.closed
+            if not closed:
+                self._threads[thread] = _ThreadCursor(cursor, database._clock(), epoch)
+        if closed:
+            database.checkin(cursor, reuse=False)
+            raise DatabaseConnectionError("Database handle has been closed")
+        return cursor
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Borrow a pooled cursor for the duration of a ``with`` block.
+
+        Args:
+            timeout: Seconds to wait when every cursor is in use
+
+        Yields:
+            Cursor that returns to the pool when the block exits
+        """
+        if self.closed:
+            raise DatabaseConnectionError("Database handle has been closed")
+        database = self.database
+        database.check()
+        epoch = database.epoch
+        cursor = database.checkout(timeout)
+        reuse = True
+        try:
+            yield cursor
+        except duckdb.Error:
+            reuse = False
+            raise
+        finally:
+            database.checkin(cursor, reuse=reuse, epoch=epoch)
+
+    def generation(self) -> DatabaseGeneration:
+        """
+        Get the current generation of the database, checking the file first.
+
+        Returns:
+            DatabaseGeneration whose ``token`` belongs in cache keys
+        """
+        self.database.check()
+        return self.database.generation
+
+    def _drop_thread(self, thread: threading.Thread) -> None:
+        """Close one thread's cursor."""
+        with self._lock:
+            entry = self._threads.pop(thread, None)
+        if entry is not None:
+            self.database.checkin(entry.cursor, reuse=False)
+
+    def _take_threads(self, match: Callable[[threading.Thread], bool]) -> list[duckdb.DuckDBPyConnection]:
+        """Remove and return the cursors of matching threads (database lock held)."""
+        with self._lock:
+            threads = [thread for thread in self._threads if match(thread)]
+            return [self._threads.pop(thread).cursor for thread in threads]
+
+    @property
+    def thread_cursors(self) -> int:
+        """Number of per-thread cursors currently open."""
+        return len(self._threads)
+
+    def close(self) -> None:
+        """Close this handle's thread cursors and release the database."""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            entries = list(self._threads.values())
+            self._threads.clear()
+        for entry in entries:
+            # Thread cursors may carry session state (settings, prepared statements), so they are not pooled
+            self.database.checkin(entry.cursor, reuse=False)
+        self._release(self.database)
+
+    def __enter__(self) -> "DatabaseHandle":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class DatabaseRegistry:
+    """
+    Shares one DuckDB database instance per ``(path, read_only, config)``.
+
+    Example:
+        >>> registry = DatabaseRegistry()
+        >>> with registry.open("analytics.duckdb", max_cursors=4) as handle:
+        ...     handle.cursor().execute("SELECT 1")
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the registry.
+
+        Args:
+            clock: Monotonic time source passed to every database (injectable for tests)
+        """
+        self._clock = clock
+        self._databases: dict[DatabaseKey, SharedDatabase] = {}
+        self._lock = threading.Lock()
+
+    def open(
+        self,
+        database: str | os.PathLike,
+        read_only: bool = True,
+        config: Optional[dict[str, Any]] = None,
+        max_cursors: int = 10,
+        **options: float,
+    ) -> DatabaseHandle:
+        """
+        Get a handle on a database file, opening it if no handle is open yet.
+
+        Limits come from whichever caller opened the database first.
+
+        Args:
+            database: Path to the database file or MotherDuck URL
+            read_only: Open in read-only mode
+            config: DuckDB configuration options
+            max_cursors: Maximum cursors open at once on the database
+            **options: ``acquire_timeout``, ``health_check_interval``, ``idle_timeout``,
+                       ``check_interval`` or ``drain_timeout``
+
+        Returns:
+            Handle to close when done
+
+        Raises:
+            duckdb.Error: If DuckDB cannot open the database
+        """
+        database = os.fspath(database)
+        if database == ":memory:":
+            return self.adopt(duckdb.connect(":memory:", config=config or {}), max_cursors, **options)
+
+        key = database_key(database, read_only, config)
+        with self._lock:
+            shared = self._databases.get(key)
+            if shared is None:
+                # Stat before connecting: a file swapped in between is then caught as a replacement
+                identity = FileIdentity.of(key[0])
+                root = duckdb.connect(database, read_only=read_only, config=config or {})
+                shared = SharedDatabase(root, key, max_cursors, identity=identity, clock=self._clock, **options)
+                self._databases[key] = shared
+            shared.refs += 1
+            return self._handle(shared)
+
+    def adopt(self, connection: duckdb.DuckDBPyConnection, max_cursors: int = 10, **options: float) -> DatabaseHandle:
+        """
+        Wrap a connection to a private (in-memory) database in a handle.
+
+        The database is not shared; closing the handle closes ``connection``.
+
+        Args:
+            connection: Connection that owns the database
+            max_cursors: Maximum cursors open at once on the database
+            **options: ``acquire_timeout``, ``health_check_interval`` or ``idle_timeout``
+
+        Returns:
+            Handle to close when done
+        """
+        shared = SharedDatabase(connection, None, max_cursors, clock=self._clock, **options)
+        shared.refs = 1
+        return self._handle(shared)
+
+    def _handle(self, shared: SharedDatabase) -> DatabaseHandle:
+        handle = DatabaseHandle(shared, self._release)
+        with shared._cond:
+            shared._handles.add(handle)
+        return handle
+
+    def _release(self, shared: SharedDatabase) -> None:
+        """Drop a handle's reference, closing the database with the last one."""
+        with self._lock:
+            with shared._cond:
+                shared._handles = {handle for handle in shared._handles if not handle.closed}
+            shared.refs -= 1
+            if shared.refs > 0:
+                return
+            if shared.key is not None and self._databases.get(shared.key) is shared:
+                del self._databases[shared.key]
+        shared.close()
+
+    def reap(self) -> int:
+        """
+        Close idle pooled cursors and cursors of finished threads on every database.
+
+        Returns:
+            Number of cursors closed
+        """
+        with self._lock:
+            databases = list(self._databases.values())
+        return sum(shared.reap() for shared in databases)
+
+    def get(
+        self, database: str | os.PathLike, read_only: bool = True, config: Optional[dict[str, Any]] = None
+    ) -> Optional[SharedDatabase]:
+        """
+        Look up an open database without opening it.
+
+        Returns:
+            SharedDatabase, or None if no handle on it is open
+        """
+        return self._databases.get(database_key(database, read_only, config))
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Cursor statistics per open database."""
+        with self._lock:
+            databases = list(self._databases.values())
+        return {shared.name: shared.stats() for shared in databases}
+
+    def __len__(self) -> int:
+        return len(self._databases)
+
+
+_registry = DatabaseRegistry()
+
+
+def get_registry() -> DatabaseRegistry:
+    """Get the process-wide database registry."""
+    return _registry
@@ -0,0 +1,145 @@
+"""
+Single-flight coalescing of identical concurrent calls.
+
+When many callers ask the same question at once, only the first (the leader)
+runs it; callers arriving while it is in flight wait for and share its
+outcome, result or exception. Nothing is kept once the call finishes, so this
+complements rather than replaces result caching: it covers the window in
+which a popular query is running and cannot be cached yet.
+
+Waiters can be threads (``do``) or coroutines (``do_async``) on the same key.
+The outcome is published through a ``concurrent.futures.Future``, which
+threads block on and coroutines await without blocking their event loop.
+The leader's call is not cancelled when the caller that started it goes away,
+since other waiters may still need it. A waiter can bound its wait with
+``timeout``; giving up raises ``TimeoutError`` and leaves the call running.
+
+Because every waiter receives the same object, results should be immutable,
+or ``share`` should hand each waiter its own view (e.g. a shallow copy of a
+frozen DataFrame).
+
+Example:
+    >>> flights = SingleFlight(share=lambda df: df.copy(deep=False))
+    >>> df = flights.do(("SELECT ...", ()), run_query, "SELECT ...")
+    >>> df = await flights.do_async(("SELECT ...", ()), run_query, "SELECT ...")
+"""
+
+import asyncio
+import inspect
+from concurrent.futures import Future, wait
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional
+
+
+def _waited_too_long(timeout: float) -> TimeoutError:
+    return TimeoutError(f"Gave up after waiting {timeout:g}s for the identical call in flight")
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution."""
+
+    def __init__(self, share: Optional[Callable[[Any], Any]] = None):
+        """
+        Initialize with no calls in flight.
+
+        Args:
+            share: Applied to the result for each waiter, including the leader
+        """
+        self._share = share
+        self._lock = Lock()
+        self._flights: dict[Hashable, Future] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.executions = 0
+        self.coalesced = 0
+
+    def _join(self, key: Hashable) -> tuple[Future, bool]:
+        """The in-flight call for ``key``, and whether the caller must run it."""
+        with self._lock:
+            future = self._flights.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = self._flights[key] = Future()
+            # A running future cannot be cancelled by one of its waiters
+            future.set_running_or_notify_cancel()
+            self.executions += 1
+            return future, True
+
+    def _settle(self, key: Hashable, future: Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Publish the outcome; callers arriving from now on start a new call."""
+        with self._lock:
+            self._flights.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _run(self, key: Hashable, future: Future, func: Callable, args: tuple, kwargs: dict) -> None:
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            self._settle(key, future, error=e)
+        else:
+            self._settle(key, future, result)
+
+    def _result(self, result: Any) -> Any:
+        return self._share(result) if self._share is not None else result
+
+    def do(self, key: Hashable, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Call ``func(*args, **kwargs)``, or wait for the identical call already in flight.
+
+        Args:
+            key: Identifies identical calls (must be hashable)
+            func: Function to run if no call with ``key`` is in flight
+            timeout: Seconds a waiter waits for the call in flight (None waits as long as it runs)
+
+        Returns:
+            The shared result
+
+        Raises:
+            TimeoutError: If a waiter's ``timeout`` passes first
+            Whatever the shared call raised
+        """
+        future, leader = self._join(key)
+        if leader:
+            self._run(key, future, func, args, kwargs)
+        elif not wait((future,), timeout).done:
+            raise _waited_too_long(timeout)
+        return self._result(future.result())
+
+    async def do_async(self, key: Hashable, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Async ``do``: the leader runs a coroutine function as a task, or a
+        blocking function in a worker thread, and every waiter awaits the outcome.
+        """
+        future, leader = self._join(key)
+        outcome = asyncio.wrap_future(future)
+        if leader:
+            if inspect.iscoroutinefunction(func):
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                self._tasks.add(task)
+                task.add_done_callback(lambda t: self._finish_task(key, future, t))
+            else:
+                asyncio.get_running_loop().run_in_executor(None, self._run, key, future, func, args, kwargs)
+        elif not (await asyncio.wait((outcome,), timeout=timeout))[0]:
+            # The call is running, so this only detaches the waiter from it
+            outcome.cancel()
+            raise _waited_too_long(timeout)
+        return self._result(await outcome)
+
+    def _finish_task(self, key: Hashable, future: Future, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            self._settle(key, future, error=asyncio.CancelledError())
+        else:
+            self._settle(key, future, task.result() if task.exception() is None else None, task.exception())
+
+    def __len__(self) -> int:
+        """Number of calls in flight."""
+        return len(self._flights)
+
+    def stats(self) -> dict[str, int]:
+        """In-flight calls, executions started and calls that joined one instead."""
+        with self._lock:
+            return {"in_flight": len(self._flights), "executions": self.executions, "coalesced": self.coalesced}
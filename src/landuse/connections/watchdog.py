@@ -0,0 +1,129 @@
+"""
+Query deadlines for DuckDB connections.
+
+DuckDB statements run unbounded by default. ``QueryDeadline`` arms a timer
+that calls ``connection.interrupt()`` once the deadline passes, so the running
+statement fails with ``duckdb.InterruptException`` and the worker thread is
+released. The interruption is re-raised as ``QueryTimeoutError``.
+
+``QueryBudget`` bounds a query whose work is split into steps, such as the
+fetches of a streamed result, counting only the time spent inside the steps.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Optional
+
+import duckdb
+
+from ..exceptions import QueryTimeoutError
+
+
+def _timeout_error(timeout: float, query: Optional[str]) -> QueryTimeoutError:
+    return QueryTimeoutError(
+        f"Query exceeded the {timeout:g}s execution limit and was cancelled", query=query, timeout=timeout
+    )
+
+
+class QueryDeadline:
+    """
+    Context manager that interrupts a DuckDB connection after a timeout.
+
+    Example:
+        >>> with QueryDeadline(conn, timeout=30):
+        ...     df = conn.execute(sql).df()
+    """
+
+    def __init__(self, connection: duckdb.DuckDBPyConnection, timeout: Optional[float], query: Optional[str] = None):
+        """
+        Initialize the deadline.
+
+        Args:
+            connection: Connection whose running statement is interrupted
+            timeout: Seconds before interrupting; None or <= 0 disables the deadline
+            query: SQL text, attached to the raised QueryTimeoutError
+        """
+        self.connection = connection
+        self.timeout = timeout
+        self.query = query
+        self.expired = False
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def _expire(self) -> None:
+        """Timer callback: interrupt the connection unless already disarmed."""
+        # Interrupt under the lock, so it cannot land after __exit__ on the connection's next statement
+        with self._lock:
+            if self._timer is None:
+                return
+            self.expired = True
+            self.connection.interrupt()
+
+    def __enter__(self) -> "QueryDeadline":
+        if self.timeout and self.timeout > 0:
+            self._timer = threading.Timer(self.timeout, self._expire)
+            self._timer.daemon = True
+            self._timer.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+
+        # Arrow readers report an interrupted fetch as an OSError; a statement that finished is not failed
+        if self.expired and exc_type is not None and issubclass(exc_type, (duckdb.InterruptException, OSError)):
+            raise _timeout_error(self.timeout, self.query) from exc_val
+        return False
+
+
+class QueryBudget:
+    """
+    Deadline for one query whose DuckDB work runs in several steps.
+
+    Each ``step()`` is bounded by a ``QueryDeadline`` for the time left, so the
+    caller's own work between steps (e.g. a consumer handling a streamed
+    batch) never counts against the timeout and is never interrupted.
+
+    Example:
+        >>> budget = QueryBudget(cursor, timeout=30)
+        >>> with budget.step():
+        ...     result = cursor.execute(sql)
+        >>> with budget.step():
+        ...     rows = result.fetchmany(1000)
+    """
+
+    def __init__(self, connection: duckdb.DuckDBPyConnection, timeout: Optional[float], query: Optional[str] = None):
+        """
+        Initialize the budget.
+
+        Args:
+            connection: Connection whose running statement is interrupted
+            timeout: Total seconds allowed inside steps; None or <= 0 disables the budget
+            query: SQL text, attached to the raised QueryTimeoutError
+        """
+        self.connection = connection
+        self.timeout = timeout
+        self.query = query
+        self.spent = 0.0
+
+    @contextmanager
+    def step(self) -> Iterator[None]:
+        """Run the enclosed block under a deadline for the remaining budget."""
+        if not (self.timeout and self.timeout > 0):
+            yield
+            return
+        remaining = self.timeout - self.spent
+        if remaining <= 0:
+            raise _timeout_error(self.timeout, self.query)
+        start = time.monotonic()
+        try:
+            with QueryDeadline(self.connection, remaining, self.query):
+                yield
+        except QueryTimeoutError as e:
+            raise _timeout_error(self.timeout, self.query) from e.__cause__
+        finally:
+            self.spent += time.monotonic() - start
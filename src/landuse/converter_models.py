@@ -10,6 +10,8 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from .core.app_config import RUNTIME_PROFILES, RuntimeProfile
+
 
 class ConversionMode(str, Enum):
     """Available conversion modes"""
@@ -76,6 +78,21 @@ class ConversionConfig(BaseModel):
             raise ValueError(f"Invalid memory limit format: {v}. Use format like '8GB' or '512MB'")
         return v
 
+    def runtime_profile(self, base: Optional[RuntimeProfile] = None) -> RuntimeProfile:
+        """
+        DuckDB runtime settings for the conversion.
+
+        Args:
+            base: Profile to start from (defaults to the built-in ``conversion`` profile)
+
+        Returns:
+            ``base`` with this config's memory limit, threads and temp directory (for spilling)
+        """
+        update = {"memory_limit": self.memory_limit, "threads": self.threads}
+        if self.temp_dir:
+            update["temp_directory"] = str(self.temp_dir)
+        return (base or RUNTIME_PROFILES["conversion"]).model_copy(update=update)
+
 
 class RawLandUseData(BaseModel):
     """Raw land use data from JSON"""
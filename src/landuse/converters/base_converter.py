@@ -10,7 +10,7 @@ import duckdb
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeRemainingColumn
 
-from landuse.connections.duckdb_connection import DuckDBConnection
+from landuse.connections.duckdb_connection import ConnectionConfig, DuckDBConnection
 from landuse.core.app_config import AppConfig
 from landuse.utils.retry_decorators import database_retry
 
@@ -46,7 +46,14 @@ class BaseConverter(ABC):
 
         # Initialize database connection if output is DuckDB
         if str(self.output_path).endswith(".duckdb"):
-            self.db_connection = DuckDBConnection(database_path=str(self.output_path), read_only=False)
+            self.db_connection = DuckDBConnection(
+                ConnectionConfig(
+                    database=str(self.output_path),
+                    read_only=False,
+                    max_connections=self.config.database.max_connections,
+                    profile=self.config.runtime.conversion,
+                )
+            )
         else:
             self.db_connection = None
 
@@ -99,7 +106,7 @@ class BaseConverter(ABC):
         if not self.db_connection:
             raise ValueError("No database connection available")
 
-        conn = self.db_connection._instance
+        conn = self.db_connection.cursor()
         if params:
             return conn.execute(query, params)
         else:
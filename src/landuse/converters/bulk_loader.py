@@ -17,6 +17,7 @@ from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
 from ..converter_models import ConversionConfig, ConversionStats, ProcessedTransition
+from ..core.app_config import RuntimeProfile
 from ..utils.retry_decorators import database_retry, execute_with_retry, file_retry
 
 console = Console()
@@ -36,8 +37,10 @@ class DuckDBBulkLoader:
         temp_dir: Optional[str] = None,
         batch_size: int = 100000,
         compression: str = "snappy",
+        runtime: Optional[RuntimeProfile] = None,
     ):
         self.db_path = Path(db_path)
+        self.runtime = runtime
         self.temp_dir = temp_dir or tempfile.mkdtemp(prefix="duckdb_bulk_")
         self.batch_size = batch_size
         self.compression = compression
@@ -65,6 +68,7 @@ class DuckDBBulkLoader:
                 max_wait=10.0,
                 exceptions=(ConnectionError, OSError, RuntimeError),
                 database=str(self.db_path),
+                config=self.runtime.duckdb_config() if self.runtime else {},
             )
             yield self.conn
         finally:
@@ -355,5 +359,8 @@ def create_bulk_loader(db_path: Union[str, Path], config: Optional[ConversionCon
         config = ConversionConfig()
 
     return DuckDBBulkLoader(
-        db_path=db_path, batch_size=config.batch_size, temp_dir=str(config.temp_dir) if config.temp_dir else None
+        db_path=db_path,
+        batch_size=config.batch_size,
+        temp_dir=str(config.temp_dir) if config.temp_dir else None,
+        runtime=config.runtime_profile(),
     )
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+SSP Socioeconomic Projections Loader
+Loads county population and income projections into the star schema and
+precomputes a county x scenario x period table joining them to land use
+"""
+
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+import duckdb
+import pandas as pd
+from rich.console import Console
+
+from ..converter_models import ConversionStats
+from ..core.app_config import RuntimeProfile
+from .bulk_loader import DuckDBBulkLoader
+
+console = Console()
+
+# dim_socioeconomic rows: (ssp, name, narrative, population trend, economic trend, urbanization)
+SSP_SCENARIOS = [
+    (
+        "SSP1",
+        "Sustainability",
+        "Sustainable development with low challenges to mitigation and adaptation",
+        "Low",
+        "Medium",
+        "Medium",
+    ),
+    ("SSP2", "Middle of the Road", "Historical trends continue with moderate challenges", "Medium", "Medium", "Medium"),
+    (
+        "SSP3",
+        "Regional Rivalry",
+        "Fragmented world with high challenges to mitigation and adaptation",
+        "High",
+        "Low",
+        "Low",
+    ),
+    ("SSP4", "Inequality", "Unequal development with high challenges to adaptation", "Medium", "Medium", "High"),
+    (
+        "SSP5",
+        "Fossil-fueled Development",
+        "Rapid fossil-fueled growth with high challenges to mitigation",
+        "Low",
+        "High",
+        "High",
+    ),
+]
+
+# dim_indicators rows: (name, type, unit, description)
+INDICATORS = {
+    "population": ("Population", "Demographic", "Thousands of people", "County population"),
+    "income": ("Income Per Capita", "Economic", "Thousands of 2009 USD", "County per capita personal income"),
+}
+
+# Precomputed county x scenario x period land use and socioeconomic table
+JOIN_TABLE = "fact_county_socioeconomic"
+
+_FIPS_COLUMNS = ("fips", "fips_code", "geoid", "county_fips")
+_SSP_COLUMNS = ("ssp", "ssp_scenario", "scenario")
+
+SCHEMA_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS dim_socioeconomic (
+        socioeconomic_id INTEGER PRIMARY KEY,
+        ssp_scenario VARCHAR NOT NULL UNIQUE,
+        scenario_name VARCHAR NOT NULL,
+        narrative_description VARCHAR,
+        population_growth_trend VARCHAR,
+        economic_growth_trend VARCHAR,
+        urbanization_level VARCHAR,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS dim_indicators (
+        indicator_id INTEGER PRIMARY KEY,
+        indicator_name VARCHAR NOT NULL UNIQUE,
+        indicator_type VARCHAR NOT NULL,
+        unit_of_measure VARCHAR NOT NULL,
+        description VARCHAR,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS fact_socioeconomic_projections (
+        projection_id BIGINT PRIMARY KEY,
+        geography_id INTEGER NOT NULL,
+        socioeconomic_id INTEGER NOT NULL,
+        indicator_id INTEGER NOT NULL,
+        year INTEGER NOT NULL,
+        value DOUBLE NOT NULL,
+        is_historical BOOLEAN DEFAULT FALSE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE OR REPLACE VIEW v_population_trends AS
+    SELECT g.fips_code, g.county_name, g.state_name, g.region, se.ssp_scenario, se.scenario_name,
+           sp.year, sp.value AS population_thousands, sp.is_historical
+    FROM fact_socioeconomic_projections sp
+    JOIN dim_geography g ON sp.geography_id = g.geography_id
+    JOIN dim_socioeconomic se ON sp.socioeconomic_id = se.socioeconomic_id
+    JOIN dim_indicators i ON sp.indicator_id = i.indicator_id
+    WHERE i.indicator_name = 'Population'
+    """,
+    """
+    CREATE OR REPLACE VIEW v_income_trends AS
+    SELECT g.fips_code, g.county_name, g.state_name, g.region, se.ssp_scenario, se.scenario_name,
+           sp.year, sp.value AS income_per_capita_2009usd, sp.is_historical
+    FROM fact_socioeconomic_projections sp
+    JOIN dim_geography g ON sp.geography_id = g.geography_id
+    JOIN dim_socioeconomic se ON sp.socioeconomic_id = se.socioeconomic_id
+    JOIN dim_indicators i ON sp.indicator_id = i.indicator_id
+    WHERE i.indicator_name = 'Income Per Capita'
+    """,
+]
+
+# Land use at the end of each period, population and income at both ends
+JOIN_TABLE_SQL = f"""
+CREATE OR REPLACE TABLE {JOIN_TABLE} AS
+WITH land AS (
+    SELECT
+        f.geography_id,
+        f.scenario_id,
+        f.time_id,
+        SUM(f.acres) AS total_acres,
+        SUM(CASE WHEN tl.landuse_name = 'Crop' THEN f.acres ELSE 0 END) AS crop_acres,
+        SUM(CASE WHEN tl.landuse_name = 'Pasture' THEN f.acres ELSE 0 END) AS pasture_acres,
+        SUM(CASE WHEN tl.landuse_name = 'Rangeland' THEN f.acres ELSE 0 END) AS rangeland_acres,
+        SUM(CASE WHEN tl.landuse_name = 'Forest' THEN f.acres ELSE 0 END) AS forest_acres,
+        SUM(CASE WHEN tl.landuse_name = 'Urban' THEN f.acres ELSE 0 END) AS urban_acres,
+        SUM(CASE WHEN tl.landuse_name = 'Urban' AND f.transition_type = 'change' THEN f.acres ELSE 0 END)
+            AS urban_expansion_acres
+    FROM fact_landuse_transitions f
+    JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
+    GROUP BY ALL
+),
+projections AS (
+    SELECT
+        sp.geography_id,
+        upper(se.ssp_scenario) AS ssp_scenario,
+        sp.year,
+        MAX(CASE WHEN i.indicator_name = 'Population' THEN sp.value END) AS population,
+        MAX(CASE WHEN i.indicator_name = 'Income Per Capita' THEN sp.value END) AS income
+    FROM fact_socioeconomic_projections sp
+    JOIN dim_socioeconomic se ON sp.socioeconomic_id = se.socioeconomic_id
+    JOIN dim_indicators i ON sp.indicator_id = i.indicator_id
+    GROUP BY ALL
+)
+SELECT
+    land.geography_id,
+    g.fips_code,
+    g.county_name,
+    g.state_name,
+    land.scenario_id,
+    upper(s.rcp_scenario) AS rcp_scenario,
+    upper(s.ssp_scenario) AS ssp_scenario,
+    land.time_id,
+    t.year_range,
+    t.start_year,
+    t.end_year,
+    land.* EXCLUDE (geography_id, scenario_id, time_id),
+    p0.population AS population_start,
+    p1.population AS population_end,
+    p0.income AS income_start,
+    p1.income AS income_end
+FROM land
+JOIN dim_geography g ON land.geography_id = g.geography_id
+JOIN dim_scenario s ON land.scenario_id = s.scenario_id
+JOIN dim_time t ON land.time_id = t.time_id
+LEFT JOIN projections p0
+    ON p0.geography_id = land.geography_id AND p0.ssp_scenario = upper(s.ssp_scenario) AND p0.year = t.start_year
+LEFT JOIN projections p1
+    ON p1.geography_id = land.geography_id AND p1.ssp_scenario = upper(s.ssp_scenario) AND p1.year = t.end_year
+ORDER BY g.fips_code, land.scenario_id, t.start_year
+"""
+
+
+def _pick(columns: list[str], candidates: tuple[str, ...]) -> Optional[str]:
+    """First column whose lowercase name is one of ``candidates``."""
+    lowered = {c.lower(): c for c in columns}
+    return next((lowered[c] for c in candidates if c in lowered), None)
+
+
+def read_projections(source: Union[str, Path, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Read county projections into long form (fips_code, ssp_scenario, year, value).
+
+    Accepts a long layout (fips, ssp, year, value columns) or the wide layout
+    of the RPA county projection tables (fips, year, one column per SSP).
+
+    Args:
+        source: CSV or Parquet path, or a DataFrame
+
+    Returns:
+        Long-form DataFrame with 5-digit FIPS codes and upper-case SSP codes
+    """
+    if isinstance(source, pd.DataFrame):
+        df = source.copy()
+    elif Path(source).suffix.lower() == ".parquet":
+        df = pd.read_parquet(source)
+    else:
+        df = pd.read_csv(source, dtype=str)
+
+    fips_column = _pick(list(df.columns), _FIPS_COLUMNS)
+    year_column = _pick(list(df.columns), ("year",))
+    if fips_column is None or year_column is None:
+        raise ValueError(f"Projection data needs FIPS and year columns, got: {', '.join(map(str, df.columns))}")
+
+    ssp_column = _pick(list(df.columns), _SSP_COLUMNS)
+    if ssp_column is not None:
+        value_column = _pick(list(df.columns), ("value",))
+        if value_column is None:
+            raise ValueError("Long-form projection data needs a 'value' column")
+        long = df[[fips_column, ssp_column, year_column, value_column]]
+        long.columns = ["fips_code", "ssp_scenario", "year", "value"]
+    else:
+        ssp_columns = [c for c in df.columns if str(c).lower().startswith("ssp")]
+        if not ssp_columns:
+            raise ValueError("Projection data needs an SSP column or one column per SSP (SSP1..SSP5)")
+        long = df.melt(
+            id_vars=[fips_column, year_column], value_vars=ssp_columns, var_name="ssp_scenario", value_name="value"
+        )
+        long = long.rename(columns={fips_column: "fips_code", year_column: "year"})
+
+    long = long.assign(
+        fips_code=long["fips_code"].astype(str).str.strip().str.zfill(5),
+        ssp_scenario=long["ssp_scenario"].astype(str).str.strip().str.upper(),
+        year=pd.to_numeric(long["year"], errors="coerce"),
+        value=pd.to_numeric(long["value"], errors="coerce"),
+    )
+    # Same bounds as landuse.models.SocioeconomicProjection
+    valid = long["year"].between(2010, 2100) & (long["value"] >= 0)
+    return long[valid].astype({"year": "int64", "value": "float64"}).reset_index(drop=True)
+
+
+class SocioeconomicLoader:
+    """
+    Load SSP population and income projections into an RPA database.
+
+    Dimension rows are small and inserted directly; projection rows go
+    through ``DuckDBBulkLoader`` (Parquet + COPY). ``build_join_table`` then
+    materializes ``fact_county_socioeconomic`` so per-capita and density
+    metrics read one table instead of joining six at query time.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        bulk_loader: Optional[DuckDBBulkLoader] = None,
+        runtime: Optional[RuntimeProfile] = None,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            db_path: RPA database with the land use star schema
+            bulk_loader: Bulk loader to reuse (a temporary one is created per load otherwise)
+            runtime: DuckDB runtime settings for every connection the loader opens
+        """
+        self.db_path = Path(db_path)
+        self.bulk_loader = bulk_loader
+        self.runtime = runtime
+
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        """Open a writable connection with the loader's runtime settings."""
+        return duckdb.connect(str(self.db_path), config=self.runtime.duckdb_config() if self.runtime else {})
+
+    def create_schema(self) -> None:
+        """Create the socioeconomic tables and views and seed their dimensions."""
+        with self._connect() as conn:
+            for statement in SCHEMA_SQL:
+                conn.execute(statement)
+            conn.executemany(
+                "INSERT OR IGNORE INTO dim_socioeconomic "
+                "(socioeconomic_id, ssp_scenario, scenario_name, narrative_description, "
+                "population_growth_trend, economic_growth_trend, urbanization_level) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(i, *row) for i, row in enumerate(SSP_SCENARIOS, 1)],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO dim_indicators "
+                "(indicator_id, indicator_name, indicator_type, unit_of_measure, description) VALUES (?, ?, ?, ?, ?)",
+                [(i, *row) for i, row in enumerate(INDICATORS.values(), 1)],
+            )
+
+    def load(
+        self,
+        population: Union[str, Path, pd.DataFrame, None] = None,
+        income: Union[str, Path, pd.DataFrame, None] = None,
+        replace: bool = True,
+    ) -> ConversionStats:
+        """
+        Load population and/or income projections, then rebuild the join table.
+
+        Args:
+            population: Population projections (thousands of people)
+            income: Per capita income projections (thousands of 2009 USD)
+            replace: Delete existing rows for the loaded indicators first
+
+        Returns:
+            ConversionStats for the projection rows loaded
+        """
+        start_time = time.time()
+        self.create_schema()
+
+        with self._connect() as conn:
+            geography = conn.execute("SELECT fips_code, geography_id FROM dim_geography").df()
+            ssp_ids = dict(
+                conn.execute("SELECT upper(ssp_scenario), socioeconomic_id FROM dim_socioeconomic").fetchall()
+            )
+            indicator_ids = dict(conn.execute("SELECT indicator_name, indicator_id FROM dim_indicators").fetchall())
+            next_id = conn.execute(
+                "SELECT COALESCE(MAX(projection_id), 0) FROM fact_socioeconomic_projections"
+            ).fetchone()[0]
+
+            frames = []
+            for key, source in (("population", population), ("income", income)):
+                if source is None:
+                    continue
+                indicator_id = indicator_ids[INDICATORS[key][0]]
+                if replace:
+                    conn.execute("DELETE FROM fact_socioeconomic_projections WHERE indicator_id = ?", [indicator_id])
+                long = read_projections(source).merge(geography, on="fips_code", how="inner")
+                long["socioeconomic_id"] = long["ssp_scenario"].map(ssp_ids)
+                long = long.dropna(subset=["socioeconomic_id"])
+                long["indicator_id"] = indicator_id
+                frames.append(long)
+                console.print(f"📈 Prepared {len(long):,} {INDICATORS[key][0].lower()} projection rows")
+
+        if not frames:
+            raise ValueError("Provide population and/or income projections to load")
+
+        rows = pd.concat(frames, ignore_index=True)
+        rows = pd.DataFrame(
+            {
+                "projection_id": range(next_id + 1, next_id + 1 + len(rows)),
+                "geography_id": rows["geography_id"].astype("int32"),
+                "socioeconomic_id": rows["socioeconomic_id"].astype("int32"),
+                "indicator_id": rows["indicator_id"].astype("int32"),
+                "year": rows["year"].astype("int32"),
+                "value": rows["value"],
+                "is_historical": rows["year"] <= 2020,
+            }
+        )
+        if self.bulk_loader is not None:
+            self.bulk_loader.bulk_load_dataframe(rows, "fact_socioeconomic_projections", columns=list(rows.columns))
+        else:
+            with DuckDBBulkLoader(self.db_path, runtime=self.runtime) as loader:
+                loader.bulk_load_dataframe(rows, "fact_socioeconomic_projections", columns=list(rows.columns))
+        self.build_join_table()
+
+        return ConversionStats(
+            total_records=len(rows), processed_records=len(rows), processing_time=time.time() - start_time
+        )
+
+    def build_join_table(self) -> int:
+        """
+        Materialize ``fact_county_socioeconomic`` from the fact tables.
+
+        Returns:
+            Number of county x scenario x period rows
+        """
+        with self._connect() as conn:
+            conn.execute(JOIN_TABLE_SQL)
+            count = conn.execute(f"SELECT COUNT(*) FROM {JOIN_TABLE}").fetchone()[0]
+        console.print(f"🔗 Built {JOIN_TABLE}: {count:,} county x scenario x period rows")
+        return count
@@ -1,6 +1,7 @@
 """Unified application configuration with dependency injection support."""
 
 import os
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, Optional, Type, TypeVar
 
@@ -20,6 +21,16 @@ class DatabaseConfig(BaseModel):
     connection_timeout: int = Field(default=30, ge=1, le=300, description="Database connection timeout in seconds")
     max_connections: int = Field(default=10, ge=1, le=100, description="Maximum number of database connections in pool")
     cache_ttl: int = Field(default=3600, ge=0, description="Default cache TTL for query results in seconds")
+    cache_max_entries: int = Field(default=256, ge=0, description="Maximum cached query results per connection")
+    cache_max_mb: int = Field(default=256, ge=0, description="Maximum size of cached query results per connection in MB")
+    result_cache_path: Optional[str] = Field(
+        default=None, description="SQLite file persisting query results across processes and restarts (None disables)"
+    )
+    result_cache_mb: int = Field(default=1024, ge=0, description="Maximum size of persisted query results in MB")
+    in_memory: bool = Field(default=False, description="Copy the database into memory at startup")
+    preload_scenarios: Optional[list[str]] = Field(
+        default=None, description='Scenarios to keep in memory, as scenario_name or "RCP/SSP" pairs (None keeps all)'
+    )
 
     @field_validator("path")
     @classmethod
@@ -38,6 +49,119 @@ class DatabaseConfig(BaseModel):
         return v
 
 
+class RuntimeProfile(BaseModel):
+    """DuckDB runtime settings applied when a database is opened (None keeps DuckDB's default)."""
+
+    memory_limit: Optional[str] = Field(default=None, description="Memory limit, e.g. '8GB'")
+    threads: Optional[int] = Field(default=None, ge=1, description="Worker threads shared by all queries")
+    temp_directory: Optional[str] = Field(default=None, description="Directory for spilling to disk")
+    max_temp_directory_size: Optional[str] = Field(default=None, description="Maximum size of spilled data")
+    enable_object_cache: Optional[bool] = Field(default=None, description="Cache metadata objects between queries")
+    preserve_insertion_order: Optional[bool] = Field(
+        default=None, description="Keep row order of queries without ORDER BY (False lets large loads stream)"
+    )
+    checkpoint_threshold: Optional[str] = Field(
+        default=None, description="WAL size that triggers an automatic checkpoint, e.g. '1GB'"
+    )
+
+    def duckdb_config(self) -> dict[str, Any]:
+        """DuckDB ``config`` dict for ``duckdb.connect`` holding the settings that are set."""
+        config = self.model_dump(exclude_none=True)
+        if "temp_directory" in config:
+            config["temp_directory"] = os.path.expanduser(config["temp_directory"])
+        return config
+
+
+_SPILL_DIRECTORY = os.path.join(tempfile.gettempdir(), "landuse-duckdb")
+
+# Built-in profiles, selected by name through RuntimeConfig
+RUNTIME_PROFILES: dict[str, RuntimeProfile] = {
+    # Bulk loads: bounded memory spilling to a scratch directory, unordered streaming
+    # inserts and rare checkpoints
+    "conversion": RuntimeProfile(
+        memory_limit="8GB",
+        threads=8,
+        temp_directory=_SPILL_DIRECTORY,
+        enable_object_cache=False,
+        preserve_insertion_order=False,
+        checkpoint_threshold="1GB",
+    ),
+    # Few concurrent users: every core works on each query
+    "api-low-latency": RuntimeProfile(
+        memory_limit="4GB",
+        temp_directory=_SPILL_DIRECTORY,
+        enable_object_cache=True,
+        preserve_insertion_order=True,
+    ),
+    # Many concurrent users: a small thread pool per database so parallel queries do not
+    # oversubscribe the CPU, and less buffering to keep row order
+    "api-high-concurrency": RuntimeProfile(
+        memory_limit="4GB",
+        threads=2,
+        temp_directory=_SPILL_DIRECTORY,
+        max_temp_directory_size="20GB",
+        enable_object_cache=True,
+        preserve_insertion_order=False,
+    ),
+}
+
+
+class RuntimeConfig(BaseModel):
+    """DuckDB runtime tuning profiles."""
+
+    profile: Optional[str] = Field(
+        default=None, description="Profile for query connections (API, agents); None keeps DuckDB defaults"
+    )
+    conversion_profile: str = Field(default="conversion", description="Profile for connections that build databases")
+    profiles: dict[str, RuntimeProfile] = Field(
+        default_factory=lambda: dict(RUNTIME_PROFILES), description="Available profiles by name"
+    )
+
+    @model_validator(mode="after")
+    def validate_profiles(self) -> "RuntimeConfig":
+        """Ensure the selected profiles exist."""
+        for name in (self.profile, self.conversion_profile):
+            if name is not None and name not in self.profiles:
+                raise ConfigurationError(f"Unknown runtime profile: {name}. Available: {sorted(self.profiles)}")
+        return self
+
+    def get(self, name: Optional[str] = None) -> Optional[RuntimeProfile]:
+        """
+        Look up a profile.
+
+        Args:
+            name: Profile name (defaults to ``profile``)
+
+        Returns:
+            RuntimeProfile, or None if no profile is selected
+        """
+        name = name or self.profile
+        if name is None:
+            return None
+        if name not in self.profiles:
+            raise ConfigurationError(f"Unknown runtime profile: {name}. Available: {sorted(self.profiles)}")
+        return self.profiles[name]
+
+    @property
+    def conversion(self) -> RuntimeProfile:
+        """Profile for connections that build or migrate databases."""
+        return self.profiles[self.conversion_profile]
+
+
+def get_runtime_profile(profile: "RuntimeProfile | str | None") -> Optional[RuntimeProfile]:
+    """
+    Resolve a built-in profile name (or pass a RuntimeProfile through).
+
+    Raises:
+        ConfigurationError: If the name is not a built-in profile
+    """
+    if profile is None or isinstance(profile, RuntimeProfile):
+        return profile
+    if profile not in RUNTIME_PROFILES:
+        raise ConfigurationError(f"Unknown runtime profile: {profile}. Available: {sorted(RUNTIME_PROFILES)}")
+    return RUNTIME_PROFILES[profile]
+
+
 class LLMConfig(BaseModel):
     """LLM configuration settings."""
 
@@ -188,6 +312,7 @@ class AppConfig(BaseSettings):
     features: FeatureConfig = Field(default_factory=FeatureConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     backend: BackendConfig = Field(default_factory=BackendConfig)
+    runtime: RuntimeConfig = Field(default_factory=RuntimeConfig)
 
     # Application metadata
     app_name: str = Field(default="RPA Land Use Analytics")
@@ -148,11 +148,23 @@ class SchemaVersionManager:
     def get_current_version(self) -> Optional[str]:
         """Get the current database schema version.
 
+        Returns:
+            Current version number or None if not versioned
+        """
+        return self.read_version(self.connection)
+
+    @staticmethod
+    def read_version(connection: duckdb.DuckDBPyConnection) -> Optional[str]:
+        """Read the schema version without creating the version table.
+
+        Args:
+            connection: DuckDB connection
+
         Returns:
             Current version number or None if not versioned
         """
         try:
-            result = self.connection.execute("""
+            result = connection.execute("""
                 SELECT version_number
                 FROM schema_version
                 ORDER BY version_id DESC
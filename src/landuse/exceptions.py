@@ -7,6 +7,7 @@ Provides a comprehensive exception hierarchy with specific exception types:
 - AgentError: Agent-related errors with specific subtypes
 - SecurityError: Security-related errors
 - ValidationError: Data validation errors
+- CircuitOpenError: Calls shed by an open circuit breaker
 """
 
 
@@ -64,6 +65,14 @@ class QueryValidationError(DatabaseError):
         self.validation_type = validation_type
 
 
+class QueryTimeoutError(DatabaseError):
+    """Query interrupted after exceeding its execution deadline."""
+
+    def __init__(self, message: str, query: str = None, timeout: float = None, error_code: str = "TIMEOUT"):
+        super().__init__(message, query=query, error_code=error_code)
+        self.timeout = timeout
+
+
 # =============================================================================
 # Configuration Exceptions
 # =============================================================================
@@ -180,6 +189,20 @@ class DataProcessingError(ValidationError):
         self.data_type = data_type
 
 
+# =============================================================================
+# Resilience Exceptions
+# =============================================================================
+
+
+class CircuitOpenError(LanduseError):
+    """Call rejected without being attempted because its circuit breaker is open."""
+
+    def __init__(self, message: str, breaker: str = None, retry_after: float = None, error_code: str = "CIRCUIT_OPEN"):
+        super().__init__(message, error_code)
+        self.breaker = breaker
+        self.retry_after = retry_after
+
+
 # =============================================================================
 # Exception Mapping and Utilities
 # =============================================================================
@@ -12,6 +12,8 @@ from typing import Any, Literal, Optional
 import pandas as pd
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from landuse.security.sql_scanner import scan_sql
+
 
 # Enums for controlled vocabularies
 class LandUseType(str, Enum):
@@ -155,7 +157,7 @@ class SQLQuery(BaseModel):
         v = v.strip()
         if not v.upper().startswith(("SELECT", "WITH")):
             raise ValueError("Only SELECT and WITH queries are allowed")
-        if "DELETE" in v.upper() or "DROP" in v.upper() or "UPDATE" in v.upper():
+        if scan_sql(v).words & {"DELETE", "DROP", "UPDATE"}:
             raise ValueError("Destructive operations not allowed")
         return v
 
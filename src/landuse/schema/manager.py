@@ -10,6 +10,7 @@ import duckdb
 import yaml
 from rich.console import Console
 
+from landuse.connections.registry import DatabaseHandle, get_registry
 from landuse.core.app_config import AppConfig
 from landuse.database.schema_version import SchemaVersionManager
 from landuse.exceptions import SchemaError
@@ -62,6 +63,7 @@ class SchemaManager:
 
         # Initialize components
         self._cache = InMemoryCache(max_size=100, default_ttl=3600)
+        self._database: Optional[DatabaseHandle] = None
         self._connection: Optional[duckdb.DuckDBPyConnection] = None
         self._version_manager: Optional[SchemaVersionManager] = None
         self._migration_engine: Optional[MigrationEngine] = None
@@ -69,9 +71,18 @@ class SchemaManager:
 
     @property
     def connection(self) -> duckdb.DuckDBPyConnection:
-        """Get or create database connection."""
+        """Get or create database connection (a cursor on the registry's shared database)."""
         if self._connection is None:
-            self._connection = duckdb.connect(str(self.db_path), read_only=self.read_only)
+            # Writable connections migrate the database, so they get the conversion profile
+            runtime = self.config.runtime
+            profile = runtime.get() if self.read_only else runtime.conversion
+            self._database = get_registry().open(
+                str(self.db_path),
+                read_only=self.read_only,
+                config=profile.duckdb_config() if profile else None,
+                max_cursors=self.config.database.max_connections,
+            )
+            self._connection = self._database.cursor()
         return self._connection
 
     @property
@@ -359,9 +370,12 @@ class SchemaManager:
 
     def close(self):
         """Close database connection and cleanup resources."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        if self._database is not None:
+            self._database.close()
+            self._database = None
+        self._connection = None
+        self._version_manager = None
+        self._migration_engine = None
         self._cache.clear()
 
 
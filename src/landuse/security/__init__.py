@@ -1,5 +1,14 @@
 """Security utilities for the landuse application."""
 
 from .database_security import DatabaseSecurity, QueryValidationResult, QueryValidator
+from .sql_scanner import SQLScan, clear_scan_cache, scan_cache_info, scan_sql
 
-__all__ = ["DatabaseSecurity", "QueryValidator", "QueryValidationResult"]
+__all__ = [
+    "DatabaseSecurity",
+    "QueryValidator",
+    "QueryValidationResult",
+    "SQLScan",
+    "scan_sql",
+    "scan_cache_info",
+    "clear_scan_cache",
+]
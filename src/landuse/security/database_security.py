@@ -4,6 +4,8 @@ from typing import FrozenSet, List, Set
 
 from pydantic import BaseModel, Field
 
+from .sql_scanner import scan_sql, strip_comments
+
 
 class DatabaseSecurity:
     """
@@ -19,6 +21,7 @@ class DatabaseSecurity:
             # Fact tables
             "fact_landuse_transitions",
             "fact_socioeconomic_projections",
+            "fact_county_socioeconomic",
             # Dimension tables
             "dim_scenario",
             "dim_geography",
@@ -76,8 +79,8 @@ class DatabaseSecurity:
         ]
     )
 
-    # Disallowed SQL keywords and patterns
-    # Note: Comment syntax (--,/*,*/) removed as comments are stripped before validation
+    # Disallowed SQL keywords and patterns, matched against whole words outside comments and literals.
+    # ";--" stands for statement chaining and is reported as ";"; "xp_"/"sp_" match word prefixes.
     DANGEROUS_KEYWORDS: FrozenSet[str] = frozenset(
         [
             "DROP",
@@ -105,6 +108,9 @@ class DatabaseSecurity:
         ]
     )
 
+    # Dangerous keywords that are also harmless scalar functions when called, e.g. replace(s, 'a', 'b')
+    SAFE_FUNCTIONS: FrozenSet[str] = frozenset(["REPLACE"])
+
     @classmethod
     def validate_table_name(cls, table_name: str) -> str:
         """
@@ -177,15 +183,7 @@ class DatabaseSecurity:
         Returns:
             Query with comments removed
         """
-        import re
-
-        # Remove -- style comments (to end of line)
-        query = re.sub(r"--[^\n]*", "", query)
-
-        # Remove /* */ style comments
-        query = re.sub(r"/\*.*?\*/", "", query, flags=re.DOTALL)
-
-        return query
+        return strip_comments(query)
 
     @classmethod
     def scan_query_for_dangerous_content(cls, query: str) -> List[str]:
@@ -196,19 +194,22 @@ class DatabaseSecurity:
             query: SQL query to scan
 
         Returns:
-            List of dangerous patterns found
+            List of dangerous patterns found, in order of appearance
         """
-        # Remove comments before checking for dangerous patterns
-        query_without_comments = cls.remove_sql_comments(query)
-        dangerous_patterns = []
-        query_upper = query_without_comments.upper()
-
-        # Check for dangerous keywords
-        for keyword in cls.DANGEROUS_KEYWORDS:
-            if keyword in query_upper:
-                dangerous_patterns.append(keyword)
+        scan = scan_sql(query)
+        prefixes = tuple(k.upper() for k in cls.DANGEROUS_KEYWORDS if k.endswith("_"))
+        dangerous_patterns = [
+            word for word in scan.keywords if word in cls.DANGEROUS_KEYWORDS or word.startswith(prefixes)
+        ]
+        dangerous_patterns += [
+            word
+            for word in scan.calls
+            if (word in cls.DANGEROUS_KEYWORDS and word not in cls.SAFE_FUNCTIONS) or word.startswith(prefixes)
+        ]
+        if scan.statements > 1:
+            dangerous_patterns.append(";")
 
-        return dangerous_patterns
+        return list(dict.fromkeys(dangerous_patterns))
 
     @classmethod
     def validate_query_safety(cls, query: str) -> None:
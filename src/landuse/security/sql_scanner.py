@@ -0,0 +1,176 @@
+"""Single-pass SQL tokenizer used by the query security checks.
+
+One precompiled pattern splits a query into comments, string literals, quoted
+identifiers, numbers, words and symbols. Keyword checks then compare whole
+words, so ``created_at`` is not mistaken for ``CREATE``, ``ssp_scenario`` for
+an ``sp_`` procedure, or ``'DROP'`` inside a string literal for a statement.
+
+Scans are memoized per query text (least recently used first), so validating
+a query the application has seen before is a dictionary lookup.
+
+String literals are tokenized the way DuckDB reads them, including ``E'...'``
+strings with backslash escapes and ``$tag$...$tag$`` dollar-quoted strings, so
+a statement cannot be smuggled past the checks by ending a literal early. For
+nested block comments the tokenizer sees more of the query as code than DuckDB
+does, so there it over-reports keywords rather than hiding them.
+"""
+
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional
+
+_TOKEN = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<comment>--[^\n]*|/\*.*?(?:\*/|\Z))
+    | (?P<escape_string>(?<![\w$])[eE]'(?:[^'\\]|\\.|'')*'?)
+    | (?P<dollar_string>\$(?P<tag>(?:[^\W\d]\w*)?)\$.*?(?:\$(?P=tag)\$|\Z))
+    | (?P<string>'(?:[^']|'')*'?)
+    | (?P<quoted>"(?:[^"]|"")*"?)
+    | (?P<hex>0[xX][0-9a-fA-F]+)
+    | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    | (?P<word>[^\W\d][\w$]*)
+    | (?P<semicolon>;)
+    | (?P<symbol>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+@dataclass(frozen=True)
+class SQLScan:
+    """What a query contains, as seen by the tokenizer.
+
+    Attributes:
+        keywords: Unqualified words (upper case, in order of first use) not
+                  directly followed by ``(``
+        calls: Unqualified words directly followed by ``(`` (function calls), in order of first use
+        statements: Number of non-empty statements separated by ``;``
+        leading_word: First word of the query, upper case
+        has_hex_literal: Whether the query contains a ``0x...`` literal
+        into_targets: Words following ``INTO``
+    """
+
+    keywords: tuple[str, ...]
+    calls: tuple[str, ...]
+    statements: int
+    leading_word: Optional[str]
+    has_hex_literal: bool
+    into_targets: frozenset[str]
+
+    @property
+    def words(self) -> frozenset[str]:
+        """Every unqualified word, whether used as a keyword or called."""
+        return frozenset(self.keywords) | frozenset(self.calls)
+
+
+def _scan(query: str) -> SQLScan:
+    """Tokenize ``query`` in one pass."""
+    keywords: dict[str, None] = {}
+    calls: dict[str, None] = {}
+    into_targets: set[str] = set()
+    statements = 0
+    in_statement = False
+    leading_word = None
+    has_hex = False
+    pending_word = None  # last word, until the next token shows whether it is called
+    previous = None  # kind and value of the previous significant token
+    previous_word = None
+
+    for match in _TOKEN.finditer(query):
+        kind = match.lastgroup
+        if kind == "space" or kind == "comment":
+            continue
+
+        if pending_word is not None:
+            if kind == "symbol" and match.group() == "(":
+                calls.setdefault(pending_word, None)
+            else:
+                keywords.setdefault(pending_word, None)
+            pending_word = None
+
+        if kind == "semicolon":
+            in_statement = False
+            previous = previous_word = None
+            continue
+        if not in_statement:
+            statements += 1
+            in_statement = True
+
+        if kind == "word":
+            word = match.group().upper()
+            if leading_word is None:
+                leading_word = word
+            # Qualified names (schema.table, t.column) are identifiers, not keywords
+            if previous != ("symbol", "."):
+                pending_word = word
+            if previous_word == "INTO":
+                into_targets.add(word)
+            previous_word = word
+        else:
+            has_hex = has_hex or kind == "hex"
+            previous_word = None
+        previous = (kind, match.group() if kind == "symbol" else None)
+
+    if pending_word is not None:
+        keywords.setdefault(pending_word, None)
+    return SQLScan(
+        keywords=tuple(keywords),
+        calls=tuple(calls),
+        statements=statements,
+        leading_word=leading_word,
+        has_hex_literal=has_hex,
+        into_targets=frozenset(into_targets),
+    )
+
+
+def strip_comments(query: str) -> str:
+    """Replace comments with a space, leaving comment markers inside literals alone."""
+    return "".join(" " if m.lastgroup == "comment" else m.group() for m in _TOKEN.finditer(query))
+
+
+# Scans keyed by query text, least recently used first
+_SCAN_MAX = 4096
+_scans: OrderedDict[str, SQLScan] = OrderedDict()
+_scan_lock = Lock()
+_scan_stats = {"hits": 0, "misses": 0}
+
+
+def scan_sql(query: str) -> SQLScan:
+    """
+    Tokenize a query, reusing the scan of identical query text.
+
+    Args:
+        query: SQL text
+
+    Returns:
+        SQLScan of the query
+    """
+    with _scan_lock:
+        scan = _scans.get(query)
+        if scan is not None:
+            _scans.move_to_end(query)
+            _scan_stats["hits"] += 1
+            return scan
+    scan = _scan(query)
+    with _scan_lock:
+        _scan_stats["misses"] += 1
+        _scans[query] = scan
+        if len(_scans) > _SCAN_MAX:
+            _scans.popitem(last=False)
+    return scan
+
+
+def scan_cache_info() -> dict[str, int]:
+    """Hit/miss statistics of the scan memo."""
+    with _scan_lock:
+        return {**_scan_stats, "size": len(_scans)}
+
+
+def clear_scan_cache() -> None:
+    """Drop all memoized scans."""
+    with _scan_lock:
+        _scans.clear()
+        _scan_stats.update(hits=0, misses=0)
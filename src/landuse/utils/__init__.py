@@ -2,10 +2,16 @@
 
 This package consolidates all utility functions including:
 - retry_decorators: Tenacity-based retry logic for database, API, and file operations
+- circuit_breaker: Failure-rate circuit breakers that shed calls to failing dependencies
 - security: SQL validation, input sanitization, and rate limiting
 - state_mappings: US state code/name mappings and lookups
 """
 
+from landuse.utils.circuit_breaker import (
+    CircuitBreaker,
+    circuit_breaker_metrics,
+    get_circuit_breaker,
+)
 from landuse.utils.retry_decorators import (
     api_retry,
     database_retry,
@@ -30,6 +36,10 @@ __all__ = [
     "api_retry",
     "file_retry",
     "network_retry",
+    # Circuit breakers
+    "CircuitBreaker",
+    "get_circuit_breaker",
+    "circuit_breaker_metrics",
     # Security
     "RateLimiter",
     "SQLSanitizer",
@@ -0,0 +1,315 @@
+"""
+Circuit breakers that shed calls to a failing dependency.
+
+Retrying every failure is right for a blip but wrong for an outage: each
+request keeps its thread busy in retry loops and multiplies the load on the
+dependency that is already failing. A ``CircuitBreaker`` tracks the failure
+rate of recent calls and, once it crosses ``failure_rate`` (over at least
+``minimum_calls`` calls in the last ``window`` seconds), opens: calls then
+fail immediately with ``CircuitOpenError`` instead of being attempted. After
+``open_timeout`` seconds the breaker lets ``half_open_calls`` trial calls
+through; if they succeed it closes again, otherwise it reopens.
+
+Only ``failure_exceptions`` (optionally refined by ``is_failure``) count
+against the dependency: connection errors and timeouts, not a query for an
+unknown state.
+
+Breakers are usually shared per dependency through ``get_circuit_breaker``,
+and ``circuit_breaker_metrics`` reports the state of every shared breaker.
+
+Example:
+    >>> breaker = get_circuit_breaker("llm:anthropic", failure_exceptions=(ConnectionError,))
+    >>> response = await breaker.call_async(llm.ainvoke, messages)
+    >>> with breaker.guard():
+    ...     rows = conn.execute(sql).fetchall()
+"""
+
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from landuse.exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Failure counts are kept in this many time buckets per window
+_BUCKETS = 10
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker with closed, open and half-open states.
+
+    Thread-safe; the same breaker can guard sync and async callers.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        minimum_calls: int = 10,
+        window: float = 30.0,
+        open_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        failure_exceptions: tuple[type[BaseException], ...] = (Exception,),
+        is_failure: Optional[Callable[[BaseException], bool]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            name: Dependency name, used in errors, logs and metrics
+            failure_rate: Fraction of failed calls in the window that opens the breaker
+            minimum_calls: Calls needed in the window before the rate is trusted
+            window: Seconds of call history the failure rate is computed over
+            open_timeout: Seconds to stay open before allowing trial calls
+            half_open_calls: Concurrent trial calls allowed while half-open
+            failure_exceptions: Exception types that count as failures
+            is_failure: Optional predicate refining ``failure_exceptions``
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.name = name
+        self.failure_rate = failure_rate
+        self.minimum_calls = minimum_calls
+        self.window = window
+        self.open_timeout = open_timeout
+        self.half_open_calls = half_open_calls
+        self.failure_exceptions = failure_exceptions
+        self._is_failure = is_failure
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+        # [bucket start, calls, failures], oldest first, plus running totals
+        self._buckets: deque[list] = deque()
+        self._calls = 0
+        self._failures = 0
+        self._metrics = {"successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            return self._current_state(self._clock())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now - self._opened_at >= self.open_timeout:
+            self._set_state(HALF_OPEN)
+            self._trials = 0
+        return self._state
+
+    def _set_state(self, state: str) -> None:
+        if state != self._state:
+            logger.log(
+                logging.WARNING if state == OPEN else logging.INFO,
+                f"Circuit breaker {self.name}: {self._state} -> {state}",
+            )
+            self._state = state
+
+    def allow(self) -> None:
+        """
+        Admit a call, to be followed by ``record_success`` or ``record_failure``.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with its trial calls in flight
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._trials < self.half_open_calls:
+                self._trials += 1
+                return
+            self._metrics["rejected"] += 1
+            retry_after = max(0.0, self.open_timeout - (now - self._opened_at))
+        raise CircuitOpenError(
+            f"{self.name} is unavailable after repeated failures; retry in {retry_after:.0f}s",
+            breaker=self.name,
+            retry_after=retry_after,
+        )
+
+    def record_success(self) -> None:
+        """Record a completed call."""
+        with self._lock:
+            self._metrics["successes"] += 1
+            if self._state == HALF_OPEN:
+                # The trial succeeded: start over with a clean window
+                self._set_state(CLOSED)
+                self._buckets.clear()
+                self._calls = self._failures = 0
+                return
+            self._record(self._clock(), failed=False)
+
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        """
+        Record a failed call.
+
+        Errors that do not count as failures are recorded as successes, since
+        the dependency answered; cancellations are not recorded at all.
+
+        Args:
+            error: The exception raised by the call
+        """
+        if error is not None and not self.counts_as_failure(error):
+            if isinstance(error, Exception):
+                self.record_success()
+                return
+            with self._lock:
+                if self._state == HALF_OPEN:
+                    self._trials = max(0, self._trials - 1)
+            return
+        with self._lock:
+            now = self._clock()
+            self._metrics["failures"] += 1
+            if self._state == HALF_OPEN:
+                self._open(now)
+                return
+            self._record(now, failed=True)
+            if (
+                self._state == CLOSED
+                and self._calls >= self.minimum_calls
+                and self._failures >= self.failure_rate * self._calls
+            ):
+                self._open(now)
+
+    def counts_as_failure(self, error: BaseException) -> bool:
+        """Whether ``error`` indicates the dependency is failing."""
+        if isinstance(error, CircuitOpenError) or not isinstance(error, self.failure_exceptions):
+            return False
+        return self._is_failure is None or self._is_failure(error)
+
+    def _open(self, now: float) -> None:
+        self._set_state(OPEN)
+        self._opened_at = now
+        self._metrics["opened"] += 1
+
+    def _record(self, now: float, failed: bool) -> None:
+        width = self.window / _BUCKETS
+        while self._buckets and self._buckets[0][0] <= now - self.window:
+            _, calls, failures = self._buckets.popleft()
+            self._calls -= calls
+            self._failures -= failures
+        if not self._buckets or now - self._buckets[-1][0] >= width:
+            self._buckets.append([now, 0, 0])
+        bucket = self._buckets[-1]
+        bucket[1] += 1
+        bucket[2] += failed
+        self._calls += 1
+        self._failures += failed
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Run the enclosed block as one call through the breaker."""
+        self.allow()
+        try:
+            yield
+        except BaseException as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call ``func`` through the breaker."""
+        with self.guard():
+            return func(*args, **kwargs)
+
+    async def call_async(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Await ``func(*args, **kwargs)`` through the breaker."""
+        self.allow()
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
+
+    def __call__(self, func: Callable) -> Callable:
+        """Use the breaker as a decorator on a sync or async function."""
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await self.call_async(func, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+
+        return wrapper
+
+    def reset(self) -> None:
+        """Close the breaker and forget the call history."""
+        with self._lock:
+            self._set_state(CLOSED)
+            self._buckets.clear()
+            self._calls = self._failures = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Breaker metrics: state, windowed calls/failures/rate and lifetime counters."""
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            recent = [b for b in self._buckets if b[0] > now - self.window]
+            calls = sum(b[1] for b in recent)
+            failures = sum(b[2] for b in recent)
+            return {
+                "state": state,
+                "window_calls": calls,
+                "window_failure_rate": failures / calls if calls else 0.0,
+                **self._metrics,
+            }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """
+    Get the process-wide breaker for a dependency, creating it on first use.
+
+    Args:
+        name: Dependency name (e.g. "llm:anthropic" or "duckdb:/path/to/file")
+        **kwargs: CircuitBreaker settings, only used when the breaker is created
+
+    Returns:
+        The shared CircuitBreaker
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name, **kwargs)
+        return breaker
+
+
+def circuit_breaker_metrics() -> dict[str, dict[str, Any]]:
+    """Metrics of every shared breaker, by name."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.stats() for breaker in breakers}
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "get_circuit_breaker",
+    "circuit_breaker_metrics",
+    "CLOSED",
+    "OPEN",
+    "HALF_OPEN",
+]
@@ -3,12 +3,20 @@
 Retry decorators and utilities using tenacity for robust error handling
 """
 
+import asyncio
 import functools
+import inspect
+import logging
+import random
 import time
-from typing import Any, Callable, Optional, Union
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, Union
 
 from rich.console import Console
 
+from landuse.exceptions import CircuitOpenError
+
 try:
     from tenacity import (
         RetryError,
@@ -198,7 +206,7 @@ def network_retry(max_attempts: int = 5, min_wait: float = 2.0, max_wait: float
     )
 
 
-def _get_llm_retryable_exceptions() -> tuple:
+def get_llm_retryable_exceptions() -> tuple:
     """Get Anthropic exceptions that should trigger retries.
 
     Returns:
@@ -254,7 +262,7 @@ def llm_retry(
         ... def call_llm(messages):
         ...     return llm.invoke(messages)
     """
-    exceptions = _get_llm_retryable_exceptions()
+    exceptions = get_llm_retryable_exceptions()
 
     if not HAS_TENACITY:
         return _fallback_llm_retry(max_attempts, min_wait, rate_limit_wait, exceptions)
@@ -364,7 +372,7 @@ def invoke_llm_with_retry(
     """
     import random
 
-    exceptions = _get_llm_retryable_exceptions()
+    exceptions = get_llm_retryable_exceptions()
     last_exception = None
 
     for attempt in range(max_attempts):
@@ -464,6 +472,8 @@ def _fallback_retry(max_attempts: int, wait_time: float):
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
+                except CircuitOpenError:
+                    raise
                 except Exception as e:
                     last_exception = e
                     if attempt < max_attempts - 1:  # Don't sleep on last attempt
@@ -559,6 +569,9 @@ class RetryableOperation:
                 console.print(f"✅ Attempt {attempt} succeeded")
                 return result
 
+            except CircuitOpenError:
+                console.print(f"⛔ {self.operation_name} not attempted: circuit open")
+                raise
             except self.exceptions as e:
                 if attempt == self.max_attempts:
                     console.print(f"❌ Final attempt {attempt} failed: {e}")
@@ -618,6 +631,243 @@ def execute_with_retry(
         return op.execute(func, *args, **kwargs)
 
 
+# =============================================================================
+# Async retries
+# =============================================================================
+
+_async_logger = logging.getLogger("landuse.retry.async")
+
+
+class RetryBudget:
+    """
+    Retry allowance shared by every retry made on behalf of one request.
+
+    Without a budget, nested or sequential retrying calls can each spend
+    their full backoff, so a request may run far past any useful deadline.
+    A budget bounds the total: no retry starts if its wait would end after
+    ``deadline`` seconds from creation, or once ``max_retries`` have been
+    spent, and retried attempts are cut off at the deadline. First attempts
+    are never limited by the budget: it bounds retrying, not the work itself.
+
+    Example:
+        >>> with retry_budget(deadline=30):
+        ...     await fetch_counties()  # decorated with @async_database_retry()
+    """
+
+    def __init__(self, deadline: Optional[float] = None, max_retries: Optional[int] = None):
+        """
+        Args:
+            deadline: Seconds from now after which no retry may end
+            max_retries: Maximum retries across all operations using the budget
+        """
+        self.expires_at = None if deadline is None else time.monotonic() + deadline
+        self.max_retries = max_retries
+        self.retries = 0
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None without a deadline)."""
+        return None if self.expires_at is None else max(0.0, self.expires_at - time.monotonic())
+
+    def spend(self, wait: float) -> bool:
+        """Take one retry that first waits ``wait`` seconds, if the budget allows it."""
+        remaining = self.remaining()
+        if remaining is not None and wait >= remaining:
+            return False
+        if self.max_retries is not None and self.retries >= self.max_retries:
+            return False
+        self.retries += 1
+        return True
+
+
+_current_budget: ContextVar[Optional[RetryBudget]] = ContextVar("landuse_retry_budget", default=None)
+
+
+@contextmanager
+def retry_budget(deadline: Optional[float] = None, max_retries: Optional[int] = None) -> Iterator[RetryBudget]:
+    """Apply a RetryBudget to the async retries made in this context (the current task)."""
+    budget = RetryBudget(deadline, max_retries)
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+
+
+def backoff_with_jitter(attempt: int, min_wait: float, max_wait: float) -> float:
+    """
+    Exponential backoff with equal jitter.
+
+    Waits between half and all of ``min_wait * 2 ** (attempt - 1)`` (capped at
+    ``max_wait``), so callers that failed together do not retry in lockstep.
+    """
+    base = min(max_wait, min_wait * 2 ** (attempt - 1))
+    return base / 2 + random.uniform(0, base / 2)
+
+
+class AsyncRetryableOperation:
+    """
+    Async retry loop that waits with ``asyncio.sleep`` instead of blocking the event loop.
+
+    Synchronous functions are run in a worker thread, so a blocking call
+    (e.g. a DuckDB query) does not stall other coroutines either.
+
+    Example:
+        async with AsyncRetryableOperation("LLM call", max_attempts=3) as op:
+            response = await op.execute(llm.ainvoke, messages)
+    """
+
+    def __init__(
+        self,
+        operation_name: str,
+        max_attempts: int = 3,
+        min_wait: float = 1.0,
+        max_wait: float = 60.0,
+        exceptions: tuple = None,
+        wait_for: Optional[Callable[[Exception, int], Optional[float]]] = None,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """
+        Args:
+            operation_name: Descriptive name for logging
+            max_attempts: Maximum attempts
+            min_wait: Base wait before the first retry (seconds)
+            max_wait: Maximum wait between retries (seconds)
+            exceptions: Exception types to retry on
+            wait_for: Optional override of the wait for an exception and attempt number
+            budget: Retry budget; defaults to the one set by ``retry_budget()``
+        """
+        self.operation_name = operation_name
+        self.max_attempts = max_attempts
+        self.min_wait = min_wait
+        self.max_wait = max_wait
+        self.exceptions = exceptions or (Exception,)
+        self.wait_for = wait_for
+        self.budget = budget
+        self.attempt_count = 0
+        self.waited = 0.0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            _async_logger.warning(f"{self.operation_name} failed after {self.attempt_count} attempts")
+        return False
+
+    async def execute(self, func: Callable, *args, **kwargs):
+        """Call ``func`` (a coroutine function or a blocking function) with retries."""
+        budget = self.budget or _current_budget.get()
+        for attempt in range(1, self.max_attempts + 1):
+            self.attempt_count = attempt
+            remaining = budget.remaining() if budget is not None and attempt > 1 else None
+            try:
+                if inspect.iscoroutinefunction(func):
+                    call = func(*args, **kwargs)
+                else:
+                    call = asyncio.to_thread(func, *args, **kwargs)
+                return await (call if remaining is None else asyncio.wait_for(call, remaining))
+            except CircuitOpenError:
+                raise
+            except self.exceptions as e:
+                wait = self.wait_for(e, attempt) if self.wait_for else None
+                if wait is None:
+                    wait = backoff_with_jitter(attempt, self.min_wait, self.max_wait)
+                if attempt == self.max_attempts or (budget is not None and not budget.spend(wait)):
+                    raise
+                _async_logger.warning(
+                    f"{self.operation_name} attempt {attempt} failed ({type(e).__name__}: {e}); retrying in {wait:.1f}s"
+                )
+                self.waited += wait
+                await asyncio.sleep(wait)
+
+
+def async_retry(
+    max_attempts: int = 3,
+    min_wait: float = 1.0,
+    max_wait: float = 60.0,
+    exceptions: tuple = None,
+    wait_for: Optional[Callable[[Exception, int], Optional[float]]] = None,
+):
+    """
+    Retry decorator for coroutine functions using non-blocking, jittered waits.
+
+    Retries share the ``retry_budget()`` of the calling task, if any.
+
+    Args:
+        max_attempts: Maximum number of attempts
+        min_wait: Base wait before the first retry (seconds)
+        max_wait: Maximum wait between retries (seconds)
+        exceptions: Tuple of exception types to retry on
+        wait_for: Optional override of the wait for an exception and attempt number
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            operation = AsyncRetryableOperation(
+                func.__qualname__, max_attempts, min_wait, max_wait, exceptions, wait_for
+            )
+            return await operation.execute(func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def async_database_retry(
+    max_attempts: int = 3, min_wait: float = 1.0, max_wait: float = 10.0, exceptions: tuple = None
+):
+    """
+    Async retry decorator for database operations.
+
+    Args:
+        max_attempts: Maximum number of retry attempts
+        min_wait: Base wait between retries (seconds)
+        max_wait: Maximum wait time between retries (seconds)
+        exceptions: Tuple of exception types to retry on
+    """
+    if exceptions is None:
+        exceptions = (ConnectionError, TimeoutError, OSError)
+    return async_retry(max_attempts, min_wait, max_wait, exceptions)
+
+
+def async_llm_retry(
+    max_attempts: int = 3,
+    min_wait: float = 1.0,
+    max_wait: float = 60.0,
+    rate_limit_wait: float = 30.0,
+):
+    """
+    Async retry decorator for LLM/Anthropic API calls.
+
+    Same policy as ``llm_retry`` (longer waits after rate limits), but waits
+    without blocking the event loop and within the task's retry budget.
+
+    Args:
+        max_attempts: Maximum number of retry attempts (default: 3)
+        min_wait: Base wait between retries in seconds (default: 1.0)
+        max_wait: Maximum wait time between retries in seconds (default: 60.0)
+        rate_limit_wait: Wait time for rate limit errors in seconds (default: 30.0)
+
+    Example:
+        >>> @async_llm_retry(max_attempts=3)
+        ... async def call_llm(messages):
+        ...     return await llm.ainvoke(messages)
+    """
+    return async_retry(max_attempts, min_wait, max_wait, get_llm_retryable_exceptions(), llm_wait(rate_limit_wait))
+
+
+def llm_wait(rate_limit_wait: float = 30.0) -> Callable[[Exception, int], Optional[float]]:
+    """Wait strategy for AsyncRetryableOperation giving rate limit errors a longer, jittered wait."""
+
+    def wait_for(exception: Exception, attempt: int) -> Optional[float]:
+        if _is_rate_limit_error(exception):
+            return rate_limit_wait + random.uniform(0, 5)
+        return None
+
+    return wait_for
+
+
 # Export the main decorators and utilities
 __all__ = [
     "database_retry",
@@ -626,10 +876,19 @@ __all__ = [
     "network_retry",
     "llm_retry",
     "invoke_llm_with_retry",
+    "get_llm_retryable_exceptions",
     "custom_retry",
     "retry_on_result",
     "RetryableOperation",
     "execute_with_retry",
     "RetryConfig",
     "HAS_TENACITY",
+    "AsyncRetryableOperation",
+    "RetryBudget",
+    "retry_budget",
+    "backoff_with_jitter",
+    "async_retry",
+    "async_database_retry",
+    "async_llm_retry",
+    "llm_wait",
 ]
@@ -4,23 +4,32 @@ Security utilities for the Landuse Analysis System
 Provides input validation, sanitization, and security helpers
 """
 
+import asyncio
 import hashlib
 import logging
 import re
 import secrets
+import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from functools import wraps
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from pydantic import BaseModel, Field, field_validator
 from rich.console import Console
 
+from landuse.core.app_config import SecurityConfig
+from landuse.exceptions import RateLimitError
+from landuse.security.database_security import DatabaseSecurity
+from landuse.security.sql_scanner import scan_sql
+
 logger = logging.getLogger(__name__)
 console = Console()
 
+_RATE_LIMIT_METRICS = ("allowed", "rejected", "waited", "wait_seconds", "evicted")
+
 
 class SQLQueryValidator:
     """Validates and sanitizes SQL queries for security"""
@@ -86,12 +95,9 @@ class SQLQueryValidator:
         "NULL",
     }
 
-    # Pattern to detect SQL comments
-    SQL_COMMENT_PATTERNS = [
-        re.compile(r"--.*$", re.MULTILINE),  # -- style comments
-        re.compile(r"/\*.*?\*/", re.DOTALL),  # /* */ style comments
-        re.compile(r"#.*$", re.MULTILINE),  # # style comments (MySQL)
-    ]
+    # Functions and INTO targets used to encode payloads or write files
+    SUSPICIOUS_CALLS = {"CHAR": "CHAR function not allowed", "CONCAT": "CONCAT function not allowed for security"}
+    SUSPICIOUS_INTO = {"OUTFILE": "INTO OUTFILE not allowed", "DUMPFILE": "INTO DUMPFILE not allowed"}
 
     @classmethod
     def validate_query(cls, query: str) -> tuple[bool, Optional[str]]:
@@ -102,48 +108,34 @@ class SQLQueryValidator:
         if not query or not isinstance(query, str):
             return False, "Query must be a non-empty string"
 
-        # Remove comments first
-        cleaned_query = cls._remove_comments(query)
+        # Keywords are whole words outside comments and string literals
+        scan = scan_sql(query)
 
-        # Convert to uppercase for keyword checking
-        query_upper = cleaned_query.upper()
-
-        # Check for multiple statements (semicolon not at end)
-        if ";" in cleaned_query.rstrip(";"):
+        # Check for multiple statements (trailing semicolons are fine)
+        if scan.statements > 1:
             return False, "Multiple statements not allowed"
 
         # Check for dangerous keywords
-        for keyword in cls.DANGEROUS_KEYWORDS:
-            if re.search(r"\b" + keyword + r"\b", query_upper):
+        for keyword in scan.keywords + scan.calls:
+            if keyword in cls.DANGEROUS_KEYWORDS and keyword not in DatabaseSecurity.SAFE_FUNCTIONS:
                 return False, f"Dangerous keyword '{keyword}' not allowed"
 
         # Basic structure validation - allow WITH (CTE) or SELECT
-        if not (query_upper.strip().startswith("SELECT") or query_upper.strip().startswith("WITH")):
+        if scan.leading_word not in ("SELECT", "WITH"):
             return False, "Only SELECT queries are allowed"
 
         # Check for suspicious patterns
-        suspicious_patterns = [
-            (r"0x[0-9a-fA-F]+", "Hexadecimal literals not allowed"),
-            (r"char\s*\(", "CHAR function not allowed"),
-            (r"concat\s*\(", "CONCAT function not allowed for security"),
-            (r"into\s+outfile", "INTO OUTFILE not allowed"),
-            (r"into\s+dumpfile", "INTO DUMPFILE not allowed"),
-        ]
-
-        for pattern, message in suspicious_patterns:
-            if re.search(pattern, query_upper, re.IGNORECASE):
+        if scan.has_hex_literal:
+            return False, "Hexadecimal literals not allowed"
+        for name, message in cls.SUSPICIOUS_CALLS.items():
+            if name in scan.calls:
+                return False, message
+        for target, message in cls.SUSPICIOUS_INTO.items():
+            if target in scan.into_targets:
                 return False, message
 
         return True, None
 
-    @classmethod
-    def _remove_comments(cls, query: str) -> str:
-        """Remove SQL comments from query"""
-        result = query
-        for pattern in cls.SQL_COMMENT_PATTERNS:
-            result = pattern.sub("", result)
-        return result
-
     @classmethod
     def sanitize_identifier(cls, identifier: str) -> str:
         """
@@ -232,39 +224,169 @@ class InputValidator:
 
 
 class RateLimiter:
-    """Simple rate limiter for API calls"""
+    """
+    Token-bucket rate limiter keyed by caller identifier.
+
+    Each identifier may burst up to ``max_calls`` calls, refilled at
+    ``max_calls / time_window`` calls per second. A check is O(1): it refills
+    and spends from the identifier's bucket under one of ``stripes`` locks, so
+    concurrent callers only contend when their identifiers share a stripe.
+
+    A bucket left idle long enough to refill completely is indistinguishable
+    from a new one, so such buckets are dropped as the stripe is touched;
+    ``max_identifiers`` additionally bounds memory under many distinct callers.
 
-    def __init__(self, max_calls: int = 60, time_window: int = 60):
+    Example:
+        >>> limiter = RateLimiter.from_config(AppConfig().security)
+        >>> allowed, error = limiter.check_rate_limit("user1")
+        >>> await limiter.acquire_async("user1", timeout=30)
+    """
+
+    def __init__(
+        self,
+        max_calls: int = 60,
+        time_window: float = 60,
+        stripes: int = 16,
+        max_identifiers: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize rate limiter
         Args:
             max_calls: Maximum number of calls allowed
             time_window: Time window in seconds
+            stripes: Number of independently locked identifier maps
+            max_identifiers: Maximum identifiers tracked; least recently seen are dropped first
+            clock: Monotonic time source (injectable for tests)
         """
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls: dict[str, list[float]] = defaultdict(list)
+        self.rate = max_calls / time_window
+        self.max_identifiers = max_identifiers
+        self._clock = clock
+        # Each stripe maps identifier -> [tokens, updated_at], least recently used first
+        self._stripes = [(threading.Lock(), OrderedDict()) for _ in range(stripes)]
+        self._stripe_capacity = max(1, max_identifiers // stripes)
+        self._metrics = [dict.fromkeys(_RATE_LIMIT_METRICS, 0) for _ in range(stripes)]
+
+    @classmethod
+    def from_config(cls, config: Optional[SecurityConfig] = None, **kwargs) -> "RateLimiter":
+        """Create a limiter from ``SecurityConfig.rate_limit_calls`` / ``rate_limit_window``."""
+        config = config or SecurityConfig()
+        return cls(max_calls=config.rate_limit_calls, time_window=config.rate_limit_window, **kwargs)
+
+    def _reserve(self, identifier: str, max_wait: float) -> float:
+        """
+        Take a call from the identifier's bucket.
+
+        If the bucket is empty but a call becomes available within ``max_wait``
+        seconds, the call is reserved now (the bucket goes into debt, so waiters
+        are served in arrival order) and the wait is returned.
+
+        Returns:
+            Seconds the caller must wait before proceeding (0 if it may proceed
+            now), or the negated wait if it would exceed ``max_wait``
+        """
+        index = hash(identifier) % len(self._stripes)
+        lock, buckets = self._stripes[index]
+        metrics = self._metrics[index]
+        with lock:
+            # Read under the lock so stamps only move forward; clamp anyway for non-monotonic clocks
+            now = self._clock()
+            bucket = buckets.get(identifier)
+            if bucket is None:
+                bucket = buckets[identifier] = [float(self.max_calls), now]
+            else:
+                buckets.move_to_end(identifier)
+                if now > bucket[1]:
+                    bucket[0] = min(self.max_calls, bucket[0] + (now - bucket[1]) * self.rate)
+                    bucket[1] = now
+
+            wait = 0.0 if bucket[0] >= 1 else (1 - bucket[0]) / self.rate
+            if wait <= max_wait:
+                bucket[0] -= 1
+                metrics["allowed"] += 1
+                if wait:
+                    metrics["waited"] += 1
+                    metrics["wait_seconds"] += wait
+            else:
+                metrics["rejected"] += 1
+
+            # Drop refilled buckets (and the least recently used beyond capacity)
+            while len(buckets) > 1:
+                oldest, (tokens, updated_at) = next(iter(buckets.items()))
+                full = tokens + (now - updated_at) * self.rate >= self.max_calls
+                if oldest == identifier or not (full or len(buckets) > self._stripe_capacity):
+                    break
+                del buckets[oldest]
+                metrics["evicted"] += 1
+
+        return wait if wait <= max_wait else -wait
 
     def check_rate_limit(self, identifier: str) -> tuple[bool, Optional[str]]:
         """
         Check if rate limit is exceeded
         Returns (is_allowed, error_message)
         """
-        now = time.time()
+        wait = self._reserve(identifier, 0.0)
+        if wait < 0:
+            return False, f"Rate limit exceeded. Retry after {-wait:.0f} seconds"
+        return True, None
 
-        # Clean old entries
-        self.calls[identifier] = [
-            call_time for call_time in self.calls[identifier] if now - call_time < self.time_window
-        ]
+    def acquire(self, identifier: str, timeout: Optional[float] = None) -> float:
+        """
+        Wait until a call is allowed, blocking the calling thread.
 
-        # Check limit
-        if len(self.calls[identifier]) >= self.max_calls:
-            retry_after = self.time_window - (now - self.calls[identifier][0])
-            return False, f"Rate limit exceeded. Retry after {retry_after:.0f} seconds"
+        Args:
+            identifier: Caller identifier
+            timeout: Maximum seconds to wait (None waits as long as needed)
 
-        # Record this call
-        self.calls[identifier].append(now)
-        return True, None
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateLimitError: If the call would not be allowed within ``timeout``
+        """
+        wait = self._acquire_wait(identifier, timeout)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, identifier: str, timeout: Optional[float] = None) -> float:
+        """
+        Wait until a call is allowed without blocking the event loop.
+
+        Args:
+            identifier: Caller identifier
+            timeout: Maximum seconds to wait (None waits as long as needed)
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateLimitError: If the call would not be allowed within ``timeout``
+        """
+        wait = self._acquire_wait(identifier, timeout)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def _acquire_wait(self, identifier: str, timeout: Optional[float]) -> float:
+        wait = self._reserve(identifier, float("inf") if timeout is None else timeout)
+        if wait < 0:
+            raise RateLimitError(f"Rate limit exceeded. Retry after {-wait:.0f} seconds", retry_after=-wait)
+        return wait
+
+    def stats(self) -> dict[str, float]:
+        """Limiter metrics: allowed, rejected, waited, wait_seconds, evicted and tracked identifiers."""
+        totals = dict.fromkeys(_RATE_LIMIT_METRICS, 0)
+        tracked = 0
+        for (lock, buckets), metrics in zip(self._stripes, self._metrics):
+            with lock:
+                tracked += len(buckets)
+                for name, value in metrics.items():
+                    totals[name] += value
+        return {**totals, "identifiers": tracked}
 
     def rate_limit_decorator(self, get_identifier):
         """Decorator for rate limiting functions"""
@@ -275,7 +397,7 @@ class RateLimiter:
                 identifier = get_identifier(*args, **kwargs)
                 allowed, error = self.check_rate_limit(identifier)
                 if not allowed:
-                    raise Exception(f"Rate limit exceeded: {error}")
+                    raise RateLimitError(f"Rate limit exceeded: {error}")
                 return func(*args, **kwargs)
 
             return wrapper
@@ -186,6 +186,9 @@ class StateMapper:
     _name_to_fips: Optional[Dict[str, str]] = None
     _abbrev_to_fips: Optional[Dict[str, str]] = None
     _name_to_abbrev: Optional[Dict[str, str]] = None
+    # Casefolded name keys for case-insensitive lookups
+    _folded_name_to_fips: Optional[Dict[str, str]] = None
+    _folded_name_to_abbrev: Optional[Dict[str, str]] = None
 
     @classmethod
     def _ensure_reverse_mappings(cls) -> None:
@@ -196,6 +199,10 @@ class StateMapper:
             cls._abbrev_to_fips = {v: k for k, v in cls.FIPS_TO_ABBREV.items()}
         if cls._name_to_abbrev is None:
             cls._name_to_abbrev = {v: k for k, v in cls.ABBREV_TO_NAME.items()}
+        if cls._folded_name_to_fips is None:
+            cls._folded_name_to_fips = {k.casefold(): v for k, v in cls._name_to_fips.items()}
+        if cls._folded_name_to_abbrev is None:
+            cls._folded_name_to_abbrev = {k.casefold(): v for k, v in cls._name_to_abbrev.items()}
 
     @classmethod
     def fips_to_name(cls, fips_code: str) -> Optional[str]:
@@ -214,12 +221,8 @@ class StateMapper:
         # Try exact match first
         if name in cls._name_to_fips:
             return cls._name_to_fips[name]
-        # Try case-insensitive match
-        name_lower = name.lower()
-        for state_name, fips in cls._name_to_fips.items():
-            if state_name.lower() == name_lower:
-                return fips
-        return None
+        # Fall back to case-insensitive match
+        return cls._folded_name_to_fips.get(name.casefold())
 
     @classmethod
     def abbrev_to_fips(cls, abbrev: str) -> Optional[str]:
@@ -239,12 +242,8 @@ class StateMapper:
         # Try exact match first
         if name in cls._name_to_abbrev:
             return cls._name_to_abbrev[name]
-        # Try case-insensitive match
-        name_lower = name.lower()
-        for state_name, abbrev in cls._name_to_abbrev.items():
-            if state_name.lower() == name_lower:
-                return abbrev
-        return None
+        # Fall back to case-insensitive match
+        return cls._folded_name_to_abbrev.get(name.casefold())
 
     @classmethod
     def is_valid_fips(cls, fips_code: str) -> bool:
@@ -9,6 +9,7 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import duckdb
+import pandas as pd
 import pytest
 
 # Add project root to Python path
@@ -166,6 +167,157 @@ def test_database(test_db_path):
     # Cleanup is handled by temp_dir fixture
 
 
+# Synthetic star schema mirroring the production landuse_analytics.duckdb layout
+_STAR_COUNTIES = [
+    # (geography_id, fips_code, county_name, state_code, state_name, region)
+    (1, "06037", "Los Angeles", "06", "California", "West"),
+    (2, "06073", "San Diego", "06", "California", "West"),
+    (3, "06059", "Orange", "06", "California", "West"),
+    (4, "06029", "Kern", "06", "California", "West"),
+    (5, "48201", "Harris", "48", "Texas", "South"),
+    (6, "48453", "Travis", "48", "Texas", "South"),
+    (7, "48113", "Dallas", "48", "Texas", "South"),
+    (8, "48361", "Orange", "48", "Texas", "South"),
+    (9, "37183", "Wake", "37", "North Carolina", "South"),
+    (10, "37119", "Mecklenburg", "37", "North Carolina", "South"),
+    (11, "37063", "Durham", "37", "North Carolina", "South"),
+    (12, "37135", "Orange", "37", "North Carolina", "South"),
+]
+_STAR_SCENARIOS = [
+    (1, "RCP45_SSP1", "RCP45", "SSP1"),
+    (2, "RCP85_SSP2", "RCP85", "SSP2"),
+    (3, "RCP85_SSP3", "RCP85", "SSP3"),
+    (4, "RCP85_SSP5", "RCP85", "SSP5"),
+]
+_STAR_PERIODS = [(i + 1, 2020 + 10 * i) for i in range(5)] + [(6, 2012)]
+_STAR_LANDUSES = [
+    (1, "cr", "Crop"),
+    (2, "ps", "Pasture"),
+    (3, "rg", "Rangeland"),
+    (4, "fr", "Forest"),
+    (5, "ur", "Urban"),
+]
+
+
+def build_star_schema_db(path: str) -> None:
+    """Create a small but complete RPA star schema database at ``path``.
+
+    Acres are deterministic so API results can be compared across code paths.
+    Urban never converts to other uses, matching the RPA irreversibility rule.
+    """
+    conn = duckdb.connect(path)
+    conn.execute("""
+        CREATE TABLE dim_scenario (
+            scenario_id INTEGER PRIMARY KEY, scenario_name VARCHAR, rcp_scenario VARCHAR, ssp_scenario VARCHAR
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE dim_time (
+            time_id INTEGER PRIMARY KEY, year_range VARCHAR, start_year INTEGER, end_year INTEGER,
+            period_length INTEGER
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE dim_geography (
+            geography_id INTEGER PRIMARY KEY, fips_code VARCHAR, county_name VARCHAR, state_code VARCHAR,
+            state_name VARCHAR, region VARCHAR
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE dim_landuse (
+            landuse_id INTEGER PRIMARY KEY, landuse_code VARCHAR, landuse_name VARCHAR, landuse_category VARCHAR
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE fact_landuse_transitions (
+            transition_id BIGINT PRIMARY KEY, scenario_id INTEGER, time_id INTEGER, geography_id INTEGER,
+            from_landuse_id INTEGER, to_landuse_id INTEGER, acres DECIMAL(15, 4), transition_type VARCHAR
+        )
+    """)
+    conn.executemany("INSERT INTO dim_scenario VALUES (?, ?, ?, ?)", _STAR_SCENARIOS)
+    conn.executemany(
+        "INSERT INTO dim_time VALUES (?, ?, ?, ?, ?)",
+        [
+            (
+                tid,
+                f"{start}-{start + (8 if start == 2012 else 10)}",
+                start,
+                start + (8 if start == 2012 else 10),
+                8 if start == 2012 else 10,
+            )
+            for tid, start in _STAR_PERIODS
+        ],
+    )
+    conn.executemany("INSERT INTO dim_geography VALUES (?, ?, ?, ?, ?, ?)", _STAR_COUNTIES)
+    conn.executemany(
+        "INSERT INTO dim_landuse VALUES (?, ?, ?, ?)",
+        [(lid, code, name, "Developed" if name == "Urban" else "Natural") for lid, code, name in _STAR_LANDUSES],
+    )
+
+    rows = []
+    transition_id = 0
+    for geo_id, *_ in _STAR_COUNTIES:
+        for scenario_id, *_ in _STAR_SCENARIOS:
+            for time_id, _start in _STAR_PERIODS:
+                for from_id, *_ in _STAR_LANDUSES:
+                    for to_id, *_ in _STAR_LANDUSES:
+                        if from_id == 5 and to_id != 5:
+                            acres = 0.0
+                        elif from_id == to_id:
+                            acres = 10000.0 * from_id + 500.0 * geo_id + 25.0 * time_id
+                        else:
+                            acres = float((geo_id * 7 + scenario_id * 13 + time_id * 3 + from_id * 5 + to_id) % 97 + 1)
+                        transition_id += 1
+                        rows.append(
+                            (
+                                transition_id,
+                                scenario_id,
+                                time_id,
+                                geo_id,
+                                from_id,
+                                to_id,
+                                acres,
+                                "same" if from_id == to_id else "change",
+                            )
+                        )
+    fact_rows = pd.DataFrame(rows)  # noqa: F841 - referenced by name in the SQL below
+    conn.execute("INSERT INTO fact_landuse_transitions SELECT * FROM fact_rows")
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def star_schema_db(tmp_path_factory):
+    """Session-wide synthetic RPA database for API tests."""
+    path = tmp_path_factory.mktemp("star_schema") / "landuse_star.duckdb"
+    build_star_schema_db(str(path))
+    return path
+
+
+@pytest.fixture
+def api(star_schema_db):
+    """LandUseAPI on the synthetic star schema database."""
+    from landuse.api import LandUseAPI
+
+    with LandUseAPI(db_path=star_schema_db) as api:
+        yield api
+
+
+class FakeClock:
+    """Manually advanced clock for components that accept a ``clock`` callable."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """A FakeClock starting at 1000 seconds."""
+    return FakeClock()
+
+
 @pytest.fixture
 def mock_llm():
     """Mock LLM for testing agents"""
@@ -25,7 +25,7 @@ from landuse.api import (
     Scenario,
     LandUse,
 )
-from landuse.api.queries import QueryBuilder, SCENARIO_MAP, LANDUSE_MAP
+from landuse.api.queries import QueryBuilder, QueryResult, SCENARIO_MAP, LANDUSE_MAP
 from landuse.api.formatters import format_acres, format_percent
 
 
@@ -424,3 +424,126 @@ class TestVerboseMode:
         api = LandUseAPI(verbose=False)
         assert api._console is None
         api.close()
+
+
+class _CountingConnection:
+    """Connection proxy that counts execute() calls."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.executed: list[str] = []
+
+    def execute(self, sql, params=None):
+        self.executed.append(sql)
+        return self._conn.execute(sql, params) if params is not None else self._conn.execute(sql)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class TestBatch:
+    """Tests for LandUseAPI.batch shared-scan evaluation."""
+
+    REQUESTS = [
+        {"method": "get_land_use_area", "args": {"states": ["CA", "TX"], "land_use": "forest"}},
+        {"method": "get_transitions", "args": {"states": ["CA"], "from_use": "crop", "scenario": "HM"}},
+        {"method": "get_urban_expansion", "args": {"states": ["TX"], "year_range": "2020-2030"}},
+        {"method": "get_forest_change", "args": {"states": ["NC"], "change_type": "net"}},
+        {"method": "get_agricultural_change", "args": {"states": ["CA"], "ag_type": "crop"}},
+        {"method": "compare_scenarios", "args": {"states": ["CA"], "metric": "forest_loss"}},
+        {"method": "compare_states", "args": {"states": ["CA", "TX", "NC"], "metric": "urban_expansion"}},
+        ("get_time_series", {"states": ["NC"], "metric": "forest_area", "scenario": "LM"}),
+    ]
+
+    @pytest.fixture
+    def api(self, star_schema_db):
+        with LandUseAPI(db_path=star_schema_db) as api:
+            yield api
+
+    def test_batch_matches_individual_calls(self, api):
+        """Each batched result equals the result of the direct method call."""
+        results = api.batch(self.REQUESTS)
+
+        assert len(results) == len(self.REQUESTS)
+        for request, result in zip(self.REQUESTS, results):
+            method, args = (request["method"], request["args"]) if isinstance(request, dict) else request
+            expected = getattr(api, method)(**args)
+            assert result.success, result
+            assert result.to_dict() == expected.to_dict()
+
+    def test_batch_uses_single_scan(self, api):
+        """Cube-compatible requests are answered from one SQL statement."""
+        counting = _CountingConnection(api._get_conn())
+        api._conn = counting
+
+        api.batch(self.REQUESTS)
+
+        assert len(counting.executed) == 1
+
+    def test_batch_mixed_methods_preserve_order(self, api):
+        """Non-cube methods run individually and results keep request order."""
+        results = api.batch(
+            [
+                {"method": "get_data_summary"},
+                {"method": "get_urban_expansion", "args": {"states": ["CA"]}},
+                {"method": "get_county_data", "args": {"state": "CA", "county": "Kern"}},
+                {"method": "get_forest_change", "args": {"states": ["CA"]}},
+            ]
+        )
+
+        assert isinstance(results[0], DataSummaryResult)
+        assert isinstance(results[1], UrbanExpansionResult)
+        assert isinstance(results[2], CountyResult)
+        assert isinstance(results[3], ForestChangeResult)
+
+    def test_batch_invalid_requests(self, api):
+        """Unknown methods and bad arguments yield INVALID_REQUEST errors."""
+        results = api.batch(
+            [
+                {"method": "drop_tables"},
+                {"method": "get_urban_expansion", "args": {"bogus": 1}},
+                "get_urban_expansion",
+                {"method": "get_urban_expansion", "args": {"states": ["CA"]}},
+            ]
+        )
+
+        assert [r.error_code for r in results[:3]] == ["INVALID_REQUEST"] * 3
+        assert results[3].success
+
+    def test_batch_no_data(self, api):
+        """Filters with no matching rows produce the same NO_DATA error."""
+        results = api.batch(
+            [
+                {"method": "get_urban_expansion", "args": {"states": ["WY"]}},
+                {"method": "get_land_use_area", "args": {"states": ["CA"]}},
+            ]
+        )
+
+        assert results[0].error_code == "NO_DATA"
+        assert results[1].success
+
+
+class TestQueryTimeout:
+    """Tests for per-query deadlines."""
+
+    def test_slow_query_returns_timeout_error(self, star_schema_db, monkeypatch):
+        """A query exceeding query_timeout is interrupted and reported as TIMEOUT."""
+        slow = QueryResult(
+            sql="SELECT COUNT(*) AS n FROM range(100000000000) a", params=[], description="slow"
+        )
+        monkeypatch.setattr(QueryBuilder, "land_use_area", staticmethod(lambda *args, **kwargs: slow))
+
+        with LandUseAPI(db_path=star_schema_db, query_timeout=0.2) as api:
+            result = api.get_land_use_area(states=["CA"])
+            assert isinstance(result, ErrorResult)
+            assert result.error_code == "TIMEOUT"
+            assert result.suggestion
+
+            # Connection stays usable for subsequent queries
+            assert api.get_urban_expansion(states=["CA"]).success
+
+    def test_no_timeout_by_default(self, star_schema_db):
+        """Queries are unbounded unless query_timeout is set."""
+        with LandUseAPI(db_path=star_schema_db) as api:
+            assert api.query_timeout is None
+            assert api.get_land_use_area(states=["TX"]).success
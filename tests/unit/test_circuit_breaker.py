@@ -0,0 +1,137 @@
+"""Unit tests for circuit breakers."""
+
+import asyncio
+import shutil
+
+import pytest
+
+from landuse.api import LandUseAPI
+from landuse.exceptions import CircuitOpenError
+from landuse.utils.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    circuit_breaker_metrics,
+    get_circuit_breaker,
+)
+from landuse.utils.retry_decorators import RetryableOperation
+
+
+def _fail():
+    raise ConnectionError("down")
+
+
+def _run(breaker: CircuitBreaker, func, times: int = 1) -> None:
+    for _ in range(times):
+        try:
+            breaker.call(func)
+        except ConnectionError:
+            pass
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(
+        "db", minimum_calls=4, window=10, open_timeout=5, failure_exceptions=(ConnectionError,), clock=clock
+    )
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_on_failure_rate(self, breaker):
+        _run(breaker, lambda: "ok", 2)
+        _run(breaker, _fail, 1)
+        assert breaker.state == CLOSED  # 1 of 3 calls failed, below minimum_calls
+
+        _run(breaker, _fail, 1)
+        assert breaker.state == OPEN
+
+        calls = []
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.call(calls.append, 1)
+        assert calls == [] and exc_info.value.retry_after == 5
+
+    def test_failures_outside_window_forgotten(self, breaker, clock):
+        _run(breaker, _fail, 3)
+        clock.now += 11
+        _run(breaker, _fail, 1)
+        _run(breaker, lambda: "ok", 3)
+
+        assert breaker.state == CLOSED
+        assert breaker.stats()["window_calls"] == 4
+
+    def test_non_failures_count_as_successes(self, breaker):
+        for _ in range(10):
+            with pytest.raises(ValueError):
+                breaker.call(int, "not a number")
+
+        assert breaker.state == CLOSED
+        assert breaker.stats()["successes"] == 10
+
+    def test_half_open_trial(self, breaker, clock):
+        _run(breaker, _fail, 4)
+        clock.now += 5
+        assert breaker.state == HALF_OPEN
+
+        # One trial at a time; a failed trial reopens the breaker
+        breaker.allow()
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+        breaker.record_failure(ConnectionError())
+        assert breaker.state == OPEN
+
+        clock.now += 5
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == CLOSED
+        assert breaker.stats()["opened"] == 2
+
+    def test_async_calls_and_decorator(self, breaker):
+        @breaker
+        async def fetch(fail: bool) -> str:
+            if fail:
+                raise ConnectionError("down")
+            return "ok"
+
+        async def run():
+            results = await asyncio.gather(*(fetch(i % 2 == 0) for i in range(1, 5)), return_exceptions=True)
+            assert sum(isinstance(r, ConnectionError) for r in results) == 2
+            with pytest.raises(CircuitOpenError):
+                await fetch(False)
+
+        asyncio.run(run())
+        assert breaker.stats()["rejected"] == 1
+
+    def test_shared_breakers_and_metrics(self):
+        breaker = get_circuit_breaker("test:shared", minimum_calls=1)
+
+        assert get_circuit_breaker("test:shared") is breaker
+        _run(breaker, _fail)
+        assert circuit_breaker_metrics()["test:shared"]["state"] == OPEN
+
+    def test_retryable_operation_does_not_retry_open_circuit(self, breaker):
+        _run(breaker, _fail, 4)
+        operation = RetryableOperation("query", max_attempts=3, min_wait=0.01)
+
+        with pytest.raises(CircuitOpenError):
+            operation.execute(breaker.call, lambda: "ok")
+        assert operation.attempt_count == 1
+
+
+def test_api_sheds_queries_while_open(star_schema_db, tmp_path, clock):
+    path = tmp_path / "landuse.duckdb"
+    shutil.copy(star_schema_db, path)
+    breaker = CircuitBreaker("duckdb:test", minimum_calls=1, open_timeout=30, clock=clock)
+
+    with LandUseAPI(db_path=path, circuit_breaker=breaker) as api:
+        assert api.get_land_use_area(["CA"]).success
+        breaker.record_failure(OSError("disk gone"))
+
+        result = api.get_land_use_area(["CA"])
+        assert result.error_code == "UNAVAILABLE"
+        assert "30 seconds" in result.suggestion
+
+        clock.now += 30
+        assert api.get_land_use_area(["CA"]).success
+        assert breaker.state == CLOSED
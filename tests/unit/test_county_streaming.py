@@ -0,0 +1,122 @@
+"""Unit tests for streaming and paged county-level results."""
+
+import time
+
+import pyarrow as pa
+import pytest
+
+from landuse.api import CountyPageResult, ErrorResult, LandUseAPI
+from landuse.api.queries import COUNTY_EXPORT_COLUMNS, QueryBuilder, QueryResult
+from landuse.exceptions import QueryTimeoutError
+from landuse.utils.circuit_breaker import CircuitBreaker
+
+SIZE_ARGS = {"iter_county_batches": "batch_size", "iter_county_rows": "chunk_size"}
+
+
+def _all_rows(api, metric="land_area", **kwargs):
+    query = QueryBuilder.county_export(metric, **kwargs)
+    return [tuple(row) for row in api._get_conn().execute(query.sql, query.params).fetchall()]
+
+
+class TestCountyExportQuery:
+    """Tests for the county export query builder."""
+
+    def test_unknown_metric(self):
+        with pytest.raises(ValueError):
+            QueryBuilder.county_export("population")
+
+    def test_keyset_params(self):
+        query = QueryBuilder.county_export(
+            "forest_loss", states=["CA"], scenarios=["LM"], after_fips="06037", county_limit=2
+        )
+        assert query.params == ["California", "06037", 2, "RCP45", "SSP1"]
+
+
+class TestStreaming:
+    """Tests for iterator-based county streaming."""
+
+    def test_record_batches(self, api):
+        batches = list(api.iter_county_batches(batch_size=500))
+
+        assert all(isinstance(b, pa.RecordBatch) for b in batches)
+        assert all(b.num_rows <= 500 for b in batches)
+        assert len(batches) > 1
+        table = pa.Table.from_batches(batches)
+        assert tuple(table.column_names) == COUNTY_EXPORT_COLUMNS
+        # 12 counties x 4 scenarios x 6 periods x 5 land uses
+        assert table.num_rows == 1440
+
+    def test_tuple_chunks_match_full_result(self, api):
+        chunks = list(api.iter_county_rows(metric="urban_expansion", states=["TX"], chunk_size=100))
+
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        rows = [row for chunk in chunks for row in chunk]
+        assert rows == _all_rows(api, "urban_expansion", states=["TX"])
+        assert {row[2] for row in rows} == {"Texas"}
+
+    def test_early_stop_releases_cursor(self, api):
+        stream = api.iter_county_rows(chunk_size=10)
+        first = next(stream)
+        stream.close()
+
+        assert len(first) == 10
+
+    @pytest.mark.parametrize("method", ["iter_county_batches", "iter_county_rows"])
+    def test_slow_consumer_is_not_timed_out(self, star_schema_db, method):
+        breaker = CircuitBreaker("duckdb:stream", failure_exceptions=(QueryTimeoutError,))
+        with LandUseAPI(db_path=star_schema_db, query_timeout=0.5, circuit_breaker=breaker) as api:
+            chunks = 0
+            for _ in getattr(api, method)(states=["CA"], **{SIZE_ARGS[method]: 100}):
+                time.sleep(0.2)
+                chunks += 1
+
+            assert chunks > 2
+            assert breaker.stats()["failures"] == 0
+            assert api.get_land_use_area(states=["CA"]).success
+
+    @pytest.mark.parametrize("method", ["iter_county_batches", "iter_county_rows"])
+    def test_deadline_and_breaker_cover_database_work(self, star_schema_db, method, monkeypatch):
+        slow = QueryResult(sql="SELECT COUNT(*) AS n FROM range(100000000000) a", params=[], description="slow")
+        monkeypatch.setattr(QueryBuilder, "county_export", staticmethod(lambda *args, **kwargs: slow))
+        breaker = CircuitBreaker("duckdb:stream", failure_exceptions=(QueryTimeoutError,))
+        with LandUseAPI(db_path=star_schema_db, query_timeout=0.2, circuit_breaker=breaker) as api:
+            with pytest.raises(QueryTimeoutError) as exc_info:
+                list(getattr(api, method)())
+
+            assert exc_info.value.timeout == 0.2
+            assert breaker.stats()["failures"] == 1
+            # Main connection remains usable
+            assert api.get_urban_expansion(states=["CA"]).success
+
+
+class TestCountyPages:
+    """Tests for cursor-based county paging."""
+
+    def test_pages_cover_all_counties(self, api):
+        pages = []
+        cursor = None
+        while True:
+            page = api.get_county_page(metric="forest_loss", scenarios=["HH"], cursor=cursor, page_counties=5)
+            assert isinstance(page, CountyPageResult)
+            pages.append(page)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert [p.county_count for p in pages] == [5, 5, 2]
+        rows = [tuple(row) for p in pages for row in p.rows]
+        assert rows == _all_rows(api, "forest_loss", scenarios=["HH"])
+        assert pages[0].columns == list(COUNTY_EXPORT_COLUMNS)
+
+    def test_state_filtered_pages(self, api):
+        page = api.get_county_page(states=["NC"], page_counties=3)
+
+        assert page.next_cursor == "37135"
+        last = api.get_county_page(states=["NC"], cursor=page.next_cursor, page_counties=3)
+        assert last.county_count == 1
+        assert last.next_cursor is None
+
+    def test_invalid_metric(self, api):
+        result = api.get_county_page(metric="population")
+        assert isinstance(result, ErrorResult)
+        assert result.error_code == "INVALID_REQUEST"
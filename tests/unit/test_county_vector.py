@@ -0,0 +1,95 @@
+"""Unit tests for dense FIPS-ordered county vectors."""
+
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from landuse.api import CountyVectorResult, ErrorResult
+from landuse.api import client as api_client
+
+
+def _per_county(api, where: str) -> dict[str, float]:
+    rows = (
+        api._get_conn()
+        .execute(
+            f"""
+        SELECT g.fips_code, SUM(f.acres)
+        FROM fact_landuse_transitions f
+        JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id
+        JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
+        JOIN dim_geography g ON f.geography_id = g.geography_id
+        JOIN dim_scenario s ON f.scenario_id = s.scenario_id
+        JOIN dim_time t ON f.time_id = t.time_id
+        WHERE {where}
+        GROUP BY g.fips_code
+        """
+        )
+        .fetchall()
+    )
+    return {fips: float(acres) for fips, acres in rows}
+
+
+class TestCountyVector:
+    """Tests for LandUseAPI.get_county_vector."""
+
+    def test_aligned_to_fips_order(self, api):
+        result = api.get_county_vector("urban_expansion", scenario="HH", year_range="2020-2030")
+
+        assert isinstance(result, CountyVectorResult)
+        assert list(result.fips) == sorted(result.fips)
+        assert len(result.fips) == len(result.values) == 12
+        expected = _per_county(
+            api,
+            "tl.landuse_name = 'Urban' AND f.transition_type = 'change' "
+            "AND s.ssp_scenario = 'SSP5' AND t.year_range = '2020-2030'",
+        )
+        assert result.to_series().to_dict() == pytest.approx(expected)
+
+    def test_state_filter_keeps_canonical_order(self, api):
+        full = api.get_county_vector("forest_loss")
+        texas = api.get_county_vector("forest_loss", states=["TX"])
+
+        assert list(texas.fips) == list(full.fips)
+        in_texas = np.array([fips.startswith("48") for fips in texas.fips])
+        assert np.isnan(texas.values[~in_texas]).all()
+        np.testing.assert_allclose(texas.values[in_texas], full.values[in_texas])
+
+    def test_forest_net_is_gain_minus_loss(self, api):
+        net = api.get_county_vector("forest_net", scenario="LM")
+        gain = api.get_county_vector("forest_gain", scenario="LM")
+        loss = api.get_county_vector("forest_loss", scenario="LM")
+
+        np.testing.assert_allclose(net.values, gain.values - loss.values)
+
+    def test_concurrent_calls_share_the_cache(self, api, monkeypatch):
+        class SlowLRU(OrderedDict):
+            """Widens the window between a lookup and its reordering."""
+
+            def move_to_end(self, key, last=True):
+                time.sleep(0.001)
+                super().move_to_end(key, last)
+
+        monkeypatch.setattr(api_client, "COUNTY_VECTOR_CACHE_SIZE", 2)
+        api._county_vectors = SlowLRU()
+        calls = [(metric, scenario) for metric in ("forest_loss", "forest_gain") for scenario in ("LM", "HH")] * 25
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda call: api.get_county_vector(call[0], scenario=call[1]), calls))
+
+        assert all(isinstance(r, CountyVectorResult) for r in results)
+        assert len(api._county_vectors) <= 2
+
+    def test_unknown_metric(self, api):
+        result = api.get_county_vector("population")
+
+        assert isinstance(result, ErrorResult)
+        assert result.error_code == "INVALID_REQUEST"
+
+    def test_llm_string(self, api):
+        text = api.get_county_vector("urban_expansion", states=["CA"]).to_llm_string()
+
+        assert "of 12 counties" in text
+        assert "Highest: FIPS 06" in text
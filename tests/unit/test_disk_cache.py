@@ -0,0 +1,186 @@
+"""Unit tests for the persistent on-disk query result cache."""
+
+import multiprocessing
+import os
+import shutil
+import sqlite3
+
+import duckdb
+import pandas as pd
+import pytest
+
+from landuse.api import LandUseAPI
+from landuse.connections.disk_cache import DiskQueryCache
+from landuse.connections.duckdb_connection import ConnectionConfig, DuckDBConnection
+
+
+def _frame(rows: int = 10) -> pd.DataFrame:
+    return pd.DataFrame({"id": range(rows), "name": [f"county {i}" for i in range(rows)]})
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "cache" / "results.sqlite"
+
+
+class TestDiskQueryCache:
+    """Tests for DiskQueryCache."""
+
+    def test_round_trip_keeps_duckdb_dtypes(self, cache_path):
+        df = duckdb.sql(
+            """
+            SELECT range::INTEGER AS i, (range * 1.5)::DECIMAL(10, 2) AS d, 's' || range AS s,
+                   CASE WHEN range % 2 = 0 THEN NULL ELSE range END::INTEGER AS ni,
+                   DATE '2020-01-01' + range::INTEGER AS dt
+            FROM range(5)
+            """
+        ).df()
+        cache = DiskQueryCache(cache_path)
+
+        assert cache.set("gen", ("SELECT", ()), df)
+        pd.testing.assert_frame_equal(cache.get("gen", ("SELECT", ())), df)
+
+    def test_keyed_by_generation(self, cache_path):
+        cache = DiskQueryCache(cache_path)
+        cache.set("gen-1", ("SELECT 1", ()), _frame())
+
+        assert cache.get("gen-2", ("SELECT 1", ())) is None
+        assert cache.get("gen-1", ("SELECT 1", (1,))) is None
+        assert cache.stats()["misses"] == 2
+
+    def test_shared_across_instances(self, cache_path):
+        DiskQueryCache(cache_path).set("gen", ("SELECT 1", ()), _frame())
+        reopened = DiskQueryCache(cache_path)
+
+        pd.testing.assert_frame_equal(reopened.get("gen", ("SELECT 1", ())), _frame())
+        assert reopened.stats()["hits"] == 1
+
+    def test_ttl_and_max_age(self, cache_path, clock):
+        cache = DiskQueryCache(cache_path, clock=clock)
+        cache.set("gen", "a", _frame(), ttl=60)
+
+        clock.now += 30
+        assert cache.get("gen", "a", max_age=10) is None
+        assert cache.get("gen", "a") is not None
+        clock.now += 30
+        assert cache.get("gen", "a") is None
+
+        # Expired entries are dropped by the next write
+        cache.set("gen", "b", _frame())
+        assert len(cache) == 1
+
+    def test_size_bounded_lru_eviction(self, cache_path, clock):
+        probe = DiskQueryCache(cache_path, clock=clock)
+        probe.set("gen", "probe", _frame(100))
+        size = probe.nbytes
+        probe.clear()
+
+        cache = DiskQueryCache(cache_path, max_bytes=int(size * 2.5), touch_interval=0, clock=clock)
+        for key in "abc":
+            clock.now += 1
+            cache.set("gen", key, _frame(100))
+            if key == "b":
+                clock.now += 1
+                assert cache.get("gen", "a") is not None
+
+        assert cache.nbytes <= cache.max_bytes
+        assert cache.get("gen", "a") is not None
+        assert cache.get("gen", "b") is None
+
+    def test_oversized_results_not_stored(self, cache_path):
+        cache = DiskQueryCache(cache_path, max_entry_bytes=100)
+        assert not cache.set("gen", "big", _frame(1000))
+        assert len(cache) == 0
+
+    def test_sqlite_errors_are_misses(self, cache_path):
+        cache = DiskQueryCache(cache_path)
+        with sqlite3.connect(cache_path) as conn:
+            conn.execute("DROP TABLE results")
+
+        assert cache.get("gen", "a") is None
+        assert not cache.set("gen", "a", _frame())
+        assert cache.stats()["errors"] == 2
+
+    def test_corrupt_payloads_are_misses_and_deleted(self, cache_path):
+        cache = DiskQueryCache(cache_path)
+        cache.set("gen", "a", _frame())
+        with sqlite3.connect(cache_path) as conn:
+            conn.execute("UPDATE results SET payload = substr(payload, 1, 50)")
+
+        assert cache.get("gen", "a") is None
+        assert len(cache) == 0
+        assert cache.stats()["misses"] == 1 and cache.stats()["errors"] == 1
+
+    def test_concurrent_processes(self, cache_path):
+        DiskQueryCache(cache_path)
+        context = multiprocessing.get_context("fork")
+        with context.Pool(4) as pool:
+            results = pool.starmap(_write_and_read, [(str(cache_path), worker) for worker in range(4)])
+
+        assert all(results)
+        cache = DiskQueryCache(cache_path)
+        assert len(cache) == 4 * 20
+        pd.testing.assert_frame_equal(cache.get("gen", (3, 19)), _frame(19))
+
+
+def _write_and_read(path: str, worker: int) -> bool:
+    cache = DiskQueryCache(path, busy_timeout=30)
+    for i in range(20):
+        cache.set("gen", (worker, i), _frame(i))
+    return all(len(cache.get("gen", (worker, i))) == i for i in range(20)) and cache.errors == 0
+
+
+class TestDiskCacheConsumers:
+    """DuckDBConnection and LandUseAPI start warm from the persistent cache."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        path = tmp_path / "landuse.duckdb"
+        with duckdb.connect(str(path)) as conn:
+            conn.execute("CREATE TABLE t AS SELECT range AS id FROM range(10)")
+        return path
+
+    def test_duckdb_connection_second_level(self, db_path, cache_path):
+        config = ConnectionConfig(database=str(db_path), result_cache_path=str(cache_path))
+        with DuckDBConnection(config) as first:
+            first.query("SELECT MAX(id) AS m FROM t")
+            assert first.cache_stats()["disk_writes"] == 1
+
+        with DuckDBConnection(config) as restarted:
+            assert restarted.query("SELECT MAX(id) AS m FROM t")["m"].iloc[0] == 9
+            restarted.query("SELECT MAX(id) AS m FROM t")
+            stats = restarted.cache_stats()
+            assert stats["disk_hits"] == 1 and stats["hits"] == 1
+
+    def test_rebuilt_database_misses(self, db_path, cache_path):
+        config = ConnectionConfig(database=str(db_path), result_cache_path=str(cache_path))
+        with DuckDBConnection(config) as connection:
+            connection.query("SELECT MAX(id) AS m FROM t")
+
+        staging = db_path.with_suffix(".staging")
+        with duckdb.connect(str(staging)) as conn:
+            conn.execute("CREATE TABLE t AS SELECT range + 1000 AS id FROM range(10)")
+        os.replace(staging, db_path)
+
+        with DuckDBConnection(config) as connection:
+            assert connection.query("SELECT MAX(id) AS m FROM t")["m"].iloc[0] == 1009
+            assert connection.cache_stats()["disk_hits"] == 0
+
+    def test_writable_and_memory_databases_skip_disk(self, db_path, cache_path):
+        disk_cache = DiskQueryCache(cache_path)
+        with DuckDBConnection(database=str(db_path), read_only=False, disk_cache=disk_cache) as writable:
+            writable.query("SELECT 1 AS one")
+        with DuckDBConnection(database=":memory:", read_only=False, disk_cache=disk_cache) as memory:
+            memory.query("SELECT 1 AS one")
+        assert len(disk_cache) == 0
+
+    def test_api_restart_served_from_disk(self, star_schema_db, tmp_path, cache_path):
+        path = tmp_path / "landuse.duckdb"
+        shutil.copy(star_schema_db, path)
+        with LandUseAPI(db_path=path, result_cache=str(cache_path)) as api:
+            expected = api.get_land_use_area(["CA", "TX"], land_use="forest").to_dict()
+            assert api.result_cache.stats()["writes"] >= 1
+
+        with LandUseAPI(db_path=path, result_cache=str(cache_path)) as restarted:
+            assert restarted.get_land_use_area(["CA", "TX"], land_use="forest").to_dict() == expected
+            assert restarted.result_cache.stats()["hits"] >= 1
@@ -5,6 +5,8 @@ Unit tests for DuckDBConnection class
 
 import os
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -13,6 +15,12 @@ import pandas as pd
 import pytest
 
 from landuse.connections.duckdb_connection import ConnectionConfig, DuckDBConnection
+from landuse.connections.watchdog import QueryBudget, QueryDeadline
+from landuse.core.app_config import RuntimeProfile
+from landuse.exceptions import QueryTimeoutError
+
+# Runs for minutes unless interrupted
+SLOW_QUERY = "SELECT COUNT(*) AS n FROM range(100000000000) a"
 
 
 class TestDuckDBConnection:
@@ -267,3 +275,109 @@ class TestDuckDBConnection:
         assert config.read_only is True
         assert config.memory_limit is None
         assert config.threads is None
+
+    def test_query_timeout_interrupts_long_query(self):
+        """Test that a query exceeding query_timeout is interrupted"""
+        connection = DuckDBConnection(config=ConnectionConfig(database=":memory:", read_only=False, query_timeout=0.2))
+
+        start = time.monotonic()
+        with pytest.raises(QueryTimeoutError) as exc_info:
+            connection.query(SLOW_QUERY, use_cache=False)
+
+        assert time.monotonic() - start < 5
+        assert exc_info.value.error_code == "TIMEOUT"
+        assert exc_info.value.timeout == 0.2
+
+        # Connection remains usable after the interrupt
+        assert connection.query("SELECT 1 AS one", use_cache=False)["one"].iloc[0] == 1
+        connection.close()
+
+    def test_late_deadline_does_not_fail_finished_statement(self):
+        """Test that a deadline firing after the statement finished raises nothing"""
+        conn = duckdb.connect()
+
+        with QueryDeadline(conn, 0.05) as deadline:
+            assert conn.execute("SELECT 1").fetchall() == [(1,)]
+            time.sleep(0.2)
+
+        assert deadline.expired
+        assert conn.execute("SELECT 2").fetchall() == [(2,)]
+        conn.close()
+
+    def test_deadline_exit_waits_for_interrupt_in_progress(self):
+        """Test that an interrupt cannot land after the deadline is disarmed"""
+
+        class BlockingConnection:
+            def __init__(self):
+                self.started = threading.Event()
+                self.release = threading.Event()
+
+            def interrupt(self):
+                self.started.set()
+                assert self.release.wait(5)
+
+        conn = BlockingConnection()
+        deadline = QueryDeadline(conn, 0.01).__enter__()
+        assert conn.started.wait(5)
+        exiting = threading.Thread(target=deadline.__exit__, args=(None, None, None))
+        exiting.start()
+        exiting.join(0.1)
+        assert exiting.is_alive()
+
+        conn.release.set()
+        exiting.join(5)
+        assert not exiting.is_alive()
+
+    def test_query_budget_counts_only_steps(self):
+        """Test that time between QueryBudget steps does not count against the timeout"""
+        conn = duckdb.connect()
+        budget = QueryBudget(conn, 0.3, SLOW_QUERY)
+
+        with budget.step():
+            conn.execute("SELECT 1").fetchall()
+        time.sleep(0.4)
+        with budget.step():
+            conn.execute("SELECT 2").fetchall()
+        assert budget.spent < 0.3
+
+        with pytest.raises(QueryTimeoutError) as exc_info:
+            with budget.step():
+                conn.execute(SLOW_QUERY).fetchall()
+        assert exc_info.value.timeout == 0.3
+        conn.close()
+
+    def test_query_with_result_reports_timeout(self):
+        """Test that query_with_result returns a failed result on timeout"""
+        connection = DuckDBConnection(config=ConnectionConfig(database=":memory:", read_only=False, query_timeout=0.2))
+
+        result = connection.query_with_result(SLOW_QUERY, ttl=0)
+
+        assert not result.success
+        assert "timeout" in result.error.lower()
+        connection.close()
+
+    def test_connection_config_from_app_config(self, temp_db_path):
+        """Test that DatabaseConfig.connection_timeout bounds statements"""
+        app_config = Mock()
+        app_config.database.path = temp_db_path
+        app_config.database.read_only = True
+        app_config.database.connection_timeout = 15
+        app_config.database.in_memory = False
+        app_config.database.preload_scenarios = None
+        app_config.database.cache_max_entries = 64
+        app_config.database.cache_max_mb = 32
+        app_config.database.max_connections = 4
+        app_config.database.result_cache_path = None
+        app_config.database.result_cache_mb = 512
+        app_config.runtime.get.return_value = RuntimeProfile(threads=2)
+
+        config = ConnectionConfig.from_app_config(app_config)
+
+        assert config.database == temp_db_path
+        assert config.query_timeout == 15
+        assert config.cache_max_entries == 64
+        assert config.cache_max_bytes == 32 * 1024**2
+        assert config.max_connections == 4
+        assert config.result_cache_path is None
+        assert config.result_cache_bytes == 512 * 1024**2
+        assert config.duckdb_config() == {"threads": 2}
@@ -0,0 +1,93 @@
+"""Unit tests for Arrow/Parquet bulk export."""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from landuse.api import ErrorResult, ExportResult
+from landuse.api.queries import TRANSITIONS_EXPORT_COLUMNS
+
+
+def _expected_count(api, where: str, params: list) -> int:
+    return (
+        api._get_conn()
+        .execute(
+            f"""
+        SELECT COUNT(*)
+        FROM fact_landuse_transitions f
+        JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
+        JOIN dim_scenario s ON f.scenario_id = s.scenario_id
+        WHERE {where}
+        """,
+            params,
+        )
+        .fetchone()[0]
+    )
+
+
+class TestExportTable:
+    """Tests for exporting to an in-memory Arrow table."""
+
+    def test_full_table(self, api):
+        table = api.export_table()
+
+        assert isinstance(table, pa.Table)
+        assert tuple(table.column_names) == TRANSITIONS_EXPORT_COLUMNS
+        assert table.num_rows == 7200
+
+    def test_filters_reuse_query_clauses(self, api):
+        table = api.export_table(rcp="rcp85", to_use="urban", transition_type="change")
+
+        assert set(table.column("rcp_scenario").to_pylist()) == {"RCP85"}
+        assert set(table.column("to_landuse").to_pylist()) == {"Urban"}
+        assert table.num_rows == _expected_count(
+            api,
+            "s.rcp_scenario = 'RCP85' AND tl.landuse_name = 'Urban' AND f.transition_type = 'change'",
+            [],
+        )
+
+    def test_state_and_scenario_filters(self, api):
+        table = api.export_table(states=["CA"], scenarios=["LM"], year_range="2020-2030")
+
+        assert set(table.column("state_name").to_pylist()) == {"California"}
+        assert set(table.column("ssp_scenario").to_pylist()) == {"SSP1"}
+        assert set(table.column("year_range").to_pylist()) == {"2020-2030"}
+
+
+class TestExportFile:
+    """Tests for streaming exports to Parquet and Arrow IPC files."""
+
+    def test_parquet_round_trip(self, api, tmp_path):
+        path = tmp_path / "urban.parquet"
+        result = api.export_file(path, to_use="urban", batch_size=500)
+
+        assert isinstance(result, ExportResult)
+        assert result.success
+        assert result.bytes_written == path.stat().st_size
+        assert result.columns == list(TRANSITIONS_EXPORT_COLUMNS)
+        table = pq.read_table(path)
+        assert table.num_rows == result.rows
+        assert table.equals(api.export_table(to_use="urban"))
+
+    def test_ipc_round_trip(self, api, tmp_path):
+        path = tmp_path / "texas.arrow"
+        result = api.export_file(path, file_format="ipc", states=["TX"], compression=None)
+
+        assert result.success
+        with pa.memory_map(str(path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+        assert table.num_rows == result.rows == 2400
+        assert set(table.column("state_name").to_pylist()) == {"Texas"}
+
+    def test_unknown_format(self, api, tmp_path):
+        result = api.export_file(tmp_path / "out.csv", file_format="csv")
+
+        assert isinstance(result, ErrorResult)
+        assert result.error_code == "INVALID_REQUEST"
+
+    def test_unwritable_destination_leaves_no_file(self, api, tmp_path):
+        path = tmp_path / "missing" / "out.parquet"
+        result = api.export_file(path)
+
+        assert isinstance(result, ErrorResult)
+        assert result.error_code == "EXPORT_ERROR"
+        assert not path.exists()
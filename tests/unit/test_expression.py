@@ -0,0 +1,147 @@
+"""Unit tests for composable LandUseQuery expressions."""
+
+import pytest
+
+from landuse.api import AggregateResult, ErrorResult, LandUseAPI, LandUseQuery
+from landuse.api.expression import clear_plan_cache, plan_cache_info
+from landuse.api.queries import QueryBuilder
+
+
+class TestCompile:
+    """Tests for compiling queries to SQL."""
+
+    def test_builders_are_immutable(self):
+        base = LandUseQuery("urban_expansion").where(states=["CA"])
+        by_state = base.group_by("state")
+
+        assert base.dimensions == ()
+        assert by_state.dimensions == ("state",)
+        assert by_state.filters == base.filters
+
+    def test_filters_pushed_down_and_unused_joins_dropped(self):
+        query = LandUseQuery("urban_expansion").where(states=["CA"], scenario="HH").group_by("period").compile()
+
+        assert "f.geography_id IN (SELECT geography_id FROM dim_geography" in query.sql
+        assert "f.scenario_id IN (SELECT scenario_id FROM dim_scenario" in query.sql
+        assert "JOIN dim_geography" not in query.sql
+        assert "JOIN dim_scenario" not in query.sql
+        assert "JOIN dim_time" in query.sql
+        assert query.params == ["Urban", "change", "California", "RCP85", "SSP5"]
+
+    def test_plans_cached_by_shape(self):
+        clear_plan_cache()
+        first = LandUseQuery("forest_loss").where(states=["CA"]).group_by("county").top(5).compile()
+        second = LandUseQuery("forest_loss").where(states=["TX"]).group_by("county").top(10).compile()
+        third = LandUseQuery("forest_loss").where(states=["TX", "NC"]).group_by("county").top(10).compile()
+
+        assert first.sql == second.sql
+        assert first.params != second.params
+        assert third.sql != second.sql
+        assert plan_cache_info().hits == 1
+        assert plan_cache_info().misses == 2
+
+    def test_labels_and_ranking(self):
+        query = (
+            LandUseQuery("forest_gain")
+            .group_by("from_use", "state")
+            .label(from_landuse="from_use")
+            .ranked_by_measure()
+            .compile()
+        )
+
+        assert "fl.landuse_name as from_use" in query.sql
+        assert "ORDER BY acres DESC, from_use, state_name" in query.sql
+        assert "LIMIT" not in query.sql
+        with pytest.raises(ValueError):
+            LandUseQuery().label(planet="x")
+
+    @pytest.mark.parametrize(
+        "method, kwargs",
+        [
+            ("urban_expansion", {"states": ["CA"], "source_land_use": "forest"}),
+            ("forest_loss", {"states": ["CA"], "scenario": "HH"}),
+            ("forest_gain", {"states": ["CA"], "year_range": "2020-2030"}),
+            ("agricultural_change", {"states": ["CA"], "ag_type": "crop"}),
+            ("state_comparison", {"states": ["CA", "TX"], "metric": "land_area", "year": 2025}),
+        ],
+    )
+    def test_query_builder_templates_compile_through_expressions(self, method, kwargs):
+        query = getattr(QueryBuilder, method)(**kwargs)
+
+        assert "f.geography_id IN (SELECT geography_id FROM dim_geography" in query.sql
+        assert "JOIN dim_scenario" not in query.sql and "JOIN dim_time" not in query.sql
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError):
+            LandUseQuery("population")
+        with pytest.raises(ValueError):
+            LandUseQuery().group_by("planet")
+        with pytest.raises(ValueError):
+            LandUseQuery().where(scenario="XX")
+
+
+class TestAggregate:
+    """Tests for running queries through LandUseAPI.aggregate."""
+
+    def test_matches_hand_written_sql(self, api):
+        result = api.aggregate(
+            LandUseQuery("urban_expansion").where(states=["TX"], year_range="2020-2030").group_by("scenario")
+        )
+        expected = (
+            api._get_conn()
+            .execute(
+                """
+            SELECT s.rcp_scenario, s.ssp_scenario, SUM(f.acres)
+            FROM fact_landuse_transitions f
+            JOIN dim_landuse tl ON f.to_landuse_id = tl.landuse_id
+            JOIN dim_geography g ON f.geography_id = g.geography_id
+            JOIN dim_time t ON f.time_id = t.time_id
+            JOIN dim_scenario s ON f.scenario_id = s.scenario_id
+            WHERE tl.landuse_name = 'Urban' AND f.transition_type = 'change'
+            AND g.state_name = 'Texas' AND t.year_range = '2020-2030'
+            GROUP BY ALL
+            ORDER BY 1, 2
+            """
+            )
+            .fetchall()
+        )
+
+        assert isinstance(result, AggregateResult)
+        assert result.columns == ["rcp_scenario", "ssp_scenario", "acres"]
+        assert [(r, s, float(a)) for r, s, a in result.rows] == pytest.approx(
+            [(r, s, float(a)) for r, s, a in expected]
+        )
+
+    def test_top_k_and_forest_net(self, api):
+        top = api.aggregate(LandUseQuery("forest_net").group_by("state").top(2, descending=False).named("net"))
+
+        assert top.columns == ["state_name", "net"]
+        assert len(top.rows) == 2
+        assert top.rows[0][1] <= top.rows[1][1]
+
+    def test_top_counties_shares_code_path(self, api):
+        result = api.get_top_counties(metric="forest_loss", limit=3, states=["CA", "NC"])
+        expected = (
+            api._get_conn()
+            .execute(
+                """
+            SELECT g.fips_code, SUM(f.acres) as total_acres
+            FROM fact_landuse_transitions f
+            JOIN dim_landuse fl ON f.from_landuse_id = fl.landuse_id
+            JOIN dim_geography g ON f.geography_id = g.geography_id
+            WHERE fl.landuse_name = 'Forest' AND f.transition_type = 'change'
+            AND g.state_name IN ('California', 'North Carolina')
+            GROUP BY g.fips_code
+            ORDER BY total_acres DESC
+            LIMIT 3
+            """
+            )
+            .fetchall()
+        )
+
+        assert "LIMIT ?" in QueryBuilder.top_counties("forest_loss").sql
+        assert [c.fips for c in result.counties] == [row[0] for row in expected]
+
+    def test_database_error(self, tmp_path):
+        with LandUseAPI(db_path=str(tmp_path / "missing.duckdb")) as api:
+            assert isinstance(api.aggregate(LandUseQuery()), ErrorResult)
@@ -0,0 +1,105 @@
+"""Unit tests for the in-memory geography resolver."""
+
+import duckdb
+import numpy as np
+import pytest
+
+from landuse.api import CountyResult, ErrorResult, LandUseAPI
+from landuse.api.geography import County, GeographyResolver, normalize_county, trigrams
+
+
+@pytest.fixture(scope="module")
+def resolver(star_schema_db):
+    conn = duckdb.connect(star_schema_db, read_only=True)
+    try:
+        yield GeographyResolver.from_connection(conn)
+    finally:
+        conn.close()
+
+
+class TestNormalization:
+    """Tests for county name normalization."""
+
+    def test_normalize_county(self):
+        assert normalize_county("Los Angeles County") == "los angeles"
+        assert normalize_county("  ST. LOUIS ") == "st louis"
+        assert normalize_county("Orleans Parish") == "orleans"
+        assert normalize_county("County") == "county"
+
+    def test_trigrams(self):
+        assert trigrams("ab") == frozenset({"  a", " ab", "ab "})
+
+
+class TestStates:
+    """Tests for state and region resolution."""
+
+    def test_resolve_state_any_form(self, resolver):
+        assert resolver.resolve_state("CA") == "California"
+        assert resolver.resolve_state("ca") == "California"
+        assert resolver.resolve_state("north carolina") == "North Carolina"
+        assert resolver.resolve_state("48") == "Texas"
+        assert resolver.resolve_state("WY") is None
+
+    def test_state_geography_ids(self, resolver):
+        ids = resolver.state_geography_ids("TX")
+        assert isinstance(ids, np.ndarray)
+        assert ids.tolist() == [5, 6, 7, 8]
+        assert resolver.state_geography_ids("ZZ").size == 0
+
+    def test_regions(self, resolver):
+        assert resolver.regions == ["South", "West"]
+        assert resolver.region_states("south") == ["North Carolina", "Texas"]
+        assert resolver.region_geography_ids("West").tolist() == [1, 2, 3, 4]
+        assert resolver.region_states("Nowhere") == []
+
+
+class TestCounties:
+    """Tests for county matching."""
+
+    def test_exact_and_suffix(self, resolver):
+        assert resolver.find_county("CA", "Los Angeles").fips_code == "06037"
+        assert resolver.find_county("CA", "los angeles county").fips_code == "06037"
+
+    def test_same_name_different_states(self, resolver):
+        assert resolver.find_county("CA", "Orange").fips_code == "06059"
+        assert resolver.find_county("TX", "Orange").fips_code == "48361"
+        assert resolver.find_county("NC", "orange").fips_code == "37135"
+
+    def test_partial_match(self, resolver):
+        assert resolver.find_county("NC", "meck").county_name == "Mecklenburg"
+        assert resolver.find_county("CA", "angeles").county_name == "Los Angeles"
+
+    def test_fuzzy_match(self, resolver):
+        assert resolver.find_county("CA", "Los Angles").county_name == "Los Angeles"
+        assert resolver.find_county("NC", "Mecklenberg").county_name == "Mecklenburg"
+
+    def test_no_match(self, resolver):
+        assert resolver.find_county("CA", "Nonexistent County") is None
+        assert resolver.find_county("ZZ", "Orange") is None
+        assert resolver.find_county("CA", "") is None
+
+    def test_fips_lookup(self, resolver):
+        assert resolver.find_county("TX", "48201").county_name == "Harris"
+        assert resolver.find_county("CA", "48201") is None
+        assert resolver.county_by_id(9) == County(9, "37183", "Wake", "North Carolina", "South")
+
+    def test_fips_positions(self, resolver):
+        assert list(resolver.fips_order) == sorted(c.fips_code for c in resolver.counties)
+        positions = resolver.fips_positions(np.array([9, 12345]))
+        assert resolver.fips_order[positions[0]] == "37183"
+        assert positions[1] == -1
+
+
+class TestLandUseAPICounty:
+    """Tests for county queries through LandUseAPI."""
+
+    def test_get_county_data_uses_resolver(self, star_schema_db):
+        with LandUseAPI(db_path=star_schema_db) as api:
+            result = api.get_county_data(state="nc", county="Durham County")
+            assert isinstance(result, CountyResult)
+            assert result.fips == "37063"
+            assert result.state == "North Carolina"
+            assert result.total_acres > 0
+
+            assert api._geography is not None
+            assert isinstance(api.get_county_data(state="CA", county="Atlantis"), ErrorResult)
@@ -0,0 +1,124 @@
+"""Unit tests for database metadata snapshots."""
+
+import duckdb
+import pytest
+
+from landuse.api import LandUseAPI
+from landuse.connections.duckdb_connection import DuckDBConnection
+from landuse.connections.metadata import (
+    FileIdentity,
+    MetadataSnapshot,
+    get_metadata_snapshot,
+    invalidate_metadata_snapshots,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_snapshots():
+    invalidate_metadata_snapshots()
+    yield
+    invalidate_metadata_snapshots()
+
+
+@pytest.fixture
+def small_db(tmp_path):
+    path = str(tmp_path / "small.duckdb")
+    conn = duckdb.connect(path)
+    conn.execute("CREATE TABLE dim_landuse AS SELECT range AS landuse_id FROM range(5)")
+    conn.execute("CREATE VIEW v_landuse AS SELECT * FROM dim_landuse")
+    conn.close()
+    return path
+
+
+class TestFileIdentity:
+    """Tests for database file identity."""
+
+    def test_identity_of_file(self, small_db):
+        identity = FileIdentity.of(small_db)
+        assert identity is not None
+        assert identity == FileIdentity.of(small_db)
+        assert identity.size > 0
+
+    def test_no_identity_for_memory_or_missing(self, tmp_path):
+        assert FileIdentity.of(":memory:") is None
+        assert FileIdentity.of("md:landuse") is None
+        assert FileIdentity.of(str(tmp_path / "missing.duckdb")) is None
+
+
+class TestMetadataSnapshot:
+    """Tests for snapshot contents and invalidation."""
+
+    def test_star_schema_summary(self, star_schema_db):
+        conn = duckdb.connect(star_schema_db, read_only=True)
+        snapshot = MetadataSnapshot.build(conn)
+        conn.close()
+
+        assert snapshot.has_star_schema
+        assert snapshot.fact_count == snapshot.row_counts["fact_landuse_transitions"] == 7200
+        assert snapshot.county_count == 12
+        assert snapshot.state_count == 3
+        assert (snapshot.min_year, snapshot.max_year) == (2012, 2070)
+        assert snapshot.scenarios == ("RCP45/SSP1", "RCP85/SSP2", "RCP85/SSP3", "RCP85/SSP5")
+        assert snapshot.land_use_types == ("Crop", "Forest", "Pasture", "Rangeland", "Urban")
+        assert snapshot.state_coverage == {"California": 4, "North Carolina": 4, "Texas": 4}
+
+    def test_generic_database(self, small_db):
+        conn = duckdb.connect(small_db, read_only=True)
+        snapshot = MetadataSnapshot.build(conn)
+        conn.close()
+
+        assert not snapshot.has_star_schema
+        assert snapshot.tables == ("dim_landuse", "v_landuse")
+        assert snapshot.row_counts == {"dim_landuse": 5}
+        assert snapshot.fact_count is None
+
+    def test_snapshot_cached_until_file_changes(self, small_db):
+        conn = duckdb.connect(small_db, read_only=True)
+        first = get_metadata_snapshot(conn, small_db)
+        assert get_metadata_snapshot(conn, small_db) is first
+        conn.close()
+
+        writer = duckdb.connect(small_db)
+        writer.execute("INSERT INTO dim_landuse VALUES (5), (6)")
+        writer.close()
+
+        conn = duckdb.connect(small_db, read_only=True)
+        second = get_metadata_snapshot(conn, small_db)
+        conn.close()
+
+        assert second is not first
+        assert second.row_counts["dim_landuse"] == 7
+
+
+class TestSnapshotConsumers:
+    """Tests for components served from the snapshot."""
+
+    def test_duckdb_connection_uses_snapshot(self, small_db):
+        connection = DuckDBConnection(database=small_db, read_only=True)
+        try:
+            assert connection.get_row_count("dim_landuse") == 5
+            assert connection.list_tables()["table_name"].tolist() == ["dim_landuse", "v_landuse"]
+            assert connection.metadata() is connection.metadata()
+        finally:
+            connection.close()
+
+    def test_writable_connection_bypasses_snapshot(self, small_db):
+        connection = DuckDBConnection(database=small_db, read_only=False)
+        try:
+            assert connection.metadata() is None
+            assert connection.get_row_count("dim_landuse") == 5
+        finally:
+            connection.clear_cache()
+            connection.close()
+
+    def test_data_summary_served_from_snapshot(self, star_schema_db, monkeypatch):
+        with LandUseAPI(db_path=star_schema_db) as api:
+            first = api.get_data_summary()
+            assert first.success
+            assert first.total_records == 7200
+
+            def fail(*args, **kwargs):
+                raise AssertionError("summary should not query the database")
+
+            monkeypatch.setattr(MetadataSnapshot, "build", classmethod(fail))
+            assert api.get_data_summary().to_dict() == first.to_dict()
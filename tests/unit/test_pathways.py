@@ -0,0 +1,118 @@
+"""Unit tests for cumulative transition pathways."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from landuse.api import CumulativeTransitionResult, ErrorResult
+from landuse.api.pathways import build_transition_chain
+
+
+def _frame(rows):
+    return pd.DataFrame(rows, columns=["start_year", "end_year", "from_landuse", "to_landuse", "acres"])
+
+
+class TestTransitionChain:
+    """Tests for build_transition_chain."""
+
+    def test_matches_sequential_matrix_products(self):
+        rng = np.random.default_rng(7)
+        uses = ("Crop", "Forest", "Urban")
+        periods = [(2020, 2030), (2030, 2040), (2040, 2050)]
+        rows, positions, matrices = [], [], {0: [], 1: []}
+        for area in (0, 1):
+            for start, end in periods:
+                acres = rng.uniform(1, 100, (3, 3))
+                matrices[area].append(acres / acres.sum(axis=1, keepdims=True))
+                for i, from_use in enumerate(uses):
+                    for j, to_use in enumerate(uses):
+                        rows.append((start, end, from_use, to_use, acres[i, j]))
+                        positions.append(area)
+
+        chain = build_transition_chain(_frame(rows), np.array(["a", "b"]), np.array(positions))
+
+        assert chain.periods == tuple(periods)
+        for area in (0, 1):
+            expected = matrices[area][0] @ matrices[area][1] @ matrices[area][2]
+            np.testing.assert_allclose(chain.cumulative[area], expected)
+        np.testing.assert_allclose(chain.cumulative.sum(axis=2), 1.0)
+
+    def test_empty_rows_keep_their_land(self):
+        df = _frame([(2020, 2030, "Crop", "Urban", 10.0)])
+        chain = build_transition_chain(df, np.array(["a", "b"]), np.array([0]), land_uses=("Crop", "Urban"))
+
+        np.testing.assert_allclose(chain.cumulative[0], [[0, 1], [0, 1]])
+        np.testing.assert_allclose(chain.cumulative[1], np.eye(2))
+        assert chain.pathway("crop", "urban").tolist() == [10.0, 0.0]
+        with pytest.raises(ValueError):
+            chain.index("Water")
+
+    def test_aggregate_sums_flows(self):
+        rows = [
+            (2020, 2030, "Crop", "Crop", 30.0),
+            (2020, 2030, "Crop", "Urban", 10.0),
+            (2020, 2030, "Crop", "Crop", 50.0),
+            (2020, 2030, "Urban", "Urban", 5.0),
+        ]
+        chain = build_transition_chain(_frame(rows), np.array(["a", "b"]), np.array([0, 0, 1, 1]))
+        grouped = chain.aggregate(np.array(["S", "S"]))
+
+        np.testing.assert_allclose(grouped.flows[0], chain.flows.sum(axis=0))
+        np.testing.assert_allclose(grouped.cumulative[0, 0], [80 / 90, 10 / 90])
+
+
+class TestCumulativeTransitions:
+    """Tests for LandUseAPI.get_cumulative_transitions."""
+
+    def test_county_matrices(self, api):
+        result = api.get_cumulative_transitions("HM", 2020, 2070)
+
+        assert isinstance(result, CumulativeTransitionResult)
+        assert list(result.keys) == sorted(result.keys)
+        assert result.matrices.shape == (len(result.keys), len(result.land_uses), len(result.land_uses))
+        np.testing.assert_allclose(result.matrices.sum(axis=2), 1.0)
+        np.testing.assert_allclose(result.end_acres.sum(axis=1), result.start_acres.sum(axis=1))
+        assert (result.start_year, result.end_year) == (2020, 2070)
+        assert "Cumulative Land Use Transitions 2020-2070" in result.to_llm_string()
+
+    def test_start_acres_match_first_period(self, api):
+        result = api.get_cumulative_transitions("HM", 2020, 2070)
+        first = (
+            api._get_conn()
+            .execute(
+                """
+            SELECT SUM(f.acres)
+            FROM fact_landuse_transitions f
+            JOIN dim_time t ON f.time_id = t.time_id
+            JOIN dim_scenario s ON f.scenario_id = s.scenario_id
+            WHERE s.ssp_scenario = 'SSP2' AND t.start_year = 2020
+            """
+            )
+            .fetchone()[0]
+        )
+        assert result.start_acres.sum() == pytest.approx(first)
+
+    def test_state_and_region_aggregation(self, api):
+        counties = api.get_cumulative_transitions("HH", level="county")
+        states = api.get_cumulative_transitions("HH", level="state")
+        regions = api.get_cumulative_transitions("HH", level="region", states=["CA", "TX", "NC"])
+
+        assert list(states.keys) == ["California", "North Carolina", "Texas"]
+        assert list(regions.keys) == ["South", "West"]
+        np.testing.assert_allclose(states.flows.sum(axis=0), counties.flows.sum(axis=0))
+        np.testing.assert_allclose(regions.flows.sum(axis=0), counties.flows.sum(axis=0))
+        frame = states.to_dataframe()
+        assert len(frame) == 3 * len(states.land_uses)
+        assert frame.groupby("state")["end_share"].sum().tolist() == pytest.approx([1.0, 1.0, 1.0])
+
+    def test_state_filter(self, api):
+        texas = api.get_cumulative_transitions("LM", states=["TX"])
+        assert len(texas.keys) == 4
+        assert all(fips.startswith("48") for fips in texas.keys)
+
+    def test_invalid_requests(self, api):
+        assert api.get_cumulative_transitions("XX").error_code == "INVALID_REQUEST"
+        assert api.get_cumulative_transitions(level="planet").error_code == "INVALID_REQUEST"
+        missing = api.get_cumulative_transitions(start_year=2100, end_year=2200)
+        assert isinstance(missing, ErrorResult)
+        assert missing.error_code == "NO_DATA"
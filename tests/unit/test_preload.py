@@ -0,0 +1,82 @@
+"""Unit tests for in-memory database preloading."""
+
+import duckdb
+import pytest
+
+from landuse.api import DataSummaryResult, LandUseAPI
+from landuse.connections.duckdb_connection import ConnectionConfig, DuckDBConnection
+from landuse.connections.preload import PreloadReport, load_into_memory
+
+
+class TestLoadIntoMemory:
+    """Tests for copying a database file into memory."""
+
+    def test_copies_all_tables(self, star_schema_db):
+        conn, report = load_into_memory(str(star_schema_db))
+        try:
+            assert isinstance(report, PreloadReport)
+            assert report.row_counts["fact_landuse_transitions"] == 7200
+            assert report.memory_bytes > 0
+            assert report.load_seconds > 0
+            # The source file is detached; only in-memory tables remain
+            assert conn.execute("SELECT database_name FROM duckdb_databases() WHERE NOT internal").fetchall() == [
+                ("memory",)
+            ]
+            assert conn.execute("SELECT COUNT(*) FROM fact_landuse_transitions").fetchone()[0] == 7200
+        finally:
+            conn.close()
+
+    def test_scenario_and_column_subsets(self, star_schema_db):
+        conn, report = load_into_memory(
+            str(star_schema_db),
+            scenarios=["rcp85/ssp5"],
+            columns={"dim_geography": ["geography_id", "fips_code", "state_name"]},
+        )
+        try:
+            assert report.row_counts["dim_scenario"] == 1
+            assert report.row_counts["fact_landuse_transitions"] == 1800
+            columns = [row[0] for row in conn.execute("DESCRIBE dim_geography").fetchall()]
+            assert columns == ["geography_id", "fips_code", "state_name"]
+        finally:
+            conn.close()
+
+    def test_unknown_inputs(self, star_schema_db):
+        with pytest.raises(ValueError, match="Tables not found"):
+            load_into_memory(str(star_schema_db), tables=["missing"])
+        with pytest.raises(ValueError, match="No scenarios"):
+            load_into_memory(str(star_schema_db), scenarios=["RCP26/SSP9"])
+        with pytest.raises(FileNotFoundError):
+            load_into_memory("/nonexistent/db.duckdb")
+
+
+class TestInMemoryAPI:
+    """Tests for the in-memory startup option of LandUseAPI."""
+
+    def test_results_match_file_backed_api(self, star_schema_db):
+        with LandUseAPI(db_path=star_schema_db) as disk, LandUseAPI(db_path=star_schema_db, in_memory=True) as ram:
+            expected = disk.get_urban_expansion(states=["CA"])
+            actual = ram.get_urban_expansion(states=["CA"])
+
+            assert actual.model_dump(exclude={"timestamp"}) == expected.model_dump(exclude={"timestamp"})
+            assert ram.preload_report is not None
+
+    def test_preloaded_scenarios_shape_summary(self, star_schema_db):
+        with LandUseAPI(db_path=star_schema_db, in_memory=True, preload_scenarios=["HH"]) as api:
+            summary = api.get_data_summary()
+
+            assert isinstance(summary, DataSummaryResult)
+            assert summary.scenarios == ["RCP85/SSP5"]
+            assert summary.total_records == 1800
+
+
+class TestInMemoryConnection:
+    """Tests for the in-memory option of DuckDBConnection."""
+
+    def test_preloaded_connection(self, star_schema_db):
+        config = ConnectionConfig(database=str(star_schema_db), in_memory=True, preload_tables=["dim_geography"])
+        with DuckDBConnection(config) as conn:
+            assert conn.preload_report.tables == ("dim_geography",)
+            assert conn.metadata().tables == ("dim_geography",)
+            assert conn.get_row_count("dim_geography") == 12
+            with pytest.raises(duckdb.CatalogException):
+                conn.query("SELECT * FROM dim_scenario", use_cache=False)
@@ -0,0 +1,118 @@
+"""Unit tests for LandUseAPI query profiling."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from landuse.api import LandUseAPI
+from landuse.api.profiling import QueryProfile, QueryProfiler, cost_summary, parse_profile
+
+
+@pytest.fixture
+def profiled(star_schema_db):
+    profiles: list[QueryProfile] = []
+    profiler = QueryProfiler(sink=profiles.append, slow_threshold_ms=0)
+    with LandUseAPI(db_path=star_schema_db, profiler=profiler) as api:
+        yield api, profiler, profiles
+
+
+class TestParseProfile:
+    """Tests for DuckDB JSON profile parsing."""
+
+    def test_parse_nested_operators(self):
+        raw = {
+            "latency": 0.012,
+            "cumulative_rows_scanned": 7200,
+            "children": [
+                {
+                    "operator_type": "HASH_GROUP_BY",
+                    "operator_timing": 0.004,
+                    "operator_cardinality": 10,
+                    "children": [
+                        {"operator_type": "TABLE_SCAN", "operator_timing": 0.006, "operator_cardinality": 7200},
+                        {"operator_type": "HASH_GROUP_BY", "operator_timing": 0.001, "operator_cardinality": 5},
+                    ],
+                }
+            ],
+        }
+
+        profile = parse_profile(raw, "Urban expansion", "SELECT 1", wall_ms=15.0, result_rows=10)
+
+        assert profile.latency_ms == 12.0
+        assert profile.rows_scanned == 7200
+        assert [o.operator for o in profile.operators] == ["TABLE_SCAN", "HASH_GROUP_BY"]
+        assert profile.operators[1].timing_ms == 5.0
+        assert profile.operators[1].rows == 15
+
+    def test_cost_summary(self):
+        a = QueryProfile("a", wall_ms=2.0, latency_ms=1.5, rows_scanned=100, result_rows=3)
+        b = QueryProfile("b", wall_ms=3.0, latency_ms=2.5, rows_scanned=50, result_rows=4)
+        assert cost_summary([a, b]) == {"queries": 2, "wall_ms": 5.0, "rows_scanned": 150, "result_rows": 7}
+
+
+class TestAPIProfiling:
+    """Tests for profiling through LandUseAPI."""
+
+    def test_result_carries_cost(self, profiled):
+        api, _, profiles = profiled
+
+        result = api.get_urban_expansion(states=["CA"])
+
+        assert result.success
+        assert result.cost["queries"] == 1
+        assert result.cost["rows_scanned"] > 0
+        assert result.cost["result_rows"] == profiles[-1].result_rows
+        assert "top_operator" in result.cost
+
+    def test_nested_calls_report_total_cost(self, profiled):
+        api, _, profiles = profiled
+
+        result = api.compare_scenarios(states=["TX"], metric="urban_expansion")
+
+        assert result.cost["queries"] == 4
+        assert len(profiles) == 4
+
+    def test_concurrent_calls_report_their_own_cost(self, profiled):
+        api, profiler, profiles = profiled
+        states = [["CA"], ["TX"], ["NC"], ["CA", "TX"]] * 4
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda s: api.get_urban_expansion(states=s), states))
+
+        assert all(r.success for r in results)
+        assert [r.cost["queries"] for r in results] == [1] * len(states)
+        assert len(profiles) == len(states)
+        assert profiler.report()["calls"].sum() == len(states)
+
+    def test_slow_query_report(self, profiled):
+        api, profiler, _ = profiled
+        api.get_urban_expansion(states=["CA"])
+        api.get_urban_expansion(states=["TX"])
+        api.get_forest_change(states=["NC"])
+
+        report = profiler.report()
+
+        assert isinstance(report, pd.DataFrame)
+        assert set(report["description"]) == {"Urban expansion query", "Forest loss query", "Forest gain query"}
+        urban = report.set_index("description").loc["Urban expansion query"]
+        assert urban["calls"] == 2
+        assert urban["slow_calls"] == 2
+        assert report["total_ms"].is_monotonic_decreasing
+        assert len(profiler.report(top=1)) == 1
+
+        profiler.reset()
+        assert profiler.report().empty
+
+    def test_no_cost_without_profiler(self, star_schema_db):
+        with LandUseAPI(db_path=star_schema_db) as api:
+            result = api.get_urban_expansion(states=["CA"])
+            assert result.cost is None
+            assert "cost" not in result.to_dict()
+
+    def test_sink_errors_are_ignored(self, star_schema_db):
+        def broken_sink(profile):
+            raise RuntimeError("sink down")
+
+        with LandUseAPI(db_path=star_schema_db, profiler=QueryProfiler(sink=broken_sink)) as api:
+            assert api.get_land_use_area(states=["CA"]).success
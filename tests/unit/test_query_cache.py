@@ -0,0 +1,131 @@
+"""Unit tests for the bounded query result cache."""
+
+import threading
+
+import duckdb
+import pandas as pd
+import pytest
+
+from landuse.connections.duckdb_connection import DuckDBConnection
+from landuse.connections.query_cache import QueryCache, frame_nbytes
+
+
+def _frame(n: int = 10) -> pd.DataFrame:
+    return pd.DataFrame({"id": range(n), "name": [f"row{i}" for i in range(n)]})
+
+
+class TestQueryCache:
+    """Tests for QueryCache."""
+
+    def test_lru_eviction_by_count(self):
+        cache = QueryCache(max_entries=2)
+        cache.set("a", _frame(), ttl=60)
+        cache.set("b", _frame(), ttl=60)
+        assert cache.get("a") is not None  # a is now most recently used
+        cache.set("c", _frame(), ttl=60)
+
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        size = frame_nbytes(_frame(100))
+        cache = QueryCache(max_entries=100, max_bytes=int(size * 2.5))
+        for key in "abc":
+            cache.set(key, _frame(100), ttl=60)
+
+        assert len(cache) == 2
+        assert cache.nbytes <= cache.max_bytes
+        assert not cache.set("huge", _frame(10_000), ttl=60)
+
+    def test_ttl_expiry_lazy_and_swept(self, clock):
+        cache = QueryCache(sweep_interval=30, clock=clock)
+        cache.set("short", _frame(), ttl=5)
+        cache.set("long", _frame(), ttl=100)
+        cache.set("idle", _frame(), ttl=10)
+
+        clock.now += 6
+        assert cache.get("short") is None
+        assert "idle" in cache
+
+        clock.now += 30  # next access sweeps "idle" without it being requested
+        assert cache.get("long") is not None
+        assert "idle" not in cache
+        assert cache.stats()["expirations"] == 2
+
+    def test_max_age(self, clock):
+        cache = QueryCache(clock=clock)
+        cache.set("a", _frame(), ttl=3600)
+        clock.now += 10
+        assert cache.get("a", max_age=5) is None
+        assert cache.get("a", max_age=60) is not None
+
+    def test_hits_are_read_only_views(self):
+        cache = QueryCache()
+        df = _frame()
+        cache.set("a", df, ttl=60)
+        view = cache.get("a")
+
+        view["extra"] = 1  # adding columns does not touch the cache
+        with pytest.raises(ValueError):
+            view.loc[0, "id"] = 99
+        assert "extra" not in cache.get("a").columns
+        assert cache.get("a")["id"].tolist() == list(range(10))
+        edited = cache.get("a").copy()
+        edited.loc[0, "id"] = 99
+        assert cache.get("a").loc[0, "id"] == 0
+
+    def test_thread_safety(self):
+        cache = QueryCache(max_entries=8)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(200):
+                    cache.set((offset, i % 16), _frame(5), ttl=60)
+                    cache.get((offset, (i + 1) % 16))
+            except Exception as e:  # pragma: no cover - surfaced by the assertion
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = cache.stats()
+        assert not errors
+        assert stats["entries"] <= 8
+        assert stats["bytes"] == sum(entry.nbytes for entry in cache._entries.values())
+
+
+class TestDuckDBConnectionCache:
+    """Tests for the cache in DuckDBConnection."""
+
+    def test_instances_have_separate_caches(self, tmp_path):
+        paths = []
+        for name in ("one", "two"):
+            path = str(tmp_path / f"{name}.duckdb")
+            with duckdb.connect(path) as conn:
+                conn.execute(f"CREATE TABLE t AS SELECT '{name}' AS name")
+            paths.append(path)
+
+        first, second = (DuckDBConnection(database=path) for path in paths)
+        assert first.query("SELECT name FROM t")["name"][0] == "one"
+        assert second.query("SELECT name FROM t")["name"][0] == "two"
+        assert first.cache_stats()["entries"] == second.cache_stats()["entries"] == 1
+        first.close()
+        second.close()
+
+    def test_hits_counted(self, tmp_path):
+        path = str(tmp_path / "hits.duckdb")
+        with duckdb.connect(path) as conn:
+            conn.execute("CREATE TABLE t AS SELECT range AS id FROM range(5)")
+
+        connection = DuckDBConnection(database=path)
+        first = connection.query("SELECT * FROM t")
+        second = connection.query("SELECT * FROM t")
+        pd.testing.assert_frame_equal(first, second)
+        assert connection.cache_stats()["hits"] == 1
+        assert connection.cache_stats()["misses"] == 1
+        connection.close()
@@ -0,0 +1,37 @@
+"""Unit tests for compiled SQL reuse and the query overhead benchmark."""
+
+from landuse.api.benchmark import benchmark_query_overhead
+from landuse.api.expression import clear_plan_cache, plan_cache_info
+from landuse.api.queries import QueryBuilder
+
+
+class TestCompiledQueries:
+    """Tests for SQL reuse across QueryBuilder calls."""
+
+    def test_same_shape_reuses_sql(self):
+        clear_plan_cache()
+        first = QueryBuilder.top_counties("forest_loss", limit=5, states=["CA"])
+        second = QueryBuilder.top_counties("forest_loss", limit=10, states=["TX"])
+        other = QueryBuilder.top_counties("forest_loss", limit=5, states=["CA", "TX"])
+
+        assert second.sql == first.sql
+        assert second.params == ["Forest", "change", "Texas", 10]
+        assert other.sql != first.sql
+        assert (plan_cache_info().hits, plan_cache_info().misses) == (1, 2)
+
+    def test_params_are_private(self):
+        first = QueryBuilder.urban_expansion(["CA"], scenario="HH")
+        first.params.append("mutated")
+
+        assert "mutated" not in QueryBuilder.urban_expansion(["CA"], scenario="HH").params
+
+
+class TestBenchmark:
+    """Smoke test for the overhead micro-benchmark."""
+
+    def test_runs(self, star_schema_db):
+        results = benchmark_query_overhead(str(star_schema_db), iterations=2)
+
+        assert [r.method for r in results][:2] == ["land_use_area", "urban_expansion"]
+        assert all(r.baseline_us > 0 and r.compiled_us > 0 for r in results)
+        assert all(r.build_us > 0 and r.cached_build_us > 0 for r in results)
@@ -0,0 +1,258 @@
+"""Unit tests for the process-wide DuckDB database registry."""
+
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pytest
+
+from landuse.api import LandUseAPI
+from landuse.connections.duckdb_connection import ConnectionConfig, DuckDBConnection
+from landuse.connections.metadata import DatabaseGeneration, FileIdentity
+from landuse.connections.registry import DatabaseRegistry, get_registry
+from landuse.database.schema_version import SchemaVersionManager
+from landuse.exceptions import DatabaseConnectionError
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "registry.duckdb"
+    with duckdb.connect(str(path)) as conn:
+        conn.execute("CREATE TABLE t AS SELECT range AS id FROM range(10)")
+    return path
+
+
+def _in_thread(fn):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(fn()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+class TestDatabaseRegistry:
+    """Tests for DatabaseRegistry and DatabaseHandle."""
+
+    def test_handles_share_one_database(self, db_path):
+        registry = DatabaseRegistry()
+        first = registry.open(db_path)
+        second = registry.open(str(db_path))
+
+        assert first.database is second.database
+        assert len(registry) == 1 and first.database.refs == 2
+
+        first.close()
+        assert registry.get(db_path) is second.database
+        second.close()
+        assert len(registry) == 0 and second.database.closed
+
+    def test_conflicting_config_is_not_registered(self, db_path):
+        registry = DatabaseRegistry()
+        with registry.open(db_path) as handle:
+            # DuckDB allows one configuration per file within a process
+            with pytest.raises(duckdb.ConnectionException):
+                registry.open(db_path, config={"threads": 1})
+            assert len(registry) == 1 and handle.database.refs == 1
+
+    def test_cursor_per_thread(self, db_path):
+        with DatabaseRegistry().open(db_path) as handle:
+            mine = handle.cursor()
+            other = _in_thread(handle.cursor)
+
+            assert handle.cursor() is mine
+            assert other is not mine
+            assert mine.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 10
+
+    def test_pool_exhaustion_and_dead_thread_reclaim(self, db_path):
+        with DatabaseRegistry().open(db_path, max_cursors=2, acquire_timeout=0) as handle:
+            handle.cursor()
+            _in_thread(handle.cursor)
+            assert handle.thread_cursors == 2
+
+            # The finished thread's cursor is reclaimed instead of failing
+            with handle.lease() as cursor:
+                assert cursor.execute("SELECT 1").fetchone() == (1,)
+                with pytest.raises(DatabaseConnectionError):
+                    with handle.lease():
+                        pass
+            assert handle.thread_cursors == 1
+
+    def test_lease_reuses_pooled_cursor(self, db_path):
+        with DatabaseRegistry().open(db_path) as handle:
+            with handle.lease() as first:
+                pass
+            with handle.lease() as second:
+                pass
+            assert first is second
+            assert handle.database.stats()["created"] == 1
+
+    def test_idle_reaping(self, db_path, clock):
+        with DatabaseRegistry(clock=clock).open(db_path, idle_timeout=10) as handle:
+            with handle.lease():
+                pass
+            assert handle.database.stats()["idle"] == 1
+
+            clock.now += 11
+            assert handle.database.reap() == 1
+            assert handle.database.stats()["open"] == 0
+
+    def test_health_check_replaces_broken_cursor(self, db_path, clock):
+        with DatabaseRegistry(clock=clock).open(db_path, health_check_interval=5) as handle:
+            broken = handle.cursor()
+            broken.close()
+
+            clock.now += 6
+            fresh = handle.cursor()
+            assert fresh is not broken
+            assert fresh.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 10
+            assert handle.database.stats()["failed_checks"] == 1
+            assert handle.database.health_check()
+
+    def test_memory_databases_are_private(self):
+        registry = DatabaseRegistry()
+        with registry.open(":memory:") as a, registry.open(":memory:") as b:
+            a.cursor().execute("CREATE TABLE x (i INTEGER)")
+            assert len(registry) == 0
+            with pytest.raises(duckdb.CatalogException):
+                b.cursor().execute("SELECT * FROM x")
+
+    def test_closed_handle_refuses_cursors(self, db_path):
+        handle = DatabaseRegistry().open(db_path)
+        handle.close()
+        with pytest.raises(DatabaseConnectionError):
+            handle.cursor()
+
+
+class TestRegistryConsumers:
+    """DuckDBConnection and LandUseAPI draw cursors from the shared registry."""
+
+    def test_duckdb_connection_thread_cursors(self, db_path):
+        with DuckDBConnection(database=str(db_path)) as first, DuckDBConnection(database=str(db_path)) as second:
+            assert first._handle.database is second._handle.database
+            other = _in_thread(first.cursor)
+            assert other is not first.cursor()
+            assert first.pool_stats()["handles"] == 2
+        assert get_registry().get(db_path) is None
+
+    def test_api_concurrent_calls(self, star_schema_db):
+        with LandUseAPI(db_path=star_schema_db) as api:
+            expected = api.get_land_use_area(["CA", "TX"], land_use="forest").to_dict()
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(lambda _: api.get_land_use_area(["CA", "TX"], land_use="forest"), range(8)))
+                conns = set(pool.map(lambda _: id(api._get_conn()), range(8)))
+
+            assert all(result.to_dict() == expected for result in results)
+            assert id(api._conn) not in conns
+            assert api._db.database.stats()["open"] <= api.max_connections
+
+    def test_idle_threads_do_not_hold_cursors(self, star_schema_db, db_path, tmp_path):
+        # A private copy, so no other handle has opened it with a different limit
+        star_path = tmp_path / "landuse.duckdb"
+        shutil.copy(star_schema_db, star_path)
+        # More live threads than cursors, used one after another
+        pools = [ThreadPoolExecutor(max_workers=1) for _ in range(5)]
+        config = ConnectionConfig(database=str(db_path), max_connections=3)
+        try:
+            with LandUseAPI(db_path=star_path, max_connections=3) as api, DuckDBConnection(config=config) as conn:
+                api.get_land_use_area(["CA"])
+                conn.connect()
+                for pool in pools:
+                    assert pool.submit(api.get_land_use_area, ["CA"]).result().success
+                    assert pool.submit(api.batch, [("get_land_use_area", {"states": ["TX"]})]).result()[0].success
+                    counted = pool.submit(conn.query, "SELECT COUNT(*) AS n FROM t", use_cache=False).result()
+                    assert counted["n"][0] == 10
+                    assert pool.submit(conn.list_tables).result()["table_name"].tolist() == ["t"]
+
+                assert api._db.thread_cursors == 1 and api._db.database.stats()["open"] <= 3
+                assert conn._handle.thread_cursors == 1
+        finally:
+            for pool in pools:
+                pool.shutdown()
+
+
+def _rebuild(path, value):
+    """Write a new database next to ``path`` and rename it over ``path``, like the nightly rebuild."""
+    staging = path.with_suffix(".staging")
+    with duckdb.connect(str(staging)) as conn:
+        conn.execute(f"CREATE TABLE t AS SELECT range + {value} AS id FROM range(10)")
+    os.replace(staging, path)
+
+
+class TestGenerations:
+    """Generation tokens and reopening of replaced database files."""
+
+    def test_token_tracks_identity_and_schema_version(self, db_path):
+        identity = FileIdentity.of(db_path)
+        assert DatabaseGeneration(identity, "2.2.0").token == DatabaseGeneration(identity, "2.2.0").token
+        assert DatabaseGeneration(identity, "2.2.0").token != DatabaseGeneration(identity, "2.1.0").token
+        assert DatabaseGeneration(None, instance=1).token != DatabaseGeneration(None, instance=2).token
+
+    def test_schema_version_read_without_side_effects(self, db_path):
+        with DatabaseRegistry().open(db_path) as handle:
+            assert handle.generation().schema_version is None
+        with duckdb.connect(str(db_path)) as conn:
+            SchemaVersionManager(conn).apply_version("2.2.0", "test")
+        with DatabaseRegistry().open(db_path) as handle:
+            assert handle.generation().schema_version == "2.2.0"
+
+    def test_in_place_change_new_token_same_instance(self, db_path, clock):
+        with DatabaseRegistry(clock=clock).open(db_path, read_only=False, check_interval=1) as handle:
+            before = handle.generation().token
+            cursor = handle.cursor()
+            cursor.execute("INSERT INTO t VALUES (100)")
+            cursor.execute("CHECKPOINT")
+
+            assert handle.generation().token == before  # not re-checked yet
+            clock.now += 2
+            assert handle.generation().token != before
+            assert handle.cursor() is cursor and handle.database.reloads == 0
+
+    def test_replaced_file_is_reopened(self, db_path, clock):
+        with DatabaseRegistry(clock=clock).open(db_path, check_interval=1, drain_timeout=0.05) as handle:
+            before = handle.generation().token
+            idle = _in_thread(lambda: handle.cursor() and threading.current_thread())
+            old = handle.cursor()
+            _rebuild(db_path, 1000)
+
+            # Still the old file until the next check, with the old token
+            assert old.execute("SELECT MIN(id) FROM t").fetchone()[0] == 0
+            assert handle.generation().token == before
+
+            clock.now += 2
+            fresh = handle.cursor()
+            assert fresh is not old
+            assert fresh.execute("SELECT MIN(id) FROM t").fetchone()[0] == 1000
+            assert handle.generation().token != before
+            stats = handle.database.stats()
+            assert stats["reloads"] == 1 and stats["open"] == 1
+            assert idle not in handle._threads
+
+    def test_duckdb_connection_cache_misses_after_rebuild(self, db_path):
+        with DuckDBConnection(database=str(db_path)) as connection:
+            connection.connect()
+            connection._handle.database.check_interval = 0
+            assert connection.query("SELECT MIN(id) AS m FROM t")["m"].iloc[0] == 0
+            _rebuild(db_path, 1000)
+
+            assert connection.query("SELECT MIN(id) AS m FROM t")["m"].iloc[0] == 1000
+            assert connection.cursor() is connection._instance
+            assert connection.cache_stats()["hits"] == 0
+
+    def test_api_caches_follow_rebuild(self, star_schema_db, tmp_path):
+        path = tmp_path / "landuse.duckdb"
+        shutil.copy(star_schema_db, path)
+        with LandUseAPI(db_path=path) as api:
+            before = api.get_county_vector("urban_expansion", scenario="HH")
+            api._db.database.check_interval = 0
+
+            staging = tmp_path / "staging.duckdb"
+            shutil.copy(star_schema_db, staging)
+            with duckdb.connect(str(staging)) as conn:
+                conn.execute("UPDATE fact_landuse_transitions SET acres = acres * 2")
+            os.replace(staging, path)
+
+            after = api.get_county_vector("urban_expansion", scenario="HH")
+            assert after.values == pytest.approx([2 * value for value in before.values])
+            assert api._geography_token == api._generation_token()
@@ -3,22 +3,31 @@
 Unit tests for retry decorators and utilities
 """
 
+import asyncio
 import os
 import tempfile
+import threading
 import time
 from unittest.mock import Mock, patch
 
 import pytest
 
+from landuse.exceptions import CircuitOpenError
 from landuse.utils.retry_decorators import (
     HAS_TENACITY,
+    AsyncRetryableOperation,
     RetryableOperation,
+    RetryBudget,
     api_retry,
+    async_database_retry,
+    async_retry,
+    backoff_with_jitter,
     custom_retry,
     database_retry,
     execute_with_retry,
     file_retry,
     network_retry,
+    retry_budget,
     retry_on_result,
 )
 
@@ -363,5 +372,140 @@ class TestErrorHandling:
         assert call_count == 2
 
 
+class TestAsyncRetry:
+    """Test async retry utilities"""
+
+    def test_async_database_retry_does_not_block_loop(self):
+        """Test that waits between attempts let other coroutines run"""
+        call_count = 0
+
+        @async_database_retry(max_attempts=3, min_wait=0.05)
+        async def flaky():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise ConnectionError("Connection failed")
+            return "success"
+
+        async def ticker(ticks: list):
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        async def run():
+            ticks = []
+            task = asyncio.create_task(ticker(ticks))
+            result = await flaky()
+            task.cancel()
+            return result, len(ticks)
+
+        result, ticks = asyncio.run(run())
+        assert result == "success" and call_count == 3
+        assert ticks >= 3
+
+    def test_budget_deadline_stops_retries(self):
+        """Test that no retry starts if it would end after the deadline"""
+        call_count = 0
+
+        @async_retry(max_attempts=5, min_wait=1.0, exceptions=(ConnectionError,))
+        async def failing():
+            nonlocal call_count
+            call_count += 1
+            raise ConnectionError("down")
+
+        async def run():
+            with retry_budget(deadline=0.5):
+                await failing()
+
+        start = time.monotonic()
+        with pytest.raises(ConnectionError):
+            asyncio.run(run())
+        assert call_count == 1
+        assert time.monotonic() - start < 0.5
+
+    def test_budget_deadline_cuts_off_retried_attempts(self):
+        """Test that a slow retried attempt is cancelled at the deadline"""
+        attempts = []
+
+        async def flaky():
+            attempts.append(time.monotonic())
+            if len(attempts) == 1:
+                raise ConnectionError("down")
+            await asyncio.sleep(10)
+
+        operation = AsyncRetryableOperation(
+            "flaky", min_wait=0.01, max_wait=0.01, exceptions=(ConnectionError,), budget=RetryBudget(deadline=0.2)
+        )
+        with pytest.raises((TimeoutError, asyncio.TimeoutError)):
+            asyncio.run(operation.execute(flaky))
+        assert operation.attempt_count == 2
+
+    def test_expired_budget_still_runs_first_attempt(self):
+        """Test that the budget limits retries, not the first attempt"""
+        budget = RetryBudget(deadline=0)
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                raise ConnectionError("down")
+            return "ok"
+
+        operation = AsyncRetryableOperation("fetch", min_wait=0.01, exceptions=(ConnectionError,), budget=budget)
+        with pytest.raises(ConnectionError):
+            asyncio.run(operation.execute(fetch))
+        assert calls == [1]
+
+        # A fresh call on the expired budget still gets its first attempt
+        assert asyncio.run(operation.execute(fetch)) == "ok"
+
+    def test_budget_shared_across_operations(self):
+        """Test that max_retries bounds retries across every operation of a request"""
+        budget = RetryBudget(max_retries=2)
+        attempts = []
+
+        async def failing(name):
+            attempts.append(name)
+            raise ConnectionError("down")
+
+        async def run():
+            for name in ("a", "b"):
+                operation = AsyncRetryableOperation(name, max_attempts=3, min_wait=0.001, budget=budget)
+                with pytest.raises(ConnectionError):
+                    await operation.execute(failing, name)
+
+        asyncio.run(run())
+        assert attempts == ["a", "a", "a", "b"]
+
+    def test_sync_functions_run_in_thread(self):
+        """Test that blocking functions run off the event loop thread"""
+        loop_thread = threading.get_ident()
+
+        async def run():
+            operation = AsyncRetryableOperation("blocking")
+            return await operation.execute(threading.get_ident)
+
+        assert asyncio.run(run()) != loop_thread
+
+    def test_open_circuit_not_retried(self):
+        """Test that calls shed by a circuit breaker fail immediately"""
+        operation = AsyncRetryableOperation("shed", max_attempts=3, min_wait=0.001)
+
+        async def shed():
+            raise CircuitOpenError("open")
+
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(operation.execute(shed))
+        assert operation.attempt_count == 1
+
+    def test_backoff_with_jitter_bounds(self):
+        """Test jittered waits stay within half and all of the exponential wait"""
+        waits = [backoff_with_jitter(3, 1.0, 60.0) for _ in range(100)]
+        assert all(2.0 <= w <= 4.0 for w in waits)
+        assert len(set(waits)) > 1
+        assert backoff_with_jitter(10, 1.0, 5.0) <= 5.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
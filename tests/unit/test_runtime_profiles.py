@@ -0,0 +1,103 @@
+"""Unit tests for DuckDB runtime profiles."""
+
+import shutil
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from landuse.api import LandUseAPI
+from landuse.api.benchmark import benchmark_runtime_profiles
+from landuse.connections.duckdb_connection import ConnectionConfig, DuckDBConnection
+from landuse.converter_models import ConversionConfig
+from landuse.converters.bulk_loader import create_bulk_loader
+from landuse.core.app_config import RUNTIME_PROFILES, AppConfig, RuntimeConfig, RuntimeProfile
+from landuse.exceptions import ConfigurationError
+
+SETTINGS = "SELECT name, value FROM duckdb_settings() WHERE name IN ('threads', 'preserve_insertion_order')"
+
+
+def _settings(conn: duckdb.DuckDBPyConnection) -> dict[str, str]:
+    return dict(conn.execute(SETTINGS).fetchall())
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "profiles.duckdb"
+    with duckdb.connect(str(path)) as conn:
+        conn.execute("CREATE TABLE t AS SELECT range AS id FROM range(10)")
+    return path
+
+
+class TestRuntimeProfiles:
+    """Tests for RuntimeProfile and RuntimeConfig."""
+
+    def test_duckdb_config_omits_unset_settings(self, tmp_path):
+        profile = RuntimeProfile(threads=2, preserve_insertion_order=False, temp_directory="~/spill")
+
+        config = profile.duckdb_config()
+        assert config == {"threads": 2, "preserve_insertion_order": False, "temp_directory": str(Path.home() / "spill")}
+        assert RuntimeProfile().duckdb_config() == {}
+
+    def test_builtin_profiles_are_valid_duckdb_config(self, db_path):
+        for name, profile in RUNTIME_PROFILES.items():
+            with duckdb.connect(str(db_path), read_only=True, config=profile.duckdb_config()) as conn:
+                assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 10, name
+
+    def test_app_config_selects_profile_from_environment(self, monkeypatch):
+        monkeypatch.setenv("LANDUSE_RUNTIME__PROFILE", "api-high-concurrency")
+        runtime = AppConfig().runtime
+
+        assert runtime.get() == RUNTIME_PROFILES["api-high-concurrency"]
+        assert runtime.conversion == RUNTIME_PROFILES["conversion"]
+
+    def test_unknown_profile_rejected(self):
+        with pytest.raises(ConfigurationError):
+            RuntimeConfig(profile="turbo")
+        assert RuntimeConfig().get() is None
+
+    def test_conversion_config_forwards_limits(self, tmp_path):
+        source = tmp_path / "input.json"
+        source.write_text("[]")
+        config = ConversionConfig(input_file=source, memory_limit="2GB", threads=3, temp_dir=tmp_path / "spill")
+
+        profile = config.runtime_profile()
+        assert (profile.memory_limit, profile.threads) == ("2GB", 3)
+        assert profile.temp_directory == str(tmp_path / "spill")
+        assert profile.preserve_insertion_order is False
+
+        loader = create_bulk_loader(tmp_path / "out.duckdb", config)
+        with loader.connection() as conn:
+            assert _settings(conn)["threads"] == "3"
+        loader.cleanup()
+
+
+class TestProfileConsumers:
+    """Connections opened by DuckDBConnection and LandUseAPI apply the profile."""
+
+    def test_connection_config_applies_profile(self, db_path):
+        profile = RuntimeProfile(threads=2, preserve_insertion_order=False)
+        config = ConnectionConfig(database=str(db_path), profile=profile, threads=3)
+
+        with DuckDBConnection(config) as connection:
+            assert _settings(connection.cursor()) == {"threads": "3", "preserve_insertion_order": "false"}
+
+    def test_api_runtime_profile(self, star_schema_db, tmp_path):
+        path = tmp_path / "landuse.duckdb"
+        shutil.copy(star_schema_db, path)
+
+        with LandUseAPI(db_path=path, runtime_profile="api-high-concurrency") as api:
+            assert api.get_land_use_area(["CA"]).success
+            assert _settings(api._get_conn()) == {"threads": "2", "preserve_insertion_order": "false"}
+
+        with pytest.raises(ConfigurationError):
+            LandUseAPI(db_path=path, runtime_profile="turbo")
+
+    def test_benchmark_runs_every_profile(self, star_schema_db, tmp_path):
+        path = tmp_path / "landuse.duckdb"
+        shutil.copy(star_schema_db, path)
+
+        results = benchmark_runtime_profiles(str(path), iterations=1, concurrency=2, load_rows=1000)
+
+        assert [r.profile for r in results] == ["duckdb-default", *RUNTIME_PROFILES]
+        assert all(r.latency_ms > 0 and r.throughput_qps > 0 and r.load_seconds > 0 for r in results)
@@ -0,0 +1,57 @@
+"""Unit tests for scenario differences with top-k divergences."""
+
+import numpy as np
+import pytest
+
+from landuse.api import ErrorResult, ScenarioDiffResult
+
+
+class TestScenarioDiff:
+    """Tests for LandUseAPI.get_scenario_diff."""
+
+    def test_county_difference_matches_vectors(self, api):
+        result = api.get_scenario_diff("forest_loss", "LM", "HH", top_k=3)
+        lm = api.get_county_vector("forest_loss", scenario="LM")
+        hh = api.get_county_vector("forest_loss", scenario="HH")
+
+        assert isinstance(result, ScenarioDiffResult)
+        assert list(result.keys) == list(lm.fips)
+        np.testing.assert_allclose(result.difference, hh.values - lm.values)
+
+    def test_top_k_matches_full_sort(self, api):
+        result = api.get_scenario_diff("urban_expansion", "LM", "HH", top_k=4)
+        difference = result.difference
+
+        positive = np.sort(difference[difference > 0])[::-1][:4]
+        negative = np.sort(difference[difference < 0])[:4]
+        assert [d.difference for d in result.increases] == pytest.approx(positive.tolist())
+        assert [d.difference for d in result.decreases] == pytest.approx(negative.tolist())
+        for d in result.increases + result.decreases:
+            i = list(result.keys).index(d.key)
+            assert d.difference == pytest.approx(difference[i])
+        assert [d.rank for d in result.increases] == list(range(1, len(positive) + 1))
+        assert all(d.difference > 0 for d in result.increases)
+        assert all(d.difference < 0 for d in result.decreases)
+
+    def test_state_level(self, api):
+        counties = api.get_scenario_diff("urban_expansion", "HM", "HL", states=["TX", "NC"])
+        states = api.get_scenario_diff("urban_expansion", "HM", "HL", level="state", states=["TX", "NC"])
+
+        assert list(counties.keys) and all(k[:2] in ("48", "37") for k in counties.keys)
+        assert list(states.keys) == ["North Carolina", "Texas"]
+        assert states.difference.sum() == pytest.approx(counties.difference.sum())
+        assert "Scenario Difference" in states.to_llm_string()
+
+    def test_vectors_are_cached(self, api):
+        api.get_scenario_diff("ag_loss", "LM", "HH")
+        cached = dict(api._county_vectors)
+        api.get_scenario_diff("ag_loss", "HH", "LM", level="state")
+
+        assert len(api._county_vectors) == len(cached) == 2
+        assert all(api._county_vectors[key] is values for key, values in cached.items())
+
+    def test_invalid_requests(self, api):
+        assert isinstance(api.get_scenario_diff(scenario_a="XX"), ErrorResult)
+        assert api.get_scenario_diff(level="region").error_code == "INVALID_REQUEST"
+        assert api.get_scenario_diff(top_k=0).error_code == "INVALID_REQUEST"
+        assert api.get_scenario_diff("carbon").error_code == "INVALID_REQUEST"
@@ -2,13 +2,17 @@
 Unit tests for security utilities
 """
 
+import asyncio
 import os
+import threading
 import time
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from landuse.core.app_config import SecurityConfig
+from landuse.exceptions import RateLimitError
 from landuse.utils.security import (
     InputValidator,
     RateLimiter,
@@ -306,6 +310,85 @@ class TestRateLimiter:
 
         assert call_count == 2  # Function not called
 
+    def test_refill_and_retry_after(self, clock):
+        """Test that calls refill at max_calls per time_window"""
+        limiter = RateLimiter(max_calls=2, time_window=10, clock=clock)
+
+        assert limiter.check_rate_limit("user1")[0] and limiter.check_rate_limit("user1")[0]
+        allowed, error = limiter.check_rate_limit("user1")
+        assert not allowed and "Retry after 5 seconds" in error
+
+        clock.now += 5
+        assert limiter.check_rate_limit("user1")[0]
+        assert not limiter.check_rate_limit("user1")[0]
+        assert limiter.stats()["rejected"] == 2
+
+    def test_clock_going_backwards_does_not_drain_tokens(self, clock):
+        """Test that a clock reading older than the bucket's stamp refills nothing and takes nothing"""
+        limiter = RateLimiter(max_calls=2, time_window=10, clock=clock)
+
+        assert limiter.check_rate_limit("user1")[0]
+        clock.now -= 5
+        assert limiter.check_rate_limit("user1")[0]
+        assert not limiter.check_rate_limit("user1")[0]
+
+        # Refill resumes from the newest stamp, not the stale reading
+        clock.now += 10
+        assert limiter.check_rate_limit("user1")[0]
+        assert not limiter.check_rate_limit("user1")[0]
+
+    def test_idle_identifiers_evicted(self, clock):
+        """Test that refilled buckets and identifiers beyond the bound are dropped"""
+        limiter = RateLimiter(max_calls=5, time_window=10, stripes=1, max_identifiers=3, clock=clock)
+
+        for user in ("a", "b", "c", "d"):
+            limiter.check_rate_limit(user)
+        assert limiter.stats()["identifiers"] == 3
+
+        clock.now += 10
+        limiter.check_rate_limit("e")
+        stats = limiter.stats()
+        assert (stats["evicted"], stats["identifiers"]) == (4, 1)
+
+    def test_concurrent_checks_are_exact(self):
+        """Test that concurrent callers never exceed the limit"""
+        limiter = RateLimiter(max_calls=100, time_window=3600, stripes=4)
+        results = []
+
+        def worker():
+            results.extend(limiter.check_rate_limit(f"user{i % 3}")[0] for i in range(200))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(results) == 300
+        assert limiter.stats()["allowed"] == 300
+
+    def test_acquire_async_waits_in_order(self):
+        """Test that acquire_async waits for a call instead of failing"""
+        limiter = RateLimiter(max_calls=1, time_window=0.05)
+
+        async def run():
+            return await asyncio.gather(*(limiter.acquire_async("user1", timeout=1) for _ in range(3)))
+
+        waits = asyncio.run(run())
+        assert waits[0] == 0 and 0 < waits[1] < waits[2] <= 0.1
+        assert limiter.stats()["waited"] == 2
+
+        with pytest.raises(RateLimitError) as exc_info:
+            limiter.acquire("user1", timeout=0)
+        assert exc_info.value.retry_after > 0
+
+    def test_from_config(self):
+        """Test that limits come from SecurityConfig"""
+        limiter = RateLimiter.from_config(SecurityConfig(rate_limit_calls=5, rate_limit_window=30))
+
+        assert (limiter.max_calls, limiter.time_window) == (5, 30)
+        assert RateLimiter.from_config().max_calls == SecurityConfig().rate_limit_calls
+
 
 class TestSecureConfig:
     """Test secure configuration management"""
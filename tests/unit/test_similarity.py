@@ -0,0 +1,71 @@
+"""Unit tests for county similarity search."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from landuse.api import ErrorResult, SimilarCountiesResult
+from landuse.api.similarity import CountySimilarityIndex
+
+
+def _index() -> CountySimilarityIndex:
+    # Counties a and b share a trajectory shape at different sizes; c differs; d has no data
+    rows = []
+    for position, (crop, forest) in enumerate([(80, 20), (40, 10), (10, 90)]):
+        for year in (2030, 2040):
+            rows += [("HH", year, "Crop", crop, position), ("HH", year, "Forest", forest, position)]
+    df = pd.DataFrame(rows, columns=["scenario_name", "end_year", "land_use", "acres", "position"])
+    return CountySimilarityIndex.from_frame(df, np.array(["a", "b", "c", "d"]), df["position"].to_numpy())
+
+
+class TestCountySimilarityIndex:
+    """Tests for CountySimilarityIndex."""
+
+    def test_rows_are_unit_length(self):
+        index = _index()
+        assert index.matrix.shape == (4, 4)
+        np.testing.assert_allclose(np.linalg.norm(index.matrix[:3], axis=1), 1.0)
+        assert index.valid.tolist() == [True, True, True, False]
+        assert index.features[0] == ("HH", 2030, "Crop")
+
+    def test_neighbors_ranked_by_cosine(self):
+        index = _index()
+        positions, scores = index.neighbors(0, k=5)
+
+        assert positions.tolist() == [1, 2]
+        assert scores[0] == pytest.approx(1.0)
+        assert scores[0] > scores[1]
+
+    def test_mask_limits_candidates(self):
+        positions, _ = _index().neighbors(0, k=5, mask=np.array([True, False, True, True]))
+        assert positions.tolist() == [2]
+
+
+class TestFindSimilarCounties:
+    """Tests for LandUseAPI.find_similar_counties."""
+
+    def test_matches_brute_force(self, api):
+        result = api.find_similar_counties("NC", "Wake", k=4)
+        index = api._similarity
+
+        assert isinstance(result, SimilarCountiesResult)
+        assert result.fips == "37183"
+        target = list(index.fips).index("37183")
+        scores = index.matrix @ index.matrix[target]
+        expected = sorted((s for i, s in enumerate(scores) if i != target), reverse=True)[:4]
+        assert [c.similarity for c in result.counties] == pytest.approx(expected, abs=1e-6)
+        assert "37183" not in [c.fips for c in result.counties]
+        assert "Most Similar to Wake" in result.to_llm_string()
+
+    def test_state_and_region_filters(self, api):
+        texas = api.find_similar_counties("CA", "Los Angeles", k=10, states=["TX"])
+        south = api.find_similar_counties("CA", "Los Angeles", k=10, region="south")
+
+        assert len(texas.counties) == 4
+        assert {c.state for c in texas.counties} == {"Texas"}
+        assert {c.state for c in south.counties} == {"Texas", "North Carolina"}
+
+    def test_errors(self, api):
+        assert api.find_similar_counties("CA", "Atlantis").error_code == "NOT_FOUND"
+        assert api.find_similar_counties("CA", "Orange", region="Moon").error_code == "INVALID_REQUEST"
+        assert isinstance(api.find_similar_counties("CA", "Orange", k=0), ErrorResult)
@@ -0,0 +1,276 @@
+"""Unit tests for single-flight coalescing of identical concurrent queries."""
+
+import asyncio
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pytest
+
+from landuse.api import LandUseAPI
+from landuse.api import client as api_client
+from landuse.connections.duckdb_connection import DuckDBConnection
+from landuse.connections.single_flight import SingleFlight
+
+
+class SlowCall:
+    """Counts calls and blocks each one until released."""
+
+    def __init__(self, result="done"):
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.result = result
+
+    def __call__(self, *args):
+        self.calls += 1
+        self.started.set()
+        assert self.release.wait(5)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return (self.result, *args)
+
+
+def _wait_for_waiters(flights: SingleFlight, coalesced: int) -> None:
+    deadline = time.monotonic() + 5
+    while flights.coalesced < coalesced:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_threads_share_one_execution(self):
+        flights = SingleFlight()
+        call = SlowCall()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(flights.do, "key", call, 1)]
+            assert call.started.wait(5)
+            futures += [pool.submit(flights.do, "key", call, 1) for _ in range(3)]
+            _wait_for_waiters(flights, 3)
+            call.release.set()
+            results = [f.result() for f in futures]
+
+        assert call.calls == 1
+        assert results == [("done", 1)] * 4
+        assert flights.stats() == {"in_flight": 0, "executions": 1, "coalesced": 3}
+
+        # Nothing is kept once the call finishes
+        assert flights.do("key", lambda: "again") == "again"
+
+    def test_different_keys_run_separately(self):
+        flights = SingleFlight()
+
+        assert flights.do("a", lambda: 1) == 1
+        assert flights.do("b", lambda: 2) == 2
+        assert flights.executions == 2 and flights.coalesced == 0
+
+    def test_exception_reaches_every_waiter(self):
+        flights = SingleFlight()
+        call = SlowCall(result=ValueError("bad query"))
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flights.do, "key", call)
+            assert call.started.wait(5)
+            waiter = pool.submit(flights.do, "key", call)
+            _wait_for_waiters(flights, 1)
+            call.release.set()
+
+            for future in (leader, waiter):
+                with pytest.raises(ValueError, match="bad query"):
+                    future.result()
+        assert call.calls == 1 and len(flights) == 0
+
+    def test_waiter_timeout_leaves_the_call_running(self):
+        flights = SingleFlight()
+        call = SlowCall()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(flights.do, "key", call)
+            assert call.started.wait(5)
+            start = time.monotonic()
+            with pytest.raises(TimeoutError):
+                flights.do("key", call, timeout=0.05)
+            with pytest.raises(TimeoutError):
+                asyncio.run(flights.do_async("key", call, timeout=0.05))
+            assert time.monotonic() - start < 2
+            call.release.set()
+            assert leader.result() == ("done",)
+
+        assert call.calls == 1 and len(flights) == 0
+
+    def test_share_gives_each_waiter_its_own_view(self):
+        flights = SingleFlight(share=list)
+
+        first = flights.do("key", lambda: (1, 2))
+        first.append(3)
+        assert flights.do("key", lambda: (1, 2)) == [1, 2]
+
+    def test_async_waiters_join_a_thread_leader(self):
+        flights = SingleFlight()
+        call = SlowCall()
+
+        async def run():
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                leader = pool.submit(flights.do, "key", call)
+                assert call.started.wait(5)
+                waiters = [asyncio.ensure_future(flights.do_async("key", call)) for _ in range(3)]
+                await asyncio.sleep(0)
+                # The event loop is free while the waiters wait
+                assert not any(w.done() for w in waiters)
+                call.release.set()
+                return leader.result(), await asyncio.gather(*waiters)
+
+        leader_result, waiter_results = asyncio.run(run())
+        assert call.calls == 1
+        assert waiter_results == [leader_result] * 3
+
+    def test_async_coroutine_leader(self):
+        flights = SingleFlight()
+        calls = []
+
+        async def fetch(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value * 2
+
+        async def run():
+            return await asyncio.gather(*(flights.do_async("key", fetch, 21) for _ in range(5)))
+
+        assert asyncio.run(run()) == [42] * 5
+        assert calls == [21]
+
+    def test_cancelled_waiter_does_not_cancel_the_call(self):
+        flights = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        async def run():
+            first = asyncio.ensure_future(flights.do_async("key", fetch))
+            second = asyncio.ensure_future(flights.do_async("key", fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()) == "ok"
+        assert flights.executions == 1
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "test.duckdb"
+    conn = duckdb.connect(str(path))
+    conn.execute("CREATE TABLE t AS SELECT range AS id FROM range(1000)")
+    conn.close()
+    return str(path)
+
+
+class TestDuckDBConnectionCoalescing:
+    """DuckDBConnection shares concurrent identical queries on read-only databases."""
+
+    def test_concurrent_queries_share_one_execution(self, db_path, monkeypatch):
+        connection = DuckDBConnection(database=db_path, read_only=True)
+        release = threading.Event()
+        run_query = connection._run_query
+
+        def slow_run_query(*args):
+            assert release.wait(5)
+            return run_query(*args)
+
+        monkeypatch.setattr(connection, "_run_query", slow_run_query)
+        query = "SELECT SUM(id) AS total FROM t"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(connection.query, query, use_cache=False) for _ in range(4)]
+            _wait_for_waiters(connection._flights, 3)
+            release.set()
+            frames = [f.result() for f in futures]
+
+        assert [df["total"].iloc[0] for df in frames] == [499500] * 4
+        assert connection.cache_stats()["coalesced"] == 3
+        # Shared results are read-only, but each caller may add columns
+        with pytest.raises(ValueError):
+            frames[0]["total"].values[0] = 0
+        frames[0]["extra"] = 1
+        assert "extra" not in frames[1]
+        connection.close()
+
+    def test_query_async(self, db_path):
+        connection = DuckDBConnection(database=db_path, read_only=True)
+
+        async def run():
+            return await asyncio.gather(
+                *(connection.query_async("SELECT COUNT(*) AS n FROM t", use_cache=False) for _ in range(3))
+            )
+
+        assert [df["n"].iloc[0] for df in asyncio.run(run())] == [1000] * 3
+        connection.close()
+
+
+def test_api_coalesces_identical_calls(star_schema_db, tmp_path, monkeypatch):
+    path = tmp_path / "landuse.duckdb"
+    shutil.copy(star_schema_db, path)
+    release = threading.Event()
+    executions = []
+
+    with LandUseAPI(db_path=path) as api:
+        run_query = api._run_query
+
+        def slow_run_query(sql, params, description):
+            executions.append(sql)
+            assert release.wait(5)
+            return run_query(sql, params, description)
+
+        monkeypatch.setattr(api, "_run_query", slow_run_query)
+        before = api_client._flights.coalesced
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(api.get_land_use_area, ["CA"]) for _ in range(3)]
+            deadline = time.monotonic() + 5
+            while api_client._flights.coalesced - before < 2:
+                assert time.monotonic() < deadline
+                time.sleep(0.001)
+            release.set()
+            results = [f.result() for f in futures]
+
+    assert all(r.success for r in results)
+    assert len(executions) == len(set(executions))
+    assert results[0].model_dump() == results[1].model_dump() == results[2].model_dump()
+
+
+def test_waiter_applies_its_own_query_timeout(star_schema_db, tmp_path, monkeypatch):
+    path = tmp_path / "landuse.duckdb"
+    shutil.copy(star_schema_db, path)
+    release = threading.Event()
+
+    with LandUseAPI(db_path=path) as slow_api, LandUseAPI(db_path=path, query_timeout=0.5) as api:
+        run_query = slow_api._run_query
+
+        def slow_run_query(*args):
+            assert release.wait(10)
+            return run_query(*args)
+
+        monkeypatch.setattr(slow_api, "_run_query", slow_run_query)
+        before = api_client._flights.coalesced
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(slow_api.get_land_use_area, ["CA"])
+            deadline = time.monotonic() + 5
+            while len(api_client._flights) == 0:
+                assert time.monotonic() < deadline
+                time.sleep(0.001)
+            start = time.monotonic()
+            result = api.get_land_use_area(["CA"])
+            waited = time.monotonic() - start
+            release.set()
+            assert leader.result().success
+
+    assert api_client._flights.coalesced - before == 1
+    assert result.error_code == "TIMEOUT"
+    assert waited < 2
@@ -0,0 +1,153 @@
+"""Unit tests for the SSP socioeconomic loader and per-capita queries."""
+
+import shutil
+
+import duckdb
+import pandas as pd
+import pytest
+
+from landuse.api import ErrorResult, LandUseAPI, SocioeconomicResult
+from landuse.converters.socioeconomic_loader import JOIN_TABLE, SocioeconomicLoader, read_projections
+
+YEARS = [2010, 2020, 2030, 2040, 2050, 2060, 2070]
+
+
+@pytest.fixture(scope="module")
+def ssp_db(star_schema_db, tmp_path_factory):
+    path = tmp_path_factory.mktemp("ssp") / "landuse_ssp.duckdb"
+    shutil.copy(star_schema_db, path)
+
+    with duckdb.connect(str(path), read_only=True) as conn:
+        fips = [row[0] for row in conn.execute("SELECT fips_code FROM dim_geography ORDER BY fips_code").fetchall()]
+
+    # Wide CSV layout for population (integer-like FIPS lose their leading zero)
+    population = pd.DataFrame(
+        [
+            {"GEOID": int(code), "YEAR": year, **{f"SSP{k}": 100.0 * (i + 1) + k * (year - 2010) for k in range(1, 6)}}
+            for i, code in enumerate(fips)
+            for year in YEARS
+        ]
+    )
+    csv = path.parent / "population.csv"
+    population.to_csv(csv, index=False)
+
+    # Long layout for income
+    income = pd.DataFrame(
+        [
+            (code, f"ssp{k}", year, 40.0 + k + (year - 2010) / 10)
+            for code in fips
+            for k in range(1, 6)
+            for year in YEARS
+        ],
+        columns=["fips", "ssp", "year", "value"],
+    )
+
+    stats = SocioeconomicLoader(path).load(population=csv, income=income)
+    assert stats.processed_records == 2 * len(fips) * 5 * len(YEARS)
+    return path
+
+
+class TestReadProjections:
+    """Tests for projection file normalization."""
+
+    def test_wide_and_long_layouts(self):
+        wide = pd.DataFrame({"fips": ["6037"], "year": [2030], "SSP1": [10.0], "SSP2": [12.0]})
+        long = read_projections(wide)
+        assert long.to_dict("records") == [
+            {"fips_code": "06037", "ssp_scenario": "SSP1", "year": 2030, "value": 10.0},
+            {"fips_code": "06037", "ssp_scenario": "SSP2", "year": 2030, "value": 12.0},
+        ]
+
+    def test_drops_out_of_range_rows(self):
+        df = pd.DataFrame({"fips": ["06037"] * 3, "ssp": ["SSP1"] * 3, "year": [2000, 2030, 2030], "value": [1, 2, -1]})
+        assert read_projections(df)["year"].tolist() == [2030]
+
+    def test_missing_columns(self):
+        with pytest.raises(ValueError):
+            read_projections(pd.DataFrame({"county": ["x"], "year": [2030]}))
+
+
+class TestSocioeconomicLoader:
+    """Tests for SocioeconomicLoader."""
+
+    def test_join_table(self, ssp_db):
+        with duckdb.connect(str(ssp_db), read_only=True) as conn:
+            rows, missing = conn.execute(
+                f"SELECT COUNT(*), COUNT(*) FILTER (WHERE population_end IS NULL) FROM {JOIN_TABLE}"
+            ).fetchone()
+            assert rows == 12 * 4 * 6
+            # Every period end year has a projection (only the 2012 start year does not)
+            assert missing == 0
+            la = conn.execute(
+                f"""
+                SELECT population_start, population_end, income_end, total_acres
+                FROM {JOIN_TABLE} WHERE fips_code = '06037' AND ssp_scenario = 'SSP2' AND year_range = '2020-2030'
+                """
+            ).fetchone()
+            landuse = conn.execute(
+                """
+                SELECT SUM(acres) FROM fact_landuse_transitions f
+                JOIN dim_geography g USING (geography_id) JOIN dim_time t USING (time_id)
+                WHERE g.fips_code = '06037' AND f.scenario_id = 2 AND t.year_range = '2020-2030'
+                """
+            ).fetchone()[0]
+            views = conn.execute("SELECT COUNT(*) FROM v_population_trends").fetchone()[0]
+            index = conn.execute("SELECT COUNT(*) FROM dim_geography WHERE fips_code < '06037'").fetchone()[0]
+
+        assert la[0] == pytest.approx(100.0 * (index + 1) + 2 * 10)
+        assert la[1] == pytest.approx(100.0 * (index + 1) + 2 * 20)
+        assert la[2] == pytest.approx(42.0 + 2.0)
+        assert la[3] == pytest.approx(float(landuse))
+        assert views == 12 * 5 * len(YEARS)
+
+    def test_reload_replaces_indicator(self, ssp_db):
+        income = pd.DataFrame({"fips": ["06037"], "ssp": ["SSP1"], "year": [2030], "value": [50.0]})
+        SocioeconomicLoader(ssp_db).load(income=income)
+        with duckdb.connect(str(ssp_db), read_only=True) as conn:
+            counts = dict(
+                conn.execute("SELECT indicator_id, COUNT(*) FROM fact_socioeconomic_projections GROUP BY 1").fetchall()
+            )
+        assert counts == {1: 12 * 5 * len(YEARS), 2: 1}
+
+
+class TestSocioeconomicMetric:
+    """Tests for LandUseAPI.get_socioeconomic_metric."""
+
+    def test_population_density_ranking(self, ssp_db):
+        with LandUseAPI(db_path=ssp_db) as api:
+            result = api.get_socioeconomic_metric("population_density", scenario="HH", year=2070, limit=3)
+            rows = (
+                api._get_conn()
+                .execute(
+                    f"""
+                SELECT fips_code, population_end * 1000 * 640 / total_acres AS density
+                FROM {JOIN_TABLE} WHERE ssp_scenario = 'SSP5' AND end_year = 2070
+                ORDER BY density DESC LIMIT 3
+                """
+                )
+                .fetchall()
+            )
+
+        assert isinstance(result, SocioeconomicResult)
+        assert [c.fips for c in result.counties] == [r[0] for r in rows]
+        assert [c.value for c in result.counties] == pytest.approx([r[1] for r in rows])
+        assert result.unit == "people per sq mi"
+        assert "Population Density (HH, 2070)" in result.to_llm_string()
+
+    def test_state_filter_and_ascending(self, ssp_db):
+        with LandUseAPI(db_path=ssp_db) as api:
+            result = api.get_socioeconomic_metric(
+                "urban_acres_per_capita", states=["NC"], scenario="LM", year=2030, ascending=True
+            )
+        values = [c.value for c in result.counties]
+        assert len(values) == 4 and values == sorted(values)
+        assert {c.state for c in result.counties} == {"North Carolina"}
+
+    def test_errors(self, ssp_db, star_schema_db):
+        with LandUseAPI(db_path=ssp_db) as api:
+            assert api.get_socioeconomic_metric("happiness").error_code == "INVALID_REQUEST"
+            assert api.get_socioeconomic_metric(scenario="XX").error_code == "INVALID_REQUEST"
+        with LandUseAPI(db_path=star_schema_db) as api:
+            missing = api.get_socioeconomic_metric()
+        assert isinstance(missing, ErrorResult)
+        assert missing.error_code == "NO_DATA"
@@ -0,0 +1,103 @@
+"""Unit tests for the single-pass SQL tokenizer used by the security checks."""
+
+import pytest
+
+from landuse.security import DatabaseSecurity, clear_scan_cache, scan_cache_info, scan_sql, sql_scanner
+from landuse.utils.security import SQLQueryValidator
+
+
+@pytest.fixture(autouse=True)
+def _fresh_scan_cache():
+    clear_scan_cache()
+    yield
+    clear_scan_cache()
+
+
+class TestScanSQL:
+    """Tests for scan_sql."""
+
+    def test_classifies_tokens(self):
+        scan = scan_sql(
+            "WITH x AS (SELECT t.drop, \"DELETE\", 'UPDATE' FROM t) -- INSERT\n"
+            "SELECT char(65), count(*) /* ALTER */ FROM x INTO outfile 'f';"
+        )
+
+        assert scan.leading_word == "WITH"
+        assert {"CHAR", "COUNT"} <= set(scan.calls)
+        assert {"DROP", "DELETE", "UPDATE", "INSERT", "ALTER"}.isdisjoint(scan.words)
+        assert scan.into_targets == frozenset({"OUTFILE"})
+        assert scan.statements == 1
+        assert not scan.has_hex_literal
+
+    def test_statements_and_hex(self):
+        assert scan_sql("SELECT 1; SELECT 2;;").statements == 2
+        assert scan_sql("SELECT ';' AS s;").statements == 1
+        assert scan_sql("SELECT 0x41").has_hex_literal
+        assert not scan_sql("SELECT x0x41, '0x41'").has_hex_literal
+
+    def test_unterminated_literal_and_comment_are_consumed(self):
+        assert scan_sql("SELECT 'abc DROP").keywords == ("SELECT",)
+        assert scan_sql("SELECT 1 /* DROP").keywords == ("SELECT",)
+
+    def test_memoized_and_bounded(self, monkeypatch):
+        monkeypatch.setattr(sql_scanner, "_SCAN_MAX", 2)
+
+        first = scan_sql("SELECT 1")
+        assert scan_sql("SELECT 1") is first
+        scan_sql("SELECT 2")
+        scan_sql("SELECT 3")
+
+        assert scan_cache_info() == {"hits": 1, "misses": 3, "size": 2}
+        assert scan_sql("SELECT 1") is not first
+
+
+class TestValidatorsUseTokens:
+    """DatabaseSecurity and SQLQueryValidator no longer match substrings."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "SELECT created_at, updated_at, ssp_scenario FROM dim_scenario",
+            "SELECT replace(scenario_name, '_', ' ') FROM dim_scenario",
+            "SELECT * FROM dim_scenario WHERE scenario_name = 'DROP TABLE x; --'",
+            'SELECT "delete" FROM dim_scenario',
+        ],
+    )
+    def test_identifiers_literals_and_functions_pass(self, query):
+        assert DatabaseSecurity.scan_query_for_dangerous_content(query) == []
+        assert SQLQueryValidator.validate_query(query) == (True, None)
+
+    def test_dangerous_content_reported_in_order(self):
+        query = "SELECT 1; DELETE FROM t; EXEC xp_cmdshell 'dir'"
+
+        assert DatabaseSecurity.scan_query_for_dangerous_content(query) == ["DELETE", "EXEC", "XP_CMDSHELL", ";"]
+
+    def test_create_or_replace_still_rejected(self):
+        with pytest.raises(ValueError, match="CREATE"):
+            DatabaseSecurity.validate_query_safety("CREATE OR REPLACE TABLE t AS SELECT 1")
+        assert SQLQueryValidator.validate_query("SELECT * FROM copy_of_t")[0]
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "SELECT E'\\'' AS a; DROP TABLE t; --'",
+            "SELECT $$'$$ AS a; DROP TABLE t; --'",
+            "SELECT $q$'$q$ AS a; DROP TABLE t; --'",
+            "SELECT 1 AS a$$; DROP TABLE t; --$$",
+        ],
+    )
+    def test_escape_and_dollar_strings_cannot_hide_statements(self, query):
+        scan = scan_sql(query)
+        assert "DROP" in scan.words and scan.statements == 2
+
+        with pytest.raises(ValueError):
+            DatabaseSecurity.validate_query_safety(query)
+        assert not SQLQueryValidator.validate_query(query)[0]
+
+    def test_escape_and_dollar_strings_are_literals(self):
+        assert scan_sql("SELECT E'it\\'s; DROP' AS a").keywords == ("SELECT", "AS", "A")
+        assert scan_sql("SELECT $t$ $$; DROP $t$, $$x$$ AS a").keywords == ("SELECT", "AS", "A")
+        assert scan_sql("SELECT $t$ $$; DROP $t$, $$x$$ AS a").statements == 1
+
+    def test_comment_markers_inside_literals_kept(self):
+        assert DatabaseSecurity.remove_sql_comments("SELECT '--x' /* y */ -- z").split() == ["SELECT", "'--x'"]